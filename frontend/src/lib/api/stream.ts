@@ -1,8 +1,17 @@
 // Stream API
 
-import apiClient from './client';
+import apiClient, { ApiError } from './client';
 import type { StreamInfo, StreamResult, BandwidthInfo } from '@/types/api';
 
+export interface StreamSession {
+  result: StreamResult;
+  end: () => Promise<void>;
+}
+
+// lease_ttl 안에 여러 번 heartbeat (한두 번 실패해도 슬롯 유지)
+const HEARTBEAT_PER_TTL = 3;
+const DEFAULT_LEASE_TTL_S = 30;
+
 export const streamApi = {
   /**
    * 스트리밍 URL 획득
@@ -19,10 +28,52 @@ export const streamApi = {
   },
 
   /**
-   * 스트리밍 종료
+   * 스트리밍 슬롯 lease 연장 (만료되었으면 404)
+   */
+  async heartbeat(contentId: string, leaseId: string): Promise<{ status: string }> {
+    const query = new URLSearchParams({ lease_id: leaseId }).toString();
+    return apiClient.post<{ status: string }>(`/stream/${contentId}/heartbeat?${query}`);
+  },
+
+  /**
+   * 스트리밍 종료 (leaseId가 없으면 해당 컨텐츠의 가장 오래된 lease 해제)
    */
-  async endStream(contentId: string): Promise<{ status: string }> {
-    return apiClient.post<{ status: string }>(`/stream/${contentId}/end`);
+  async endStream(contentId: string, leaseId?: string): Promise<{ status: string }> {
+    const query = leaseId ? `?${new URLSearchParams({ lease_id: leaseId }).toString()}` : '';
+    return apiClient.post<{ status: string }>(`/stream/${contentId}/end${query}`);
+  },
+
+  /**
+   * 스트리밍 시작 + 재생 중 heartbeat 유지
+   *
+   * 반환된 end()를 재생 종료/언마운트 시 호출해야 슬롯이 즉시 해제된다.
+   * lease가 만료되었으면 (404) 다시 start해서 새 lease를 받는다.
+   */
+  async openStream(contentId: string): Promise<StreamSession> {
+    const result = await streamApi.startStream(contentId);
+    let leaseId = result.lease_id;
+    const ttlMs = (result.lease_ttl ?? DEFAULT_LEASE_TTL_S) * 1000;
+
+    const timer = setInterval(async () => {
+      if (!leaseId) return;
+      try {
+        await streamApi.heartbeat(contentId, leaseId);
+      } catch (error) {
+        if (error instanceof ApiError && error.status === 404) {
+          // 만료된 lease → 다시 start (제한 초과면 다음 주기에 재시도)
+          const renewed = await streamApi.startStream(contentId).catch(() => null);
+          if (renewed?.lease_id) leaseId = renewed.lease_id;
+        }
+      }
+    }, ttlMs / HEARTBEAT_PER_TTL);
+
+    return {
+      result,
+      end: async () => {
+        clearInterval(timer);
+        await streamApi.endStream(contentId, leaseId);
+      },
+    };
   },
 
   /**
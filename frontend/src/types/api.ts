@@ -95,6 +95,8 @@ export interface StreamInfo {
 export interface StreamResult {
   allowed: boolean;
   error?: string;
+  lease_id?: string;
+  lease_ttl?: number; // 초, 이 시간 안에 heartbeat가 없으면 슬롯 해제
 }
 
 export interface BandwidthInfo {
@@ -3,8 +3,13 @@ NAS 스캔 및 카탈로그 동기화 스크립트
 
 호스트에서 실행하여 NAS 파일을 스캔하고 API로 동기화합니다.
 
+마지막 동기화 상태(커서 + 파일별 크기/mtime)를 state 파일에 저장해 두고,
+다음 실행부터는 바뀐 파일만 /catalog/sync/delta로 보냅니다.
+state 파일이 없거나 서버가 커서를 거부하면(409) 전체 스캔으로 다시 맞춥니다.
+
 사용법:
     python scripts/sync_nas.py [--nas-path Z:\ARCHIVE] [--api-url http://localhost:8002]
+        [--state-file .nas_sync_state.json] [--full]
 """
 
 import argparse
@@ -19,6 +24,18 @@ import requests
 # 비디오 확장자
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm", ".m4v", ".ts"}
 
+# 경로 기반 NAS 파일 ID 네임스페이스 (서버 flat_catalog.models와 동일해야 함)
+NAS_FILE_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://wsoptv/nas-file")
+
+STATE_VERSION = 1
+
+
+def normalize_nas_path(file_path: str) -> str:
+    """NAS 파일 경로 정규화 (서버 flat_catalog.models.normalize_nas_path와 동일)"""
+    parts = [p for p in file_path.replace("\\", "/").split("/") if p]
+    prefix = "/" if file_path.startswith(("/", "\\")) else ""
+    return (prefix + "/".join(parts)).lower()
+
 
 def scan_nas(nas_path: str) -> list[dict]:
     """NAS 폴더를 스캔하여 비디오 파일 목록 반환"""
@@ -46,13 +63,14 @@ def scan_nas(nas_path: str) -> list[dict]:
         try:
             stat = file_path.stat()
             files.append({
-                "id": str(uuid.uuid4()),
+                "id": str(uuid.uuid5(NAS_FILE_NAMESPACE, normalize_nas_path(str(file_path)))),
                 "file_path": str(file_path),
                 "file_name": file_path.name,
                 "file_size_bytes": stat.st_size,
                 "file_extension": ext.lstrip("."),
                 "file_category": "VIDEO",
                 "is_hidden_file": False,
+                "file_mtime": stat.st_mtime,
             })
         except OSError as e:
             print(f"Warning: Cannot access {file_path}: {e}")
@@ -61,49 +79,171 @@ def scan_nas(nas_path: str) -> list[dict]:
     return files
 
 
-def sync_to_api(api_url: str, files: list[dict], batch_size: int = 500) -> dict:
-    """API로 파일 목록 동기화"""
-    total_result = {
-        "created": 0,
-        "updated": 0,
-        "deleted": 0,
-        "skipped": 0,
-        "errors": 0,
+def load_state(state_file: str, api_url: str) -> dict:
+    """
+    마지막 동기화 상태 로드
+
+    Returns:
+        {"cursor": str | None, "files": {정규화 경로: [크기, mtime]}}
+        (없거나 다른 API 서버의 상태면 빈 상태 → 전체 스캔)
+    """
+    empty = {"cursor": None, "files": {}}
+    if not os.path.exists(state_file):
+        return empty
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Cannot read state file {state_file}: {e}")
+        return empty
+    if state.get("version") != STATE_VERSION or state.get("api_url") != api_url:
+        return empty
+    return {"cursor": state.get("cursor"), "files": state.get("files", {})}
+
+
+def save_state(state_file: str, api_url: str, cursor: str, files: list[dict]) -> None:
+    """동기화 상태 저장 (임시 파일 + rename)"""
+    state = {
+        "version": STATE_VERSION,
+        "api_url": api_url,
+        "cursor": cursor,
+        "files": {
+            normalize_nas_path(f["file_path"]): [f["file_size_bytes"], f["file_mtime"]]
+            for f in files
+        },
     }
-
-    # 배치로 나누어 동기화
-    for i in range(0, len(files), batch_size):
+    tmp = f"{state_file}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, state_file)
+
+
+def diff_files(files: list[dict], known: dict) -> tuple[list[dict], list[str]]:
+    """
+    스캔 결과와 마지막 상태 비교
+
+    Returns:
+        (새로 생기거나 크기/mtime이 바뀐 파일, 삭제된 파일 경로)
+    """
+    upserts = []
+    seen = set()
+    for f in files:
+        key = normalize_nas_path(f["file_path"])
+        seen.add(key)
+        if known.get(key) != [f["file_size_bytes"], f["file_mtime"]]:
+            upserts.append(f)
+    deletes = [path for path in known if path not in seen]
+    return upserts, deletes
+
+
+class StaleCursorError(Exception):
+    """서버가 커서 또는 scan_id를 거부함 (409)"""
+
+
+def post_delta(api_url: str, body: dict) -> dict:
+    """delta sync API 호출"""
+    response = requests.post(f"{api_url}/api/v1/catalog/sync/delta", json=body, timeout=120)
+    if response.status_code == 409:
+        raise StaleCursorError(response.text)
+    response.raise_for_status()
+    return response.json()
+
+
+def _new_result() -> dict:
+    return {"created": 0, "updated": 0, "deleted": 0, "skipped": 0, "errors": 0}
+
+
+def _accumulate(total_result: dict, result: dict) -> None:
+    for key in total_result:
+        total_result[key] += result.get(key, 0)
+    for msg in result.get("error_messages", [])[:5]:
+        print(f"  Error: {msg}")
+
+
+def sync_delta(
+    api_url: str, cursor: str, upserts: list[dict], deletes: list[str], batch_size: int
+) -> tuple[dict, str]:
+    """
+    변경분만 동기화 (배치마다 받은 새 커서로 이어서 전송)
+
+    Returns:
+        (합계 결과, 마지막 커서)
+
+    Raises:
+        StaleCursorError: 서버가 커서를 거부함
+    """
+    total_result = _new_result()
+    changes = [("upserts", f) for f in upserts] + [("deletes", p) for p in deletes]
+
+    # 변경이 없어도 빈 delta 한 번으로 커서가 아직 유효한지 확인
+    for i in range(0, max(len(changes), 1), batch_size):
+        body = {"cursor": cursor, "upserts": [], "deletes": []}
+        for kind, value in changes[i:i + batch_size]:
+            body[kind].append(value)
+        print(f"Delta batch {i // batch_size + 1}: "
+              f"{len(body['upserts'])} changed, {len(body['deletes'])} deleted...")
+        result = post_delta(api_url, body)
+        _accumulate(total_result, result)
+        cursor = result["cursor"]
+
+    return total_result, cursor
+
+
+def sync_full(api_url: str, files: list[dict], batch_size: int) -> tuple[dict, str]:
+    """
+    전체 스캔 동기화 (같은 scan_id로 나눠 보내고 마지막 배치에서 서버가 정리)
+
+    Returns:
+        (합계 결과, 새 커서)
+    """
+    total_result = _new_result()
+    scan_id = uuid.uuid4().hex
+    cursor = None
+
+    for i in range(0, max(len(files), 1), batch_size):
         batch = files[i:i + batch_size]
-        print(f"Syncing batch {i // batch_size + 1}: {len(batch)} files...")
-
-        try:
-            response = requests.post(
-                f"{api_url}/api/v1/catalog/sync",
-                json={"files": batch},
-                timeout=120,
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                total_result["created"] += result.get("created", 0)
-                total_result["updated"] += result.get("updated", 0)
-                total_result["deleted"] += result.get("deleted", 0)
-                total_result["skipped"] += result.get("skipped", 0)
-                total_result["errors"] += result.get("errors", 0)
-
-                if result.get("error_messages"):
-                    for msg in result["error_messages"][:5]:
-                        print(f"  Error: {msg}")
-            else:
-                print(f"Error: API returned {response.status_code}")
-                print(response.text)
-                total_result["errors"] += len(batch)
-
-        except requests.RequestException as e:
-            print(f"Error: {e}")
-            total_result["errors"] += len(batch)
-
-    return total_result
+        print(f"Full scan batch {i // batch_size + 1}: {len(batch)} files...")
+        result = post_delta(api_url, {
+            "scan_id": scan_id,
+            "final": i + batch_size >= len(files),
+            "upserts": batch,
+        })
+        _accumulate(total_result, result)
+        cursor = result.get("cursor")
+
+    return total_result, cursor
+
+
+def sync_to_api(
+    api_url: str,
+    files: list[dict],
+    state_file: str | None = None,
+    full: bool = False,
+    batch_size: int = 500,
+) -> dict:
+    """API로 파일 목록 동기화 (state 파일이 있으면 변경분만)"""
+    state = load_state(state_file, api_url) if state_file and not full else None
+
+    try:
+        if state and state["cursor"]:
+            upserts, deletes = diff_files(files, state["files"])
+            try:
+                result, cursor = sync_delta(api_url, state["cursor"], upserts, deletes, batch_size)
+            except StaleCursorError:
+                print("Sync cursor rejected by server, running full scan...")
+                result, cursor = sync_full(api_url, files, batch_size)
+        else:
+            result, cursor = sync_full(api_url, files, batch_size)
+    except (requests.RequestException, StaleCursorError) as e:
+        # 일부만 반영되었을 수 있으므로 상태를 저장하지 않음 (다음 실행은 커서 거부 → 전체 스캔)
+        print(f"Error: {e}")
+        result = _new_result()
+        result["errors"] = len(files)
+        return result
+
+    if state_file and cursor:
+        save_state(state_file, api_url, cursor, files)
+    return result
 
 
 def main():
@@ -123,6 +263,16 @@ def main():
         action="store_true",
         help="스캔만 하고 동기화하지 않음",
     )
+    parser.add_argument(
+        "--state-file",
+        default=".nas_sync_state.json",
+        help="마지막 동기화 상태 파일 (기본값: .nas_sync_state.json, 빈 값이면 매번 전체 스캔)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="state 파일을 무시하고 전체 스캔으로 동기화",
+    )
 
     args = parser.parse_args()
 
@@ -145,7 +295,7 @@ def main():
 
     # API 동기화
     print(f"\nSyncing to {args.api_url}...")
-    result = sync_to_api(args.api_url, files)
+    result = sync_to_api(args.api_url, files, state_file=args.state_file, full=args.full)
 
     print("\n=== Sync Result ===")
     print(f"Created: {result['created']}")
@@ -3,6 +3,8 @@
 NAS 파일 스캔 및 카탈로그 동기화 스크립트
 
 Z:/ARCHIVE 폴더의 비디오 파일을 스캔하여 Block F 카탈로그 API로 동기화합니다.
+전체 스캔 모드(/catalog/sync/delta + scan_id)로 보내므로 배치를 나눠도
+마지막 배치에서만 NAS에 없는 항목이 정리됩니다.
 """
 
 import os
@@ -19,6 +21,16 @@ API_BASE_URL = "http://localhost:8002/api/v1"
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"}
 BATCH_SIZE = 2000  # 전체 파일을 한 번에 동기화
 
+# 경로 기반 NAS 파일 ID 네임스페이스 (서버 flat_catalog.models와 동일해야 함)
+NAS_FILE_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://wsoptv/nas-file")
+
+
+def normalize_nas_path(file_path: str) -> str:
+    """NAS 파일 경로 정규화 (서버 flat_catalog.models.normalize_nas_path와 동일)"""
+    parts = [p for p in file_path.replace("\\", "/").split("/") if p]
+    prefix = "/" if file_path.startswith(("/", "\\")) else ""
+    return (prefix + "/".join(parts)).lower()
+
 
 def scan_video_files(base_path: str) -> Generator[dict, None, None]:
     """비디오 파일 스캔"""
@@ -40,23 +52,24 @@ def scan_video_files(base_path: str) -> Generator[dict, None, None]:
             try:
                 stat = file_path.stat()
                 yield {
-                    "id": str(uuid.uuid4()),
+                    "id": str(uuid.uuid5(NAS_FILE_NAMESPACE, normalize_nas_path(str(file_path)))),
                     "file_path": str(file_path),
                     "file_name": file,
                     "file_size_bytes": stat.st_size,
                     "file_extension": ext.lstrip('.').upper(),
                     "file_category": "VIDEO",
                     "is_hidden_file": False,
+                    "file_mtime": stat.st_mtime,
                 }
             except OSError as e:
                 print(f"  [SKIP] {file_path}: {e}")
 
 
-def sync_batch(files: list[dict]) -> dict:
-    """배치 동기화 API 호출"""
+def sync_batch(files: list[dict], scan_id: str, final: bool) -> dict:
+    """배치 동기화 API 호출 (전체 스캔의 한 배치)"""
     response = requests.post(
-        f"{API_BASE_URL}/catalog/sync",
-        json={"files": files},
+        f"{API_BASE_URL}/catalog/sync/delta",
+        json={"scan_id": scan_id, "final": final, "upserts": files},
         timeout=120,
     )
     response.raise_for_status()
@@ -92,6 +105,7 @@ def main():
     total_updated = 0
     total_skipped = 0
     total_errors = 0
+    scan_id = uuid.uuid4().hex
 
     for i in range(0, len(files), BATCH_SIZE):
         batch = files[i:i + BATCH_SIZE]
@@ -101,7 +115,7 @@ def main():
         print(f"   배치 {batch_num}/{total_batches} ({len(batch)}개)...", end=" ")
 
         try:
-            result = sync_batch(batch)
+            result = sync_batch(batch, scan_id, final=batch_num == total_batches)
             total_created += result["created"]
             total_updated += result["updated"]
             total_skipped += result["skipped"]
@@ -112,8 +126,12 @@ def main():
                 for err in result["error_messages"][:3]:
                     print(f"      [WARN] {err}")
         except requests.RequestException as e:
+            # 배치가 빠진 채로 final을 보내면 그 파일들이 삭제되므로 스캔 중단
+            # (서버의 스캔 상태는 final 없이 만료됨 - 다음 실행에서 처음부터 다시)
             print(f"FAIL: {e}")
-            total_errors += len(batch)
+            print("   [ABORT] 전송 실패로 동기화를 중단합니다 (삭제 정리 안 함)")
+            total_errors += len(files) - i
+            break
 
     # 결과 출력
     print()
@@ -124,6 +124,7 @@ class AdminService:
         # Cache Block 이벤트
         await self._bus.subscribe("cache.hit", self._on_cache_hit)
         await self._bus.subscribe("cache.miss", self._on_cache_miss)
+        await self._bus.subscribe("cache.miss_batch", self._on_cache_miss_batch)
 
         # Content Block 이벤트
         await self._bus.subscribe("content.viewed", self._on_content_viewed)
@@ -186,6 +187,10 @@ class AdminService:
         """캐시 미스 이벤트 핸들러"""
         self._stats["cache_misses"] += 1
 
+    async def _on_cache_miss_batch(self, msg: BlockMessage):
+        """다중 조회 캐시 미스 이벤트 핸들러 (미스된 키 수만큼 집계)"""
+        self._stats["cache_misses"] += msg.payload.get("count", 1)
+
     async def _on_content_viewed(self, msg: BlockMessage):
         """콘텐츠 조회 이벤트 핸들러"""
         pass  # 콘텐츠 조회 통계 추적 가능
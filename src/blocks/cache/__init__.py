@@ -7,14 +7,22 @@ L3: Limiter (Rate limiting, 동시 스트리밍 제한)
 L4: NAS (Cold content, 18TB)
 """
 
-from .models import BandwidthInfo, CacheEntry, CacheTier, HotContent, StreamSlot
+from .models import (
+    BandwidthInfo,
+    CachedValue,
+    CacheEntry,
+    CacheTier,
+    SSDCacheEntry,
+    StreamSlot,
+)
 from .service import CacheService
 
 __all__ = [
     "CacheTier",
     "CacheEntry",
-    "HotContent",
+    "CachedValue",
     "StreamSlot",
+    "SSDCacheEntry",
     "BandwidthInfo",
     "CacheService",
 ]
@@ -0,0 +1,68 @@
+"""
+L2 Admission Policy - 크기를 고려한 TinyLFU 승격 필터
+
+SSD 용량이 부족할 때 후보를 받아들이려면 퇴출될 항목들이 있어야 한다.
+후보의 최근 빈도가 퇴출 대상들의 빈도 합보다 클 때만 승격한다.
+- 한 번 몰아본 컨텐츠가 꾸준히 인기 있는 카탈로그를 밀어내지 못함
+- 큰 파일일수록 퇴출 대상이 많아져 기준이 높아짐 (40GB 녹화본 1개 vs 인기 클립 여러 개)
+"""
+
+from dataclasses import dataclass, field
+
+from .popularity import PopularityTracker
+from .tiers import L2SSDCache
+
+
+@dataclass
+class AdmissionDecision:
+    """승격 판정 결과"""
+    admitted: bool
+    candidate_frequency: int
+    victim_frequency: int = 0
+    victims: list[str] = field(default_factory=list)
+
+
+class SizeAwareTinyLFU:
+    """L2SSDCache 앞단 승격 필터"""
+
+    def __init__(self, popularity: PopularityTracker, l2: L2SSDCache):
+        """
+        Args:
+            popularity: 빈도 추정기 (최근 7일 조회수)
+            l2: 승격 대상 SSD 캐시
+        """
+        self.popularity = popularity
+        self.l2 = l2
+
+    def evaluate(self, content_id: str, size_bytes: int) -> AdmissionDecision:
+        """
+        승격 여부 판정
+
+        Args:
+            content_id: 후보 컨텐츠 ID
+            size_bytes: 후보 파일 크기
+
+        Returns:
+            AdmissionDecision: 판정 결과 (퇴출 대상 포함)
+        """
+        candidate = self.popularity.estimate(content_id)
+
+        if size_bytes > self.l2.max_bytes:
+            return AdmissionDecision(admitted=False, candidate_frequency=candidate)
+
+        victims = self.l2.eviction_candidates(size_bytes, exclude=content_id)
+        if not victims:
+            # 여유 공간이 있으면 항상 승격
+            return AdmissionDecision(admitted=True, candidate_frequency=candidate)
+
+        victim_frequency = sum(self.popularity.estimate(v) for v in victims)
+        return AdmissionDecision(
+            admitted=candidate > victim_frequency,
+            candidate_frequency=candidate,
+            victim_frequency=victim_frequency,
+            victims=victims,
+        )
+
+    def admit(self, content_id: str, size_bytes: int) -> bool:
+        """승격 허용 여부"""
+        return self.evaluate(content_id, size_bytes).admitted
@@ -2,9 +2,12 @@
 Cache Block Models - 4-Tier Cache 데이터 모델
 """
 
+import math
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 
@@ -24,37 +27,77 @@ class CacheEntry:
     tier: CacheTier
     ttl: int
     created_at: datetime = field(default_factory=datetime.now)
+    expires_at: float = 0.0  # time.monotonic() 기준 만료 시각 (0이면 생성 시 계산)
+    size_bytes: int = 0  # 추정 메모리 크기 (용량 제한용)
 
-    def is_expired(self) -> bool:
-        """TTL 만료 확인"""
-        elapsed = (datetime.now() - self.created_at).total_seconds()
-        return elapsed > self.ttl
+    def __post_init__(self):
+        if not self.expires_at:
+            self.expires_at = time.monotonic() + self.ttl
+
+    def is_expired(self, now: float | None = None) -> bool:
+        """TTL 만료 확인 (monotonic clock, 시스템 시각 변경에 영향 없음)"""
+        if now is None:
+            now = time.monotonic()
+        return now > self.expires_at
+
+
+@dataclass
+class CachedValue:
+    """
+    Soft TTL 엔벨로프 (stale-while-revalidate)
+
+    soft_expires_at이 지나면 값은 stale이지만 L1의 hard TTL까지는 계속 반환되고,
+    그 사이에 백그라운드 갱신이 일어난다. 여러 프로세스가 Redis를 공유하므로
+    시각은 wall clock(time.time()) 기준이다.
+    """
+    value: Any
+    soft_expires_at: float  # time.time() 기준 soft 만료 시각
+    delta: float = 0.0  # 마지막 로딩 소요 시간 (초, XFetch 가중치)
+
+    def is_stale(self, now: float) -> bool:
+        """soft TTL 경과 여부"""
+        return now >= self.soft_expires_at
+
+    def should_refresh(self, now: float, beta: float, rand: float) -> bool:
+        """
+        갱신 필요 여부 (XFetch 확률적 조기 만료)
+
+        now - delta * beta * ln(rand) >= soft_expires_at 이면 갱신한다.
+        로딩이 오래 걸리는 키일수록, soft 만료가 가까울수록 일찍 갱신될 확률이 높다.
+
+        Args:
+            now: 현재 시각 (time.time())
+            beta: 조기 갱신 강도 (0이면 soft TTL 경과 시에만 갱신)
+            rand: (0, 1] 구간 난수
+        """
+        if self.is_stale(now):
+            return True
+        if beta <= 0 or self.delta <= 0 or rand <= 0:
+            return False
+        return now - self.delta * beta * math.log(rand) >= self.soft_expires_at
 
 
 @dataclass
 class StreamSlot:
-    """스트리밍 슬롯 (동시 스트리밍 제한용)"""
+    """
+    스트리밍 슬롯 (동시 스트리밍 제한용)
+
+    lease_id로 해제/heartbeat하며, expires_at까지 heartbeat가 없으면 자동 해제된다.
+    """
     user_id: str
     content_id: str
     acquired_at: datetime = field(default_factory=datetime.now)
+    lease_id: str = ""
+    expires_at: float = 0.0  # epoch seconds
 
 
 @dataclass
-class HotContent:
-    """Hot content 추적 (7일 내 5회 이상 조회 시 SSD 승격)"""
+class SSDCacheEntry:
+    """L2 SSD 캐시 파일 항목"""
     content_id: str
-    view_count: int = 0
-    last_viewed: datetime = field(default_factory=datetime.now)
-
-    def record_view(self) -> None:
-        """조회 기록"""
-        self.view_count += 1
-        self.last_viewed = datetime.now()
-
-    def is_hot(self) -> bool:
-        """Hot content 판정 (7일 내 5회 이상)"""
-        days_elapsed = (datetime.now() - self.last_viewed).days
-        return self.view_count >= 5 and days_elapsed <= 7
+    path: Path
+    size_bytes: int
+    last_access: float  # epoch seconds (파일 mtime으로 영속화)
 
 
 @dataclass
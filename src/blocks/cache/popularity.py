@@ -0,0 +1,127 @@
+"""
+Popularity Tracker - 시간 창 기반 Hot content 감지
+
+- 하루 단위 버킷 N개 (기본 7일) 슬라이딩 윈도우
+- 버킷마다 count-min sketch → 컨텐츠 수와 무관한 고정 메모리
+- 오래된 버킷은 다음 기록 시 재사용 (lazy reset)
+"""
+
+import hashlib
+import time
+from array import array
+from collections.abc import Callable
+
+
+class CountMinSketch:
+    """
+    Count-min sketch (빈도 추정, 과대 추정만 발생)
+
+    메모리: width * depth * 4 바이트
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        """
+        Args:
+            width: 행당 카운터 수 (클수록 충돌 감소)
+            depth: 해시 함수(행) 수
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        if depth > 8:
+            raise ValueError("depth must be <= 8")
+
+        self.width = width
+        self.depth = depth
+        self._counters = array("I", bytes(4 * width * depth))
+
+    def _indexes(self, key: str) -> list[int]:
+        # 프로세스 간 동일한 결과를 위해 hash() 대신 blake2b 사용
+        digest = hashlib.blake2b(key.encode(), digest_size=8 * self.depth).digest()
+        return [
+            row * self.width
+            + int.from_bytes(digest[row * 8:(row + 1) * 8], "little") % self.width
+            for row in range(self.depth)
+        ]
+
+    def add(self, key: str, count: int = 1) -> None:
+        """빈도 증가"""
+        for i in self._indexes(key):
+            self._counters[i] = min(self._counters[i] + count, 0xFFFFFFFF)
+
+    def estimate(self, key: str) -> int:
+        """빈도 추정값"""
+        return min(self._counters[i] for i in self._indexes(key))
+
+    def clear(self) -> None:
+        """모든 카운터 초기화"""
+        self._counters = array("I", bytes(4 * self.width * self.depth))
+
+
+class PopularityTracker:
+    """슬라이딩 윈도우 조회수 추적 (최근 window_days일)"""
+
+    DEFAULT_WINDOW_DAYS = 7
+    DEFAULT_HOT_THRESHOLD = 5
+    BUCKET_SECONDS = 86400
+
+    def __init__(
+        self,
+        window_days: int = DEFAULT_WINDOW_DAYS,
+        hot_threshold: int = DEFAULT_HOT_THRESHOLD,
+        width: int = 2048,
+        depth: int = 4,
+        bucket_seconds: int = BUCKET_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            window_days: 윈도우 버킷 수 (일)
+            hot_threshold: Hot 판정 최소 조회수
+            width: sketch 행당 카운터 수
+            depth: sketch 해시 함수 수
+            bucket_seconds: 버킷 하나의 길이 (초)
+            clock: 시계 (테스트 주입용)
+        """
+        if window_days < 1:
+            raise ValueError("window_days must be positive")
+
+        self.window_days = window_days
+        self.hot_threshold = hot_threshold
+        self.bucket_seconds = bucket_seconds
+        self._clock = clock
+
+        self._sketches = [CountMinSketch(width, depth) for _ in range(window_days)]
+        # 슬롯별로 현재 담고 있는 버킷 번호 (-1이면 비어 있음)
+        self._bucket_ids = [-1] * window_days
+
+    def _current_bucket(self) -> int:
+        return int(self._clock() // self.bucket_seconds)
+
+    def _live_slots(self) -> list[int]:
+        """윈도우 안에 있는 슬롯 인덱스"""
+        oldest = self._current_bucket() - self.window_days + 1
+        return [slot for slot, bucket in enumerate(self._bucket_ids) if bucket >= oldest]
+
+    def record(self, content_id: str, count: int = 1) -> None:
+        """조회 기록"""
+        bucket = self._current_bucket()
+        slot = bucket % self.window_days
+        if self._bucket_ids[slot] != bucket:
+            # 윈도우를 벗어난 버킷 재사용
+            self._sketches[slot].clear()
+            self._bucket_ids[slot] = bucket
+        self._sketches[slot].add(content_id, count)
+
+    def estimate(self, content_id: str) -> int:
+        """윈도우 내 조회수 추정값"""
+        return sum(self._sketches[slot].estimate(content_id) for slot in self._live_slots())
+
+    def is_hot(self, content_id: str) -> bool:
+        """윈도우 내 hot_threshold회 이상 조회 여부"""
+        return self.estimate(content_id) >= self.hot_threshold
+
+    def clear(self) -> None:
+        """모든 기록 삭제"""
+        for sketch in self._sketches:
+            sketch.clear()
+        self._bucket_ids = [-1] * self.window_days
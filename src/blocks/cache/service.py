@@ -2,37 +2,78 @@
 Cache Service - 4-Tier Cache 통합 서비스
 """
 
-from datetime import datetime
+import asyncio
+import logging
+import os
+import random
+import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
-from .models import BandwidthInfo, CacheTier, HotContent
-from .tiers import L1RedisCache, L2SSDCache, L3Limiter, L4NASCache
+from .admission import SizeAwareTinyLFU
+from .models import BandwidthInfo, CachedValue, CacheTier
+from .popularity import PopularityTracker
+from .tiers import (
+    HLSSegmentCache,
+    L2SSDCache,
+    L3Limiter,
+    L4NASCache,
+    SeekIndexStore,
+    create_l1_cache,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class CacheService:
     """
     4-Tier Cache 통합 서비스
 
-    L1: Redis (메타데이터, 세션) → TTL 600초
+    L1: Redis (메타데이터, 세션) → TTL 600초 (L1_CACHE_BACKEND=redis면 실제 Redis)
     L2: SSD (Hot content) → 500GB
     L3: Limiter (Rate limit) → 사용자당 3개 스트리밍
     L4: NAS (Cold content) → 18TB
+
+    segments: HLS 패키지 SSD 캐시 (워커가 패키징, Stream 블럭이 서빙)
+    seek_index: MP4 탐색 인덱스 sidecar (워커가 추출, Stream 블럭이 조회)
     """
 
     def __init__(self):
         """초기화"""
-        self.l1 = L1RedisCache()
+        self.l1 = create_l1_cache()
         self.l2 = L2SSDCache()
+        # 동시 스트리밍 lease - StreamService가 공유해 획득/heartbeat/해제를 담당
         self.l3 = L3Limiter(max_streams_per_user=3)
         self.l4 = L4NASCache()
 
-        # Hot content 추적
-        self._hot_content: dict[str, HotContent] = {}
+        # HLS 패키지 (fMP4 세그먼트) - L2와 별도 용량/퇴출
+        self.segments = HLSSegmentCache()
+
+        # MP4 키프레임 인덱스 (시각 → 바이트 오프셋)
+        self.seek_index = SeekIndexStore()
+
+        # Hot content 추적 (최근 7일 조회수, 고정 메모리)
+        self.popularity = PopularityTracker()
+
+        # 키별 진행 중인 로더 (single-flight, 백그라운드 갱신 포함)
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        # soft TTL 판정용 시계 / XFetch 난수 (테스트 주입용)
+        self._clock = time.time
+        self._random = random.random
 
         # MessageBus (이벤트 발행용)
         self._bus = None
 
+    async def start(self) -> None:
+        """백그라운드 작업 시작 (L1 만료 정리 / near-cache 무효화 구독)"""
+        await self.l1.start()
+
+    async def stop(self) -> None:
+        """백그라운드 작업 중지"""
+        await self.l1.stop()
+
     def _get_bus(self):
         """MessageBus 인스턴스 lazy loading"""
         if self._bus is None:
@@ -48,11 +89,17 @@ class CacheService:
             캐시 값 또는 None
         """
         # L1 Redis 조회
-        value = await self.l1.get(key)
+        value = self._unwrap(await self.l1.get(key))
         if value is not None:
             return value
 
         # 캐시 미스 이벤트 발행
+        await self._publish_miss(key)
+
+        return None
+
+    async def _publish_miss(self, key: str) -> None:
+        """cache.miss 이벤트 발행"""
         bus = self._get_bus()
         from src.orchestration.message_bus import BlockMessage
         await bus.publish("cache.miss", BlockMessage(
@@ -61,7 +108,175 @@ class CacheService:
             payload={"key": key}
         ))
 
-        return None
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        """soft TTL 엔벨로프 제거"""
+        if isinstance(value, CachedValue):
+            return value.value
+        return value
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = 600,
+        soft_ttl: int | None = None,
+        beta: float = 0.0,
+    ) -> Any:
+        """
+        캐시 조회, 미스 시 loader로 값을 만들어 L1에 저장 (single-flight)
+
+        같은 키에 대한 동시 미스는 하나의 loader 실행을 함께 기다린다.
+        cache.miss 이벤트와 L1 저장도 loader 실행당 한 번만 일어난다.
+        loader가 실패하면 기다리던 모든 호출에 같은 예외가 전달된다.
+
+        soft_ttl 또는 beta를 지정하면 stale-while-revalidate로 동작한다.
+        soft_ttl이 지난 값(또는 XFetch로 조기 만료 판정된 값)은 즉시 반환하고
+        백그라운드에서 한 번만 갱신한다. ttl은 stale 값을 보관하는 hard TTL이다.
+
+        Args:
+            key: 캐시 키
+            loader: 값을 만드는 코루틴 함수 (DB/NAS 조회 등)
+            ttl: L1 hard TTL (초)
+            soft_ttl: 갱신 시작 시점 (초, None이면 ttl)
+            beta: XFetch 조기 갱신 강도 (0이면 비활성, 보통 1.0)
+
+        Returns:
+            캐시 값 또는 loader 결과
+        """
+        swr = soft_ttl is not None or beta > 0
+        if soft_ttl is None:
+            soft_ttl = ttl
+        if soft_ttl > ttl:
+            raise ValueError("soft_ttl must not exceed ttl")
+
+        cached = await self.l1.get(key)
+        if isinstance(cached, CachedValue):
+            if cached.should_refresh(self._clock(), beta, self._random()):
+                self._refresh_in_background(key, loader, ttl, soft_ttl)
+            return cached.value
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = self._start_load(
+                key, loader, ttl, soft_ttl if swr else None, publish_miss=True
+            )
+
+        # 먼저 온 호출이 취소되어도 다른 대기자의 로딩은 계속된다
+        return await asyncio.shield(inflight)
+
+    def _start_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        soft_ttl: int | None,
+        publish_miss: bool,
+    ) -> asyncio.Future:
+        inflight = asyncio.ensure_future(
+            self._load(key, loader, ttl, soft_ttl, publish_miss)
+        )
+        self._inflight[key] = inflight
+        inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return inflight
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        soft_ttl: int,
+    ) -> None:
+        """stale 값 백그라운드 갱신 (키당 동시에 하나만)"""
+        if key in self._inflight:
+            return
+
+        def _log_failure(task: asyncio.Future) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(f"Background refresh failed for {key}: {task.exception()}")
+
+        task = self._start_load(key, loader, ttl, soft_ttl, publish_miss=False)
+        task.add_done_callback(_log_failure)
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        soft_ttl: int | None,
+        publish_miss: bool,
+    ) -> Any:
+        if publish_miss:
+            await self._publish_miss(key)
+
+        started = self._clock()
+        value = await loader()
+        if value is None:
+            return None
+
+        if soft_ttl is None:
+            await self.l1.set(key, value, ttl)
+        else:
+            now = self._clock()
+            await self.l1.set(
+                key,
+                CachedValue(
+                    value=value,
+                    soft_expires_at=now + soft_ttl,
+                    delta=max(now - started, 0.0),
+                ),
+                ttl,
+            )
+        return value
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any | None]:
+        """
+        다중 캐시 조회 (L1 1회 왕복)
+
+        get()과 같은 키별 결과를 반환하며, 미스는 키마다 이벤트를 발행하지 않고
+        cache.miss_batch 이벤트 하나로 묶어서 발행한다.
+
+        Returns:
+            dict: 요청한 키 순서대로 키 → 값 (미스는 None)
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        found = await self.l1.get_many(unique_keys)
+        results = {key: self._unwrap(found.get(key)) for key in unique_keys}
+
+        missed = [key for key, value in results.items() if value is None]
+        if missed:
+            bus = self._get_bus()
+            from src.orchestration.message_bus import BlockMessage
+            await bus.publish("cache.miss_batch", BlockMessage(
+                source_block="cache",
+                event_type="cache.miss_batch",
+                payload={"keys": missed, "count": len(missed)}
+            ))
+
+        return results
+
+    async def set_many(
+        self, items: dict[str, Any], ttl: int = 600, tier: CacheTier | None = None
+    ) -> None:
+        """
+        다중 캐시 저장
+
+        Args:
+            items: 키 → 값
+            ttl: TTL (초)
+            tier: 캐시 티어 (None이면 L1)
+        """
+        if tier is None or tier == CacheTier.L1:
+            await self.l1.set_many(items, ttl)
+
+    async def invalidate_many(self, keys: list[str]) -> None:
+        """다중 캐시 무효화 (삭제)"""
+        await self.l1.delete_many(list(dict.fromkeys(keys)))
 
     async def set(
         self, key: str, value: Any, ttl: int = 600, tier: CacheTier | None = None
@@ -86,7 +301,7 @@ class CacheService:
             (값, 티어) 또는 (None, None)
         """
         # L1 조회
-        value = await self.l1.get(key)
+        value = self._unwrap(await self.l1.get(key))
         if value is not None:
             return value, CacheTier.L1
 
@@ -117,35 +332,76 @@ class CacheService:
         """
         컨텐츠 접근 기록 (Hot content 감지용)
 
-        7일 내 5회 이상 조회 시 Hot content로 분류
+        최근 7일 내 5회 이상 조회 시 Hot content로 분류
         """
-        if content_id not in self._hot_content:
-            self._hot_content[content_id] = HotContent(content_id=content_id)
-
-        self._hot_content[content_id].record_view()
+        self.popularity.record(content_id)
 
     async def is_hot_content(self, content_id: str) -> bool:
-        """Hot content 여부 확인"""
-        if content_id not in self._hot_content:
-            return False
+        """Hot content 여부 확인 (최근 7일 조회수 기준)"""
+        return self.popularity.is_hot(content_id)
+
+    async def admit_to_l2(self, content_id: str, size_bytes: int) -> bool:
+        """
+        SSD(L2) 승격 판정 및 공간 예약
+
+        SSD 공간이 부족하면 TinyLFU 승격 필터를 거친다. 후보의 최근 조회수가
+        퇴출될 항목들의 조회수 합보다 커야 승격된다. 승격되면 복사가 끝날 때까지
+        size_bytes를 L2에 예약한다 (등록 또는 l2.release 시 해제).
 
-        return self._hot_content[content_id].is_hot()
+        이벤트 발행: cache.ssd_rejected (거절 시)
+
+        Args:
+            content_id: 후보 컨텐츠 ID
+            size_bytes: 후보 파일 크기
 
-    async def mark_as_hot(self, content_id: str, file_path: str) -> None:
+        Returns:
+            bool: 승격 여부
+        """
+        decision = SizeAwareTinyLFU(self.popularity, self.l2).evaluate(content_id, size_bytes)
+        if decision.admitted and await self.l2.reserve(content_id, size_bytes):
+            return True
+
+        bus = self._get_bus()
+        from src.orchestration.message_bus import BlockMessage
+        await bus.publish("cache.ssd_rejected", BlockMessage(
+            source_block="cache",
+            event_type="cache.ssd_rejected",
+            payload={
+                "content_id": content_id,
+                "size_bytes": size_bytes,
+                "candidate_frequency": decision.candidate_frequency,
+                "victim_frequency": decision.victim_frequency,
+            }
+        ))
+        return False
+
+    async def mark_as_hot(self, content_id: str, file_path: str) -> bool:
         """
         Hot content로 표시 및 SSD(L2)로 승격
 
-        이벤트 발행: cache.ssd_promoted
+        SSD에 없는 컨텐츠는 admit_to_l2 승격 필터를 거친다.
+
+        이벤트 발행: cache.ssd_promoted / cache.ssd_rejected
+
+        Returns:
+            bool: 승격 여부
         """
+        if not await self.l2.exists(content_id):
+            size = (await asyncio.to_thread(os.stat, file_path)).st_size
+            if not await self.admit_to_l2(content_id, size):
+                return False
+
         # SSD에 저장
-        await self.l2.store(content_id, file_path)
+        try:
+            await self.l2.store(content_id, file_path)
+        except BaseException:
+            self.l2.release(content_id)
+            raise
 
-        # Hot content 기록
-        if content_id not in self._hot_content:
-            self._hot_content[content_id] = HotContent(content_id=content_id, view_count=5)
-        else:
-            current = self._hot_content[content_id].view_count
-            self._hot_content[content_id].view_count = max(5, current)
+        # 현재 윈도우에서 Hot 판정이 유지되도록 부족분만 기록
+        shortfall = self.popularity.hot_threshold - self.popularity.estimate(content_id)
+        if shortfall > 0:
+            self.popularity.record(content_id, shortfall)
 
         # SSD 승격 이벤트 발행
         bus = self._get_bus()
@@ -155,6 +411,7 @@ class CacheService:
             event_type="cache.ssd_promoted",
             payload={"content_id": content_id}
         ))
+        return True
 
     async def get_content_tier(self, content_id: str) -> CacheTier:
         """컨텐츠가 저장된 티어 확인"""
@@ -181,21 +438,6 @@ class CacheService:
         path = await self.l4.get_path(content_id)
         return path
 
-    async def acquire_stream_slot(self, user_id: str) -> tuple[bool, str | None]:
-        """
-        스트리밍 슬롯 획득 (L3 Limiter)
-
-        Returns:
-            (성공 여부, 실패 사유)
-        """
-        # 임시 content_id (실제로는 요청에서 받아야 함)
-        content_id = f"stream_{user_id}_{datetime.now().timestamp()}"
-        return await self.l3.acquire_slot(user_id, content_id)
-
-    async def release_stream_slot(self, user_id: str) -> None:
-        """스트리밍 슬롯 해제"""
-        await self.l3.release_slot(user_id)
-
     async def get_user_bandwidth(self, user_id: str) -> BandwidthInfo:
         """사용자 대역폭 정보 조회"""
         return await self.l3.get_bandwidth_info(user_id)
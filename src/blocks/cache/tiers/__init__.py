@@ -3,13 +3,24 @@ Cache Tiers - 4-Tier 캐시 계층 구현
 """
 
 from .l1_redis import L1RedisCache
+from .l1_redis_backend import L1RedisBackend, create_l1_cache
 from .l2_ssd import L2SSDCache
 from .l3_limiter import L3Limiter
 from .l4_nas import L4NASCache
+from .seek_index import SeekIndexStore
+from .segment_cache import HLSSegmentCache
+from .slot_store import MemorySlotStore, RedisSlotStore, create_slot_store
 
 __all__ = [
     "L1RedisCache",
+    "L1RedisBackend",
+    "create_l1_cache",
     "L2SSDCache",
     "L3Limiter",
     "L4NASCache",
+    "HLSSegmentCache",
+    "SeekIndexStore",
+    "MemorySlotStore",
+    "RedisSlotStore",
+    "create_slot_store",
 ]
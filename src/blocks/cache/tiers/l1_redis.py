@@ -1,62 +1,224 @@
 """
 L1 Redis Cache - 메모리 캐시 (TTL 관리)
+
+- 엔트리 수 / 바이트 용량 제한 (O(1) LRU 퇴출)
+- monotonic clock 기반 TTL
+- 만료 힙을 이용한 백그라운드 만료 정리 (소량 배치 단위)
 """
 
-from datetime import datetime
+import asyncio
+import heapq
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from ..models import CacheEntry, CacheTier
 
 
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """값의 대략적인 메모리 크기 (바이트)"""
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, list | tuple | set | frozenset):
+        size += sum(estimate_size(v, _depth + 1) for v in value)
+    return size
+
+
 class L1RedisCache:
     """Redis 기반 L1 캐시 (인메모리 Mock 구현)"""
 
-    def __init__(self):
-        """초기화"""
-        self._storage: dict[str, CacheEntry] = {}
+    DEFAULT_MAX_ENTRIES = 10_000
 
-    async def get(self, key: str) -> Any | None:
-        """캐시 조회"""
-        if key not in self._storage:
-            return None
+    def __init__(
+        self,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: 최대 엔트리 수 (None이면 제한 없음)
+            max_bytes: 최대 추정 메모리 크기 (None이면 제한 없음)
+            clock: 만료 판정용 시계 (테스트 주입용)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+
+        # LRU 순서 (앞쪽이 가장 오래 전에 사용된 항목)
+        self._storage: OrderedDict[str, CacheEntry] = OrderedDict()
+        # (expires_at, key) 최소 힙 - 갱신된 키의 이전 항목은 정리 시 무시
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._bytes = 0
+
+        self._sweeper: asyncio.Task | None = None
 
-        entry = self._storage[key]
+        # 통계
+        self.evictions = 0
+        self.expirations = 0
 
-        # TTL 만료 확인
-        if entry.is_expired():
-            await self.delete(key)
+    def __len__(self) -> int:
+        return len(self._storage)
+
+    @property
+    def size_bytes(self) -> int:
+        """현재 추정 메모리 사용량"""
+        return self._bytes
+
+    def _remove(self, key: str) -> CacheEntry | None:
+        entry = self._storage.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size_bytes
+        return entry
+
+    def _get_live(self, key: str) -> CacheEntry | None:
+        entry = self._storage.get(key)
+        if entry is None:
             return None
+        if entry.is_expired(self._clock()):
+            self._remove(key)
+            self.expirations += 1
+            return None
+        return entry
 
+    async def get(self, key: str) -> Any | None:
+        """캐시 조회"""
+        entry = self._get_live(key)
+        if entry is None:
+            return None
+
+        self._storage.move_to_end(key)
         return entry.value
 
     async def set(self, key: str, value: Any, ttl: int = 600) -> None:
         """캐시 저장"""
+        expires_at = self._clock() + ttl
         entry = CacheEntry(
             key=key,
             value=value,
             tier=CacheTier.L1,
             ttl=ttl,
-            created_at=datetime.now()
+            expires_at=expires_at,
+            size_bytes=estimate_size(value) if self.max_bytes is not None else 0,
         )
+
+        self._remove(key)
         self._storage[key] = entry
+        self._bytes += entry.size_bytes
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+        self._enforce_limits()
+
+    def _enforce_limits(self) -> None:
+        """용량 초과 시 LRU 순서로 퇴출"""
+        while self._storage and (
+            (self.max_entries is not None and len(self._storage) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, entry = self._storage.popitem(last=False)
+            self._bytes -= entry.size_bytes
+            self.evictions += 1
+
+        # 갱신/퇴출로 쌓인 힙 항목 정리
+        if len(self._expiry_heap) > 2 * len(self._storage) + 64:
+            self._expiry_heap = [(e.expires_at, k) for k, e in self._storage.items()]
+            heapq.heapify(self._expiry_heap)
 
     async def delete(self, key: str) -> None:
         """캐시 삭제"""
-        if key in self._storage:
-            del self._storage[key]
+        self._remove(key)
 
-    async def exists(self, key: str) -> bool:
-        """키 존재 확인 (만료되지 않은 경우만)"""
-        if key not in self._storage:
-            return False
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        다중 조회
 
-        entry = self._storage[key]
-        if entry.is_expired():
-            await self.delete(key)
-            return False
+        Returns:
+            dict: 존재하는 키 → 값 (미스는 포함하지 않음)
+        """
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
 
-        return True
+    async def set_many(self, items: dict[str, Any], ttl: int = 600) -> None:
+        """다중 저장"""
+        for key, value in items.items():
+            await self.set(key, value, ttl)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """다중 삭제"""
+        for key in keys:
+            self._remove(key)
+
+    async def exists(self, key: str) -> bool:
+        """키 존재 확인 (만료되지 않은 경우만)"""
+        return self._get_live(key) is not None
 
     async def clear(self) -> None:
         """모든 캐시 삭제"""
         self._storage.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
+
+    def sweep_expired(self, batch_size: int = 100) -> int:
+        """
+        만료된 키를 최대 batch_size개 삭제
+
+        Returns:
+            int: 삭제된 키 수
+        """
+        now = self._clock()
+        removed = 0
+        heap = self._expiry_heap
+
+        while heap and removed < batch_size and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._storage.get(key)
+            # 이후 다시 set된 키는 힙에 새 항목이 있으므로 건너뛴다
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                self.expirations += 1
+                removed += 1
+
+        return removed
+
+    async def _sweep_loop(self, interval: float, batch_size: int) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            # 배치 사이마다 이벤트 루프에 양보
+            while self.sweep_expired(batch_size) >= batch_size:
+                await asyncio.sleep(0)
+
+    def start_sweeper(self, interval: float = 1.0, batch_size: int = 100) -> None:
+        """백그라운드 만료 정리 시작"""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_loop(interval, batch_size))
+
+    async def stop_sweeper(self) -> None:
+        """백그라운드 만료 정리 중지"""
+        if self._sweeper is None:
+            return
+        self._sweeper.cancel()
+        try:
+            await self._sweeper
+        except asyncio.CancelledError:
+            pass
+        self._sweeper = None
+
+    async def start(self) -> None:
+        """백그라운드 작업 시작 (L1RedisBackend와 동일한 인터페이스)"""
+        self.start_sweeper()
+
+    async def stop(self) -> None:
+        """백그라운드 작업 중지"""
+        await self.stop_sweeper()
@@ -0,0 +1,267 @@
+"""
+L1 Redis Backend - 실제 Redis 기반 L1 캐시
+
+- 모든 uvicorn 워커/노드가 하나의 Redis를 공유 (워커 수와 무관한 히트율)
+- MGET / 파이프라인 기반 다중 조회·저장 (1회 왕복)
+- 프로세스별 near-cache (짧은 TTL) + pub/sub 무효화
+"""
+
+import asyncio
+import json
+import logging
+import os
+import pickle
+import uuid
+from typing import Any
+
+from .l1_redis import L1RedisCache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "wsoptv:cache:l1:invalidate"
+
+
+class L1RedisBackend:
+    """Redis 기반 L1 캐시 (L1RedisCache와 동일한 인터페이스)"""
+
+    KEY_PREFIX = "wsoptv:l1:"
+    DEFAULT_NEAR_CACHE_SIZE = 1000
+    DEFAULT_NEAR_CACHE_TTL = 5  # pub/sub 메시지 유실 시 최대 불일치 시간 (초)
+
+    def __init__(
+        self,
+        client: Any | None = None,
+        url: str | None = None,
+        near_cache_size: int = DEFAULT_NEAR_CACHE_SIZE,
+        near_cache_ttl: int = DEFAULT_NEAR_CACHE_TTL,
+        key_prefix: str = KEY_PREFIX,
+        channel: str = INVALIDATION_CHANNEL,
+    ):
+        """
+        Args:
+            client: redis.asyncio 호환 클라이언트 (fakeredis 주입 가능)
+            url: Redis URL (client가 없을 때, 기본 REDIS_URL 환경변수)
+            near_cache_size: near-cache 최대 엔트리 수 (0이면 비활성)
+            near_cache_ttl: near-cache TTL (초)
+            key_prefix: Redis 키 접두사
+            channel: 무효화 pub/sub 채널
+        """
+        if client is None:
+            import redis.asyncio as redis
+
+            client = redis.from_url(
+                url or os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+            )
+
+        self._redis = client
+        self._prefix = key_prefix
+        self._channel = channel
+        self._near_ttl = near_cache_ttl
+        self._near = L1RedisCache(max_entries=near_cache_size) if near_cache_size > 0 else None
+
+        # 자신이 발행한 무효화 메시지 구분용
+        self._node_id = uuid.uuid4().hex
+        self._pubsub: Any | None = None
+        self._listener: asyncio.Task | None = None
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    @staticmethod
+    def _dumps(value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _loads(raw: bytes) -> Any:
+        return pickle.loads(raw)
+
+    async def _near_set(self, key: str, value: Any, ttl: float) -> None:
+        if self._near is not None and ttl > 0:
+            await self._near.set(key, value, min(ttl, self._near_ttl))
+
+    async def _fetch(self, keys: list[str]) -> list[tuple[bytes | None, float]]:
+        """GET + PTTL을 파이프라인 1회 왕복으로 조회 → [(raw, 남은 TTL 초)]"""
+        pipe = self._redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(self._key(key))
+            pipe.pttl(self._key(key))
+        results = await pipe.execute()
+        return [
+            (results[i], results[i + 1] / 1000 if results[i + 1] > 0 else 0.0)
+            for i in range(0, len(results), 2)
+        ]
+
+    async def _publish_invalidation(self, keys: list[str]) -> None:
+        message = json.dumps({"node": self._node_id, "keys": keys})
+        await self._redis.publish(self._channel, message)
+
+    async def get(self, key: str) -> Any | None:
+        """캐시 조회 (near-cache → Redis)"""
+        if self._near is None:
+            raw = await self._redis.get(self._key(key))
+            return self._loads(raw) if raw is not None else None
+
+        value = await self._near.get(key)
+        if value is not None:
+            return value
+
+        [(raw, ttl)] = await self._fetch([key])
+        if raw is None:
+            return None
+
+        value = self._loads(raw)
+        await self._near_set(key, value, ttl)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = 600) -> None:
+        """캐시 저장 (다른 프로세스의 near-cache 무효화)"""
+        await self._redis.set(self._key(key), self._dumps(value), ex=ttl)
+        await self._near_set(key, value, ttl)
+        await self._publish_invalidation([key])
+
+    async def delete(self, key: str) -> None:
+        """캐시 삭제"""
+        if self._near is not None:
+            await self._near.delete(key)
+        await self._redis.delete(self._key(key))
+        await self._publish_invalidation([key])
+
+    async def exists(self, key: str) -> bool:
+        """키 존재 확인"""
+        if self._near is not None and await self._near.exists(key):
+            return True
+        return bool(await self._redis.exists(self._key(key)))
+
+    async def clear(self) -> None:
+        """접두사에 해당하는 모든 키 삭제"""
+        if self._near is not None:
+            await self._near.clear()
+
+        batch: list[str] = []
+        async for redis_key in self._redis.scan_iter(match=f"{self._prefix}*", count=500):
+            batch.append(redis_key)
+            if len(batch) >= 500:
+                await self._redis.delete(*batch)
+                batch = []
+        if batch:
+            await self._redis.delete(*batch)
+
+        await self._publish_invalidation(["*"])
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        다중 조회 (near-cache 미스분만 Redis 1회 왕복)
+
+        Returns:
+            dict: 존재하는 키 → 값 (미스는 포함하지 않음)
+        """
+        found: dict[str, Any] = {}
+        missing: list[str] = []
+
+        for key in keys:
+            value = await self._near.get(key) if self._near is not None else None
+            if value is not None:
+                found[key] = value
+            else:
+                missing.append(key)
+
+        if not missing:
+            return found
+
+        if self._near is None:
+            raws = await self._redis.mget([self._key(k) for k in missing])
+            fetched = [(raw, 0.0) for raw in raws]
+        else:
+            fetched = await self._fetch(missing)
+
+        for key, (raw, ttl) in zip(missing, fetched, strict=True):
+            if raw is None:
+                continue
+            value = self._loads(raw)
+            found[key] = value
+            await self._near_set(key, value, ttl)
+
+        return found
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 600) -> None:
+        """다중 저장 (파이프라인 1회 왕복 + 무효화 메시지 1회)"""
+        if not items:
+            return
+
+        pipe = self._redis.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._key(key), self._dumps(value), ex=ttl)
+        await pipe.execute()
+
+        for key, value in items.items():
+            await self._near_set(key, value, ttl)
+        await self._publish_invalidation(list(items))
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """다중 삭제 (DEL 1회 + 무효화 메시지 1회)"""
+        if not keys:
+            return
+        if self._near is not None:
+            for key in keys:
+                await self._near.delete(key)
+        await self._redis.delete(*[self._key(k) for k in keys])
+        await self._publish_invalidation(list(keys))
+
+    async def _handle_invalidation(self, data: bytes | str) -> None:
+        message = json.loads(data)
+        if message.get("node") == self._node_id or self._near is None:
+            return
+        for key in message.get("keys", []):
+            if key == "*":
+                await self._near.clear()
+            else:
+                await self._near.delete(key)
+
+    async def _listen(self) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                await self._handle_invalidation(message["data"])
+            except Exception as e:
+                logger.error(f"Invalid L1 invalidation message: {e}")
+
+    async def start(self) -> None:
+        """near-cache 무효화 구독 시작"""
+        if self._near is None or self._listener is not None:
+            return
+        self._pubsub = self._redis.pubsub()
+        await self._pubsub.subscribe(self._channel)
+        self._listener = asyncio.create_task(self._listen())
+        self._near.start_sweeper()
+
+    async def stop(self) -> None:
+        """구독 해제 및 백그라운드 작업 중지"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self._channel)
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._near is not None:
+            await self._near.stop_sweeper()
+
+
+def create_l1_cache() -> L1RedisCache | L1RedisBackend:
+    """
+    L1_CACHE_BACKEND 환경변수에 따라 L1 구현 선택
+
+    - "memory" (기본): 프로세스 내 Mock (테스트용)
+    - "redis": REDIS_URL의 실제 Redis
+    """
+    backend = os.environ.get("L1_CACHE_BACKEND", "memory").lower()
+    if backend == "redis":
+        return L1RedisBackend()
+    if backend != "memory":
+        raise ValueError(f"Unknown L1_CACHE_BACKEND: {backend}")
+    return L1RedisCache()
@@ -1,50 +1,309 @@
 """
 L2 SSD Cache - Hot content 캐시 (500GB)
+
+- NAS(L4) 파일을 SSD로 복사 (임시 파일 → rename 원자적 승격)
+- 실제 디스크 사용량(바이트) 추적
+- 용량 초과 시 가장 오래 스트리밍되지 않은 파일부터 LRU 퇴출
+- 복사 중인 파일 크기를 미리 예약 (동시 승격이 용량을 넘지 않도록)
+- 시작 시 캐시 디렉토리에서 인덱스 재구성
 """
 
+import asyncio
+import os
+import shutil
+import time
+from collections import OrderedDict
 from pathlib import Path
 
+from ..models import SSDCacheEntry
+
+# 복사 중인 임시 파일 접미사 (인덱스 재구성 시 제외)
+PARTIAL_SUFFIX = ".part"
+
+BYTES_PER_GB = 1024**3
+
 
 class L2SSDCache:
     """SSD 기반 L2 캐시 (Hot content 전용)"""
 
-    def __init__(self, cache_dir: str = "/cache/ssd"):
-        """초기화"""
+    # 마지막 접근 시각을 파일 mtime에 기록하는 최소 간격 (재시작 후 LRU 순서 보존용)
+    TOUCH_INTERVAL_S = 3600
+
+    def __init__(self, cache_dir: str | None = None, max_size_gb: float = 500):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 SSD_CACHE_PATH 환경변수 또는 /cache/ssd)
+            max_size_gb: 최대 캐시 용량 (GB)
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get("SSD_CACHE_PATH", "/cache/ssd")
         self.cache_dir = Path(cache_dir)
-        self._content_paths: dict[str, Path] = {}
-        self._max_size_gb = 500
+        self._max_size_gb = max_size_gb
+
+        # LRU 순서 (앞쪽이 가장 오래 전에 접근된 항목)
+        self._entries: OrderedDict[str, SSDCacheEntry] = OrderedDict()
+        self._used_bytes = 0
+        self._pending: dict[str, asyncio.Task] = {}
+        # 복사 중인 컨텐츠의 예약 용량 (등록 또는 release 시 해제)
+        self._reserved: dict[str, int] = {}
+        self._lock = asyncio.Lock()
+
+        self.load_index()
+
+    @property
+    def max_bytes(self) -> int:
+        """최대 캐시 용량 (바이트)"""
+        return int(self._max_size_gb * BYTES_PER_GB)
+
+    @property
+    def used_bytes(self) -> int:
+        """현재 사용 중인 용량 (바이트)"""
+        return self._used_bytes
+
+    @property
+    def reserved_bytes(self) -> int:
+        """복사 중인 컨텐츠에 예약된 용량 (바이트)"""
+        return sum(self._reserved.values())
+
+    def load_index(self) -> int:
+        """
+        캐시 디렉토리에서 인덱스 재구성
+
+        mtime 순으로 LRU 순서를 복원한다. 복사 도중 중단된 임시 파일은 건너뛴다.
+
+        Returns:
+            int: 인덱스된 파일 수
+        """
+        self._entries.clear()
+        self._used_bytes = 0
+
+        if not self.cache_dir.is_dir():
+            return 0
+
+        found: list[SSDCacheEntry] = []
+        for path in self.cache_dir.iterdir():
+            if not path.is_file() or path.name.endswith(PARTIAL_SUFFIX):
+                continue
+            stat = path.stat()
+            found.append(
+                SSDCacheEntry(
+                    content_id=path.stem,
+                    path=path,
+                    size_bytes=stat.st_size,
+                    last_access=stat.st_mtime,
+                )
+            )
+
+        for entry in sorted(found, key=lambda e: e.last_access):
+            self._add_entry(entry)
+
+        return len(found)
+
+    def path_for(self, content_id: str, suffix: str = ".mp4") -> Path:
+        """컨텐츠의 캐시 파일 경로"""
+        return self.cache_dir / f"{content_id}{suffix}"
+
+    def get_entry(self, content_id: str) -> SSDCacheEntry | None:
+        """인덱스 항목 조회 (LRU 접근 기록 없음)"""
+        return self._entries.get(content_id)
+
+    def _add_entry(self, entry: SSDCacheEntry) -> None:
+        old = self._entries.pop(entry.content_id, None)
+        if old is not None:
+            self._used_bytes -= old.size_bytes
+        self._entries[entry.content_id] = entry
+        self._used_bytes += entry.size_bytes
+
+    def _touch(self, entry: SSDCacheEntry) -> None:
+        now = time.time()
+        self._entries.move_to_end(entry.content_id)
+        if now - entry.last_access >= self.TOUCH_INTERVAL_S:
+            try:
+                os.utime(entry.path, (now, now))
+            except OSError:
+                pass
+        entry.last_access = now
 
     async def get_path(self, content_id: str) -> Path | None:
-        """컨텐츠 파일 경로 조회"""
-        return self._content_paths.get(content_id)
+        """컨텐츠 파일 경로 조회 (LRU 접근 기록)"""
+        entry = self._entries.get(content_id)
+        if entry is None:
+            return None
+        self._touch(entry)
+        return entry.path
 
     async def store(self, content_id: str, source_path: str) -> Path:
         """
-        Hot content를 SSD로 복사 (실제로는 경로만 저장)
+        Hot content를 SSD로 복사
+
+        1. 필요한 만큼 LRU 퇴출로 공간 확보
+        2. 임시 파일(.part)로 복사 후 fsync
+        3. rename으로 원자적 승격 (중간 상태 파일이 노출되지 않음)
+
+        Args:
+            content_id: 컨텐츠 ID
+            source_path: 원본 파일 경로 (L4 NAS)
+
+        Returns:
+            Path: SSD 캐시 파일 경로
+
+        Raises:
+            FileNotFoundError: 원본 파일 없음
+            ValueError: 파일이 캐시 전체 용량보다 큼
+        """
+        # 같은 컨텐츠의 동시 승격은 하나의 복사로 합친다
+        if content_id in self._pending:
+            return await asyncio.shield(self._pending[content_id])
+
+        task = asyncio.ensure_future(self._store(content_id, Path(source_path)))
+        self._pending[content_id] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._pending.pop(content_id, None)
+            else:
+                task.add_done_callback(lambda _: self._pending.pop(content_id, None))
+
+    async def _store(self, content_id: str, source: Path) -> Path:
+        size = (await asyncio.to_thread(source.stat)).st_size
+        if size > self.max_bytes:
+            raise ValueError(
+                f"File too large for L2 cache: {size} bytes > {self.max_bytes} bytes"
+            )
+
+        existing = self._entries.get(content_id)
+        if existing is not None and existing.size_bytes == size:
+            self._touch(existing)
+            return existing.path
+
+        if not await self.reserve(content_id, size):
+            raise ValueError(f"Not enough L2 space for {content_id}: {size} bytes")
+
+        target = self.path_for(content_id, source.suffix or ".mp4")
+        try:
+            await asyncio.to_thread(self._copy_atomic, source, target)
+        except BaseException:
+            self.release(content_id)
+            raise
+
+        if existing is not None and existing.path != target:
+            await self.delete(content_id)
+
+        return self.register(content_id, target)
+
+    @staticmethod
+    def _copy_atomic(source: Path, target: Path) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        partial = target.with_name(target.name + PARTIAL_SUFFIX)
+        try:
+            shutil.copyfile(source, partial)
+            with open(partial, "rb+") as f:
+                os.fsync(f.fileno())
+            os.replace(partial, target)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+    def register(self, content_id: str, path: Path) -> Path:
+        """
+        캐시 디렉토리에 이미 존재하는 파일을 인덱스에 등록 (예약 해제)
+
+        Args:
+            content_id: 컨텐츠 ID
+            path: 캐시 파일 경로
+
+        Returns:
+            Path: 등록된 경로
+        """
+        size = path.stat().st_size
+        self._reserved.pop(content_id, None)
+        self._add_entry(
+            SSDCacheEntry(
+                content_id=content_id,
+                path=path,
+                size_bytes=size,
+                last_access=time.time(),
+            )
+        )
+        return path
+
+    async def reserve(self, content_id: str, size_bytes: int) -> bool:
+        """
+        복사 전에 size_bytes를 예약하고 필요한 만큼 LRU 퇴출
+
+        예약은 await 전에 기록되므로 직전의 승격 판정(eviction_candidates)과
+        원자적이다. 이후 동시에 시작된 복사는 이 예약을 사용 중 용량으로 본다.
+
+        Args:
+            content_id: 컨텐츠 ID
+            size_bytes: 복사할 파일 크기
+
+        Returns:
+            bool: 예약 성공 여부 (다른 복사의 예약만으로 용량이 찬 경우 False)
+        """
+        self._reserved[content_id] = size_bytes
+        try:
+            await self.make_room(0, exclude=content_id)
+        except BaseException:
+            self.release(content_id)
+            raise
+
+        if self._used_bytes + self.reserved_bytes > self.max_bytes:
+            self.release(content_id)
+            return False
+        return True
+
+    def release(self, content_id: str) -> None:
+        """복사 실패 등으로 등록하지 않는 예약 해제"""
+        self._reserved.pop(content_id, None)
+
+    async def make_room(self, required_bytes: int, exclude: str | None = None) -> list[str]:
+        """
+        required_bytes를 추가할 수 있을 때까지 LRU 순서로 퇴출
+
+        Returns:
+            list[str]: 퇴출된 컨텐츠 ID 목록
+        """
+        evicted: list[str] = []
+        async with self._lock:
+            for content_id in self.eviction_candidates(required_bytes, exclude=exclude):
+                await self.delete(content_id)
+                evicted.append(content_id)
+        return evicted
+
+    def eviction_candidates(self, required_bytes: int, exclude: str | None = None) -> list[str]:
+        """
+        required_bytes를 확보하기 위해 퇴출해야 할 항목 (LRU 순서, 실제 삭제 없음)
 
-        실제 구현에서는:
-        1. source_path에서 SSD로 파일 복사
-        2. 용량 제한 확인 (500GB)
-        3. LRU 정책으로 오래된 파일 삭제
+        복사 중인 컨텐츠의 예약 용량도 사용 중으로 계산한다.
         """
-        # Mock: 경로만 저장
-        cache_path = self.cache_dir / f"{content_id}.mp4"
-        self._content_paths[content_id] = cache_path
-        return cache_path
+        overflow = self._used_bytes + self.reserved_bytes + required_bytes - self.max_bytes
+        victims: list[str] = []
+        for content_id, entry in self._entries.items():
+            if overflow <= 0:
+                break
+            if content_id == exclude:
+                continue
+            victims.append(content_id)
+            overflow -= entry.size_bytes
+        return victims
 
     async def exists(self, content_id: str) -> bool:
         """컨텐츠 존재 확인"""
-        return content_id in self._content_paths
+        return content_id in self._entries
 
     async def delete(self, content_id: str) -> None:
-        """컨텐츠 삭제"""
-        if content_id in self._content_paths:
-            del self._content_paths[content_id]
+        """컨텐츠 삭제 (인덱스 및 파일)"""
+        entry = self._entries.pop(content_id, None)
+        if entry is None:
+            return
+        self._used_bytes -= entry.size_bytes
+        await asyncio.to_thread(entry.path.unlink, True)
 
     async def get_size_gb(self) -> float:
         """현재 사용 중인 캐시 크기 (GB)"""
-        # Mock: 임의 값 반환
-        return len(self._content_paths) * 2.5  # 파일당 평균 2.5GB
+        return self._used_bytes / BYTES_PER_GB
 
     async def has_space(self, required_gb: float) -> bool:
         """사용 가능한 공간 확인"""
@@ -1,22 +1,48 @@
 """
 L3 Rate Limiter - 동시 스트리밍 제한 및 대역폭 관리
-"""
 
-from datetime import datetime
+슬롯은 lease 저장소(slot_store)에 보관되며, STREAM_SLOT_BACKEND=redis면
+모든 워커/노드가 같은 사용자당 동시 스트리밍 한도를 공유한다.
+"""
 
 from ..models import BandwidthInfo, StreamSlot
+from .slot_store import MemorySlotStore, RedisSlotStore, create_slot_store
 
 
 class L3Limiter:
     """Rate Limiter - 동시 스트리밍 제한 (사용자당 최대 3개)"""
 
-    def __init__(self, max_streams_per_user: int = 3, bandwidth_limit_mbps: float = 100.0):
-        """초기화"""
+    DEFAULT_LEASE_TTL_S = 30.0  # heartbeat 없이 슬롯을 유지하는 시간
+
+    def __init__(
+        self,
+        max_streams_per_user: int = 3,
+        bandwidth_limit_mbps: float = 100.0,
+        store: MemorySlotStore | RedisSlotStore | None = None,
+        lease_ttl: float = DEFAULT_LEASE_TTL_S,
+    ):
+        """
+        Args:
+            max_streams_per_user: 사용자당 최대 동시 스트리밍 수
+            bandwidth_limit_mbps: 사용자당 대역폭 제한 (Mbps)
+            store: 슬롯 lease 저장소 (None이면 STREAM_SLOT_BACKEND 환경변수)
+            lease_ttl: lease 유효 시간 (초, heartbeat마다 연장)
+        """
         self.max_streams = max_streams_per_user
         self.bandwidth_limit = bandwidth_limit_mbps
-        self._user_slots: dict[str, list[StreamSlot]] = {}
+        self.lease_ttl = lease_ttl
+        self._store = store or create_slot_store()
         self._user_bandwidth: dict[str, float] = {}
 
+    async def acquire_lease(self, user_id: str, content_id: str) -> StreamSlot | None:
+        """
+        스트리밍 슬롯 lease 획득
+
+        Returns:
+            StreamSlot or None: 획득한 lease (한도 초과 시 None)
+        """
+        return await self._store.acquire(user_id, content_id, self.max_streams, self.lease_ttl)
+
     async def acquire_slot(self, user_id: str, content_id: str) -> tuple[bool, str | None]:
         """
         스트리밍 슬롯 획득
@@ -24,35 +50,45 @@ class L3Limiter:
         Returns:
             (성공 여부, 실패 사유)
         """
-        # 사용자별 현재 스트리밍 수 확인
-        if user_id not in self._user_slots:
-            self._user_slots[user_id] = []
+        slot = await self.acquire_lease(user_id, content_id)
+        if slot is None:
+            return False, f"Max {self.max_streams} concurrent streams exceeded"
+        return True, None
+
+    async def heartbeat(self, user_id: str, lease_id: str) -> bool:
+        """
+        lease 연장
 
-        current_streams = len(self._user_slots[user_id])
+        Returns:
+            bool: 연장 성공 여부 (이미 만료/해제되었으면 False)
+        """
+        return await self._store.heartbeat(user_id, lease_id, self.lease_ttl)
 
-        if current_streams >= self.max_streams:
-            return False, f"Max {self.max_streams} concurrent streams exceeded"
+    async def release_slot(self, user_id: str, lease_id: str | None = None) -> bool:
+        """
+        스트리밍 슬롯 해제
 
-        # 슬롯 할당
-        slot = StreamSlot(
-            user_id=user_id,
-            content_id=content_id,
-            acquired_at=datetime.now()
-        )
-        self._user_slots[user_id].append(slot)
+        Args:
+            user_id: 사용자 ID
+            lease_id: 해제할 lease (None이면 가장 오래된 슬롯 1개, 이전 API 호환)
 
-        return True, None
+        Returns:
+            bool: 해제 여부
+        """
+        if lease_id is None:
+            slots = await self._store.active(user_id)
+            if not slots:
+                return False
+            lease_id = slots[0].lease_id
+        return await self._store.release(user_id, lease_id)
 
-    async def release_slot(self, user_id: str) -> None:
-        """스트리밍 슬롯 해제 (가장 오래된 슬롯 1개)"""
-        if user_id in self._user_slots and self._user_slots[user_id]:
-            self._user_slots[user_id].pop(0)
+    async def get_active_slots(self, user_id: str) -> list[StreamSlot]:
+        """사용자의 유효한 슬롯 목록"""
+        return await self._store.active(user_id)
 
     async def get_active_streams(self, user_id: str) -> int:
         """사용자의 현재 활성 스트리밍 수"""
-        if user_id not in self._user_slots:
-            return 0
-        return len(self._user_slots[user_id])
+        return len(await self._store.active(user_id))
 
     async def get_bandwidth_info(self, user_id: str) -> BandwidthInfo:
         """사용자 대역폭 정보"""
@@ -63,12 +99,14 @@ class L3Limiter:
         )
 
     async def record_bandwidth_usage(self, user_id: str, mbps: float) -> None:
-        """대역폭 사용량 기록"""
-        self._user_bandwidth[user_id] = mbps
+        """대역폭 사용량 기록 (0이면 항목 삭제)"""
+        if mbps > 0:
+            self._user_bandwidth[user_id] = mbps
+        else:
+            self._user_bandwidth.pop(user_id, None)
 
     async def clear_user(self, user_id: str) -> None:
         """사용자의 모든 슬롯 및 대역폭 정보 삭제"""
-        if user_id in self._user_slots:
-            del self._user_slots[user_id]
+        await self._store.clear_user(user_id)
         if user_id in self._user_bandwidth:
             del self._user_bandwidth[user_id]
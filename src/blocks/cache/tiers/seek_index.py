@@ -0,0 +1,108 @@
+"""
+Seek Index Store - MP4 탐색 인덱스 sidecar 저장소
+
+- 컨텐츠마다 바이너리 sidecar 하나 ({content_id}.idx, 헤더 + u64 배열)
+- 워커가 한 번 추출해 저장하고, Stream 블럭이 seek 요청마다 조회
+- 최근 사용한 인덱스는 메모리에 보관 (LRU, 개수 제한)
+- 원본 크기/mtime이 바뀐 인덱스는 무효로 취급
+"""
+
+import asyncio
+import os
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+from src.core.mp4_index import MP4SeekIndex
+
+SIDECAR_SUFFIX = ".idx"
+
+
+class SeekIndexStore:
+    """MP4 탐색 인덱스 저장소 (디스크 sidecar + 메모리 LRU)"""
+
+    DEFAULT_MEMORY_ENTRIES = 256
+
+    def __init__(self, index_dir: str | None = None, max_memory_entries: int | None = None):
+        """
+        Args:
+            index_dir: sidecar 디렉토리 (None이면 MP4_INDEX_PATH 환경변수 또는 /cache/index)
+            max_memory_entries: 메모리에 보관할 인덱스 수
+        """
+        if index_dir is None:
+            index_dir = os.environ.get("MP4_INDEX_PATH", "/cache/index")
+        self.index_dir = Path(index_dir)
+        self.max_memory_entries = max_memory_entries or self.DEFAULT_MEMORY_ENTRIES
+        self._memory: OrderedDict[str, MP4SeekIndex] = OrderedDict()
+
+    def sidecar_path(self, content_id: str) -> Path:
+        """컨텐츠의 sidecar 경로"""
+        return self.index_dir / f"{content_id}{SIDECAR_SUFFIX}"
+
+    def _remember(self, content_id: str, index: MP4SeekIndex) -> None:
+        self._memory[content_id] = index
+        self._memory.move_to_end(content_id)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read(self, content_id: str) -> MP4SeekIndex | None:
+        try:
+            data = self.sidecar_path(content_id).read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return MP4SeekIndex.from_bytes(data)
+        except ValueError:
+            # 형식이 바뀌었거나 손상된 sidecar는 다시 추출
+            return None
+
+    async def load(
+        self, content_id: str, source_size: int, source_mtime_ns: int
+    ) -> MP4SeekIndex | None:
+        """
+        인덱스 조회
+
+        Args:
+            content_id: 컨텐츠 ID
+            source_size: 현재 원본 크기
+            source_mtime_ns: 현재 원본 mtime (ns)
+
+        Returns:
+            MP4SeekIndex or None: 없거나 원본이 바뀌었으면 None
+        """
+        index = self._memory.get(content_id)
+        if index is None:
+            index = await asyncio.to_thread(self._read, content_id)
+        if index is None or not index.matches(source_size, source_mtime_ns):
+            self._memory.pop(content_id, None)
+            return None
+        self._remember(content_id, index)
+        return index
+
+    def _write(self, content_id: str, data: bytes) -> Path:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        path = self.sidecar_path(content_id)
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return path
+
+    async def save(self, content_id: str, index: MP4SeekIndex) -> Path:
+        """
+        인덱스 저장 (임시 파일 + rename으로 원자적 교체)
+
+        Returns:
+            Path: sidecar 경로
+        """
+        path = await asyncio.to_thread(self._write, content_id, index.to_bytes())
+        self._remember(content_id, index)
+        return path
+
+    async def delete(self, content_id: str) -> None:
+        """인덱스 삭제 (메모리 및 sidecar)"""
+        self._memory.pop(content_id, None)
+        await asyncio.to_thread(self.sidecar_path(content_id).unlink, True)
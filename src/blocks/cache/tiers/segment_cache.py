@@ -0,0 +1,237 @@
+"""
+HLS Segment Cache - 패키징된 HLS(fMP4) 세그먼트 SSD 캐시
+
+- 컨텐츠마다 디렉토리 하나: index.m3u8 + init.mp4 + seg_NNNNN.m4s
+- 패키징은 임시 디렉토리에서 진행 후 rename으로 원자적 교체
+- 용량 초과 시 가장 오래 재생되지 않은 패키지부터 통째로 LRU 퇴출
+- 시작 시 캐시 디렉토리에서 인덱스 재구성 (마지막 접근 = playlist mtime)
+"""
+
+import asyncio
+import os
+import shutil
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+from ..models import SSDCacheEntry
+
+PLAYLIST_NAME = "index.m3u8"
+INIT_SEGMENT_NAME = "init.mp4"
+
+# 패키징 중인 임시 디렉토리 접미사 (인덱스 재구성 시 삭제)
+STAGING_SUFFIX = ".staging"
+
+BYTES_PER_GB = 1024**3
+
+
+class HLSSegmentCache:
+    """SSD 기반 HLS 세그먼트 캐시 (L2SSDCache와 별도 용량)"""
+
+    DEFAULT_MAX_SIZE_GB = 200
+
+    # 마지막 접근 시각을 playlist mtime에 기록하는 최소 간격 (재시작 후 LRU 순서 보존용)
+    TOUCH_INTERVAL_S = 3600
+
+    def __init__(self, cache_dir: str | None = None, max_size_gb: float | None = None):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 HLS_CACHE_PATH 환경변수 또는 /cache/hls)
+            max_size_gb: 최대 캐시 용량 GB (None이면 HLS_CACHE_MAX_GB 환경변수)
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get("HLS_CACHE_PATH", "/cache/hls")
+        if max_size_gb is None:
+            max_size_gb = float(os.environ.get("HLS_CACHE_MAX_GB", self.DEFAULT_MAX_SIZE_GB))
+        self.cache_dir = Path(cache_dir)
+        self._max_size_gb = max_size_gb
+
+        # LRU 순서 (앞쪽이 가장 오래 전에 접근된 패키지)
+        self._entries: OrderedDict[str, SSDCacheEntry] = OrderedDict()
+        self._used_bytes = 0
+
+        self.load_index()
+
+    @property
+    def max_bytes(self) -> int:
+        """최대 캐시 용량 (바이트)"""
+        return int(self._max_size_gb * BYTES_PER_GB)
+
+    @property
+    def used_bytes(self) -> int:
+        """현재 사용 중인 용량 (바이트)"""
+        return self._used_bytes
+
+    @staticmethod
+    def _dir_size(path: Path) -> int:
+        return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+
+    def load_index(self) -> int:
+        """
+        캐시 디렉토리에서 인덱스 재구성
+
+        playlist가 없는 디렉토리와 중단된 패키징 임시 디렉토리는 삭제한다.
+
+        Returns:
+            int: 인덱스된 패키지 수
+        """
+        self._entries.clear()
+        self._used_bytes = 0
+
+        if not self.cache_dir.is_dir():
+            return 0
+
+        found: list[SSDCacheEntry] = []
+        for path in self.cache_dir.iterdir():
+            if not path.is_dir():
+                continue
+            playlist = path / PLAYLIST_NAME
+            if path.name.endswith(STAGING_SUFFIX) or not playlist.is_file():
+                shutil.rmtree(path, ignore_errors=True)
+                continue
+            found.append(
+                SSDCacheEntry(
+                    content_id=path.name,
+                    path=path,
+                    size_bytes=self._dir_size(path),
+                    last_access=playlist.stat().st_mtime,
+                )
+            )
+
+        for entry in sorted(found, key=lambda e: e.last_access):
+            self._add_entry(entry)
+
+        return len(found)
+
+    def package_dir(self, content_id: str) -> Path:
+        """컨텐츠의 패키지 디렉토리"""
+        return self.cache_dir / content_id
+
+    def staging_dir(self, content_id: str) -> Path:
+        """패키징용 임시 디렉토리 (생성해서 반환)"""
+        path = self.cache_dir / f"{content_id}.{uuid.uuid4().hex[:8]}{STAGING_SUFFIX}"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _add_entry(self, entry: SSDCacheEntry) -> None:
+        old = self._entries.pop(entry.content_id, None)
+        if old is not None:
+            self._used_bytes -= old.size_bytes
+        self._entries[entry.content_id] = entry
+        self._used_bytes += entry.size_bytes
+
+    def _touch(self, entry: SSDCacheEntry) -> None:
+        now = time.time()
+        self._entries.move_to_end(entry.content_id)
+        if now - entry.last_access >= self.TOUCH_INTERVAL_S:
+            try:
+                os.utime(entry.path / PLAYLIST_NAME, (now, now))
+            except OSError:
+                pass
+        entry.last_access = now
+
+    async def get_file(self, content_id: str, name: str) -> Path | None:
+        """
+        패키지 파일 경로 조회 (LRU 접근 기록)
+
+        Args:
+            content_id: 컨텐츠 ID
+            name: 파일 이름 (index.m3u8, init.mp4, seg_00000.m4s)
+
+        Returns:
+            Path or None: 파일 경로 (패키지/파일이 없거나 이름이 잘못되면 None)
+        """
+        entry = self._entries.get(content_id)
+        if entry is None or not name or name != Path(name).name or name.startswith("."):
+            return None
+        path = entry.path / name
+        if not path.is_file():
+            return None
+        self._touch(entry)
+        return path
+
+    async def commit(self, content_id: str, staging: Path) -> Path:
+        """
+        패키징이 끝난 임시 디렉토리를 패키지로 등록 (기존 패키지 교체)
+
+        Args:
+            content_id: 컨텐츠 ID
+            staging: staging_dir()로 만든 디렉토리
+
+        Returns:
+            Path: 패키지 디렉토리
+
+        Raises:
+            FileNotFoundError: playlist가 없음
+        """
+        if not (staging / PLAYLIST_NAME).is_file():
+            raise FileNotFoundError(f"Playlist not found in {staging}")
+
+        target = self.package_dir(content_id)
+        await asyncio.to_thread(self._replace_dir, staging, target)
+        return self.register(content_id, target)
+
+    @staticmethod
+    def _replace_dir(staging: Path, target: Path) -> None:
+        trash = None
+        if target.exists():
+            trash = target.with_name(f"{target.name}.{uuid.uuid4().hex[:8]}{STAGING_SUFFIX}")
+            os.replace(target, trash)
+        os.replace(staging, target)
+        if trash is not None:
+            shutil.rmtree(trash, ignore_errors=True)
+
+    def register(self, content_id: str, path: Path) -> Path:
+        """
+        캐시 디렉토리에 이미 존재하는 패키지를 인덱스에 등록
+
+        Args:
+            content_id: 컨텐츠 ID
+            path: 패키지 디렉토리
+
+        Returns:
+            Path: 등록된 경로
+        """
+        self._add_entry(
+            SSDCacheEntry(
+                content_id=content_id,
+                path=path,
+                size_bytes=self._dir_size(path),
+                last_access=time.time(),
+            )
+        )
+        return path
+
+    async def make_room(self, required_bytes: int, exclude: str | None = None) -> list[str]:
+        """
+        required_bytes를 추가할 수 있을 때까지 LRU 순서로 패키지 퇴출
+
+        Returns:
+            list[str]: 퇴출된 컨텐츠 ID 목록
+        """
+        overflow = self._used_bytes + required_bytes - self.max_bytes
+        victims: list[str] = []
+        for content_id, entry in self._entries.items():
+            if overflow <= 0:
+                break
+            if content_id == exclude:
+                continue
+            victims.append(content_id)
+            overflow -= entry.size_bytes
+
+        for content_id in victims:
+            await self.delete(content_id)
+        return victims
+
+    async def exists(self, content_id: str) -> bool:
+        """패키지 존재 확인"""
+        return content_id in self._entries
+
+    async def delete(self, content_id: str) -> None:
+        """패키지 삭제 (인덱스 및 디렉토리)"""
+        entry = self._entries.pop(content_id, None)
+        if entry is None:
+            return
+        self._used_bytes -= entry.size_bytes
+        await asyncio.to_thread(shutil.rmtree, entry.path, True)
@@ -0,0 +1,270 @@
+"""
+Stream Slot Store - 동시 스트리밍 슬롯 lease 저장소
+
+- 슬롯은 TTL이 있는 lease: heartbeat로 연장, 만료되면 자동 해제
+  (비정상 종료된 클라이언트가 슬롯을 영원히 점유하지 않음)
+- 획득/해제는 lease_id 단위로 원자적 처리
+- MemorySlotStore: 프로세스 내 저장소 (단일 워커/테스트용)
+- RedisSlotStore: 모든 워커/노드가 공유하는 Redis 저장소 (Lua 스크립트)
+"""
+
+import json
+import os
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from ..models import StreamSlot
+
+
+def _new_lease_id() -> str:
+    return uuid.uuid4().hex
+
+
+class MemorySlotStore:
+    """프로세스 내 lease 저장소"""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            clock: 시계 (테스트 주입용)
+        """
+        self._clock = clock
+        self._slots: dict[str, dict[str, StreamSlot]] = {}  # user_id -> lease_id -> slot
+
+    def _live(self, user_id: str) -> dict[str, StreamSlot]:
+        """만료된 lease 정리 후 사용자 슬롯 반환"""
+        slots = self._slots.get(user_id)
+        if slots is None:
+            return {}
+        now = self._clock()
+        for lease_id in [lid for lid, slot in slots.items() if slot.expires_at <= now]:
+            del slots[lease_id]
+        if not slots:
+            del self._slots[user_id]
+            return {}
+        return slots
+
+    async def acquire(
+        self, user_id: str, content_id: str, limit: int, ttl: float
+    ) -> StreamSlot | None:
+        """
+        슬롯 획득 (limit 미만일 때만)
+
+        Returns:
+            StreamSlot or None: 획득한 lease (한도 초과 시 None)
+        """
+        if len(self._live(user_id)) >= limit:
+            return None
+
+        slot = StreamSlot(
+            user_id=user_id,
+            content_id=content_id,
+            acquired_at=datetime.fromtimestamp(self._clock()),
+            lease_id=_new_lease_id(),
+            expires_at=self._clock() + ttl,
+        )
+        self._slots.setdefault(user_id, {})[slot.lease_id] = slot
+        return slot
+
+    async def heartbeat(self, user_id: str, lease_id: str, ttl: float) -> bool:
+        """lease 연장 (이미 만료/해제되었으면 False)"""
+        slot = self._live(user_id).get(lease_id)
+        if slot is None:
+            return False
+        slot.expires_at = self._clock() + ttl
+        return True
+
+    async def release(self, user_id: str, lease_id: str) -> bool:
+        """lease 해제 (없으면 False)"""
+        slots = self._live(user_id)
+        if lease_id not in slots:
+            return False
+        del slots[lease_id]
+        if not slots:
+            del self._slots[user_id]
+        return True
+
+    async def active(self, user_id: str) -> list[StreamSlot]:
+        """유효한 lease 목록 (획득 순)"""
+        return sorted(self._live(user_id).values(), key=lambda s: s.acquired_at)
+
+    async def clear_user(self, user_id: str) -> None:
+        """사용자의 모든 lease 삭제"""
+        self._slots.pop(user_id, None)
+
+
+# KEYS[1]: 사용자 lease ZSET (score = 만료 시각 ms), KEYS[2]: lease 메타데이터 HASH
+# 만료 시각이 가장 늦은 lease에 맞춰 두 키의 만료를 설정해 비활성 사용자 키가 남지 않게 한다.
+# (Redis 서버 시계와 무관하도록 PEXPIREAT 대신 호출 시각 기준 상대 시간 사용)
+_PURGE = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if #expired > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+    redis.call('HDEL', KEYS[2], unpack(expired))
+end
+"""
+
+_EXPIRE_KEYS = """
+local last = redis.call('ZRANGE', KEYS[1], -1, -1, 'WITHSCORES')
+if #last > 0 then
+    local ttl = math.max(1, math.floor(tonumber(last[2]) - tonumber(ARGV[1])))
+    redis.call('PEXPIRE', KEYS[1], ttl)
+    redis.call('PEXPIRE', KEYS[2], ttl)
+end
+"""
+
+# ARGV: now_ms, expires_ms, limit, lease_id, meta
+_ACQUIRE_SCRIPT = _PURGE + """
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+redis.call('HSET', KEYS[2], ARGV[4], ARGV[5])
+""" + _EXPIRE_KEYS + """
+return 1
+"""
+
+# ARGV: now_ms, expires_ms, lease_id
+_HEARTBEAT_SCRIPT = _PURGE + """
+if not redis.call('ZSCORE', KEYS[1], ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], 'XX', ARGV[2], ARGV[3])
+""" + _EXPIRE_KEYS + """
+return 1
+"""
+
+# ARGV: now_ms, lease_id
+_RELEASE_SCRIPT = _PURGE + """
+local removed = redis.call('ZREM', KEYS[1], ARGV[2])
+redis.call('HDEL', KEYS[2], ARGV[2])
+return removed
+"""
+
+
+class RedisSlotStore:
+    """
+    Redis lease 저장소 (모든 워커/노드 공유)
+
+    획득/연장/해제는 각각 Lua 스크립트 1회 호출로 원자적으로 처리한다.
+    만료 판정은 호출한 노드의 시계를 사용하므로 노드 간 시계 동기화(NTP)가 필요하다
+    (lease TTL에 비해 충분히 작은 오차는 무시 가능).
+    """
+
+    KEY_PREFIX = "wsoptv:slots:"
+
+    def __init__(
+        self,
+        client: Any | None = None,
+        url: str | None = None,
+        key_prefix: str = KEY_PREFIX,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            client: redis.asyncio 호환 클라이언트 (fakeredis 주입 가능)
+            url: Redis URL (client가 없을 때, 기본 REDIS_URL 환경변수)
+            key_prefix: Redis 키 접두사
+            clock: 시계 (테스트 주입용)
+        """
+        if client is None:
+            import redis.asyncio as redis
+
+            client = redis.from_url(
+                url or os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+            )
+
+        self._redis = client
+        self._prefix = key_prefix
+        self._clock = clock
+        self._acquire = client.register_script(_ACQUIRE_SCRIPT)
+        self._heartbeat = client.register_script(_HEARTBEAT_SCRIPT)
+        self._release = client.register_script(_RELEASE_SCRIPT)
+
+    def _keys(self, user_id: str) -> list[str]:
+        return [f"{self._prefix}{user_id}", f"{self._prefix}{user_id}:meta"]
+
+    def _now_ms(self) -> int:
+        return int(self._clock() * 1000)
+
+    async def acquire(
+        self, user_id: str, content_id: str, limit: int, ttl: float
+    ) -> StreamSlot | None:
+        """슬롯 획득 (limit 미만일 때만, 원자적)"""
+        now = self._clock()
+        slot = StreamSlot(
+            user_id=user_id,
+            content_id=content_id,
+            acquired_at=datetime.fromtimestamp(now),
+            lease_id=_new_lease_id(),
+            expires_at=now + ttl,
+        )
+        meta = json.dumps({"content_id": content_id, "acquired_at": now})
+        acquired = await self._acquire(
+            keys=self._keys(user_id),
+            args=[int(now * 1000), int(slot.expires_at * 1000), limit, slot.lease_id, meta],
+        )
+        return slot if int(acquired) else None
+
+    async def heartbeat(self, user_id: str, lease_id: str, ttl: float) -> bool:
+        """lease 연장 (이미 만료/해제되었으면 False)"""
+        now_ms = self._now_ms()
+        extended = await self._heartbeat(
+            keys=self._keys(user_id), args=[now_ms, now_ms + int(ttl * 1000), lease_id]
+        )
+        return bool(int(extended))
+
+    async def release(self, user_id: str, lease_id: str) -> bool:
+        """lease 해제 (없으면 False)"""
+        removed = await self._release(keys=self._keys(user_id), args=[self._now_ms(), lease_id])
+        return bool(int(removed))
+
+    async def active(self, user_id: str) -> list[StreamSlot]:
+        """유효한 lease 목록 (획득 순)"""
+        slots_key, meta_key = self._keys(user_id)
+        entries = await self._redis.zrangebyscore(
+            slots_key, f"({self._now_ms()}", "+inf", withscores=True
+        )
+        if not entries:
+            return []
+
+        lease_ids = [lid.decode() if isinstance(lid, bytes) else lid for lid, _ in entries]
+        metas = await self._redis.hmget(meta_key, lease_ids)
+
+        slots = []
+        for lease_id, (_, score), raw in zip(lease_ids, entries, metas, strict=True):
+            if raw is None:
+                continue
+            meta = json.loads(raw)
+            slots.append(
+                StreamSlot(
+                    user_id=user_id,
+                    content_id=meta["content_id"],
+                    acquired_at=datetime.fromtimestamp(meta["acquired_at"]),
+                    lease_id=lease_id,
+                    expires_at=score / 1000,
+                )
+            )
+        return sorted(slots, key=lambda s: s.acquired_at)
+
+    async def clear_user(self, user_id: str) -> None:
+        """사용자의 모든 lease 삭제"""
+        await self._redis.delete(*self._keys(user_id))
+
+
+def create_slot_store() -> MemorySlotStore | RedisSlotStore:
+    """
+    STREAM_SLOT_BACKEND 환경변수에 따라 슬롯 저장소 선택
+
+    - "memory" (기본): 프로세스 내 저장소 (단일 워커/테스트용)
+    - "redis": REDIS_URL의 실제 Redis (여러 워커/노드에서 동시 스트리밍 제한 공유)
+    """
+    backend = os.environ.get("STREAM_SLOT_BACKEND", "memory").lower()
+    if backend == "redis":
+        return RedisSlotStore()
+    if backend != "memory":
+        raise ValueError(f"Unknown STREAM_SLOT_BACKEND: {backend}")
+    return MemorySlotStore()
@@ -142,8 +142,8 @@ class EpisodeMigrator:
                 else:
                     item.created_at = episode_data["created_at"]
 
-            # 인메모리 저장
-            self._catalog._items[item.id] = item
+            # 인메모리 저장 (보조 인덱스 포함)
+            self._catalog.add_item(item)
 
             return item
 
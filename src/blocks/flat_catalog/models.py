@@ -6,10 +6,35 @@ Block F: Flat Catalog - 데이터 모델
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
+
+# 경로 기반 NAS 파일 ID 네임스페이스 (NAS 스캔 스크립트와 동일해야 함)
+NAS_FILE_NAMESPACE = uuid5(NAMESPACE_URL, "https://wsoptv/nas-file")
+
+
+def normalize_nas_path(file_path: str) -> str:
+    """
+    NAS 파일 경로 정규화 (파일 식별 키)
+
+    구분자를 "/"로 통일하고 중복/끝 구분자를 제거한 뒤 소문자로 변환한다
+    (NAS는 SMB로 공유되어 대소문자를 구분하지 않음).
+
+    Examples:
+        >>> normalize_nas_path("Z:\\ARCHIVE\\WSOP\\a.mp4")
+        'z:/archive/wsop/a.mp4'
+    """
+    parts = [p for p in file_path.replace("\\", "/").split("/") if p]
+    prefix = "/" if file_path.startswith(("/", "\\")) else ""
+    return (prefix + "/".join(parts)).lower()
+
+
+def stable_nas_file_id(file_path: str) -> UUID:
+    """정규화된 경로로 만든 NAS 파일 ID (스캔할 때마다 같은 값)"""
+    return uuid5(NAS_FILE_NAMESPACE, normalize_nas_path(file_path))
 
 
 @dataclass
@@ -39,6 +64,7 @@ class CatalogItem:
     file_name: str = ""
     file_size_bytes: int = 0
     file_extension: str = ""
+    file_mtime: float | None = None  # NAS 파일 수정 시각 (delta sync 변경 감지)
 
     # 미디어 메타데이터
     duration_seconds: int | None = None
@@ -68,6 +94,7 @@ class CatalogItem:
             "file_name": self.file_name,
             "file_size_bytes": self.file_size_bytes,
             "file_extension": self.file_extension,
+            "file_mtime": self.file_mtime,
             "duration_seconds": self.duration_seconds,
             "quality": self.quality,
             "codec": self.codec,
@@ -93,6 +120,7 @@ class CatalogItem:
         item.file_name = data.get("file_name", "")
         item.file_size_bytes = data.get("file_size_bytes", 0)
         item.file_extension = data.get("file_extension", "")
+        item.file_mtime = data.get("file_mtime")
         item.duration_seconds = data.get("duration_seconds")
         item.quality = data.get("quality")
         item.codec = data.get("codec")
@@ -138,6 +166,7 @@ class CatalogSyncResult:
     errors: int = 0
     duration_seconds: float = 0.0
     error_messages: list[str] = field(default_factory=list)
+    cursor: str | None = None  # delta sync 다음 요청에 보낼 커서
 
     @property
     def total_processed(self) -> int:
@@ -155,6 +184,7 @@ class CatalogSyncResult:
             "total_processed": self.total_processed,
             "duration_seconds": self.duration_seconds,
             "error_messages": self.error_messages[:10],  # 최대 10개만
+            "cursor": self.cursor,
         }
 
 
@@ -169,6 +199,7 @@ class NASFileInfo:
     file_extension: str
     file_category: str  # VIDEO, METADATA, etc.
     is_hidden_file: bool = False
+    file_mtime: float | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> NASFileInfo:
@@ -181,4 +212,14 @@ class NASFileInfo:
             file_extension=data.get("file_extension", ""),
             file_category=data.get("file_category", "OTHER"),
             is_hidden_file=data.get("is_hidden_file", False),
+            file_mtime=data.get("file_mtime"),
         )
+
+
+@dataclass
+class NASScanState:
+    """진행 중인 전체 스캔 상태 (scan_id별)"""
+
+    # 스캔 중 확인된 item id (다른 동기화/수정으로 바뀐 항목도 포함 - 삭제 대상에서 제외)
+    seen: set[UUID] = field(default_factory=set)
+    touched_at: float = field(default_factory=time.monotonic)  # 마지막 배치 시각
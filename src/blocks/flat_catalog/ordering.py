@@ -0,0 +1,132 @@
+"""
+Block F: Flat Catalog - 정렬 인덱스
+
+필터 조합(project_code, year, visible_only)마다 (created_at, id) 순으로
+정렬된 목록을 유지해 최신순 페이지를 정렬 없이 잘라낸다.
+
+- 생성/삭제: 조합당 이진 탐색 + 삽입/삭제
+- 페이지 조회: O(log n + limit) (skip 또는 커서 위치에서 limit개)
+- 커서: 마지막 아이템의 (created_at, id)를 인코딩한 불투명 문자열
+"""
+
+from __future__ import annotations
+
+import base64
+from bisect import bisect_left, insort
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from src.blocks.flat_catalog.models import CatalogItem
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+# (created_at 마이크로초, id)
+SortKey = tuple[int, UUID]
+# (project_code, year, visible_only) - None은 필터 없음
+FilterKey = tuple[str | None, int | None, bool]
+
+
+def sort_key(item: CatalogItem) -> SortKey:
+    """정렬 키 (timezone 없는 created_at은 UTC로 취급)"""
+    created_at = item.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=UTC)
+    return (created_at - _EPOCH) // _MICROSECOND, item.id
+
+
+def encode_cursor(key: SortKey) -> str:
+    """정렬 키 → 커서 문자열"""
+    raw = f"{key[0]}:{key[1].hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """
+    커서 문자열 → 정렬 키
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        micros, item_id = raw.split(":")
+        return int(micros), UUID(hex=item_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def filter_key(project_code: str | None, year: int | None, visible_only: bool) -> FilterKey:
+    """조회 조건 → 필터 키 (빈 값은 필터 없음)"""
+    return project_code or None, year or None, visible_only
+
+
+class CatalogOrdering:
+    """필터 조합별 (created_at, id) 정렬 목록"""
+
+    def __init__(self) -> None:
+        self._lists: dict[FilterKey, list[SortKey]] = {}
+
+    @staticmethod
+    def _filter_keys(item: CatalogItem) -> list[FilterKey]:
+        """아이템이 포함되는 모든 필터 조합"""
+        projects = [None, item.project_code] if item.project_code else [None]
+        years = [None, item.year] if item.year else [None]
+        visibility = [False, True] if item.is_visible else [False]
+        return [(p, y, v) for p in projects for y in years for v in visibility]
+
+    def add(self, item: CatalogItem) -> None:
+        """아이템 추가"""
+        key = sort_key(item)
+        for fkey in self._filter_keys(item):
+            insort(self._lists.setdefault(fkey, []), key)
+
+    def remove(self, item: CatalogItem) -> None:
+        """아이템 제거 (추가할 때와 같은 필드 값으로 호출)"""
+        key = sort_key(item)
+        for fkey in self._filter_keys(item):
+            keys = self._lists.get(fkey)
+            if keys is None:
+                continue
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+            if not keys:
+                del self._lists[fkey]
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._lists.clear()
+
+    def count(self, fkey: FilterKey) -> int:
+        """필터 조합의 아이템 수"""
+        return len(self._lists.get(fkey, ()))
+
+    def page(
+        self,
+        fkey: FilterKey,
+        skip: int = 0,
+        limit: int = 100,
+        after: SortKey | None = None,
+    ) -> tuple[list[UUID], SortKey | None]:
+        """
+        최신순 페이지
+
+        Args:
+            fkey: 필터 조합
+            skip: 건너뛸 개수 (after 기준 위치에서)
+            limit: 최대 개수
+            after: 이 키보다 오래된 아이템부터 (커서 페이지네이션)
+
+        Returns:
+            (아이템 ID 목록, 다음 페이지 커서 키 - 더 없으면 None)
+        """
+        keys = self._lists.get(fkey, [])
+        end = bisect_left(keys, after) if after is not None else len(keys)
+        end = max(end - skip, 0)
+        start = max(end - limit, 0)
+
+        page = keys[start:end]
+        page.reverse()
+        next_key = page[-1] if page and start > 0 else None
+        return [item_id for _, item_id in page], next_key
@@ -2,21 +2,50 @@
 Block F: Flat Catalog - API 라우터
 
 카탈로그 관련 REST API 엔드포인트.
-"""
 
-from __future__ import annotations
+목록/통계/프로젝트/연도 응답은 카탈로그 버전 ETag를 보내며,
+If-None-Match가 일치하면 항목을 조회/직렬화하지 않고 304를 반환한다.
 
-from typing import Annotated
-from uuid import UUID
+/sync/stream은 NDJSON 본문을 받는 대로 배치 단위로 반영하고 진행 상황을
+NDJSON으로 돌려준다 (본문 전체를 파싱해 두지 않으므로 메모리는 배치 크기만큼).
+"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
-from src.blocks.flat_catalog.models import CatalogItem, NASFileInfo
-from src.blocks.flat_catalog.service import FlatCatalogService, get_flat_catalog_service
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, Field, ValidationError
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from src.blocks.flat_catalog.models import (
+    CatalogItem,
+    CatalogSyncResult,
+    NASFileInfo,
+    stable_nas_file_id,
+)
+from src.blocks.flat_catalog.ordering import decode_cursor
+from src.blocks.flat_catalog.service import (
+    FlatCatalogService,
+    SyncCursorError,
+    SyncScanError,
+    get_flat_catalog_service,
+)
+from src.core.conditional import is_not_modified
 
 router = APIRouter(prefix="/catalog", tags=["catalog"])
 
+# NDJSON 스트리밍 동기화
+SYNC_STREAM_BATCH_SIZE = 500  # 한 번에 반영하는 레코드 수 (기본값)
+SYNC_STREAM_MAX_LINE_BYTES = 64 * 1024  # 레코드 한 줄 최대 크기
+SYNC_STREAM_MAX_ERROR_MESSAGES = 10
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 
 # Pydantic 스키마
 class CatalogItemResponse(BaseModel):
@@ -50,6 +79,7 @@ class CatalogListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: str | None = None
 
 
 class CatalogUpdateRequest(BaseModel):
@@ -95,6 +125,41 @@ class SyncResponse(BaseModel):
     error_messages: list[str]
 
 
+class DeltaFileRequest(BaseModel):
+    """delta sync 파일 정보 (id가 없으면 경로로 안정 ID 생성)"""
+
+    id: str | None = None
+    file_path: str
+    file_name: str
+    file_size_bytes: int
+    file_extension: str
+    file_category: str = "VIDEO"
+    is_hidden_file: bool = False
+    file_mtime: float | None = None
+
+
+class DeltaSyncRequest(BaseModel):
+    """delta sync 요청"""
+
+    cursor: str | None = Field(None, description="마지막으로 받은 커서 (전체 스캔이면 생략)")
+    scan_id: str | None = Field(
+        None, description="전체 스캔 ID (같은 스캔의 배치마다 동일, 일반 delta는 생략)"
+    )
+    final: bool = Field(False, description="전체 스캔의 마지막 배치 (보지 못한 항목 삭제)")
+    upserts: list[DeltaFileRequest] = Field(
+        default_factory=list, max_length=5000, description="새로 생기거나 바뀐 파일"
+    )
+    deletes: list[str] = Field(
+        default_factory=list, max_length=5000, description="삭제된 파일 경로"
+    )
+
+
+class DeltaSyncResponse(SyncResponse):
+    """delta sync 응답"""
+
+    cursor: str | None = Field(None, description="다음 delta에 보낼 커서 (스캔 중간 배치면 null)")
+
+
 class ProjectStats(BaseModel):
     """프로젝트 통계"""
 
@@ -115,6 +180,38 @@ class CatalogStats(BaseModel):
 CatalogServiceDep = Annotated[FlatCatalogService, Depends(get_flat_catalog_service)]
 
 
+def _to_nas_file(f: DeltaFileRequest) -> NASFileInfo:
+    """delta 파일 요청 → NASFileInfo (id가 없으면 경로 기반 안정 ID)"""
+    return NASFileInfo(
+        id=UUID(f.id) if f.id else stable_nas_file_id(f.file_path),
+        file_path=f.file_path,
+        file_name=f.file_name,
+        file_size_bytes=f.file_size_bytes,
+        file_extension=f.file_extension,
+        file_category=f.file_category,
+        is_hidden_file=f.is_hidden_file,
+        file_mtime=f.file_mtime,
+    )
+
+
+def _not_modified(
+    request: Request, response: Response, service: FlatCatalogService
+) -> Response | None:
+    """
+    카탈로그 버전 ETag 설정 및 304 판정
+
+    Returns:
+        Response or None: 클라이언트 사본이 최신이면 304 응답
+    """
+    etag = service.etag
+    # 매번 재검증하도록 (CDN/브라우저는 ETag로 304를 받는다)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if is_not_modified(request.headers.get("if-none-match"), None, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
 def _to_response(item: CatalogItem) -> CatalogItemResponse:
     """CatalogItem을 응답 스키마로 변환"""
     return CatalogItemResponse(
@@ -147,13 +244,16 @@ def _to_response(item: CatalogItem) -> CatalogItemResponse:
     description="필터링 및 페이지네이션을 지원하는 카탈로그 목록을 반환합니다.",
 )
 async def list_catalog(
+    request: Request,
+    response: Response,
     service: CatalogServiceDep,
     project_code: str | None = Query(None, description="프로젝트 코드 필터"),
     year: int | None = Query(None, description="연도 필터"),
     visible_only: bool = Query(True, description="표시 가능한 항목만"),
     skip: int = Query(0, ge=0, description="스킵할 개수"),
     limit: int = Query(100, ge=1, le=500, description="반환할 최대 개수"),
-) -> CatalogListResponse:
+    after: str | None = Query(None, description="이전 응답의 next_cursor (커서 페이지네이션)"),
+) -> CatalogListResponse | Response:
     """
     카탈로그 목록 조회
 
@@ -161,21 +261,38 @@ async def list_catalog(
     - **year**: 연도 필터 (예: 2024)
     - **visible_only**: True면 숨김 항목 제외
     - **skip/limit**: 페이지네이션
+    - **after**: 커서 페이지네이션 (깊은 페이지도 정렬 없이 limit개만 조회)
     """
-    items = service.get_all(
-        project_code=project_code,
-        year=year,
-        visible_only=visible_only,
-        skip=skip,
-        limit=limit,
-    )
-    total = service.count(project_code=project_code, visible_only=visible_only)
+    # 잘못된 커서는 ETag와 무관하게 400 (304로 가려지지 않도록 먼저 검증)
+    if after:
+        try:
+            decode_cursor(after)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    not_modified = _not_modified(request, response, service)
+    if not_modified:
+        return not_modified
+
+    try:
+        items, next_cursor = service.get_page(
+            project_code=project_code,
+            year=year,
+            visible_only=visible_only,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    total = service.count(project_code=project_code, visible_only=visible_only, year=year)
 
     return CatalogListResponse(
         items=[_to_response(item) for item in items],
         total=total,
         skip=skip,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -207,9 +324,15 @@ async def search_catalog(
     description="프로젝트별 통계 및 연도 목록을 반환합니다.",
 )
 async def get_catalog_stats(
+    request: Request,
+    response: Response,
     service: CatalogServiceDep,
-) -> CatalogStats:
+) -> CatalogStats | Response:
     """카탈로그 통계"""
+    not_modified = _not_modified(request, response, service)
+    if not_modified:
+        return not_modified
+
     projects_raw = service.get_projects()
     years = service.get_years()
 
@@ -228,9 +351,15 @@ async def get_catalog_stats(
     description="프로젝트별 콘텐츠 개수를 반환합니다.",
 )
 async def list_projects(
+    request: Request,
+    response: Response,
     service: CatalogServiceDep,
-) -> list[ProjectStats]:
+) -> list[ProjectStats] | Response:
     """프로젝트별 통계"""
+    not_modified = _not_modified(request, response, service)
+    if not_modified:
+        return not_modified
+
     projects_raw = service.get_projects()
     return [ProjectStats(code=p["code"], count=p["count"]) for p in projects_raw]
 
@@ -242,10 +371,16 @@ async def list_projects(
     description="콘텐츠가 있는 연도 목록을 반환합니다.",
 )
 async def list_years(
+    request: Request,
+    response: Response,
     service: CatalogServiceDep,
     project_code: str | None = Query(None, description="프로젝트 코드 필터"),
-) -> list[int]:
+) -> list[int] | Response:
     """연도 목록 (내림차순)"""
+    not_modified = _not_modified(request, response, service)
+    if not_modified:
+        return not_modified
+
     return service.get_years(project_code=project_code)
 
 
@@ -388,6 +523,204 @@ async def sync_catalog(
     )
 
 
+@router.post(
+    "/sync/delta",
+    response_model=DeltaSyncResponse,
+    summary="NAS 변경분 동기화",
+    description="마지막 커서 이후 바뀐 파일만 반영하고 새 커서를 반환합니다.",
+    responses={
+        409: {"description": "커서가 현재 상태와 다름(전체 스캔 필요) 또는 이어갈 수 없는 scan_id"}
+    },
+)
+async def sync_catalog_delta(
+    request: DeltaSyncRequest,
+    service: CatalogServiceDep,
+) -> DeltaSyncResponse:
+    """
+    NAS 변경분 동기화 (파일은 정규화 경로로 식별)
+
+    - 일반 delta: cursor + 바뀐 파일(upserts) / 삭제된 경로(deletes)
+    - 전체 스캔: 같은 scan_id로 모든 파일을 나눠 보내고 마지막 배치에 final=true
+    - 409: 커서가 없거나 오래됨 → 전체 스캔으로 다시 동기화
+    - 409: 끝났거나 만료된 scan_id, 동시 스캔 과다 → 새 scan_id로 처음부터 다시
+    """
+    upserts = [_to_nas_file(f) for f in request.upserts]
+
+    try:
+        result = service.apply_nas_delta(
+            upserts,
+            request.deletes,
+            cursor=request.cursor,
+            scan_id=request.scan_id,
+            final=request.final,
+        )
+    except (SyncCursorError, SyncScanError) as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return DeltaSyncResponse(**result.to_dict())
+
+
+class SyncStreamError(Exception):
+    """NDJSON 본문을 더 읽을 수 없음 (이후 레코드는 반영하지 않음)"""
+
+
+class _IngestResponse(StreamingResponse):
+    """
+    요청 본문을 읽으면서 보내는 스트리밍 응답
+
+    StreamingResponse는 (ASGI 2.4 미만 서버에서) 응답 중 receive()로 연결 종료를
+    기다리는데, 이 응답의 제너레이터도 같은 receive()로 본문을 읽으므로
+    본문 메시지를 빼앗기지 않도록 연결 종료 감시 없이 전송한다.
+    (연결이 끊기면 본문 읽기에서 ClientDisconnect가 발생)
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def _iter_ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    본문 청크 → NDJSON 줄 (빈 줄 제외)
+
+    Raises:
+        SyncStreamError: 줄이 SYNC_STREAM_MAX_LINE_BYTES보다 김
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        if len(buffer) > SYNC_STREAM_MAX_LINE_BYTES:
+            raise SyncStreamError(f"Record exceeds {SYNC_STREAM_MAX_LINE_BYTES} bytes")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+def _merge_result(total: CatalogSyncResult, batch: CatalogSyncResult) -> None:
+    """배치 결과를 합계에 더하기 (오류 메시지는 개수 제한)"""
+    total.created += batch.created
+    total.updated += batch.updated
+    total.deleted += batch.deleted
+    total.skipped += batch.skipped
+    total.errors += batch.errors
+    room = SYNC_STREAM_MAX_ERROR_MESSAGES - len(total.error_messages)
+    total.error_messages.extend(batch.error_messages[:max(room, 0)])
+
+
+def _progress_line(total: CatalogSyncResult, **extra: Any) -> bytes:
+    data = total.to_dict()
+    data.update(extra)
+    return (json.dumps(data, ensure_ascii=False) + "\n").encode()
+
+
+async def _ingest_ndjson(
+    service: FlatCatalogService,
+    chunks: AsyncIterator[bytes],
+    cursor: str | None,
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    """
+    NDJSON 레코드를 batch_size개씩 반영하고 배치마다 진행 상황 한 줄 전송
+
+    cursor가 있으면 배치마다 새 커서로 이어지는 delta, 없으면 요청 하나가
+    전체 스캔 (본문을 끝까지 받은 뒤에만 보지 못한 항목 삭제).
+    스캔은 요청마다 별도 scan_id라서 다른 스트림/배치 동기화와 겹쳐도 안전하다.
+    """
+    start_time = time.time()
+    total = CatalogSyncResult()
+    scan_id = None if cursor else uuid4().hex
+    upserts: list[NASFileInfo] = []
+    deletes: list[str] = []
+    line_no = 0
+    batch_no = 0
+
+    def apply(final: bool) -> None:
+        nonlocal cursor
+        result = service.apply_nas_delta(
+            upserts, deletes, cursor=cursor, scan_id=scan_id, final=final
+        )
+        _merge_result(total, result)
+        if scan_id is None or final:
+            cursor = result.cursor
+        upserts.clear()
+        deletes.clear()
+
+    try:
+        async for line in _iter_ndjson_lines(chunks):
+            line_no += 1
+            try:
+                record = json.loads(line)
+                if isinstance(record, dict) and "delete" in record:
+                    deletes.append(str(record["delete"]))
+                else:
+                    upserts.append(_to_nas_file(DeltaFileRequest.model_validate(record)))
+            except (ValueError, ValidationError) as e:
+                # 잘못된 레코드는 건너뛰고 계속
+                total.errors += 1
+                if len(total.error_messages) < SYNC_STREAM_MAX_ERROR_MESSAGES:
+                    total.error_messages.append(f"line {line_no}: {e}")
+                continue
+
+            if len(upserts) + len(deletes) >= batch_size:
+                apply(final=False)
+                batch_no += 1
+                yield _progress_line(total, batch=batch_no, lines=line_no)
+
+        apply(final=True)
+    except (SyncStreamError, SyncCursorError, SyncScanError) as e:
+        total.duration_seconds = time.time() - start_time
+        yield _progress_line(total, done=False, lines=line_no, error=str(e))
+        return
+
+    total.duration_seconds = time.time() - start_time
+    total.cursor = cursor
+    yield _progress_line(total, done=True, lines=line_no)
+
+
+@router.post(
+    "/sync/stream",
+    summary="NAS 스트리밍 동기화 (NDJSON)",
+    description=(
+        "NDJSON 본문(한 줄에 파일 하나, 삭제는 {\"delete\": 경로})을 받는 대로 "
+        "배치 단위로 반영하고 진행 상황을 NDJSON으로 반환합니다."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}}, "description": "배치별 진행 상황 + 최종 결과"},
+        409: {"description": "커서가 현재 상태와 다름 - 전체 스캔 필요"},
+    },
+)
+async def sync_catalog_stream(
+    request: Request,
+    service: CatalogServiceDep,
+    cursor: str | None = Query(None, description="delta 모드 커서 (생략하면 전체 스캔)"),
+    batch_size: int = Query(SYNC_STREAM_BATCH_SIZE, ge=1, le=5000, description="배치 크기"),
+) -> StreamingResponse:
+    """
+    NDJSON 스트리밍 동기화
+
+    - 레코드 형식은 /sync/delta의 upserts 항목과 같음 (id 생략 시 경로로 식별)
+    - 진행 줄: 누적 결과 + batch/lines, 마지막 줄: done=true + cursor
+    - 본문 도중 오류(레코드가 너무 김, 커서 충돌)는 done=false + error 줄로 끝남
+      (전체 스캔이면 삭제 정리도 하지 않음)
+    """
+    if cursor is not None and cursor != service.sync_cursor:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Stale sync cursor: {cursor} (current: {service.sync_cursor})",
+        )
+
+    return _IngestResponse(
+        _ingest_ndjson(service, request.stream(), cursor, batch_size),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
 @router.delete(
     "/",
     status_code=status.HTTP_204_NO_CONTENT,
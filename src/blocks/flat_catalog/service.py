@@ -2,23 +2,53 @@
 Block F: Flat Catalog - 서비스
 
 NAS 파일을 단일 계층 카탈로그로 변환하는 핵심 서비스.
+조회는 항상 메모리에서 처리하고, 저장소(CatalogStore)가 있으면 변경을 디스크에 기록한다.
+
+NAS 동기화 방식:
+- sync_from_nas_files: 요청에 담긴 파일 목록이 NAS 전체 (목록에 없는 항목 삭제)
+- apply_nas_delta: 정규화 경로로 파일을 식별하고, 커서 이후 변경분만 반영
+  (변경 없는 파일은 경로 조회 + 크기/mtime 비교만 하므로 제목을 다시 만들지 않음)
 """
 
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from collections.abc import Callable
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from src.blocks.flat_catalog.models import (
     CatalogItem,
     CatalogSyncResult,
     NASFileInfo,
+    NASScanState,
+    normalize_nas_path,
+)
+from src.blocks.flat_catalog.ordering import (
+    CatalogOrdering,
+    decode_cursor,
+    encode_cursor,
+    filter_key,
 )
+from src.blocks.flat_catalog.store import CatalogStore, create_catalog_store
 from src.blocks.title_generator.service import (
     TitleGeneratorService,
     get_title_generator_service,
 )
+from src.core.conditional import make_etag
+
+
+def _parent_dir(file_path: str) -> str:
+    """파일 경로의 상위 폴더 (Windows/POSIX 구분자 모두 허용)"""
+    return file_path.replace("\\", "/").rsplit("/", 1)[0].lower()
+
+
+class SyncCursorError(ValueError):
+    """delta sync 커서가 현재 카탈로그 상태와 다름 (전체 스캔 필요)"""
+
+
+class SyncScanError(ValueError):
+    """전체 스캔을 이어갈 수 없음 (만료/이미 끝남/동시 스캔 과다 - 새 scan_id로 다시 시작)"""
 
 
 class FlatCatalogService:
@@ -29,19 +59,211 @@ class FlatCatalogService:
     Block F의 모든 기능을 제공.
     """
 
+    SCAN_TTL_S = 3600  # 이 시간 동안 배치가 없는 전체 스캔은 폐기
+    MAX_ACTIVE_SCANS = 8  # 동시에 진행할 수 있는 전체 스캔 수
+    MAX_CLOSED_SCANS = 1024  # 끝난/폐기된 scan_id 기억 개수 (재사용 거부)
+
     def __init__(
         self,
         title_generator: TitleGeneratorService | None = None,
+        store: CatalogStore | None = None,
     ) -> None:
         """
         서비스 초기화
 
         Args:
             title_generator: Title Generator 서비스 (None이면 기본 서비스 사용)
+            store: 영속 저장소 (있으면 시작 시 복구하고 변경을 기록, None이면 인메모리 전용)
         """
         self._title_generator = title_generator or get_title_generator_service()
         self._items: dict[UUID, CatalogItem] = {}  # 인메모리 저장소 (추후 DB 연동)
 
+        # 보조 인덱스 (생성/수정/삭제 시 함께 갱신, 조회 비용을 결과 크기에 비례하게)
+        self._by_nas_file_id: dict[UUID, UUID] = {}  # nas_file_id -> item id
+        self._by_path: dict[str, UUID] = {}  # 정규화 경로 -> item id (delta sync)
+        self._by_project: dict[str, set[UUID]] = {}  # project_code -> item ids
+        self._by_year: dict[int, set[UUID]] = {}  # year -> item ids
+        self._by_dir: dict[str, set[UUID]] = {}  # 상위 폴더 -> item ids (find_next)
+        self._visible: set[UUID] = set()
+
+        # 파일명에서 파싱한 (시리즈 키, 순서 키) 캐시 (find_next에서 처음 필요할 때 채움)
+        self._sequence_keys: dict[UUID, tuple[tuple, tuple[int, int, int] | None]] = {}
+
+        # 필터 조합별 최신순 정렬 목록 (get_all 페이지네이션)
+        self._ordering = CatalogOrdering()
+
+        # 진행 중인 전체 스캔 (scan_id -> 상태) / 끝났거나 폐기된 scan_id
+        self._scans: dict[str, NASScanState] = {}
+        self._closed_scans: OrderedDict[str, None] = OrderedDict()
+
+        # 영속 저장소에서 복구 (제목 재생성 없이 저장된 아이템 그대로)
+        self._store = store
+        if store is not None:
+            for item in store.load():
+                self._items[item.id] = item
+                self._index(item)
+            if store.needs_compaction(len(self._items)):
+                store.compact(self._items.values())
+
+        # 카탈로그 버전 (변경될 때마다 증가, 저장소가 없을 때 목록/통계 ETag에 사용)
+        # 재시작 후 같은 번호가 다른 내용을 가리키지 않도록 인스턴스 epoch 포함
+        self._epoch = uuid4().hex[:8]
+        self._version = 0
+
+        # delta sync 커서 (저장소가 있으면 재시작 후에도 유지)
+        meta = store.meta if store is not None else {}
+        self._sync_epoch: str = meta.get("sync_epoch") or uuid4().hex[:8]
+        self._sync_seq: int = meta.get("sync_seq", 0)
+
+    @property
+    def version(self) -> int:
+        """카탈로그 버전 (생성/수정/삭제 시 증가)"""
+        return self._version
+
+    @property
+    def etag(self) -> str:
+        """
+        카탈로그 전체 ETag (목록/통계/프로젝트/연도 응답 공통)
+
+        저장소가 있으면 적용된 기록의 해시 체인(CatalogStore.digest)에서 파생해
+        재시작 후에도 같은 내용이면 같은 ETag를 보낸다.
+        저장소가 없으면 인스턴스 epoch + 변경 횟수.
+        """
+        if self._store is not None:
+            return make_etag("catalog", self._store.digest)
+        return make_etag("catalog", self._epoch, self._version)
+
+    def _touch(self) -> None:
+        """변경 기록 (버전 증가)"""
+        self._version += 1
+
+    @property
+    def sync_cursor(self) -> str | None:
+        """현재 delta sync 커서 (전체 스캔을 한 번도 마치지 않았으면 None)"""
+        if not self._sync_seq:
+            return None
+        return f"{self._sync_epoch}-{self._sync_seq}"
+
+    def _advance_sync_cursor(self) -> str:
+        """delta 반영 완료 → 새 커서 발급"""
+        self._sync_seq += 1
+        if self._store is not None:
+            self._store.set_meta(sync_epoch=self._sync_epoch, sync_seq=self._sync_seq)
+        return self.sync_cursor
+
+    def _reset_sync_cursor(self) -> None:
+        """delta 밖에서 NAS 항목이 바뀜 → 기존 커서 무효화 (다음 delta는 전체 스캔부터)"""
+        if not self._sync_seq:
+            return
+        self._sync_epoch = uuid4().hex[:8]
+        self._sync_seq = 0
+        if self._store is not None:
+            self._store.set_meta(sync_epoch=self._sync_epoch, sync_seq=0)
+
+    def _persist_put(self, item: CatalogItem) -> None:
+        """생성/수정을 저장소에 기록 (로그가 커지면 스냅샷으로 압축)"""
+        if self._store is None:
+            return
+        self._store.put(item)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self._store.needs_compaction(len(self._items)):
+            self._store.compact(self._items.values())
+
+    def close(self) -> None:
+        """저장소 정리 (스냅샷 압축 후 로그 닫기) - 종료 시 호출"""
+        if self._store is None:
+            return
+        if self._store.log_records:
+            self._store.compact(self._items.values())
+        self._store.close()
+
+    def _index(self, item: CatalogItem) -> None:
+        """아이템을 보조 인덱스에 추가"""
+        if item.nas_file_id is not None:
+            self._by_nas_file_id[item.nas_file_id] = item.id
+        if item.file_path:
+            self._by_path[normalize_nas_path(item.file_path)] = item.id
+        self._by_project.setdefault(item.project_code, set()).add(item.id)
+        if item.year is not None:
+            self._by_year.setdefault(item.year, set()).add(item.id)
+        if item.file_path:
+            self._by_dir.setdefault(_parent_dir(item.file_path), set()).add(item.id)
+        if item.is_visible:
+            self._visible.add(item.id)
+        self._ordering.add(item)
+        # 스캔 도중 생성/수정된 항목은 진행 중인 스캔이 삭제하지 않도록
+        self._mark_scanned(item.id)
+
+    def _unindex(self, item: CatalogItem) -> None:
+        """아이템을 보조 인덱스에서 제거"""
+        if self._by_nas_file_id.get(item.nas_file_id) == item.id:
+            del self._by_nas_file_id[item.nas_file_id]
+        if item.file_path:
+            path_key = normalize_nas_path(item.file_path)
+            if self._by_path.get(path_key) == item.id:
+                del self._by_path[path_key]
+        indexes = [(self._by_project, item.project_code), (self._by_year, item.year)]
+        if item.file_path:
+            indexes.append((self._by_dir, _parent_dir(item.file_path)))
+        for index, key in indexes:
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(item.id)
+                if not ids:
+                    del index[key]
+        self._visible.discard(item.id)
+        self._sequence_keys.pop(item.id, None)
+        self._ordering.remove(item)
+
+    def add_item(self, item: CatalogItem) -> CatalogItem:
+        """
+        이미 만들어진 카탈로그 아이템 저장 (마이그레이션 등, 같은 ID면 교체)
+
+        Args:
+            item: 카탈로그 아이템
+
+        Returns:
+            저장된 CatalogItem
+        """
+        existing = self._items.get(item.id)
+        if existing is not None:
+            self._unindex(existing)
+        self._items[item.id] = item
+        self._index(item)
+        self._touch()
+        self._persist_put(item)
+        return item
+
+    def _candidate_ids(
+        self,
+        project_code: str | None,
+        year: int | None,
+        visible_only: bool,
+    ) -> set[UUID] | None:
+        """
+        필터 조건에 맞는 아이템 ID (가장 작은 인덱스부터 교집합)
+
+        Returns:
+            ID 집합 (필터가 하나도 없으면 None = 전체)
+        """
+        sets = []
+        if project_code:
+            sets.append(self._by_project.get(project_code, set()))
+        if year:
+            sets.append(self._by_year.get(year, set()))
+        if visible_only:
+            sets.append(self._visible)
+        if not sets:
+            return None
+
+        sets.sort(key=len)
+        ids = sets[0]
+        for other in sets[1:]:
+            ids = ids & other
+        return ids
+
     def create_from_nas_file(
         self,
         nas_file: NASFileInfo,
@@ -77,6 +299,7 @@ class FlatCatalogService:
             file_name=nas_file.file_name,
             file_size_bytes=nas_file.file_size_bytes,
             file_extension=nas_file.file_extension,
+            file_mtime=nas_file.file_mtime,
             confidence=generated.confidence,
         )
 
@@ -87,9 +310,7 @@ class FlatCatalogService:
             item.category_tags.append(generated.metadata.content_type.value)
 
         # 저장
-        self._items[item.id] = item
-
-        return item
+        return self.add_item(item)
 
     def get_by_id(self, item_id: UUID) -> CatalogItem | None:
         """ID로 카탈로그 아이템 조회"""
@@ -97,10 +318,8 @@ class FlatCatalogService:
 
     def get_by_nas_file_id(self, nas_file_id: UUID) -> CatalogItem | None:
         """NAS 파일 ID로 카탈로그 아이템 조회"""
-        for item in self._items.values():
-            if item.nas_file_id == nas_file_id:
-                return item
-        return None
+        item_id = self._by_nas_file_id.get(nas_file_id)
+        return self._items.get(item_id) if item_id is not None else None
 
     def get_all(
         self,
@@ -121,25 +340,43 @@ class FlatCatalogService:
             limit: 반환할 최대 개수
 
         Returns:
-            CatalogItem 리스트
+            CatalogItem 리스트 (최신순)
         """
-        items = list(self._items.values())
+        items, _ = self.get_page(project_code, year, visible_only, skip=skip, limit=limit)
+        return items
 
-        # 필터링
-        if visible_only:
-            items = [i for i in items if i.is_visible]
-
-        if project_code:
-            items = [i for i in items if i.project_code == project_code]
+    def get_page(
+        self,
+        project_code: str | None = None,
+        year: int | None = None,
+        visible_only: bool = True,
+        skip: int = 0,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> tuple[list[CatalogItem], str | None]:
+        """
+        최신순 페이지 조회 (정렬된 목록에서 O(log n + limit))
 
-        if year:
-            items = [i for i in items if i.year == year]
+        Args:
+            project_code: 프로젝트 코드 필터
+            year: 연도 필터
+            visible_only: 표시 가능한 항목만
+            skip: 스킵할 개수 (after가 있으면 커서 위치부터)
+            limit: 반환할 최대 개수
+            after: 이전 페이지의 next_cursor (이 아이템보다 오래된 항목부터)
 
-        # 정렬 (최신순)
-        items.sort(key=lambda x: x.created_at, reverse=True)
+        Returns:
+            (CatalogItem 리스트, 다음 페이지 커서 - 마지막 페이지면 None)
 
-        # 페이지네이션
-        return items[skip : skip + limit]
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        cursor_key = decode_cursor(after) if after else None
+        ids, next_key = self._ordering.page(
+            filter_key(project_code, year, visible_only), skip, limit, cursor_key
+        )
+        items = [self._items[i] for i in ids]
+        return items, encode_cursor(next_key) if next_key is not None else None
 
     def search(
         self,
@@ -198,12 +435,16 @@ class FlatCatalogService:
         if not item:
             return None
 
-        # 필드 업데이트
+        # 필드 업데이트 (인덱스 키가 바뀔 수 있으므로 다시 인덱스)
+        self._unindex(item)
         for key, value in kwargs.items():
-            if hasattr(item, key):
+            if hasattr(item, key) and key != "id":
                 setattr(item, key, value)
+        self._index(item)
 
         item.update_timestamp()
+        self._touch()
+        self._persist_put(item)
         return item
 
     def delete(self, item_id: UUID) -> bool:
@@ -216,10 +457,15 @@ class FlatCatalogService:
         Returns:
             삭제 성공 여부
         """
-        if item_id in self._items:
-            del self._items[item_id]
-            return True
-        return False
+        item = self._items.pop(item_id, None)
+        if item is None:
+            return False
+        self._unindex(item)
+        self._touch()
+        if self._store is not None:
+            self._store.delete(item_id)
+            self._maybe_compact()
+        return True
 
     def set_visibility(self, item_id: UUID, visible: bool) -> CatalogItem | None:
         """가시성 설정"""
@@ -229,6 +475,7 @@ class FlatCatalogService:
         self,
         project_code: str | None = None,
         visible_only: bool = True,
+        year: int | None = None,
     ) -> int:
         """
         카탈로그 아이템 개수
@@ -236,19 +483,12 @@ class FlatCatalogService:
         Args:
             project_code: 프로젝트 코드 필터
             visible_only: 표시 가능한 항목만
+            year: 연도 필터
 
         Returns:
             개수
         """
-        items = list(self._items.values())
-
-        if visible_only:
-            items = [i for i in items if i.is_visible]
-
-        if project_code:
-            items = [i for i in items if i.project_code == project_code]
-
-        return len(items)
+        return self._ordering.count(filter_key(project_code, year, visible_only))
 
     def get_projects(self) -> list[dict[str, int]]:
         """
@@ -259,10 +499,10 @@ class FlatCatalogService:
         """
         project_counts: dict[str, int] = {}
 
-        for item in self._items.values():
-            if not item.is_visible:
-                continue
-            project_counts[item.project_code] = project_counts.get(item.project_code, 0) + 1
+        for code, ids in self._by_project.items():
+            count = len(ids & self._visible)
+            if count:
+                project_counts[code] = count
 
         return [
             {"code": code, "count": count}
@@ -279,17 +519,74 @@ class FlatCatalogService:
         Returns:
             연도 리스트 (내림차순)
         """
-        years = set()
+        candidates = self._candidate_ids(project_code, None, visible_only=True)
+        years = [
+            year
+            for year, ids in self._by_year.items()
+            if year and not ids.isdisjoint(candidates)
+        ]
 
-        for item in self._items.values():
-            if not item.is_visible:
+        return sorted(years, reverse=True)
+
+    def find_next(self, item_id: UUID) -> CatalogItem | None:
+        """
+        이어서 볼 가능성이 높은 다음 아이템 (다음 Part → 다음 Day → 다음 Episode)
+
+        같은 폴더 · 같은 프로젝트에서 연도/이벤트/시즌이 같은 파일 중
+        (day, part, episode) 순서상 바로 다음 아이템을 찾는다.
+
+        Args:
+            item_id: 현재 아이템 ID
+
+        Returns:
+            다음 CatalogItem 또는 None
+        """
+        current = self._items.get(item_id)
+        if not current:
+            return None
+
+        current_series, current_order = self._sequence_key(current)
+        if current_order is None:
+            return None
+
+        # 같은 폴더의 형제만 본다 (프로젝트 전체를 파싱하지 않도록)
+        siblings = self._by_dir.get(_parent_dir(current.file_path), set())
+
+        best: tuple[tuple[int, int, int], CatalogItem] | None = None
+        for sibling_id in siblings:
+            if sibling_id == current.id or sibling_id not in self._visible:
                 continue
-            if project_code and item.project_code != project_code:
+            item = self._items[sibling_id]
+            if item.project_code != current.project_code:
                 continue
-            if item.year:
-                years.add(item.year)
 
-        return sorted(years, reverse=True)
+            series, order = self._sequence_key(item)
+            if order is None or series != current_series:
+                continue
+            if order > current_order and (best is None or order < best[0]):
+                best = (order, item)
+
+        return best[1] if best else None
+
+    def _sequence_key(self, item: CatalogItem) -> tuple[tuple, tuple[int, int, int] | None]:
+        """
+        아이템의 (시리즈 키, 순서 키) - 파일명 파싱 결과를 아이템별로 캐시
+
+        Args:
+            item: 카탈로그 아이템
+
+        Returns:
+            ((project, year, event_number, event_name, season), (day, part, episode))
+            순서 정보(day/part/episode)가 하나도 없으면 순서 키는 None
+        """
+        key = self._sequence_keys.get(item.id)
+        if key is None:
+            m = self._title_generator.parse_metadata(item.file_name)
+            parts = (m.day_number, m.part_number, m.episode_number)
+            order = tuple(n or 0 for n in parts) if any(n is not None for n in parts) else None
+            key = ((m.project_code, m.year, m.event_number, m.event_name, m.season_number), order)
+            self._sequence_keys[item.id] = key
+        return key
 
     def sync_from_nas_files(
         self,
@@ -352,11 +649,160 @@ class FlatCatalogService:
                 on_progress(idx + 1, total)
 
         # 삭제된 파일 처리 (NAS에 없는 항목 삭제)
-        for item in list(self._items.values()):
-            if item.nas_file_id and item.nas_file_id not in new_nas_ids:
-                self.delete(item.id)
+        for nas_file_id in self._by_nas_file_id.keys() - new_nas_ids:
+            self.delete(self._by_nas_file_id[nas_file_id])
+            result.deleted += 1
+
+        # delta 클라이언트가 알고 있는 상태와 달라졌으므로 커서 무효화
+        self._reset_sync_cursor()
+
+        result.duration_seconds = time.time() - start_time
+        return result
+
+    def get_by_path(self, file_path: str) -> CatalogItem | None:
+        """NAS 파일 경로로 카탈로그 아이템 조회 (구분자/대소문자 무시)"""
+        item_id = self._by_path.get(normalize_nas_path(file_path))
+        return self._items.get(item_id) if item_id is not None else None
+
+    def _upsert_nas_file(self, nas_file: NASFileInfo, result: CatalogSyncResult) -> UUID | None:
+        """
+        delta 한 건 반영 (경로로 기존 항목 매칭)
+
+        Returns:
+            반영된 아이템 ID (건너뛴 비디오 외 파일/숨김 파일은 None)
+        """
+        if nas_file.file_category != "VIDEO" or nas_file.is_hidden_file:
+            result.skipped += 1
+            return None
+
+        existing = self.get_by_path(nas_file.file_path)
+        if existing is None:
+            result.created += 1
+            return self.create_from_nas_file(nas_file).id
+
+        changes: dict[str, object] = {}
+        if existing.file_size_bytes != nas_file.file_size_bytes:
+            changes["file_size_bytes"] = nas_file.file_size_bytes
+        if nas_file.file_mtime is not None and existing.file_mtime != nas_file.file_mtime:
+            changes["file_mtime"] = nas_file.file_mtime
+        if existing.nas_file_id != nas_file.id:
+            # 예전 랜덤 ID로 만든 항목 → 안정 ID로 교체 (카탈로그 ID는 유지)
+            changes["nas_file_id"] = nas_file.id
+
+        if changes:
+            self.update(existing.id, **changes)
+            result.updated += 1
+        else:
+            result.skipped += 1
+        return existing.id
+
+    def _mark_scanned(self, item_id: UUID) -> None:
+        """진행 중인 모든 전체 스캔에 확인된 항목으로 기록"""
+        for scan in self._scans.values():
+            scan.seen.add(item_id)
+
+    def _close_scan(self, scan_id: str) -> None:
+        """스캔 종료 (같은 scan_id가 다시 오면 거부)"""
+        self._scans.pop(scan_id, None)
+        self._closed_scans[scan_id] = None
+        while len(self._closed_scans) > self.MAX_CLOSED_SCANS:
+            self._closed_scans.popitem(last=False)
+
+    def _get_scan(self, scan_id: str) -> NASScanState:
+        """
+        전체 스캔 상태 조회 (처음 보는 scan_id면 새 스캔 시작)
+
+        Raises:
+            SyncScanError: 끝났거나 만료된 scan_id, 또는 동시 스캔 수 초과
+        """
+        now = time.monotonic()
+        for expired in [
+            sid for sid, scan in self._scans.items() if now - scan.touched_at > self.SCAN_TTL_S
+        ]:
+            self._close_scan(expired)
+
+        scan = self._scans.get(scan_id)
+        if scan is None:
+            if scan_id in self._closed_scans:
+                raise SyncScanError(f"Scan already finished or expired: {scan_id}")
+            if len(self._scans) >= self.MAX_ACTIVE_SCANS:
+                raise SyncScanError(f"Too many concurrent scans ({self.MAX_ACTIVE_SCANS})")
+            scan = self._scans[scan_id] = NASScanState()
+        scan.touched_at = now
+        return scan
+
+    def apply_nas_delta(
+        self,
+        upserts: list[NASFileInfo],
+        deletes: list[str],
+        cursor: str | None = None,
+        scan_id: str | None = None,
+        final: bool = False,
+    ) -> CatalogSyncResult:
+        """
+        NAS 변경분 반영 (delta sync)
+
+        일반 delta는 마지막으로 받은 커서가 현재 커서와 같아야 반영한다.
+        커서가 없거나 다르면(다른 인스턴스/동기화 누락) 전체 스캔으로 다시 맞춘다:
+        같은 scan_id로 전체 파일을 나눠 보내고, final=True인 마지막 배치에서
+        스캔 중 보지 못한 NAS 항목을 삭제한다.
+
+        스캔 상태는 scan_id별로 따로 두므로 여러 스캔이 겹쳐도 서로의 기록을
+        지우지 않으며, 스캔 도중 다른 동기화가 만들거나 바꾼 항목은 삭제하지 않는다.
+        끝났거나 SCAN_TTL_S 동안 배치가 없어 폐기된 scan_id는 다시 받지 않는다.
+
+        Args:
+            upserts: 새로 생기거나 바뀐 파일 (전체 스캔이면 모든 파일)
+            deletes: 삭제된 파일 경로
+            cursor: 마지막으로 받은 커서 (전체 스캔이면 무시)
+            scan_id: 전체 스캔 ID (None이면 일반 delta)
+            final: 전체 스캔의 마지막 배치
+
+        Returns:
+            CatalogSyncResult (cursor: 다음 delta에 보낼 커서, 스캔 중간 배치면 None)
+
+        Raises:
+            SyncCursorError: 일반 delta의 커서가 현재 커서와 다름
+            SyncScanError: 이어갈 수 없는 scan_id (새 scan_id로 처음부터 다시)
+        """
+        start_time = time.time()
+        result = CatalogSyncResult()
+
+        if scan_id is None:
+            current = self.sync_cursor
+            if current is None or cursor != current:
+                raise SyncCursorError(
+                    f"Stale sync cursor: {cursor} (current: {current}), full scan required"
+                )
+        scan = self._get_scan(scan_id) if scan_id is not None else None
+
+        for nas_file in upserts:
+            try:
+                item_id = self._upsert_nas_file(nas_file, result)
+            except Exception as e:
+                result.errors += 1
+                result.error_messages.append(f"{nas_file.file_name}: {str(e)}")
+                continue
+            if item_id is not None:
+                # 변경 없는 항목도 진행 중인 모든 스캔에서 확인된 것으로
+                self._mark_scanned(item_id)
+
+        for file_path in deletes:
+            existing = self.get_by_path(file_path)
+            if existing is not None and self.delete(existing.id):
                 result.deleted += 1
 
+        if scan_id is None or final:
+            if scan is not None:
+                # 스캔에서 보지 못한 NAS 항목 = NAS에서 삭제됨
+                self._close_scan(scan_id)
+                for item_id in [
+                    i for i in self._by_nas_file_id.values() if i not in scan.seen
+                ]:
+                    self.delete(item_id)
+                    result.deleted += 1
+            result.cursor = self._advance_sync_cursor()
+
         result.duration_seconds = time.time() - start_time
         return result
 
@@ -364,6 +810,18 @@ class FlatCatalogService:
         """모든 카탈로그 아이템 삭제"""
         count = len(self._items)
         self._items.clear()
+        self._by_nas_file_id.clear()
+        self._by_path.clear()
+        self._by_project.clear()
+        self._by_year.clear()
+        self._by_dir.clear()
+        self._visible.clear()
+        self._sequence_keys.clear()
+        self._ordering.clear()
+        self._touch()
+        if self._store is not None:
+            self._store.clear()
+        self._reset_sync_cursor()
         return count
 
 
@@ -372,8 +830,8 @@ _service: FlatCatalogService | None = None
 
 
 def get_flat_catalog_service() -> FlatCatalogService:
-    """FlatCatalogService 싱글톤 반환"""
+    """FlatCatalogService 싱글톤 반환 (CATALOG_STORE_PATH가 있으면 디스크에서 복구)"""
     global _service
     if _service is None:
-        _service = FlatCatalogService()
+        _service = FlatCatalogService(store=create_catalog_store())
     return _service
@@ -0,0 +1,282 @@
+"""
+Block F: Flat Catalog - 영속 저장소
+
+append-only 로그 + 스냅샷으로 인메모리 카탈로그를 디스크에 보존한다.
+
+- 변경(put/delete/clear)마다 로그에 JSON 한 줄 추가 (조회는 계속 메모리에서)
+- 로그가 커지면 전체 아이템을 스냅샷으로 쓰고(임시 파일 + fsync + rename) 로그를 비움
+- 시작 시 스냅샷 + 로그 재생 → 전체 NAS 재동기화/제목 재생성 없이 복구
+- 중간에 끊긴 마지막 로그 줄은 무시하고 잘라냄 (프로세스 비정상 종료 대비)
+- 한 디렉토리에는 한 프로세스만 기록 (store.lock 배타 잠금, 이미 잠겨 있으면 즉시 실패)
+  여러 uvicorn 워커가 같은 CATALOG_STORE_PATH를 쓰면 서로의 기록을 압축으로 덮어쓰므로
+  저장소를 쓰는 서버는 워커 하나로 실행해야 한다
+
+디렉토리 구성:
+    snapshot.jsonl: 헤더 한 줄({"version", "meta"}) + 아이템 한 줄씩 (CatalogItem.to_dict)
+        meta.digest: 스냅샷에 반영된 마지막 기록까지의 해시 체인 (digest 참고)
+        meta.store_epoch: 저장소를 처음 만들 때 발급 (새 저장소끼리 digest가 겹치지 않도록)
+    log.jsonl: {"op": "put", "item": {...}} / {"op": "delete", "id": ...} / {"op": "clear"}
+        / {"op": "meta", "meta": {...}} (delta sync 커서 등 카탈로그 상태)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+from src.blocks.flat_catalog.models import CatalogItem
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_NAME = "snapshot.jsonl"
+LOG_NAME = "log.jsonl"
+LOCK_NAME = "store.lock"
+FORMAT_VERSION = 1
+
+
+class CatalogStoreLockedError(RuntimeError):
+    """다른 프로세스가 이미 같은 저장소 디렉토리를 쓰고 있음"""
+
+
+def _try_lock(f) -> bool:
+    """잠금 파일에 배타 잠금 (기다리지 않음)"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+class CatalogStore:
+    """append-only 로그 + 스냅샷 카탈로그 저장소"""
+
+    COMPACT_MIN_RECORDS = 10_000  # 로그가 이보다 작으면 압축하지 않음
+
+    def __init__(self, path: str | Path, fsync: bool = False) -> None:
+        """
+        Args:
+            path: 저장 디렉토리 (없으면 생성)
+            fsync: 로그 기록마다 fsync (False면 flush만 - 프로세스 종료에는 안전,
+                전원 장애 시 마지막 몇 건 유실 가능)
+
+        Raises:
+            CatalogStoreLockedError: 다른 프로세스(또는 닫지 않은 인스턴스)가 사용 중
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+        self._log = None
+        self._lock = None
+        self._acquire_lock()
+        self._log_records = 0
+        self._digest = ""
+        self.meta: dict[str, Any] = {}  # load() 후 마지막으로 기록된 메타데이터
+
+    def _acquire_lock(self) -> None:
+        """저장소 배타 잠금 (close 후 다시 기록할 때도 호출)"""
+        if self._lock is not None:
+            return
+        f = open(self.path / LOCK_NAME, "a+")
+        if not _try_lock(f):
+            f.close()
+            raise CatalogStoreLockedError(
+                f"Catalog store {self.path} is in use by another process"
+            )
+        self._lock = f
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.path / SNAPSHOT_NAME
+
+    @property
+    def log_path(self) -> Path:
+        return self.path / LOG_NAME
+
+    @property
+    def log_records(self) -> int:
+        """마지막 스냅샷 이후 로그 레코드 수"""
+        return self._log_records
+
+    @property
+    def digest(self) -> str:
+        """
+        지금까지 적용된 기록 전체의 해시 체인 (카탈로그 내용 버전)
+
+        기록마다 이전 값과 기록 내용을 함께 해시하므로 다른 기록을 적용한
+        두 상태는 같은 값을 갖지 않는다. 스냅샷 압축은 내용을 바꾸지 않으므로
+        값을 유지하고, 재시작 후 load()하면 같은 값이 복원된다.
+        """
+        return self._digest
+
+    def _chain(self, line: str) -> None:
+        self._digest = hashlib.blake2b(
+            f"{self._digest}\n{line}".encode(), digest_size=8
+        ).hexdigest()
+
+    def load(self) -> list[CatalogItem]:
+        """
+        스냅샷 + 로그 재생으로 아이템 복구
+
+        Returns:
+            CatalogItem 리스트 (스냅샷/로그 기록 순)
+        """
+        items: dict[UUID, CatalogItem] = {}
+        self.meta = {}
+        self._digest = ""
+
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                if header.get("version") != FORMAT_VERSION:
+                    raise ValueError(f"Unsupported catalog snapshot version: {header}")
+                self.meta = dict(header.get("meta", {}))
+                self._digest = self.meta.get("digest", "")
+                for line in f:
+                    item = CatalogItem.from_dict(json.loads(line))
+                    items[item.id] = item
+
+        self._log_records = 0
+        valid_bytes = 0
+        if self.log_path.exists():
+            with open(self.log_path, "rb") as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("incomplete record")
+                        self._apply(items, self.meta, json.loads(line))
+                        self._chain(line[:-1].decode("utf-8"))
+                    except ValueError:
+                        logger.warning(
+                            f"Catalog log truncated at byte {valid_bytes} (incomplete record)"
+                        )
+                        break
+                    valid_bytes += len(line)
+                    self._log_records += 1
+
+            # 끊긴 레코드 뒤에 새 레코드가 붙지 않도록 잘라냄
+            if valid_bytes < self.log_path.stat().st_size:
+                os.truncate(self.log_path, valid_bytes)
+
+        # 새 저장소 → 이전에 지워진 저장소와 digest가 겹치지 않도록 epoch 발급
+        if "store_epoch" not in self.meta:
+            self.set_meta(store_epoch=uuid4().hex[:8])
+
+        return list(items.values())
+
+    @staticmethod
+    def _apply(
+        items: dict[UUID, CatalogItem], meta: dict[str, Any], record: dict[str, Any]
+    ) -> None:
+        op = record["op"]
+        if op == "put":
+            item = CatalogItem.from_dict(record["item"])
+            items[item.id] = item
+        elif op == "delete":
+            items.pop(UUID(record["id"]), None)
+        elif op == "clear":
+            items.clear()
+        elif op == "meta":
+            meta.update(record["meta"])
+        else:
+            raise ValueError(f"Unknown catalog log op: {op}")
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self._acquire_lock()
+        if self._log is None:
+            self._log = open(self.log_path, "a", encoding="utf-8")
+        line = json.dumps(record, ensure_ascii=False)
+        self._log.write(line + "\n")
+        self._log.flush()
+        if self._fsync:
+            os.fsync(self._log.fileno())
+        self._log_records += 1
+        self._chain(line)
+
+    def put(self, item: CatalogItem) -> None:
+        """아이템 생성/수정 기록"""
+        self._append({"op": "put", "item": item.to_dict()})
+
+    def delete(self, item_id: UUID) -> None:
+        """아이템 삭제 기록"""
+        self._append({"op": "delete", "id": str(item_id)})
+
+    def clear(self) -> None:
+        """전체 삭제 기록"""
+        self._append({"op": "clear"})
+
+    def set_meta(self, **values: Any) -> None:
+        """메타데이터 갱신 기록 (다음 스냅샷 헤더에도 유지)"""
+        self.meta.update(values)
+        self._append({"op": "meta", "meta": values})
+
+    def needs_compaction(self, item_count: int) -> bool:
+        """로그가 스냅샷으로 다시 쓸 만큼 커졌는지 (아이템 수의 2배 이상)"""
+        return self._log_records >= max(self.COMPACT_MIN_RECORDS, item_count * 2)
+
+    def compact(self, items: Iterable[CatalogItem]) -> None:
+        """
+        현재 아이템 전체를 스냅샷으로 쓰고 로그 비우기
+
+        스냅샷은 임시 파일에 쓴 뒤 fsync + rename으로 교체하므로
+        도중에 종료되어도 이전 스냅샷 + 로그가 그대로 남는다.
+        """
+        self._acquire_lock()
+        # 로그가 비워져도 digest가 이어지도록 헤더에 기록
+        self.meta["digest"] = self._digest
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            header = {"version": FORMAT_VERSION, "meta": self.meta}
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            for item in items:
+                f.write(json.dumps(item.to_dict(), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+
+        # 스냅샷에 모두 반영되었으므로 로그 비우기
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        with open(self.log_path, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_records = 0
+
+    def close(self) -> None:
+        """로그 파일 닫기 + 잠금 해제 (이후 기록하면 다시 잠금)"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self._lock is not None:
+            # 파일을 닫으면 잠금도 풀린다
+            self._lock.close()
+            self._lock = None
+
+
+def create_catalog_store() -> CatalogStore | None:
+    """
+    CATALOG_STORE_PATH 환경변수가 있으면 해당 디렉토리의 저장소
+
+    Returns:
+        CatalogStore or None: 설정이 없으면 None (인메모리 전용)
+    """
+    path = os.environ.get("CATALOG_STORE_PATH")
+    if not path:
+        return None
+    fsync = os.environ.get("CATALOG_STORE_FSYNC", "").lower() in ("1", "true", "yes")
+    return CatalogStore(path, fsync=fsync)
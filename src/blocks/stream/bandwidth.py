@@ -0,0 +1,204 @@
+"""
+Bandwidth Shaper - 사용자별/노드 전체 토큰 버킷 대역폭 제한
+
+스트리밍 청크를 내보내기 전에 토큰을 소비해 전송 속도를 맞춘다.
+- 사용자 버킷: 초기 버퍼 채우기용 burst 허용 후 사용자 제한 속도로 전송
+- 노드 버킷: 모든 스트림 합계가 NAS 업링크를 넘지 않도록 제한
+- 실제 전송 속도를 측정해 콜백으로 보고 (L3Limiter.record_bandwidth_usage)
+
+단위는 Mbps (메가비트/초)이며 0이면 제한 없음.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+BITS_PER_BYTE = 8
+BYTES_PER_MB = 1024 * 1024
+
+
+def mbps_to_bytes(mbps: float) -> float:
+    """Mbps → 초당 바이트"""
+    return mbps * 1_000_000 / BITS_PER_BYTE
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (바이트 단위)
+
+    부족한 토큰은 빚으로 남겨 다음 소비자도 그만큼 기다리게 한다.
+    """
+
+    def __init__(
+        self,
+        bytes_per_sec: float,
+        burst_bytes: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            bytes_per_sec: 초당 충전 바이트 (0이면 무제한)
+            burst_bytes: 버킷 최대 크기 (처음에는 가득 찬 상태)
+            clock: 시계 (테스트 주입용)
+        """
+        self.rate = bytes_per_sec
+        self.capacity = burst_bytes
+        self._clock = clock
+        self._tokens = burst_bytes
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, nbytes: int) -> float:
+        """
+        nbytes 소비 예약
+
+        Returns:
+            float: 전송 전 기다려야 하는 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        self._tokens -= nbytes
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    @property
+    def is_full(self) -> bool:
+        """버킷이 가득 찼는지 (오래 사용하지 않은 버킷 정리용)"""
+        if self.rate <= 0:
+            return True
+        self._refill()
+        return self._tokens >= self.capacity
+
+
+class _UserState:
+    """사용자별 버킷 + 처리량 측정"""
+
+    def __init__(self, bucket: TokenBucket, now: float):
+        self.bucket = bucket
+        self.active = 0  # 현재 전송 중인 응답 수
+        self.window_start = now
+        self.window_bytes = 0
+
+
+class BandwidthShaper:
+    """사용자별 + 노드 전체 대역폭 제한"""
+
+    DEFAULT_NODE_MBPS = 1000.0  # NAS 업링크 (1GbE)
+    DEFAULT_BURST_MB = 8  # 재생 시작 시 버퍼 채우기 허용량
+    MEASURE_INTERVAL_S = 1.0
+
+    def __init__(
+        self,
+        user_mbps: float,
+        node_mbps: float | None = None,
+        burst_bytes: int | None = None,
+        on_measure: Callable[[str, float], Awaitable[None]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            user_mbps: 사용자별 제한 Mbps (0이면 무제한)
+            node_mbps: 노드 전체 제한 Mbps (None이면 STREAM_NODE_MBPS 환경변수)
+            burst_bytes: 사용자 버킷 burst 크기 (None이면 STREAM_BURST_MB 환경변수)
+            on_measure: 측정된 사용자 처리량(Mbps) 보고 콜백
+            clock: 시계 (테스트 주입용)
+        """
+        if node_mbps is None:
+            node_mbps = float(os.environ.get("STREAM_NODE_MBPS", self.DEFAULT_NODE_MBPS))
+        if burst_bytes is None:
+            burst_bytes = int(
+                float(os.environ.get("STREAM_BURST_MB", self.DEFAULT_BURST_MB)) * BYTES_PER_MB
+            )
+
+        self.user_mbps = user_mbps
+        self.node_mbps = node_mbps
+        self.burst_bytes = burst_bytes
+        self._on_measure = on_measure
+        self._clock = clock
+
+        # 노드 버킷은 약 1초 분량의 burst만 허용
+        node_rate = mbps_to_bytes(node_mbps)
+        self._node = TokenBucket(node_rate, max(node_rate, burst_bytes), clock)
+        self._users: dict[str, _UserState] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """제한이 하나라도 설정되어 있는지"""
+        return self.user_mbps > 0 or self.node_mbps > 0
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def _state(self, user_id: str) -> _UserState:
+        state = self._users.get(user_id)
+        if state is None:
+            self._prune()
+            bucket = TokenBucket(mbps_to_bytes(self.user_mbps), self.burst_bytes, self._clock)
+            state = _UserState(bucket, self._clock())
+            self._users[user_id] = state
+        return state
+
+    def _prune(self) -> None:
+        """전송 중이 아니고 버킷이 다시 가득 찬 사용자 정리 (새 버킷과 동일한 상태)"""
+        for user_id, state in list(self._users.items()):
+            if state.active == 0 and state.bucket.is_full:
+                del self._users[user_id]
+
+    async def pace(self, user_id: str, nbytes: int) -> None:
+        """
+        nbytes 전송 전 호출 (필요한 만큼 대기)
+
+        Args:
+            user_id: 사용자 ID
+            nbytes: 전송할 바이트 수
+        """
+        state = self._state(user_id)
+        wait = max(state.bucket.reserve(nbytes), self._node.reserve(nbytes))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        await self._account(user_id, state, nbytes)
+
+    async def _account(self, user_id: str, state: _UserState, nbytes: int) -> None:
+        state.window_bytes += nbytes
+        elapsed = self._clock() - state.window_start
+        if elapsed >= self.MEASURE_INTERVAL_S:
+            mbps = state.window_bytes * BITS_PER_BYTE / 1_000_000 / elapsed
+            state.window_start = self._clock()
+            state.window_bytes = 0
+            await self._report(user_id, mbps)
+
+    async def _report(self, user_id: str, mbps: float) -> None:
+        if self._on_measure is not None:
+            await self._on_measure(user_id, mbps)
+
+    async def shape(
+        self, user_id: str, chunks: AsyncIterator[bytes]
+    ) -> AsyncIterator[bytes]:
+        """
+        청크 제너레이터에 대역폭 제한 적용
+
+        Args:
+            user_id: 사용자 ID
+            chunks: 원본 청크 제너레이터
+
+        Yields:
+            bytes: 제한 속도에 맞춰 내보내는 청크
+        """
+        state = self._state(user_id)
+        state.active += 1
+        try:
+            async for chunk in chunks:
+                await self.pace(user_id, len(chunk))
+                yield chunk
+        finally:
+            state.active -= 1
+            if state.active == 0:
+                # 사용자의 마지막 전송이 끝나면 처리량 0 보고
+                state.window_start = self._clock()
+                state.window_bytes = 0
+                await self._report(user_id, 0.0)
@@ -0,0 +1,193 @@
+"""
+Async File Reader - 전용 스레드 풀 기반 비동기 파일 읽기
+
+NAS(SMB) 읽기가 이벤트 루프를 막지 않도록 open/read/close를
+크기가 제한된 전용 스레드 풀에서 실행한다.
+- 다음 청크 1개를 미리 읽기 (read-ahead)
+- 읽기마다 지연 시간 측정 (ReadStats)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+from .models import ReadStats
+
+logger = logging.getLogger(__name__)
+
+# Windows에는 os.pread가 없으므로 seek + read를 잠금으로 보호
+_HAS_PREAD = hasattr(os, "pread")
+_seek_lock = threading.Lock()
+
+
+def _pread(f: BinaryIO, size: int, offset: int) -> bytes:
+    """파일 위치를 공유하지 않는 위치 지정 읽기"""
+    if _HAS_PREAD:
+        return os.pread(f.fileno(), size, offset)
+    with _seek_lock:
+        f.seek(offset)
+        return f.read(size)
+
+
+class AsyncFileReader:
+    """전용 스레드 풀에서 파일을 읽는 비동기 리더"""
+
+    DEFAULT_MAX_WORKERS = 8
+    SLOW_READ_THRESHOLD_MS = 500.0
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        on_read: Callable[[int, float], None] | None = None,
+    ):
+        """
+        Args:
+            max_workers: 읽기 스레드 수 (None이면 STREAM_READER_THREADS 환경변수)
+            on_read: 읽기마다 호출되는 콜백 (bytes, latency_seconds)
+        """
+        if max_workers is None:
+            max_workers = int(
+                os.environ.get("STREAM_READER_THREADS", self.DEFAULT_MAX_WORKERS)
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+
+        self.max_workers = max_workers
+        self.stats = ReadStats()
+        self._on_read = on_read
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="stream-reader"
+        )
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def open(self, file_path: Path) -> BinaryIO:
+        """파일 열기 (스레드 풀)"""
+        return await self._run(open, file_path, "rb", 0)
+
+    async def stat(self, file_path: Path) -> os.stat_result:
+        """파일 stat (스레드 풀)"""
+        return await self._run(os.stat, file_path)
+
+    async def close(self, f: BinaryIO) -> None:
+        """파일 닫기 (스레드 풀)"""
+        await self._run(f.close)
+
+    @staticmethod
+    def _timed_pread(f: BinaryIO, size: int, offset: int) -> tuple[bytes, float]:
+        started = time.perf_counter()
+        data = _pread(f, size, offset)
+        return data, time.perf_counter() - started
+
+    def _submit_read(self, f: BinaryIO, size: int, offset: int) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, self._timed_pread, f, size, offset)
+
+    def _record(self, nbytes: int, latency_s: float) -> None:
+        self.stats.record(nbytes, latency_s)
+        if latency_s * 1000 >= self.SLOW_READ_THRESHOLD_MS:
+            logger.warning(f"Slow stream read: {nbytes} bytes in {latency_s * 1000:.0f} ms")
+        if self._on_read:
+            self._on_read(nbytes, latency_s)
+
+    async def pread(self, f: BinaryIO, size: int, offset: int) -> bytes:
+        """열린 파일에서 offset 위치의 size 바이트 읽기"""
+        data, latency = await self._submit_read(f, size, offset)
+        self._record(len(data), latency)
+        return data
+
+    async def read(self, file_path: Path, start_byte: int, size: int) -> bytes:
+        """파일의 특정 구간을 한 번에 읽기"""
+        f = await self.open(file_path)
+        try:
+            return await self.pread(f, size, start_byte)
+        finally:
+            await self.close(f)
+
+    async def read_range(
+        self,
+        file_path: Path,
+        start_byte: int,
+        end_byte: int,
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        파일 범위를 청크 단위로 읽기 (다음 청크 1개 read-ahead)
+
+        현재 청크를 yield하는 동안 다음 청크 읽기가 스레드 풀에서 진행된다.
+
+        Args:
+            file_path: 파일 경로
+            start_byte: 시작 바이트
+            end_byte: 종료 바이트 (포함)
+            chunk_size: 청크 크기
+
+        Yields:
+            bytes: 파일 청크
+        """
+        f = await self.open(file_path)
+        pending: asyncio.Future | None = None
+        try:
+            offset = start_byte
+            remaining = end_byte - start_byte + 1
+            if remaining > 0:
+                pending = self._submit_read(f, min(chunk_size, remaining), offset)
+
+            while pending is not None:
+                chunk, latency = await pending
+                pending = None
+                self._record(len(chunk), latency)
+                if not chunk:
+                    break
+
+                offset += len(chunk)
+                remaining -= len(chunk)
+                if remaining > 0:
+                    pending = self._submit_read(f, min(chunk_size, remaining), offset)
+
+                yield chunk
+        finally:
+            self.close_after(f, pending)
+
+    def close_after(self, f: BinaryIO, pending: asyncio.Future | None = None) -> None:
+        """
+        진행 중인 읽기(pending)가 끝난 뒤 파일 닫기 (대기하지 않음)
+
+        클라이언트 중단 등으로 읽기 결과를 더 이상 기다리지 않을 때 사용한다.
+        """
+        if pending is not None and not pending.done():
+            pending.add_done_callback(lambda _: self._executor.submit(f.close))
+        else:
+            self._executor.submit(f.close)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """스레드 풀 종료"""
+        self._executor.shutdown(wait=wait)
+
+
+# 싱글톤 인스턴스
+_reader: AsyncFileReader | None = None
+
+
+def get_file_reader() -> AsyncFileReader:
+    """AsyncFileReader 싱글톤 반환"""
+    global _reader
+    if _reader is None:
+        _reader = AsyncFileReader()
+    return _reader
+
+
+def shutdown_file_reader() -> None:
+    """공용 AsyncFileReader 종료 (다음 get_file_reader는 새 리더를 만든다)"""
+    global _reader
+    if _reader is not None:
+        _reader.shutdown()
+        _reader = None
@@ -100,11 +100,11 @@ class StreamSession:
 class BandwidthInfo:
     """대역폭 정보"""
 
-    limit_mbps: float
+    limit_mbps: float | None  # None이면 제한 없음
     current_mbps: float
 
     def __post_init__(self):
-        if self.limit_mbps <= 0:
+        if self.limit_mbps is not None and self.limit_mbps <= 0:
             raise ValueError("limit_mbps must be positive")
         if self.current_mbps < 0:
             raise ValueError("current_mbps must be non-negative")
@@ -112,7 +112,7 @@ class BandwidthInfo:
     @property
     def is_throttled(self) -> bool:
         """대역폭 제한 초과 여부"""
-        return self.current_mbps >= self.limit_mbps
+        return self.limit_mbps is not None and self.current_mbps >= self.limit_mbps
 
 
 @dataclass
@@ -121,7 +121,72 @@ class StreamResult:
 
     allowed: bool
     error: str | None = None
+    lease_id: str | None = None  # 슬롯 lease (heartbeat/종료 시 사용)
+    lease_ttl: float | None = None  # heartbeat 없이 lease가 유지되는 시간 (초)
 
     def __post_init__(self):
         if not self.allowed and not self.error:
             raise ValueError("error message required when not allowed")
+
+
+@dataclass
+class ReadStats:
+    """파일 읽기 지연 통계 (NAS 읽기 모니터링용)"""
+
+    reads: int = 0
+    bytes_read: int = 0
+    total_latency_s: float = 0.0
+    max_latency_s: float = 0.0
+    last_latency_s: float = 0.0
+
+    def record(self, nbytes: int, latency_s: float) -> None:
+        """읽기 1회 기록"""
+        self.reads += 1
+        self.bytes_read += nbytes
+        self.total_latency_s += latency_s
+        self.last_latency_s = latency_s
+        self.max_latency_s = max(self.max_latency_s, latency_s)
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """평균 읽기 지연 (ms)"""
+        if self.reads == 0:
+            return 0.0
+        return self.total_latency_s / self.reads * 1000
+
+    def to_dict(self) -> dict[str, float]:
+        """딕셔너리로 변환"""
+        return {
+            "reads": self.reads,
+            "bytes_read": self.bytes_read,
+            "avg_latency_ms": self.avg_latency_ms,
+            "max_latency_ms": self.max_latency_s * 1000,
+            "last_latency_ms": self.last_latency_s * 1000,
+        }
+
+
+@dataclass
+class SeekPosition:
+    """재생 시각에 대응하는 바이트 위치 (MP4 키프레임 인덱스)"""
+
+    requested_s: float
+    keyframe_s: float  # requested_s 이전의 가장 가까운 키프레임
+    offset: int  # 키프레임 첫 바이트
+    moov_offset: int
+    moov_size: int
+    duration_s: float
+    total_size: int
+
+    def __post_init__(self):
+        if self.offset < 0 or self.offset >= self.total_size:
+            raise ValueError("offset must be within the file")
+
+    @property
+    def moov_range(self) -> str:
+        """moov 전체를 받는 Range 헤더 값"""
+        return f"bytes={self.moov_offset}-{self.moov_offset + self.moov_size - 1}"
+
+    @property
+    def seek_range(self) -> str:
+        """키프레임부터 받는 Range 헤더 값"""
+        return f"bytes={self.offset}-"
@@ -7,51 +7,137 @@ HTTP Range 헤더 파싱 및 응답 생성 유틸리티
 import re
 from collections.abc import AsyncGenerator
 from pathlib import Path
+from typing import BinaryIO
 
+from .file_reader import AsyncFileReader, get_file_reader
 from .models import RangeRequest
 
+# 한 요청에서 허용하는 최대 범위 수 (작은 범위 수천 개로 seek를 유발하는 요청 방지)
+MAX_RANGES = 16
 
-def parse_range_header(header: str, total_size: int = 0) -> RangeRequest | None:
+# 이 간격(바이트) 이하로 떨어진 범위는 하나로 합친다 (파트 헤더보다 작은 간격)
+COALESCE_GAP = 80
+
+_RANGE_SPEC = re.compile(r"^(\d*)-(\d*)$")
+
+
+def _parse_range_spec(spec: str, total_size: int | None) -> tuple[int, int] | None:
+    """
+    byte-range-spec 하나 파싱 ("0-499", "500-", "-500")
+
+    Returns:
+        tuple or None: (start, end) - end는 total_size 기준으로 잘림,
+            만족할 수 없거나 total_size를 몰라 끝을 정할 수 없으면 None
+
+    Raises:
+        ValueError: 문법 오류
     """
-    HTTP Range 헤더 파싱
+    match = _RANGE_SPEC.match(spec.strip())
+    if not match or (not match.group(1) and not match.group(2)):
+        raise ValueError(f"Invalid byte-range-spec: {spec!r}")
+
+    first, last = match.group(1), match.group(2)
+
+    if not first:
+        # suffix-byte-range-spec: 마지막 N 바이트
+        suffix = int(last)
+        if total_size is None or total_size <= 0 or suffix == 0:
+            return None
+        return max(0, total_size - suffix), total_size - 1
+
+    start = int(first)
+    if last:
+        end = int(last)
+        if end < start:
+            raise ValueError(f"Invalid byte-range-spec: {spec!r}")
+    elif total_size is None:
+        return None
+    else:
+        end = total_size - 1
+
+    if total_size is not None:
+        if start >= total_size:
+            return None  # 만족할 수 없는 범위 (빈 파일이면 모든 범위)
+        end = min(end, total_size - 1)
+    return start, end
+
+
+def parse_range_set(header: str, total_size: int | None) -> list[RangeRequest] | None:
+    """
+    Range 헤더 전체 파싱 (RFC 7233)
+
+    suffix 범위("bytes=-500")와 여러 범위("bytes=0-99,-500")를 지원한다.
+    만족할 수 없는 범위는 버리고, 겹치거나 인접한 범위는 정렬 후 합친다.
 
     Args:
-        header: Range 헤더 값 (예: "bytes=0-1023")
-        total_size: 전체 파일 크기 (선택적)
+        header: Range 헤더 값
+        total_size: 전체 파일 크기 (None이면 모름 - 끝이 열린 범위는 버림)
 
     Returns:
-        RangeRequest or None: 파싱 결과
+        list or None: 합쳐진 범위 목록 (시작 바이트 순),
+            문법 오류이거나 범위가 MAX_RANGES개를 넘으면 None (헤더 무시 → 200),
+            만족할 수 있는 범위가 없으면 빈 리스트 (416, 빈 파일이면 항상)
 
     Examples:
-        >>> parse_range_header("bytes=0-1023")
-        RangeRequest(start_byte=0, end_byte=1023)
-
-        >>> parse_range_header("bytes=1024-")
-        RangeRequest(start_byte=1024, end_byte=-1)
+        >>> parse_range_set("bytes=0-99,50-199,-100", 1000)
+        [RangeRequest(start_byte=0, end_byte=199), RangeRequest(start_byte=900, end_byte=999)]
     """
     if not header:
         return None
 
-    # "bytes=start-end" 형식 파싱
-    match = re.match(r"bytes=(\d+)-(\d*)", header)
-    if not match:
+    unit, _, specs = header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs.strip():
         return None
 
-    start_byte = int(match.group(1))
-    end_str = match.group(2)
-
-    if end_str:
-        end_byte = int(end_str)
-    else:
-        # "bytes=1024-" 형식 (끝까지)
-        end_byte = total_size - 1 if total_size > 0 else -1
+    parts = [spec for spec in specs.split(",") if spec.strip()]
+    if not parts or len(parts) > MAX_RANGES:
+        return None
 
+    spans = []
     try:
-        return RangeRequest(start_byte=start_byte, end_byte=end_byte)
+        for spec in parts:
+            span = _parse_range_spec(spec, total_size)
+            if span is not None:
+                spans.append(span)
+
+        spans.sort()
+        merged: list[list[int]] = []
+        for start, end in spans:
+            if merged and start <= merged[-1][1] + 1 + COALESCE_GAP:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        return [RangeRequest(start_byte=start, end_byte=end) for start, end in merged]
     except ValueError:
         return None
 
 
+def parse_range_header(header: str, total_size: int | None = None) -> RangeRequest | None:
+    """
+    HTTP Range 헤더 파싱 (단일 범위)
+
+    여러 범위가 있으면 합친 뒤 첫 번째 범위를 반환한다.
+    여러 범위를 모두 처리하려면 parse_range_set을 사용한다.
+
+    Args:
+        header: Range 헤더 값 (예: "bytes=0-1023")
+        total_size: 전체 파일 크기 (선택적, suffix/열린 범위에 필요)
+
+    Returns:
+        RangeRequest or None: 파싱 결과
+
+    Examples:
+        >>> parse_range_header("bytes=0-1023")
+        RangeRequest(start_byte=0, end_byte=1023)
+
+        >>> parse_range_header("bytes=-500", total_size=1000)
+        RangeRequest(start_byte=500, end_byte=999)
+    """
+    ranges = parse_range_set(header, total_size)
+    return ranges[0] if ranges else None
+
+
 def build_range_response(
     total_size: int, start_byte: int, end_byte: int
 ) -> dict[str, str]:
@@ -85,16 +171,24 @@ def build_range_response(
 
 
 async def stream_file_range(
-    file_path: Path, start_byte: int, end_byte: int, chunk_size: int = 1024 * 1024
+    file_path: Path,
+    start_byte: int,
+    end_byte: int,
+    chunk_size: int = 1024 * 1024,
+    reader: AsyncFileReader | None = None,
 ) -> AsyncGenerator[bytes, None]:
     """
     파일의 특정 범위를 청크 단위로 스트리밍
 
+    실제 open/read는 AsyncFileReader 스레드 풀에서 실행되므로
+    느린 NAS 읽기가 이벤트 루프를 막지 않는다.
+
     Args:
         file_path: 파일 경로
         start_byte: 시작 바이트
         end_byte: 종료 바이트
         chunk_size: 청크 크기 (기본 1MB)
+        reader: 파일 리더 (None이면 공용 리더 사용)
 
     Yields:
         bytes: 파일 청크
@@ -103,26 +197,87 @@ async def stream_file_range(
         >>> async for chunk in stream_file_range(Path("video.mp4"), 0, 1048575):
         ...     print(f"Chunk size: {len(chunk)}")
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    reader = reader or get_file_reader()
+
+    async for chunk in reader.read_range(file_path, start_byte, end_byte, chunk_size):
+        yield chunk
+
+
+def build_multipart_part_headers(
+    ranges: list[RangeRequest], total_size: int, content_type: str, boundary: str
+) -> tuple[list[bytes], bytes, int]:
+    """
+    multipart/byteranges 파트 헤더와 전체 본문 길이 계산
+
+    Args:
+        ranges: 전송할 범위 목록
+        total_size: 전체 파일 크기
+        content_type: 각 파트의 Content-Type
+        boundary: multipart 경계 문자열
 
-    total_bytes = end_byte - start_byte + 1
-    remaining = total_bytes
+    Returns:
+        tuple: (파트별 헤더, 닫는 경계, 본문 전체 바이트 수)
+    """
+    part_headers = [
+        (
+            f"\r\n--{boundary}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Range: bytes {r.start_byte}-{r.end_byte}/{total_size}\r\n"
+            "\r\n"
+        ).encode("latin-1")
+        for r in ranges
+    ]
+    closing = f"\r\n--{boundary}--\r\n".encode("latin-1")
+    content_length = (
+        sum(len(h) for h in part_headers) + sum(r.size for r in ranges) + len(closing)
+    )
+    return part_headers, closing, content_length
+
+
+async def stream_multipart_ranges(
+    file_path: Path,
+    ranges: list[RangeRequest],
+    part_headers: list[bytes],
+    closing: bytes,
+    chunk_size: int = 1024 * 1024,
+    file: BinaryIO | None = None,
+    reader: AsyncFileReader | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """
+    multipart/byteranges 본문 스트리밍
 
-    with open(file_path, "rb") as f:
-        f.seek(start_byte)
+    파트를 순서대로 청크 단위로 읽어 보내므로 메모리에는 청크 하나만 올라간다.
 
-        while remaining > 0:
-            # 읽을 크기 결정 (남은 바이트와 청크 크기 중 작은 값)
-            read_size = min(chunk_size, remaining)
+    Args:
+        file_path: 파일 경로
+        ranges: 전송할 범위 목록
+        part_headers: build_multipart_part_headers가 만든 파트 헤더
+        closing: 닫는 경계
+        chunk_size: 청크 크기
+        file: 이미 열린 파일 (있으면 파트마다 다시 열지 않음, 닫지 않음)
+        reader: 파일 리더 (None이면 공용 리더 사용)
 
-            # 청크 읽기
-            chunk = f.read(read_size)
+    Yields:
+        bytes: 파트 헤더 또는 파일 청크
+    """
+    reader = reader or get_file_reader()
+
+    for header, r in zip(part_headers, ranges, strict=True):
+        yield header
+        if file is None:
+            async for chunk in reader.read_range(file_path, r.start_byte, r.end_byte, chunk_size):
+                yield chunk
+            continue
+
+        offset = r.start_byte
+        while offset <= r.end_byte:
+            chunk = await reader.pread(file, min(chunk_size, r.end_byte - offset + 1), offset)
             if not chunk:
                 break
-
+            offset += len(chunk)
             yield chunk
-            remaining -= len(chunk)
+
+    yield closing
 
 
 def calculate_optimal_chunk_size(
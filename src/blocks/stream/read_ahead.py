@@ -0,0 +1,336 @@
+"""
+Read-ahead Manager - 연속 Range 요청용 선행 읽기
+
+플레이어는 "bytes=N-" 형태의 작은 Range 요청을 연속으로 보낸다.
+(컨텐츠, 클라이언트)별 세션을 유지하면서:
+- 파일 디스크립터를 짧은 유휴 시간 동안 열어 둔다 (요청마다 open/seek 반복 방지)
+  StreamSourceCache의 열린 파일을 넘겨받으면 참조를 잡고 그 파일을 공유한다
+- 이전 요청 바로 뒤를 요청하면 순차 재생으로 판단하고
+  현재 범위 다음 구간(기본 4MB)을 백그라운드에서 미리 읽는다
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable
+from pathlib import Path
+from typing import BinaryIO
+
+from .file_reader import AsyncFileReader, get_file_reader
+
+SessionKey = tuple[str, str]  # (content_id, client_id)
+
+
+class ReadAheadSession:
+    """(컨텐츠, 클라이언트)별 열린 파일 + 선행 읽기 버퍼"""
+
+    def __init__(
+        self,
+        key: SessionKey,
+        path: Path,
+        f: BinaryIO,
+        now: float,
+        release_file: Callable[[], None] | None = None,
+    ):
+        self.key = key
+        self.path = path
+        self.file = f
+        # 공유 파일이면 참조 해제 함수, 직접 연 파일이면 None (세션이 닫음)
+        self.release_file = release_file
+        self.last_used = now
+        self.users = 0  # 현재 이 세션으로 전송 중인 응답 수
+
+        # 직전 요청의 마지막 바이트 (순차 재생 판정)
+        self.last_end: int | None = None
+
+        # 선행 읽기 결과
+        self.buffer_start = 0
+        self.buffer = b""
+        self.pending: asyncio.Future | None = None
+        self.pending_start = 0
+        self.pending_size = 0
+
+        # 통계
+        self.buffer_hits = 0
+        self.direct_reads = 0
+
+    @property
+    def buffer_end(self) -> int:
+        """버퍼가 담고 있는 마지막 바이트 + 1"""
+        return self.buffer_start + len(self.buffer)
+
+    def covers(self, offset: int) -> bool:
+        """offset이 버퍼 또는 진행 중인 선행 읽기 범위에 있는지"""
+        if self.buffer_start <= offset < self.buffer_end:
+            return True
+        return (
+            self.pending is not None
+            and self.pending_start <= offset < self.pending_start + self.pending_size
+        )
+
+    def is_sequential(self, start_byte: int) -> bool:
+        """이전 요청 바로 뒤(또는 선행 읽기 범위 안)를 요청했는지"""
+        if self.last_end is None:
+            return False
+        return start_byte == self.last_end + 1 or self.covers(start_byte)
+
+
+class ReadAheadManager:
+    """선행 읽기 세션 관리 (LRU + 유휴 시간 만료)"""
+
+    DEFAULT_PREFETCH_MB = 4
+    DEFAULT_IDLE_TIMEOUT_S = 15.0
+    DEFAULT_MAX_SESSIONS = 64
+
+    def __init__(
+        self,
+        reader: AsyncFileReader | None = None,
+        prefetch_bytes: int | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_S,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            reader: 파일 리더 (None이면 공용 리더)
+            prefetch_bytes: 선행 읽기 크기 (None이면 STREAM_READAHEAD_MB 환경변수)
+            idle_timeout: 사용하지 않는 세션의 파일을 닫기까지의 시간 (초)
+            max_sessions: 최대 세션 수 (초과 시 가장 오래된 유휴 세션부터 정리)
+            clock: 시계 (테스트 주입용)
+        """
+        if prefetch_bytes is None:
+            prefetch_bytes = int(
+                float(os.environ.get("STREAM_READAHEAD_MB", self.DEFAULT_PREFETCH_MB))
+                * 1024 * 1024
+            )
+
+        self._reader = reader
+        self.prefetch_bytes = prefetch_bytes
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self._clock = clock
+        self._sessions: OrderedDict[SessionKey, ReadAheadSession] = OrderedDict()
+
+    @property
+    def reader(self) -> AsyncFileReader:
+        return self._reader or get_file_reader()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get_session(self, content_id: str, client_id: str) -> ReadAheadSession | None:
+        """세션 조회 (테스트/모니터링용)"""
+        return self._sessions.get((content_id, client_id))
+
+    async def _acquire(
+        self,
+        key: SessionKey,
+        path: Path,
+        file: BinaryIO | None = None,
+        share_file: Callable[[], Callable[[], None]] | None = None,
+    ) -> ReadAheadSession:
+        session = self._sessions.get(key)
+        if session is not None and (
+            session.path != path or (file is not None and session.file is not file)
+        ):
+            # 같은 컨텐츠가 다른 티어(L2 ↔ L4)나 다시 연 파일로 서빙되기 시작한 경우
+            # 전송 중인 응답이 있으면 분리만 하고 마지막 사용자가 닫는다
+            del self._sessions[key]
+            if session.users == 0:
+                self._close(session)
+            session = None
+
+        if session is None:
+            if file is not None:
+                # share_file이 없으면 호출자가 파일 수명을 관리
+                release_file = share_file() if share_file is not None else lambda: None
+                session = ReadAheadSession(key, path, file, self._clock(), release_file)
+            else:
+                f = await self.reader.open(path)
+                session = ReadAheadSession(key, path, f, self._clock())
+            self._sessions[key] = session
+
+        self._sessions.move_to_end(key)
+        session.users += 1
+        session.last_used = self._clock()
+        return session
+
+    def _release(self, session: ReadAheadSession) -> None:
+        session.users -= 1
+        session.last_used = self._clock()
+        if session.users == 0:
+            if self._sessions.get(session.key) is not session:
+                # _acquire에서 분리된 세션
+                self._close(session)
+                return
+            # 유휴 시간이 지나면 정리 (별도 백그라운드 루프 없음)
+            try:
+                loop = asyncio.get_running_loop()
+                loop.call_later(self.idle_timeout, self.evict_idle)
+            except RuntimeError:
+                pass
+        self._enforce_limit()
+
+    def _close(self, session: ReadAheadSession) -> None:
+        if self._sessions.get(session.key) is session:
+            del self._sessions[session.key]
+        session.buffer = b""
+        pending = session.pending
+        session.pending = None
+        if session.release_file is None:
+            self.reader.close_after(session.file, pending)
+        elif pending is not None and not pending.done():
+            # 선행 읽기가 끝날 때까지 공유 파일 참조 유지
+            release_file = session.release_file
+            pending.add_done_callback(lambda _: release_file())
+        else:
+            session.release_file()
+
+    def _enforce_limit(self) -> None:
+        if len(self._sessions) <= self.max_sessions:
+            return
+        for session in list(self._sessions.values()):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if session.users == 0:
+                self._close(session)
+
+    def evict_idle(self) -> int:
+        """
+        유휴 시간이 지난 세션 정리
+
+        Returns:
+            int: 닫은 세션 수
+        """
+        now = self._clock()
+        closed = 0
+        for session in list(self._sessions.values()):
+            if session.users == 0 and now - session.last_used >= self.idle_timeout:
+                self._close(session)
+                closed += 1
+        return closed
+
+    def close_all(self) -> None:
+        """모든 세션 정리 (종료 시)"""
+        for session in list(self._sessions.values()):
+            self._close(session)
+
+    def _schedule(self, session: ReadAheadSession, position: int, horizon: int) -> None:
+        """
+        남은 선행 읽기 분량이 절반 이하로 줄면 다음 구간 읽기 시작
+
+        Args:
+            session: 세션
+            position: 다음에 전송할 바이트
+            horizon: 선행 읽기 상한 (이 위치 이전까지만 읽음)
+        """
+        pending = session.pending
+        if pending is not None:
+            if not pending.done() or session.covers(position):
+                return
+            # 탐색(seek)으로 건너뛴 구간의 결과는 버린다
+            if not pending.cancelled():
+                pending.exception()
+            session.pending = None
+
+        if session.buffer_start <= position < session.buffer_end:
+            next_start = session.buffer_end
+        else:
+            next_start = position
+
+        if next_start >= horizon or next_start - position > self.prefetch_bytes // 2:
+            return
+
+        size = min(self.prefetch_bytes, horizon - next_start)
+        session.pending_start = next_start
+        session.pending_size = size
+        session.pending = asyncio.ensure_future(
+            self.reader.pread(session.file, size, next_start)
+        )
+
+    async def _read(self, session: ReadAheadSession, offset: int, size: int) -> bytes:
+        """버퍼 → 진행 중인 선행 읽기 → 직접 읽기 순서로 조회"""
+        pending = session.pending
+        if (
+            pending is not None
+            and not (session.buffer_start <= offset < session.buffer_end)
+            and session.pending_start <= offset < session.pending_start + session.pending_size
+        ):
+            try:
+                data = await asyncio.shield(pending)
+            except Exception:
+                data = None
+            if session.pending is pending:
+                session.pending = None
+                if data is not None:
+                    session.buffer_start = session.pending_start
+                    session.buffer = data
+
+        if session.buffer_start <= offset < session.buffer_end:
+            session.buffer_hits += 1
+            start = offset - session.buffer_start
+            return session.buffer[start:start + size]
+
+        session.direct_reads += 1
+        return await self.reader.pread(session.file, size, offset)
+
+    async def stream(
+        self,
+        content_id: str,
+        client_id: str,
+        file_path: Path,
+        start_byte: int,
+        end_byte: int,
+        total_size: int,
+        chunk_size: int = 1024 * 1024,
+        file: BinaryIO | None = None,
+        share_file: Callable[[], Callable[[], None]] | None = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        파일 범위를 청크 단위로 스트리밍 (세션 파일/선행 읽기 사용)
+
+        순차 재생으로 판단되면 요청 범위를 넘어 다음 요청 구간까지 미리 읽고,
+        그렇지 않으면 이번 요청 범위 안에서만 미리 읽는다.
+
+        Args:
+            content_id: 컨텐츠 ID
+            client_id: 클라이언트 식별자
+            file_path: 파일 경로
+            start_byte: 시작 바이트
+            end_byte: 종료 바이트 (포함)
+            total_size: 전체 파일 크기
+            chunk_size: 청크 크기
+            file: 이미 열린 파일 (있으면 직접 열지 않고 공유)
+            share_file: file의 참조를 잡고 해제 함수를 반환 (세션이 닫힐 때 호출)
+
+        Yields:
+            bytes: 파일 청크
+        """
+        session = await self._acquire((content_id, client_id), file_path, file, share_file)
+        try:
+            horizon = total_size if session.is_sequential(start_byte) else end_byte + 1
+            session.last_end = end_byte
+
+            offset = start_byte
+            while offset <= end_byte:
+                chunk = await self._read(session, offset, min(chunk_size, end_byte - offset + 1))
+                if not chunk:
+                    break
+                offset += len(chunk)
+                self._schedule(session, offset, horizon)
+                yield chunk
+        finally:
+            self._release(session)
+
+
+# 싱글톤 인스턴스
+_manager: ReadAheadManager | None = None
+
+
+def get_read_ahead_manager() -> ReadAheadManager:
+    """ReadAheadManager 싱글톤 반환"""
+    global _manager
+    if _manager is None:
+        _manager = ReadAheadManager()
+    return _manager
@@ -4,22 +4,28 @@ Stream Block FastAPI Router
 HTTP Range Streaming 엔드포인트:
 - GET /stream/{content_id}: 스트리밍 URL 획득
 - GET /stream/{content_id}/video: 실제 비디오 스트리밍 (Range 지원)
-- POST /stream/{content_id}/start: 스트리밍 시작
+- GET /stream/{content_id}/hls/{name}: HLS(fMP4) playlist/세그먼트
+- GET /stream/{content_id}/seek?t=: 재생 시각 → 바이트 오프셋
+- POST /stream/{content_id}/start: 스트리밍 시작 (슬롯 lease 발급)
+- POST /stream/{content_id}/heartbeat?lease_id=: 슬롯 lease 연장
 - POST /stream/{content_id}/end: 스트리밍 종료
 """
 
 
-from fastapi import APIRouter, Header, HTTPException, Request, Response
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 
+from src.core.conditional import http_date, if_range_matches, is_not_modified, make_etag
+
+from ..cache.tiers.segment_cache import PLAYLIST_NAME
 from .models import StreamInfo, StreamResult
 from .range_handler import (
     build_range_response,
-    parse_range_header,
-    stream_file_range,
+    parse_range_set,
     validate_range,
 )
+from .sendfile import MultipartRangeResponse, SendfileResponse
 from .service import StreamService
+from .source_cache import ResolvedSource
 
 router = APIRouter(prefix="/stream", tags=["stream"])
 
@@ -69,40 +75,136 @@ async def stream_video(
 
     Args:
         content_id: 컨텐츠 ID
-        range: Range 헤더 (예: "bytes=0-1048575")
+        range: Range 헤더 (예: "bytes=0-1048575", "bytes=0-1023,-65536")
+
+    서버가 ASGI zero-copy 확장(zerocopysend/pathsend)을 지원하면
+    os.sendfile 경로로 전송하고, 아니면 청크 스트리밍으로 fallback.
+
+    ETag/Last-Modified를 항상 보내고, If-None-Match/If-Modified-Since가
+    현재 파일과 일치하면 파일을 읽지 않고 304를 반환한다.
+    If-Range가 일치하지 않으면 Range를 무시하고 전체 파일(200)을 보낸다.
+
+    여러 범위를 요청하면 (예: 앞쪽 mdat + 끝쪽 moov)
+    겹치는 범위를 합친 뒤 multipart/byteranges로 한 번에 응답.
 
     Returns:
-        StreamingResponse: 206 Partial Content 또는 200 OK
+        SendfileResponse: 206 Partial Content 또는 200 OK
+        Response: 304 Not Modified
+        MultipartRangeResponse: 여러 범위 206 Partial Content
 
     Raises:
-        HTTPException 416: Range 요청 오류
+        HTTPException 416: 만족할 수 없는 범위 (빈 파일의 모든 범위 포함)
         HTTPException 404: 파일 없음
+
+    문법이 잘못되었거나 범위가 너무 많은 Range 헤더는 무시한다 (200 전체 파일).
     """
     service: StreamService = request.app.state.stream_service
 
-    # 스트리밍 소스 조회
+    # 스트리밍 소스 조회 (경로/크기/열린 파일을 요청 간에 공유)
     try:
-        source = await service.get_stream_source(content_id)
+        source = await service.source_cache.acquire(content_id, service.get_stream_source)
     except FileNotFoundError:
-        raise HTTPException(status_code=404, detail="Content not found")
+        raise HTTPException(status_code=404, detail="File not found")
+
+    try:
+        return _build_video_response(service, request, content_id, source, range)
+    except BaseException:
+        service.source_cache.release(source)
+        raise
+
+
+def _client_host(request: Request) -> str:
+    """
+    선행 읽기 세션/대역폭 제한에 쓰는 클라이언트 주소
+
+    request.client는 직접 연결한 피어다. 리버스 프록시 뒤에서는 uvicorn의
+    --proxy-headers와 --forwarded-allow-ips를 프록시 주소로만 설정해
+    신뢰할 프록시가 보낸 X-Forwarded-For만 반영해야 한다 (클라이언트가 보낸
+    헤더를 그대로 믿으면 주소를 위조할 수 있음). 프록시 설정이 없으면 프록시/
+    docker 게이트웨이 뒤의 모든 클라이언트가 한 주소로 보이고, NAT 뒤의
+    사용자는 어떤 설정으로도 구분되지 않는다.
+    """
+    return request.client.host if request.client else "unknown"
+
+
+def _build_video_response(
+    service: StreamService,
+    request: Request,
+    content_id: str,
+    source: ResolvedSource,
+    range: str | None,
+) -> Response:
+    """
+    조건부 헤더와 Range 헤더에 따라 304/200/206 응답 생성
 
+    304는 즉시 소스 참조를 해제하고, 200/206은 응답 종료 시 해제한다.
+    """
     file_path = source.path
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="File not found")
+    total_size = source.size
+
+    validators = {"ETag": source.etag, "Last-Modified": source.last_modified}
+    if is_not_modified(
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+        source.etag,
+        source.mtime,
+    ):
+        service.source_cache.release(source)
+        return Response(status_code=304, headers=validators)
+
+    # 클라이언트가 가진 사본과 다른 파일이면 부분 응답 대신 전체 전송
+    if range and not if_range_matches(request.headers.get("if-range"), source.etag, source.mtime):
+        range = None
+
+    # 같은 클라이언트의 연속 Range 요청은 선행 읽기 세션을 공유
+    client_host = _client_host(request)
+    client_id = f"{client_host}|{request.headers.get('user-agent', '')}"
 
-    total_size = file_path.stat().st_size
+    # TODO: 실제 사용자 ID는 인증 토큰에서 추출
+    # 그 전까지 사용자별 대역폭 제한은 클라이언트 주소 단위 (STREAM_USER_SHAPING으로 opt-in)
+    user_id = client_host
+
+    common = {
+        "media_type": "video/mp4",
+        "chunk_size": service.CHUNK_SIZE,
+        "zero_copy": service.ZERO_COPY_ENABLED,
+        "read_ahead_key": (content_id, client_id),
+        "file": source.file,
+        "on_close": lambda: service.source_cache.release(source),
+        "share_file": lambda: service.source_cache.share(source),
+        "shaper": service.bandwidth_shaper,
+        "user_id": user_id,
+    }
+
+    # Range 헤더 파싱 (suffix/여러 범위, 겹치는 범위 병합)
+    # 문법 오류/범위 수 초과 헤더는 무시하고 전체 파일 전송 (RFC 7233 3.1)
+    ranges = parse_range_set(range, total_size) if range else None
 
     # Range 요청 처리
-    if range:
-        # Range 헤더 파싱
-        range_req = parse_range_header(range, total_size)
-        if not range_req:
-            raise HTTPException(status_code=416, detail="Invalid Range header")
-
-        start_byte = range_req.start_byte
-        end_byte = (
-            range_req.end_byte if range_req.end_byte >= 0 else total_size - 1
-        )
+    if ranges is not None:
+        if not ranges:
+            raise HTTPException(
+                status_code=416,
+                detail="Range not satisfiable",
+                headers={"Content-Range": f"bytes */{total_size}"},
+            )
+
+        if len(ranges) > 1:
+            return MultipartRangeResponse(
+                file_path,
+                ranges,
+                total_size,
+                media_type=common["media_type"],
+                chunk_size=common["chunk_size"],
+                headers=validators,
+                file=common["file"],
+                on_close=common["on_close"],
+                shaper=common["shaper"],
+                user_id=user_id,
+            )
+
+        start_byte = ranges[0].start_byte
+        end_byte = ranges[0].end_byte
 
         # Range 유효성 검증
         valid, error = validate_range(start_byte, end_byte, total_size)
@@ -112,27 +214,179 @@ async def stream_video(
         # 206 Partial Content 응답
         headers = build_range_response(total_size, start_byte, end_byte)
         headers["Content-Type"] = "video/mp4"
+        headers.update(validators)
 
-        return StreamingResponse(
-            stream_file_range(file_path, start_byte, end_byte),
+        return SendfileResponse(
+            file_path,
+            start_byte,
+            end_byte,
+            total_size,
             status_code=206,
             headers=headers,
-            media_type="video/mp4",
+            **common,
         )
     else:
         # 200 OK 응답 (전체 파일)
-        return StreamingResponse(
-            stream_file_range(file_path, 0, total_size - 1),
+        return SendfileResponse(
+            file_path,
+            0,
+            total_size - 1,
+            total_size,
             status_code=200,
             headers={
                 "Content-Length": str(total_size),
                 "Content-Type": "video/mp4",
                 "Accept-Ranges": "bytes",
+                **validators,
             },
-            media_type="video/mp4",
+            **common,
         )
 
 
+# playlist는 재패키징 시 바뀔 수 있어 짧게, 세그먼트는 길게 캐시 (ETag로 재검증)
+HLS_PLAYLIST_MAX_AGE = 10
+HLS_SEGMENT_MAX_AGE = 3600
+HLS_RETRY_AFTER_S = 30
+SEEK_INDEX_RETRY_AFTER_S = 5
+
+
+@router.get("/{content_id}/hls/{name}")
+async def stream_hls(content_id: str, name: str, request: Request) -> Response:
+    """
+    HLS(fMP4) playlist/세그먼트 서빙
+
+    - index.m3u8: 미디어 playlist (세그먼트 URL은 상대 경로)
+    - init.mp4, seg_NNNNN.m4s: 초기화/미디어 세그먼트
+
+    패키지가 아직 없으면 Worker Block에 HLS_PACKAGE 작업을 요청하고
+    503 + Retry-After를 반환한다 (그동안 클라이언트는 /video로 재생 가능).
+
+    Args:
+        content_id: 컨텐츠 ID
+        name: 파일 이름
+
+    Returns:
+        SendfileResponse: 200 OK
+        Response: 304 Not Modified
+
+    Raises:
+        HTTPException 404: 컨텐츠 또는 파일 없음
+        HTTPException 503: 패키징 중
+    """
+    service: StreamService = request.app.state.stream_service
+
+    path = await service.segment_cache.get_file(content_id, name)
+    if path is None:
+        if await service.segment_cache.exists(content_id):
+            raise HTTPException(status_code=404, detail="Segment not found")
+        try:
+            await service.request_hls_package(content_id)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        raise HTTPException(
+            status_code=503,
+            detail="HLS package is being prepared",
+            headers={"Retry-After": str(HLS_RETRY_AFTER_S)},
+        )
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        # 조회 직후 퇴출/재패키징된 경우
+        raise HTTPException(status_code=404, detail="Segment not found")
+
+    if name == PLAYLIST_NAME:
+        media_type = "application/vnd.apple.mpegurl"
+        max_age = HLS_PLAYLIST_MAX_AGE
+    else:
+        media_type = "video/mp4"
+        max_age = HLS_SEGMENT_MAX_AGE
+
+    etag = make_etag(stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    validators = {
+        "ETag": etag,
+        "Last-Modified": http_date(stat.st_mtime),
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if is_not_modified(
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+        etag,
+        stat.st_mtime,
+    ):
+        return Response(status_code=304, headers=validators)
+
+    client_host = _client_host(request)
+    return SendfileResponse(
+        path,
+        0,
+        stat.st_size - 1,
+        stat.st_size,
+        status_code=200,
+        headers={
+            "Content-Length": str(stat.st_size),
+            "Content-Type": media_type,
+            **validators,
+        },
+        media_type=media_type,
+        chunk_size=service.CHUNK_SIZE,
+        zero_copy=service.ZERO_COPY_ENABLED,
+        shaper=service.bandwidth_shaper,
+        user_id=client_host,
+    )
+
+
+@router.get("/{content_id}/seek", response_model=dict)
+async def seek_video(
+    content_id: str,
+    request: Request,
+    t: float = Query(..., ge=0, description="탐색 시각 (초)"),
+) -> dict:
+    """
+    재생 시각 → 바이트 오프셋 (MP4 키프레임 인덱스)
+
+    플레이어는 moov_range로 moov를 한 번에 받고 (캐시되어 있으면 생략),
+    seek_range로 키프레임부터 재생을 시작한다.
+
+    Args:
+        content_id: 컨텐츠 ID
+        t: 탐색 시각 (초)
+
+    Returns:
+        dict: {"t", "keyframe_time", "offset", "range", "moov_range", "duration", "size"}
+
+    Raises:
+        HTTPException 404: 파일 없음
+        HTTPException 422: 인덱스 추출 실패 (MP4가 아님 등)
+        HTTPException 503: 인덱스 추출 중
+    """
+    service: StreamService = request.app.state.stream_service
+
+    try:
+        position = await service.seek(content_id, t)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    if position is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Seek index is being prepared",
+            headers={"Retry-After": str(SEEK_INDEX_RETRY_AFTER_S)},
+        )
+
+    return {
+        "t": position.requested_s,
+        "keyframe_time": position.keyframe_s,
+        "offset": position.offset,
+        "range": position.seek_range,
+        "moov_range": position.moov_range,
+        "duration": position.duration_s,
+        "size": position.total_size,
+    }
+
+
 @router.post("/{content_id}/start", response_model=dict)
 async def start_stream(content_id: str, request: Request) -> dict:
     """
@@ -141,8 +395,11 @@ async def start_stream(content_id: str, request: Request) -> dict:
     Args:
         content_id: 컨텐츠 ID
 
+    슬롯은 lease로 발급되며, 재생 중에는 lease_ttl보다 짧은 주기로
+    /heartbeat를 호출해야 한다. heartbeat가 끊기면 슬롯은 자동 해제된다.
+
     Returns:
-        dict: {"allowed": true} 또는 {"allowed": false, "error": "..."}
+        dict: {"allowed": true, "lease_id": "...", "lease_ttl": 30.0}
 
     Raises:
         HTTPException 429: 동시 스트리밍 제한 초과
@@ -157,16 +414,55 @@ async def start_stream(content_id: str, request: Request) -> dict:
     if not result.allowed:
         raise HTTPException(status_code=429, detail=result.error)
 
-    return {"allowed": result.allowed}
+    return {
+        "allowed": result.allowed,
+        "lease_id": result.lease_id,
+        "lease_ttl": result.lease_ttl,
+    }
+
+
+@router.post("/{content_id}/heartbeat", response_model=dict)
+async def heartbeat_stream(
+    content_id: str,
+    request: Request,
+    lease_id: str = Query(..., description="start에서 받은 lease ID"),
+) -> dict:
+    """
+    스트리밍 슬롯 lease 연장
+
+    Args:
+        content_id: 컨텐츠 ID
+        lease_id: start에서 받은 lease ID
+
+    Returns:
+        dict: {"status": "ok"}
+
+    Raises:
+        HTTPException 404: lease 만료/해제됨 (다시 start 필요)
+    """
+    service: StreamService = request.app.state.stream_service
+
+    # TODO: 실제 사용자 ID는 인증 토큰에서 추출
+    user_id = "user123"
+
+    if not await service.heartbeat(user_id, lease_id):
+        raise HTTPException(status_code=404, detail="Lease not found or expired")
+
+    return {"status": "ok"}
 
 
 @router.post("/{content_id}/end")
-async def end_stream(content_id: str, request: Request) -> dict:
+async def end_stream(
+    content_id: str,
+    request: Request,
+    lease_id: str | None = Query(None, description="start에서 받은 lease ID"),
+) -> dict:
     """
     스트리밍 종료
 
     Args:
         content_id: 컨텐츠 ID
+        lease_id: 해제할 lease (없으면 해당 컨텐츠의 가장 오래된 lease)
 
     Returns:
         dict: {"status": "ended"}
@@ -176,7 +472,7 @@ async def end_stream(content_id: str, request: Request) -> dict:
     # TODO: 실제 사용자 ID는 인증 토큰에서 추출
     user_id = "user123"
 
-    await service.end_stream(user_id, content_id)
+    await service.end_stream(user_id, content_id, lease_id)
 
     return {"status": "ended"}
 
@@ -190,12 +486,13 @@ async def get_bandwidth(content_id: str, request: Request) -> dict:
         content_id: 컨텐츠 ID (미사용, 호환성을 위해 유지)
 
     Returns:
-        dict: {"limit_mbps": ..., "current_mbps": ...}
+        dict: {"limit_mbps": ... (제한 없으면 None), "current_mbps": ...}
     """
     service: StreamService = request.app.state.stream_service
 
     # TODO: 실제 사용자 ID는 인증 토큰에서 추출
-    user_id = "user123"
+    # 그 전까지는 미디어 전송 측정과 같은 키 (클라이언트 주소)
+    user_id = _client_host(request)
 
     bandwidth = await service.get_user_bandwidth(user_id)
 
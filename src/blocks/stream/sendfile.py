@@ -0,0 +1,284 @@
+"""
+Zero-copy File Response
+
+ASGI 서버 확장을 이용한 zero-copy 비디오 전송:
+- http.response.zerocopysend: 서버가 os.sendfile()로 지정 범위를 직접 전송
+- http.response.pathsend: 서버가 파일 경로를 받아 전체 파일을 직접 전송
+- 둘 다 지원하지 않으면 stream_file_range 청크 제너레이터로 fallback
+
+여러 범위 요청은 MultipartRangeResponse (multipart/byteranges 스트리밍)
+"""
+
+import os
+import secrets
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from .bandwidth import BandwidthShaper
+from .file_reader import get_file_reader
+from .models import RangeRequest
+from .range_handler import (
+    build_multipart_part_headers,
+    stream_file_range,
+    stream_multipart_ranges,
+)
+from .read_ahead import get_read_ahead_manager
+
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+PATHSEND_EXTENSION = "http.response.pathsend"
+
+MODE_ZEROCOPY = "zerocopysend"
+MODE_PATHSEND = "pathsend"
+MODE_CHUNKED = "chunked"
+
+
+class SendfileResponse(StreamingResponse):
+    """
+    파일 범위 응답 (zero-copy 우선, 청크 스트리밍 fallback)
+
+    서버가 zero-copy 확장을 지원하면 파이썬에서 바이트를 복사하지 않고
+    커널이 파일 → 소켓으로 직접 전송한다. 지원하지 않는 서버(uvicorn 등)나
+    zero_copy=False인 경우 기존 청크 제너레이터를 그대로 사용한다.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        start_byte: int,
+        end_byte: int,
+        total_size: int,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        media_type: str = "video/mp4",
+        chunk_size: int = 1024 * 1024,
+        zero_copy: bool = True,
+        read_ahead_key: tuple[str, str] | None = None,
+        file: BinaryIO | None = None,
+        on_close: Callable[[], None] | None = None,
+        share_file: Callable[[], Callable[[], None]] | None = None,
+        shaper: BandwidthShaper | None = None,
+        user_id: str = "",
+    ):
+        """
+        Args:
+            file_path: 전송할 파일 경로
+            start_byte: 시작 바이트
+            end_byte: 종료 바이트 (포함)
+            total_size: 전체 파일 크기
+            status_code: 200 (전체) 또는 206 (부분)
+            headers: 응답 헤더
+            media_type: Content-Type
+            chunk_size: fallback 청크 크기
+            zero_copy: False면 항상 청크 스트리밍 사용
+            read_ahead_key: (content_id, client_id) - 지정하면 청크 스트리밍 시
+                세션 파일과 선행 읽기 버퍼를 사용 (ReadAheadManager)
+            file: 이미 열린 파일 (zero-copy 전송에 사용, 닫지 않음)
+            on_close: 응답 종료(완료/중단) 시 호출 (공유 파일 참조 해제 등)
+            share_file: file의 참조를 하나 더 잡고 해제 함수를 반환
+                (선행 읽기 세션이 응답 종료 후에도 file을 계속 쓸 때 사용)
+            shaper: 대역폭 제한 (있으면 청크/zero-copy 전송 모두 속도 조절)
+            user_id: 대역폭 제한 대상 사용자
+        """
+        self.file_path = file_path
+        self.start_byte = start_byte
+        self.end_byte = end_byte
+        self.total_size = total_size
+        self.zero_copy = zero_copy
+        self._file = file
+        self._on_close = on_close
+        self._shaper = shaper if shaper is not None and shaper.enabled else None
+        self._user_id = user_id
+        self._chunk_size = chunk_size
+        self._extensions: dict = {}
+
+        # fallback 제너레이터는 실제로 순회될 때만 파일을 연다
+        if read_ahead_key is not None:
+            content = get_read_ahead_manager().stream(
+                *read_ahead_key, file_path, start_byte, end_byte, total_size, chunk_size,
+                file=file, share_file=share_file,
+            )
+        else:
+            content = stream_file_range(file_path, start_byte, end_byte, chunk_size)
+        if self._shaper is not None:
+            content = self._shaper.shape(user_id, content)
+
+        super().__init__(
+            content,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+        )
+
+    @property
+    def content_length(self) -> int:
+        """전송할 바이트 수"""
+        return self.end_byte - self.start_byte + 1
+
+    @property
+    def is_full_file(self) -> bool:
+        """전체 파일 전송 여부"""
+        return self.start_byte == 0 and self.end_byte == self.total_size - 1
+
+    @property
+    def delivery_mode(self) -> str:
+        """
+        전송 방식 결정
+
+        Returns:
+            str: "zerocopysend", "pathsend" 또는 "chunked"
+        """
+        if not self.zero_copy:
+            return MODE_CHUNKED
+        if ZEROCOPY_EXTENSION in self._extensions:
+            return MODE_ZEROCOPY
+        # pathsend는 범위 지정/속도 조절이 불가능하므로 제한 없는 전체 파일일 때만 사용
+        if (
+            PATHSEND_EXTENSION in self._extensions
+            and self.is_full_file
+            and self._shaper is None
+        ):
+            return MODE_PATHSEND
+        return MODE_CHUNKED
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self._extensions = scope.get("extensions") or {}
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+
+    async def stream_response(self, send: Send) -> None:
+        mode = self.delivery_mode
+        if mode == MODE_CHUNKED:
+            await super().stream_response(send)
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+
+        if mode == MODE_PATHSEND:
+            await send(
+                {"type": "http.response.pathsend", "path": os.path.abspath(self.file_path)}
+            )
+            return
+
+        if self._file is not None:
+            await self._send_zerocopy(send, self._file)
+            return
+
+        reader = get_file_reader()
+        f = await reader.open(self.file_path)
+        try:
+            await self._send_zerocopy(send, f)
+        finally:
+            await reader.close(f)
+
+    async def _send_zerocopy(self, send: Send, f: BinaryIO) -> None:
+        if self._shaper is None:
+            await send(
+                {
+                    "type": "http.response.zerocopysend",
+                    "file": f,
+                    "offset": self.start_byte,
+                    "count": self.content_length,
+                    "more_body": False,
+                }
+            )
+            return
+
+        # 대역폭 제한 시 청크 크기만큼 나눠서 전송
+        offset = self.start_byte
+        end = self.end_byte + 1
+        while offset < end:
+            count = min(self._chunk_size, end - offset)
+            await self._shaper.pace(self._user_id, count)
+            await send(
+                {
+                    "type": "http.response.zerocopysend",
+                    "file": f,
+                    "offset": offset,
+                    "count": count,
+                    "more_body": offset + count < end,
+                }
+            )
+            offset += count
+
+
+class MultipartRangeResponse(StreamingResponse):
+    """
+    여러 범위 응답 (206, multipart/byteranges)
+
+    파트 헤더 길이를 미리 계산해 Content-Length를 정확히 보내고,
+    본문은 파트별로 청크 스트리밍한다 (전체 범위를 메모리에 모으지 않음).
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        ranges: list[RangeRequest],
+        total_size: int,
+        media_type: str = "video/mp4",
+        chunk_size: int = 1024 * 1024,
+        headers: dict[str, str] | None = None,
+        file: BinaryIO | None = None,
+        on_close: Callable[[], None] | None = None,
+        shaper: BandwidthShaper | None = None,
+        user_id: str = "",
+    ):
+        """
+        Args:
+            file_path: 전송할 파일 경로
+            ranges: 전송할 범위 목록 (2개 이상, 겹치지 않음)
+            total_size: 전체 파일 크기
+            media_type: 각 파트의 Content-Type
+            chunk_size: 청크 크기
+            headers: 추가 응답 헤더
+            file: 이미 열린 파일 (파트 읽기에 사용, 닫지 않음)
+            on_close: 응답 종료(완료/중단) 시 호출
+            shaper: 대역폭 제한
+            user_id: 대역폭 제한 대상 사용자
+        """
+        self.file_path = file_path
+        self.ranges = ranges
+        self.total_size = total_size
+        self.boundary = secrets.token_hex(16)
+        self._on_close = on_close
+
+        part_headers, closing, content_length = build_multipart_part_headers(
+            ranges, total_size, media_type, self.boundary
+        )
+        self.content_length = content_length
+
+        content = stream_multipart_ranges(
+            file_path, ranges, part_headers, closing, chunk_size, file=file
+        )
+        if shaper is not None and shaper.enabled:
+            content = shaper.shape(user_id, content)
+
+        super().__init__(
+            content,
+            status_code=206,
+            headers={
+                **(headers or {}),
+                "Content-Length": str(content_length),
+                "Accept-Ranges": "bytes",
+            },
+            media_type=f"multipart/byteranges; boundary={self.boundary}",
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            if self._on_close is not None:
+                self._on_close()
@@ -7,20 +7,33 @@ Stream Service - HTTP Range Streaming 비즈니스 로직
 - 캐시 티어별 소스 선택
 - 동시 스트리밍 제한 (사용자당 최대 3개)
 - 대역폭 조절
+- HLS(fMP4) 패키지 서빙 (없으면 Worker Block에 패키징 요청)
+- 시각 → 바이트 오프셋 탐색 (MP4 키프레임 인덱스, 없으면 추출 요청)
 """
 
+import logging
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from uuid import UUID
 
 from ..cache.models import CacheTier
+from ..cache.tiers import HLSSegmentCache, L3Limiter, SeekIndexStore
+from .bandwidth import BandwidthShaper
+from .file_reader import get_file_reader
 from .models import (
     BandwidthInfo,
     RangeResponse,
+    SeekPosition,
     StreamInfo,
     StreamResult,
     StreamSource,
 )
+from .source_cache import StreamSourceCache
+
+logger = logging.getLogger(__name__)
 
 
 class StreamService:
@@ -29,29 +42,135 @@ class StreamService:
     MAX_CONCURRENT_STREAMS = 3
     DEFAULT_BANDWIDTH_LIMIT_MBPS = 100.0
     CHUNK_SIZE = 1024 * 1024  # 1MB
+    ZERO_COPY_ENABLED = True  # 서버가 지원하면 sendfile/pathsend로 전송
+    PREFETCH_PRIORITY = -10  # 다음 Part 워밍은 다른 작업보다 나중에 처리
+    TASK_REQUEST_INTERVAL_S = 300.0  # 같은 컨텐츠의 패키징/인덱스 작업 재요청 최소 간격
 
     def __init__(
         self,
         auth_service: Any | None = None,
         cache_service: Any | None = None,
         content_service: Any | None = None,
+        catalog_service: Any | None = None,
     ):
         """
         Args:
             auth_service: 인증 서비스 (Mock 가능)
             cache_service: 캐시 서비스 (Mock 가능)
             content_service: 컨텐츠 서비스 (Mock 가능)
+            catalog_service: Flat Catalog 서비스 (None이면 싱글톤 사용)
         """
         self._auth_service = auth_service
         self._cache_service = cache_service
         self._content_service = content_service
+        self._catalog_service = catalog_service
 
-        # 활성 스트리밍 세션 (user_id -> [content_ids])
-        self._active_streams: dict[str, list[str]] = {}
+        # 동시 스트리밍 lease (CacheService의 L3Limiter를 공유, 없으면 자체 Limiter)
+        cache_limiter = getattr(cache_service, "l3", None)
+        if isinstance(cache_limiter, L3Limiter):
+            self._limiter = cache_limiter
+        else:
+            self._limiter = L3Limiter(
+                max_streams_per_user=self.MAX_CONCURRENT_STREAMS,
+                bandwidth_limit_mbps=self.DEFAULT_BANDWIDTH_LIMIT_MBPS,
+            )
 
-        # 사용자별 대역폭 사용량 (user_id -> current_mbps)
+        # 사용자별 대역폭 사용량 (user_id -> current_mbps, 실제 전송 측정값)
         self._bandwidth_usage: dict[str, float] = {}
 
+        # 사용자별/노드 전체 대역폭 제한
+        # 미디어 요청에는 인증된 사용자 ID가 없어 사용자 버킷을 클라이언트 주소로 나눈다.
+        # 프록시/NAT 뒤의 사용자들이 버킷 하나를 공유하게 되므로 사용자별 제한은
+        # STREAM_USER_SHAPING=1일 때만 켠다 (속도: STREAM_USER_MBPS 또는 L3Limiter 설정값).
+        # 노드 전체 제한(STREAM_NODE_MBPS)은 항상 적용된다.
+        limit_mbps = 0.0
+        if os.environ.get("STREAM_USER_SHAPING", "").lower() in ("1", "true", "yes"):
+            limit_mbps = float(
+                os.environ.get("STREAM_USER_MBPS", self._limiter.bandwidth_limit)
+            )
+        self.bandwidth_shaper = BandwidthShaper(
+            user_mbps=limit_mbps, on_measure=self._record_throughput
+        )
+
+        # 해석된 스트리밍 소스 (경로/크기/열린 파일) 공유 캐시
+        self.source_cache = StreamSourceCache()
+
+        # HLS 세그먼트 캐시 (CacheService와 공유, 없으면 자체 인스턴스)
+        segments = getattr(cache_service, "segments", None)
+        if isinstance(segments, HLSSegmentCache):
+            self.segment_cache = segments
+        else:
+            self.segment_cache = HLSSegmentCache()
+
+        # MP4 탐색 인덱스 (CacheService와 공유, 없으면 자체 인스턴스)
+        seek_index = getattr(cache_service, "seek_index", None)
+        if isinstance(seek_index, SeekIndexStore):
+            self.seek_index = seek_index
+        else:
+            self.seek_index = SeekIndexStore()
+
+        # (task_type, content_id) -> 마지막 요청 시각
+        self._task_requested: dict[tuple[str, str], float] = {}
+        # (task_type, content_id) -> (실패 시각, 오류) - 재요청 간격 동안 실패로 응답
+        self._task_failed: dict[tuple[str, str], tuple[float, str]] = {}
+
+        self._subscribers_initialized = False
+
+    async def _record_throughput(self, user_id: str, mbps: float) -> None:
+        """BandwidthShaper 측정값 기록 (L3Limiter에도 반영, 0이면 항목 삭제)"""
+        if mbps > 0:
+            self._bandwidth_usage[user_id] = mbps
+        else:
+            self._bandwidth_usage.pop(user_id, None)
+        await self._limiter.record_bandwidth_usage(user_id, mbps)
+
+    async def setup_event_subscribers(self) -> None:
+        """NAS 파일 변경 이벤트 구독 (소스 캐시 무효화)"""
+        if self._subscribers_initialized:
+            return
+
+        from src.orchestration.message_bus import MessageBus
+
+        bus = MessageBus.get_instance()
+        await bus.subscribe("nas.file.updated", self._on_nas_file_changed)
+        await bus.subscribe("nas.file.deleted", self._on_nas_file_changed)
+        await bus.subscribe("worker.task_completed", self._on_worker_task_done)
+        await bus.subscribe("worker.task_failed", self._on_worker_task_done)
+        self._subscribers_initialized = True
+
+    async def _on_worker_task_done(self, msg: Any) -> None:
+        """worker.task_completed / worker.task_failed 핸들러 (요청한 작업의 결과 기록)"""
+        payload = msg.payload
+        key = (payload.get("task_type"), payload.get("content_id"))
+        if key not in self._task_requested:
+            return
+        if msg.event_type == "worker.task_failed":
+            self._task_failed[key] = (time.monotonic(), str(payload.get("error", "")))
+        else:
+            self._task_failed.pop(key, None)
+
+    async def _on_nas_file_changed(self, msg: Any) -> None:
+        """nas.file.updated / nas.file.deleted 핸들러"""
+        payload = msg.payload
+        if payload.get("file_path"):
+            self.source_cache.invalidate(
+                path=self._convert_path_for_environment(payload["file_path"])
+            )
+
+        # L2 복사본으로 서빙 중인 경우도 있으므로 content_id로도 무효화
+        try:
+            item = self._get_catalog().get_by_nas_file_id(UUID(str(payload["id"])))
+        except (KeyError, ValueError):
+            return
+        if item is not None:
+            self.source_cache.invalidate(content_id=str(item.id))
+            # 원본이 바뀌면 패키지도 무효 (다음 요청 시 다시 패키징)
+            await self.segment_cache.delete(str(item.id))
+            await self.seek_index.delete(str(item.id))
+            for task_type in ("HLS_PACKAGE", "MP4_INDEX"):
+                self._task_requested.pop((task_type, str(item.id)), None)
+                self._task_failed.pop((task_type, str(item.id)), None)
+
     async def get_stream_url(self, content_id: str, token: str) -> StreamInfo:
         """
         스트리밍 URL 획득
@@ -130,9 +249,7 @@ class StreamService:
         data = b"\x00" * content_length
 
         if file_path.exists():
-            with open(file_path, "rb") as f:
-                f.seek(start_byte)
-                data = f.read(content_length)
+            data = await get_file_reader().read(file_path, start_byte, content_length)
 
         # Content-Range 헤더 생성
         content_range = f"bytes {start_byte}-{actual_end}/{total_size}"
@@ -179,11 +296,12 @@ class StreamService:
         Returns:
             StreamSource: 스트리밍 소스
         """
-        # Cache 서비스에서 경로 조회
+        # Cache 서비스에서 경로 조회 (실제로 있는 캐시 파일만, 없으면 카탈로그 원본)
         if self._cache_service:
             cache_path = await self._cache_service.get_stream_path(content_id)
-            tier = self._determine_tier(cache_path)
-            return StreamSource(path=cache_path, tier=tier)
+            if cache_path is not None and cache_path.is_file():
+                tier = self._determine_tier(cache_path)
+                return StreamSource(path=cache_path, tier=tier)
 
         # Flat Catalog에서 file_path 조회
         try:
@@ -229,49 +347,223 @@ class StreamService:
             content_id: 컨텐츠 ID
 
         Returns:
-            StreamResult: 시작 허용 여부
+            StreamResult: 시작 허용 여부 (허용 시 lease_id, heartbeat 주기 산정용 lease_ttl)
         """
-        # 현재 스트리밍 수 확인
-        current_streams = self._active_streams.get(user_id, [])
-
-        if len(current_streams) >= self.MAX_CONCURRENT_STREAMS:
+        # 슬롯 lease 획득 (한도 검사 + 할당을 원자적으로)
+        slot = await self._limiter.acquire_lease(user_id, content_id)
+        if slot is None:
             return StreamResult(
                 allowed=False, error="concurrent_stream_limit_exceeded"
             )
 
-        # 스트리밍 세션 추가
-        if user_id not in self._active_streams:
-            self._active_streams[user_id] = []
-
-        self._active_streams[user_id].append(content_id)
-
         # 이벤트 발행
         from src.orchestration.message_bus import MessageBus
 
         bus = MessageBus.get_instance()
         await bus.publish(
             "stream.started",
-            {"user_id": user_id, "content_id": content_id, "timestamp": datetime.now()},
+            {
+                "user_id": user_id,
+                "content_id": content_id,
+                "lease_id": slot.lease_id,
+                "timestamp": datetime.now(),
+            },
         )
 
-        return StreamResult(allowed=True)
+        # 다음 Part/Day/Episode를 SSD로 미리 워밍
+        await self._prefetch_next(content_id)
+
+        return StreamResult(
+            allowed=True, lease_id=slot.lease_id, lease_ttl=self._limiter.lease_ttl
+        )
 
-    async def end_stream(self, user_id: str, content_id: str) -> None:
+    async def heartbeat(self, user_id: str, lease_id: str) -> bool:
         """
-        스트리밍 종료
+        스트리밍 lease 연장 (재생 중 주기적으로 호출)
 
         Args:
             user_id: 사용자 ID
+            lease_id: start_stream에서 받은 lease ID
+
+        Returns:
+            bool: 연장 성공 여부 (만료/해제된 lease면 False → 다시 start 필요)
+        """
+        return await self._limiter.heartbeat(user_id, lease_id)
+
+    def _get_catalog(self) -> Any:
+        """Flat Catalog 서비스 lazy loading"""
+        if self._catalog_service is None:
+            from src.blocks.flat_catalog.service import get_flat_catalog_service
+
+            self._catalog_service = get_flat_catalog_service()
+        return self._catalog_service
+
+    async def _prefetch_next(self, content_id: str) -> str | None:
+        """
+        다음에 볼 가능성이 높은 아이템의 CACHE_WARM 작업 요청
+
+        Worker Block이 worker.enqueue 메시지를 받아 낮은 우선순위로 큐에 추가한다.
+        실패해도 스트리밍 시작에는 영향을 주지 않는다.
+
+        Returns:
+            요청한 다음 컨텐츠 ID 또는 None
+        """
+        try:
+            item_id = UUID(content_id)
+        except ValueError:
+            # 카탈로그 UUID가 아닌 컨텐츠 ID
+            return None
+
+        try:
+            next_item = self._get_catalog().find_next(item_id)
+            if next_item is None:
+                return None
+
+            next_id = str(next_item.id)
+            if self._cache_service is not None:
+                tier = await self._cache_service.get_content_tier(next_id)
+                if tier == CacheTier.L2:
+                    return None
+
+            nas_path = self._convert_path_for_environment(next_item.file_path)
+
+            from src.orchestration.message_bus import BlockMessage, MessageBus
+
+            bus = MessageBus.get_instance()
+            await bus.publish("worker.enqueue", BlockMessage(
+                source_block="stream",
+                event_type="worker.enqueue",
+                payload={
+                    "task_type": "CACHE_WARM",
+                    "priority": self.PREFETCH_PRIORITY,
+                    "payload": {
+                        "content_id": next_id,
+                        "nas_path": str(nas_path),
+                        "reason": "prefetch_next",
+                        "after": content_id,
+                    },
+                },
+            ))
+            return next_id
+        except Exception as e:
+            logger.warning(f"Prefetch lookup failed for {content_id}: {e}")
+            return None
+
+    async def _request_task(self, task_type: str, content_id: str, nas_path: Path) -> bool:
+        """
+        컨텐츠 단위 Worker 작업 요청 (같은 작업은 TASK_REQUEST_INTERVAL_S 동안 한 번만)
+
+        Returns:
+            bool: 이번 호출로 요청했는지 (이미 요청 중이면 False)
+        """
+        key = (task_type, content_id)
+        now = time.monotonic()
+        requested_at = self._task_requested.get(key)
+        if requested_at is not None and now - requested_at < self.TASK_REQUEST_INTERVAL_S:
+            return False
+        self._task_requested[key] = now
+
+        from src.orchestration.message_bus import BlockMessage, MessageBus
+
+        bus = MessageBus.get_instance()
+        await bus.publish("worker.enqueue", BlockMessage(
+            source_block="stream",
+            event_type="worker.enqueue",
+            payload={
+                "task_type": task_type,
+                "payload": {
+                    "content_id": content_id,
+                    "nas_path": str(nas_path),
+                },
+            },
+        ))
+        return True
+
+    async def _existing_source(self, content_id: str) -> Path:
+        """스트리밍 소스 경로 (파일이 없으면 FileNotFoundError)"""
+        source = await self.get_stream_source(content_id)
+        if not source.path.is_file():
+            raise FileNotFoundError(f"Stream source not found: {source.path}")
+        return source.path
+
+    async def request_hls_package(self, content_id: str) -> bool:
+        """
+        HLS 패키징 작업 요청 (Worker Block의 HLS_PACKAGE)
+
+        Args:
             content_id: 컨텐츠 ID
+
+        Returns:
+            bool: 이번 호출로 요청했는지 (이미 요청 중이면 False)
+
+        Raises:
+            FileNotFoundError: 컨텐츠를 찾을 수 없음
+        """
+        path = await self._existing_source(content_id)
+        return await self._request_task("HLS_PACKAGE", content_id, path)
+
+    async def seek(self, content_id: str, seconds: float) -> SeekPosition | None:
+        """
+        재생 시각 → 바이트 오프셋 (직전 키프레임)
+
+        인덱스가 없거나 원본이 바뀌었으면 Worker Block에 MP4_INDEX 작업을 요청하고
+        None을 반환한다. 최근 추출이 실패했으면(MP4가 아님 등) 재요청 간격 동안
+        ValueError로 응답한다.
+
+        Args:
+            content_id: 컨텐츠 ID
+            seconds: 탐색 시각 (초, 재생 시간을 넘으면 마지막 키프레임)
+
+        Returns:
+            SeekPosition or None: 탐색 위치 (인덱스 준비 중이면 None)
+
+        Raises:
+            FileNotFoundError: 컨텐츠를 찾을 수 없음
+            ValueError: 최근 인덱스 추출이 실패함
         """
-        # 세션 제거
-        if user_id in self._active_streams:
-            if content_id in self._active_streams[user_id]:
-                self._active_streams[user_id].remove(content_id)
+        path = await self._existing_source(content_id)
+        stat = path.stat()
+
+        index = await self.seek_index.load(content_id, stat.st_size, stat.st_mtime_ns)
+        if index is None:
+            failure = self._task_failed.get(("MP4_INDEX", content_id))
+            if failure is not None:
+                failed_at, error = failure
+                if time.monotonic() - failed_at < self.TASK_REQUEST_INTERVAL_S:
+                    raise ValueError(f"Seek index unavailable: {error}")
+                del self._task_failed[("MP4_INDEX", content_id)]
+            await self._request_task("MP4_INDEX", content_id, path)
+            return None
+
+        keyframe_s, offset = index.lookup(seconds)
+        return SeekPosition(
+            requested_s=seconds,
+            keyframe_s=keyframe_s,
+            offset=offset,
+            moov_offset=index.moov_offset,
+            moov_size=index.moov_size,
+            duration_s=index.duration_s,
+            total_size=stat.st_size,
+        )
 
-            # 빈 리스트 제거
-            if not self._active_streams[user_id]:
-                del self._active_streams[user_id]
+    async def end_stream(
+        self, user_id: str, content_id: str, lease_id: str | None = None
+    ) -> None:
+        """
+        스트리밍 종료
+
+        Args:
+            user_id: 사용자 ID
+            content_id: 컨텐츠 ID
+            lease_id: 해제할 lease (None이면 해당 컨텐츠의 가장 오래된 lease)
+        """
+        if lease_id is None:
+            for slot in await self._limiter.get_active_slots(user_id):
+                if slot.content_id == content_id:
+                    lease_id = slot.lease_id
+                    break
+        if lease_id is not None:
+            await self._limiter.release_slot(user_id, lease_id)
 
         # 이벤트 발행
         from src.orchestration.message_bus import MessageBus
@@ -292,13 +584,15 @@ class StreamService:
         사용자 대역폭 조회
 
         Args:
-            user_id: 사용자 ID
+            user_id: 사용자 ID (BandwidthShaper와 같은 키 - 현재는 클라이언트 주소)
 
         Returns:
-            BandwidthInfo: 대역폭 정보
+            BandwidthInfo: 대역폭 정보 (limit_mbps는 실제로 적용되는 제한, 없으면 None)
         """
-        # 사용자별 대역폭 제한 (설정 가능)
-        limit_mbps = self.DEFAULT_BANDWIDTH_LIMIT_MBPS
+        # 한 사용자가 받을 수 있는 최대 속도 = 사용자별 제한과 노드 전체 제한 중 작은 값
+        shaper = self.bandwidth_shaper
+        limits = [mbps for mbps in (shaper.user_mbps, shaper.node_mbps) if mbps > 0]
+        limit_mbps = min(limits) if limits else None
 
         # 현재 사용량 조회
         current_mbps = self._bandwidth_usage.get(user_id, 0.0)
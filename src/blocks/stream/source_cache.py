@@ -0,0 +1,224 @@
+"""
+Stream Source Cache - 컨텐츠별 해석된 스트리밍 소스 캐시
+
+/video 요청마다 반복되던 작업을 요청 간에 공유한다:
+- 카탈로그 조회 + Windows → Docker 경로 변환 (get_stream_source)
+- exists() / stat() (SMB 왕복)
+- open() (zero-copy 전송용 파일 디스크립터)
+
+참조 카운트로 전송 중인 파일은 닫지 않으며,
+nas.file.updated / nas.file.deleted 이벤트 또는 max_age 경과 시 다시 해석한다.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from src.core.conditional import http_date, make_etag
+
+from ..cache.models import CacheTier
+from .file_reader import AsyncFileReader, get_file_reader
+from .models import StreamSource
+
+
+@dataclass
+class ResolvedSource:
+    """해석된 스트리밍 소스 (경로 + 크기 + 열린 파일)"""
+    content_id: str
+    path: Path
+    tier: CacheTier
+    size: int
+    mtime: float
+    file: BinaryIO
+    resolved_at: float
+    inode: int = 0
+    refs: int = 0
+    stale: bool = False
+
+    @property
+    def etag(self) -> str:
+        """강한 ETag (inode, 크기, 수정 시각)"""
+        return make_etag(self.inode, self.size, int(self.mtime * 1_000_000))
+
+    @property
+    def last_modified(self) -> str:
+        """Last-Modified 헤더 값"""
+        return http_date(self.mtime)
+
+
+class StreamSourceCache:
+    """content_id → ResolvedSource LRU 캐시 (참조 카운트)"""
+
+    DEFAULT_MAX_ENTRIES = 256
+    DEFAULT_MAX_AGE_S = 60.0
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age: float = DEFAULT_MAX_AGE_S,
+        reader: AsyncFileReader | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (사용 중이 아닌 항목부터 LRU 퇴출)
+            max_age: 항목을 다시 해석하기까지의 최대 시간 (초)
+            reader: 파일 리더 (None이면 공용 리더)
+            clock: 시계 (테스트 주입용)
+        """
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._reader = reader
+        self._clock = clock
+        self._entries: OrderedDict[str, ResolvedSource] = OrderedDict()
+        self._pending: dict[str, asyncio.Future] = {}
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def reader(self) -> AsyncFileReader:
+        return self._reader or get_file_reader()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def acquire(
+        self,
+        content_id: str,
+        resolver: Callable[[str], Awaitable[StreamSource]],
+    ) -> ResolvedSource:
+        """
+        소스 조회 (참조 카운트 증가, 사용 후 release 필수)
+
+        Args:
+            content_id: 컨텐츠 ID
+            resolver: 캐시 미스 시 호출 (예: StreamService.get_stream_source)
+
+        Returns:
+            ResolvedSource: 해석된 소스
+
+        Raises:
+            FileNotFoundError: 파일 없음
+        """
+        while True:
+            entry = self._entries.get(content_id)
+            if entry is not None and self._clock() - entry.resolved_at > self.max_age:
+                self._discard(entry)
+                entry = None
+
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(content_id)
+                break
+
+            self.misses += 1
+            # 같은 컨텐츠의 동시 미스는 한 번만 해석
+            pending = self._pending.get(content_id)
+            if pending is None:
+                pending = asyncio.ensure_future(self._resolve(content_id, resolver))
+                self._pending[content_id] = pending
+                pending.add_done_callback(lambda _: self._pending.pop(content_id, None))
+            entry = await asyncio.shield(pending)
+            # 대기 중에 퇴출/무효화되었으면 다시 해석
+            if not entry.stale:
+                break
+
+        entry.refs += 1
+        return entry
+
+    async def _resolve(
+        self,
+        content_id: str,
+        resolver: Callable[[str], Awaitable[StreamSource]],
+    ) -> ResolvedSource:
+        source = await resolver(content_id)
+        try:
+            stat = await self.reader.stat(source.path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {source.path}") from None
+
+        f = await self.reader.open(source.path)
+        entry = ResolvedSource(
+            content_id=content_id,
+            path=source.path,
+            tier=source.tier,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            inode=stat.st_ino,
+            file=f,
+            resolved_at=self._clock(),
+        )
+
+        old = self._entries.get(content_id)
+        if old is not None:
+            self._discard(old)
+        self._entries[content_id] = entry
+        self._enforce_limit(exclude=content_id)
+        return entry
+
+    def release(self, entry: ResolvedSource) -> None:
+        """참조 카운트 감소 (무효화된 항목은 마지막 사용자가 닫음)"""
+        entry.refs -= 1
+        if entry.refs <= 0 and entry.stale:
+            self._close(entry)
+        else:
+            self._enforce_limit()
+
+    def share(self, entry: ResolvedSource) -> Callable[[], None]:
+        """
+        이미 acquire한 항목의 참조를 하나 더 잡기 (다른 소유자와 파일 공유)
+
+        Returns:
+            Callable: 공유가 끝나면 호출할 release 함수
+        """
+        entry.refs += 1
+        return lambda: self.release(entry)
+
+    def _close(self, entry: ResolvedSource) -> None:
+        if not entry.file.closed:
+            self.reader.close_after(entry.file)
+
+    def _discard(self, entry: ResolvedSource) -> None:
+        """캐시에서 제거 (사용 중이면 release 시 닫힘)"""
+        if self._entries.get(entry.content_id) is entry:
+            del self._entries[entry.content_id]
+        entry.stale = True
+        if entry.refs <= 0:
+            self._close(entry)
+
+    def _enforce_limit(self, exclude: str | None = None) -> None:
+        if len(self._entries) <= self.max_entries:
+            return
+        for entry in list(self._entries.values()):
+            if len(self._entries) <= self.max_entries:
+                break
+            if entry.refs <= 0 and entry.content_id != exclude:
+                self._discard(entry)
+
+    def invalidate(self, content_id: str | None = None, path: Path | None = None) -> int:
+        """
+        content_id 또는 파일 경로가 일치하는 항목 무효화
+
+        Returns:
+            int: 무효화된 항목 수
+        """
+        targets = [
+            entry
+            for entry in self._entries.values()
+            if (content_id is not None and entry.content_id == content_id)
+            or (path is not None and entry.path == path)
+        ]
+        for entry in targets:
+            self._discard(entry)
+        return len(targets)
+
+    def clear(self) -> None:
+        """모든 항목 무효화"""
+        for entry in list(self._entries.values()):
+            self._discard(entry)
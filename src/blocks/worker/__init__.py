@@ -5,6 +5,8 @@ Worker Block
 - 썸네일 생성
 - 캐시 워밍 (NAS → SSD)
 - NAS 스캔
+- HLS 패키징
+- MP4 탐색 인덱스 추출
 """
 
 from .models import Task, TaskResult, TaskStatus, TaskType
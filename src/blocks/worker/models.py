@@ -15,6 +15,8 @@ class TaskType(str, Enum):
     THUMBNAIL = "THUMBNAIL"
     CACHE_WARM = "CACHE_WARM"
     NAS_SCAN = "NAS_SCAN"
+    HLS_PACKAGE = "HLS_PACKAGE"
+    MP4_INDEX = "MP4_INDEX"
 
 
 class TaskStatus(str, Enum):
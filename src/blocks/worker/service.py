@@ -3,11 +3,16 @@ Worker Service
 
 비동기 작업 큐 관리
 - 우선순위 큐
-- 작업 처리 (ThumbnailWorker, CacheWarmerWorker, NASScannerWorker)
+- 작업 처리 (ThumbnailWorker, CacheWarmerWorker, NASScannerWorker, HLSPackagerWorker,
+  MP4IndexWorker)
 - 재시도 메커니즘
+- 백그라운드 처리 루프 (start/stop, 앱 수명주기에서 실행)
 """
 
+import asyncio
 import heapq
+import logging
+import os
 import uuid
 from datetime import datetime
 
@@ -15,17 +20,24 @@ from src.orchestration.message_bus import BlockMessage, MessageBus
 
 from .models import Task, TaskResult, TaskStatus, TaskType
 from .workers.cache_warmer import CacheWarmerWorker
+from .workers.hls_packager import HLSPackagerWorker
+from .workers.mp4_indexer import MP4IndexWorker
 from .workers.nas_scanner import NASScannerWorker
 from .workers.thumbnail import ThumbnailWorker
 
+logger = logging.getLogger(__name__)
+
 
 class WorkerService:
     """비동기 작업 큐 서비스"""
 
-    def __init__(self, cache_service=None):
+    DEFAULT_CONCURRENCY = 2  # 동시에 처리하는 작업 수 (WORKER_CONCURRENCY로 변경)
+
+    def __init__(self, cache_service=None, concurrency: int | None = None):
         """
         Args:
             cache_service: CacheService 인스턴스 (Optional, Mock 테스트 용)
+            concurrency: 처리 루프 수 (None이면 WORKER_CONCURRENCY 또는 기본값)
         """
         self._queue: list = []  # 우선순위 큐 [(priority, task), ...]
         self._tasks: dict[str, Task] = {}  # task_id -> Task
@@ -36,10 +48,78 @@ class WorkerService:
             TaskType.THUMBNAIL: ThumbnailWorker(cache_service),
             TaskType.CACHE_WARM: CacheWarmerWorker(cache_service),
             TaskType.NAS_SCAN: NASScannerWorker(cache_service),
+            TaskType.HLS_PACKAGE: HLSPackagerWorker(cache_service),
+            TaskType.MP4_INDEX: MP4IndexWorker(cache_service),
         }
 
         # MessageBus
         self._bus = MessageBus.get_instance()
+        self._subscribers_initialized = False
+
+        # 백그라운드 처리 루프 (enqueue 시 깨움)
+        if concurrency is None:
+            concurrency = int(os.environ.get("WORKER_CONCURRENCY", self.DEFAULT_CONCURRENCY))
+        self.concurrency = max(concurrency, 1)
+        self._wakeup = asyncio.Event()
+        self._runners: list[asyncio.Task] = []
+
+    async def setup_event_subscribers(self) -> None:
+        """이벤트 구독 설정 (다른 블럭의 작업 요청 수신)"""
+        if self._subscribers_initialized:
+            return
+
+        await self._bus.subscribe("worker.enqueue", self._on_enqueue_request)
+        self._subscribers_initialized = True
+
+    async def teardown_event_subscribers(self) -> None:
+        """이벤트 구독 해제"""
+        if not self._subscribers_initialized:
+            return
+
+        await self._bus.unsubscribe("worker.enqueue", self._on_enqueue_request)
+        self._subscribers_initialized = False
+
+    async def start(self) -> None:
+        """백그라운드 처리 루프 시작 (큐에 들어온 작업을 우선순위 순으로 처리)"""
+        if self._runners:
+            return
+        self._runners = [
+            asyncio.create_task(self._run(), name=f"worker-{i}")
+            for i in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """백그라운드 처리 루프 중지 (처리 중인 작업은 취소)"""
+        runners, self._runners = self._runners, []
+        for runner in runners:
+            runner.cancel()
+        await asyncio.gather(*runners, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """큐가 빌 때까지 처리하고 다음 enqueue까지 대기"""
+        while True:
+            # 확인 전에 지워야 확인과 대기 사이의 enqueue를 놓치지 않음
+            self._wakeup.clear()
+            try:
+                result = await self.process_next()
+            except Exception as e:
+                # process_next가 작업 실패를 처리하므로 여기는 이벤트 발행 실패 등
+                logger.warning(f"Worker loop error: {e}")
+                continue
+            if result is None:
+                await self._wakeup.wait()
+
+    async def _on_enqueue_request(self, msg: BlockMessage) -> None:
+        """
+        worker.enqueue 이벤트 핸들러
+
+        payload: {"task_type": "CACHE_WARM", "payload": {...}, "priority": 0}
+        """
+        await self.enqueue(
+            task_type=msg.payload["task_type"],
+            payload=msg.payload.get("payload", {}),
+            priority=msg.payload.get("priority", 0),
+        )
 
     async def enqueue(
         self,
@@ -73,6 +153,7 @@ class WorkerService:
         # 우선순위 큐에 추가 (음수로 max heap 구현)
         heapq.heappush(self._queue, (-priority, task.created_at, task))
         self._tasks[task_id] = task
+        self._wakeup.set()
 
         return task
 
@@ -108,6 +189,7 @@ class WorkerService:
                     payload={
                         "task_id": task.id,
                         "task_type": task.type.value,
+                        "content_id": task.payload.get("content_id"),
                         "result": result.data,
                     }
                 ))
@@ -121,6 +203,7 @@ class WorkerService:
                     payload={
                         "task_id": task.id,
                         "task_type": task.type.value,
+                        "content_id": task.payload.get("content_id"),
                         "error": result.message,
                         "retries": task.retries,
                     }
@@ -141,6 +224,7 @@ class WorkerService:
                 payload={
                     "task_id": task.id,
                     "task_type": task.type.value,
+                    "content_id": task.payload.get("content_id"),
                     "error": str(e),
                     "retries": task.retries,
                 }
@@ -197,4 +281,6 @@ class WorkerService:
                 heapq.heappush(self._queue, (-task.priority, task.created_at, task))
                 retry_count += 1
 
+        if retry_count:
+            self._wakeup.set()
         return retry_count
@@ -5,9 +5,13 @@ Workers Package
 - ThumbnailWorker: 썸네일 생성
 - CacheWarmerWorker: NAS → SSD 복사
 - NASScannerWorker: NAS 스캔
+- HLSPackagerWorker: HLS(fMP4) 패키징
+- MP4IndexWorker: MP4 탐색 인덱스 추출
 """
 
 from .cache_warmer import CacheWarmerWorker
+from .hls_packager import HLSPackagerWorker
+from .mp4_indexer import MP4IndexWorker
 from .nas_scanner import NASScannerWorker
 from .thumbnail import ThumbnailWorker
 
@@ -15,4 +19,6 @@ __all__ = [
     "ThumbnailWorker",
     "CacheWarmerWorker",
     "NASScannerWorker",
+    "HLSPackagerWorker",
+    "MP4IndexWorker",
 ]
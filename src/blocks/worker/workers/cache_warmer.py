@@ -2,21 +2,187 @@
 CacheWarmerWorker
 
 NAS → SSD 캐시 워밍 작업 처리
+- 청크 단위 복사 (.part 임시 파일, 중단 시 이어서 복사)
+- 크기가 제한된 전용 스레드 풀
+- 전체 복사 대역폭 상한 (라이브 NAS 스트리밍 보호)
+- CacheService의 L2 승격 필터(SizeAwareTinyLFU) + 공간 예약 후 복사
+- 크기 + 샘플 해시 검증 후 L2SSDCache에 등록
 """
 
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from pathlib import Path
+
 from ..models import Task, TaskResult
 
+# 복사 중인 임시 파일 접미사 (L2SSDCache와 동일)
+PARTIAL_SUFFIX = ".part"
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class BandwidthThrottle:
+    """
+    스레드 간 공유 토큰 버킷 (바이트/초)
+
+    rate가 0이면 제한 없음.
+    """
+
+    def __init__(self, bytes_per_sec: float, burst_bytes: int | None = None):
+        """
+        Args:
+            bytes_per_sec: 초당 허용 바이트 (0이면 무제한)
+            burst_bytes: 버킷 최대 크기 (None이면 1초 분량)
+        """
+        self.rate = bytes_per_sec
+        self.capacity = burst_bytes if burst_bytes is not None else bytes_per_sec
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, nbytes: int) -> None:
+        """nbytes 전송 전 호출 (필요하면 호출 스레드를 잠시 멈춤)"""
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 부족분은 빚으로 남겨 다른 스레드도 그만큼 기다리게 한다
+            self._tokens -= nbytes
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def sample_hash(path: Path, size: int, sample_bytes: int = BYTES_PER_MB) -> str:
+    """
+    빠른 파일 해시 (크기 + 앞/중간/끝 샘플의 blake2b)
+
+    Args:
+        path: 파일 경로
+        size: 파일 크기
+        sample_bytes: 샘플 하나의 크기
+
+    Returns:
+        str: 16진수 해시
+    """
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    offsets = sorted({0, max(0, size // 2 - sample_bytes // 2), max(0, size - sample_bytes)})
+    with open(path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            digest.update(f.read(sample_bytes))
+    return digest.hexdigest()
+
 
 class CacheWarmerWorker:
     """캐시 워밍 워커 (NAS → SSD 복사)"""
 
-    def __init__(self, cache_service=None):
+    DEFAULT_MAX_WORKERS = 2
+    DEFAULT_MAX_MBPS = 100  # MB/s, 0이면 무제한
+    CHUNK_SIZE = 8 * BYTES_PER_MB
+
+    def __init__(
+        self,
+        cache_service=None,
+        max_workers: int | None = None,
+        max_mbps: float | None = None,
+    ):
         """
         Args:
-            cache_service: CacheService 인스턴스 (Optional)
+            cache_service: CacheService 인스턴스 (Optional, 있으면 L2에 등록)
+            max_workers: 동시 복사 스레드 수 (None이면 CACHE_WARM_THREADS 환경변수)
+            max_mbps: 전체 복사 대역폭 상한 MB/s (None이면 CACHE_WARM_MAX_MBPS 환경변수)
         """
         self._cache_service = cache_service
 
+        if max_workers is None:
+            max_workers = int(os.environ.get("CACHE_WARM_THREADS", self.DEFAULT_MAX_WORKERS))
+        if max_mbps is None:
+            max_mbps = float(os.environ.get("CACHE_WARM_MAX_MBPS", self.DEFAULT_MAX_MBPS))
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cache-warmer"
+        )
+        self._throttle = BandwidthThrottle(max_mbps * BYTES_PER_MB)
+
+    def _copy_chunked(
+        self, source: Path, partial: Path, size: int, cancelled: threading.Event
+    ) -> tuple[int, int]:
+        """
+        source → partial 청크 복사 (기존 .part가 있으면 이어서, 취소되면 중단)
+
+        Returns:
+            tuple: (이어서 복사를 시작한 위치, 이번에 복사한 바이트 수)
+        """
+        partial.parent.mkdir(parents=True, exist_ok=True)
+        offset = partial.stat().st_size if partial.exists() else 0
+        if offset > size:
+            # 원본이 바뀐 경우 처음부터 다시 복사
+            offset = 0
+            partial.unlink()
+
+        copied = 0
+        with open(source, "rb") as src, open(partial, "ab") as dst:
+            src.seek(offset)
+            while offset + copied < size and not cancelled.is_set():
+                chunk_len = min(self.CHUNK_SIZE, size - offset - copied)
+                self._throttle.consume(chunk_len)
+                chunk = src.read(chunk_len)
+                if not chunk:
+                    break
+                dst.write(chunk)
+                copied += len(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        return offset, copied
+
+    def _warm(self, source: Path, target: Path, cancelled: threading.Event) -> dict:
+        """
+        복사 → 검증 → rename (스레드 풀에서 실행)
+
+        작업이 취소되면 .part를 남긴 채 (다음에 이어서 복사) 대상 파일을 건드리지 않는다.
+        """
+        size = source.stat().st_size
+        partial = target.with_name(target.name + PARTIAL_SUFFIX)
+
+        started = time.perf_counter()
+        resumed_from, copied = self._copy_chunked(source, partial, size, cancelled)
+        elapsed = time.perf_counter() - started
+        if cancelled.is_set():
+            raise CancelledError(f"Cache warm cancelled: {target}")
+
+        copied_size = partial.stat().st_size
+        if copied_size != size:
+            partial.unlink(missing_ok=True)
+            raise OSError(f"Size mismatch after copy: {copied_size} != {size}")
+
+        checksum = sample_hash(source, size)
+        if sample_hash(partial, size) != checksum:
+            partial.unlink(missing_ok=True)
+            raise OSError("Checksum mismatch after copy")
+
+        # 대기 중인 process가 취소됐으면 예약이 이미 해제됐으므로 등록되지 않을 파일을 만들지 않음
+        if cancelled.is_set():
+            raise CancelledError(f"Cache warm cancelled: {target}")
+        os.replace(partial, target)
+
+        return {
+            "size_bytes": size,
+            "copied_bytes": copied,
+            "resumed_from": resumed_from,
+            "duration_s": round(elapsed, 3),
+            "throughput_mbps": round(copied / BYTES_PER_MB / elapsed, 2) if elapsed > 0 else 0.0,
+            "checksum": checksum,
+        }
+
     async def process(self, task: Task) -> TaskResult:
         """
         캐시 워밍 작업 처리 (NAS → SSD)
@@ -31,13 +197,14 @@ class CacheWarmerWorker:
             # Payload 검증
             nas_path = task.payload.get("nas_path")
             ssd_path = task.payload.get("ssd_path")
+            content_id = task.payload.get("content_id")
 
             if not nas_path:
                 # cache.miss 이벤트에서 온 경우 key만 있을 수 있음
                 key = task.payload.get("key")
                 if key:
-                    nas_path = task.payload.get("nas_path", f"/nas/videos/{key}.mp4")
-                    ssd_path = f"/ssd/cache/{key}.mp4"
+                    nas_path = f"/nas/videos/{key}.mp4"
+                    content_id = content_id or key
                 else:
                     return TaskResult(
                         success=False,
@@ -45,20 +212,73 @@ class CacheWarmerWorker:
                         data={}
                     )
 
-            if not ssd_path:
-                ssd_path = f"/ssd/cache/{nas_path.split('/')[-1]}"
+            source = Path(nas_path)
+            content_id = content_id or source.stem
+            l2 = getattr(self._cache_service, "l2", None)
+
+            # L2가 있으면 ssd_path와 무관하게 항상 L2 디렉토리 안에 복사 (L2가 관리하는 경로만 등록)
+            if l2 is not None:
+                target = l2.path_for(content_id, source.suffix or ".mp4")
+            elif ssd_path:
+                target = Path(ssd_path)
+            else:
+                target = Path(os.environ.get("SSD_CACHE_PATH", "/cache/ssd")) / source.name
+
+            loop = asyncio.get_running_loop()
+            existing = None
+            if l2 is not None:
+                size = (await loop.run_in_executor(self._executor, source.stat)).st_size
+                existing = l2.get_entry(content_id)
+                if existing is not None and existing.size_bytes == size:
+                    # 이미 같은 크기로 캐시됨 - 다시 복사하지 않음
+                    cached_path = await l2.get_path(content_id)
+                    return TaskResult(
+                        success=True,
+                        message=f"Already cached: {nas_path} → {cached_path}",
+                        data={
+                            "content_id": content_id,
+                            "nas_path": nas_path,
+                            "ssd_path": str(cached_path),
+                            "size_bytes": size,
+                            "copied_bytes": 0,
+                            "already_cached": True,
+                        }
+                    )
+                if existing is not None:
+                    admitted = await l2.reserve(content_id, size)
+                else:
+                    admitted = await self._cache_service.admit_to_l2(content_id, size)
+                if not admitted:
+                    return TaskResult(
+                        success=False,
+                        message=f"Cache warm rejected by L2 admission: {content_id}",
+                        data={"content_id": content_id, "size_bytes": size, "admitted": False}
+                    )
+
+            cancelled = threading.Event()
+            try:
+                stats = await loop.run_in_executor(
+                    self._executor, self._warm, source, target, cancelled
+                )
+            except BaseException:
+                cancelled.set()
+                if l2 is not None:
+                    l2.release(content_id)
+                raise
 
-            # Mock: NAS → SSD 복사 시뮬레이션
-            # 실제 구현에서는 shutil.copy 또는 rsync 사용
-            copied_size = 1024 * 1024 * 100  # 100MB (Mock)
+            if l2 is not None:
+                if existing is not None and existing.path != target:
+                    await l2.delete(content_id)
+                l2.register(content_id, target)
 
             return TaskResult(
                 success=True,
-                message=f"Cache warmed: {nas_path} → {ssd_path}",
+                message=f"Cache warmed: {nas_path} → {target}",
                 data={
+                    "content_id": content_id,
                     "nas_path": nas_path,
-                    "ssd_path": ssd_path,
-                    "size_bytes": copied_size,
+                    "ssd_path": str(target),
+                    **stats,
                 }
             )
 
@@ -0,0 +1,182 @@
+"""
+HLSPackagerWorker
+
+카탈로그 항목을 fMP4 HLS로 패키징 (재인코딩 없이 remux)
+- ffmpeg -c copy로 세그먼트(기본 6초) + index.m3u8 생성
+- 임시 디렉토리에서 패키징 후 HLSSegmentCache에 원자적으로 등록
+- 8시간 녹화본도 탐색 시 세그먼트 하나만 받으면 되고, CDN 캐시가 가능해짐
+"""
+
+import asyncio
+import os
+import shutil
+import time
+from pathlib import Path
+
+from ...cache.tiers import HLSSegmentCache
+from ...cache.tiers.segment_cache import INIT_SEGMENT_NAME, PLAYLIST_NAME
+from ..models import Task, TaskResult
+
+SEGMENT_PATTERN = "seg_%05d.m4s"
+
+# 실패 메시지에 포함할 ffmpeg stderr 최대 길이
+STDERR_TAIL = 2000
+
+
+def build_ffmpeg_args(
+    ffmpeg: str, source: Path, output_dir: Path, segment_seconds: float
+) -> list[str]:
+    """
+    fMP4 HLS remux용 ffmpeg 인자
+
+    Args:
+        ffmpeg: ffmpeg 실행 파일
+        source: 원본 비디오
+        output_dir: 출력 디렉토리
+        segment_seconds: 목표 세그먼트 길이 (키프레임 경계에서 자름)
+
+    Returns:
+        list[str]: 실행 인자
+    """
+    return [
+        ffmpeg,
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel", "error",
+        "-y",
+        "-i", str(source),
+        "-map", "0:v:0",
+        "-map", "0:a?",
+        "-c", "copy",
+        "-f", "hls",
+        "-hls_time", f"{segment_seconds:g}",
+        "-hls_playlist_type", "vod",
+        "-hls_segment_type", "fmp4",
+        "-hls_fmp4_init_filename", INIT_SEGMENT_NAME,
+        "-hls_flags", "independent_segments",
+        "-hls_segment_filename", str(output_dir / SEGMENT_PATTERN),
+        str(output_dir / PLAYLIST_NAME),
+    ]
+
+
+class HLSPackagerWorker:
+    """HLS 패키징 워커 (NAS 원본 → SSD 세그먼트 캐시)"""
+
+    DEFAULT_SEGMENT_SECONDS = 6.0
+
+    def __init__(self, cache_service=None, segment_cache: HLSSegmentCache | None = None):
+        """
+        Args:
+            cache_service: CacheService 인스턴스 (Optional, segments 캐시 공유)
+            segment_cache: 세그먼트 캐시 (None이면 cache_service.segments 또는 새 인스턴스)
+        """
+        self._cache_service = cache_service
+        if segment_cache is None:
+            segment_cache = getattr(cache_service, "segments", None)
+        self._segments = segment_cache if isinstance(segment_cache, HLSSegmentCache) else None
+        self._ffmpeg = os.environ.get("FFMPEG_PATH", "ffmpeg")
+
+    @property
+    def segments(self) -> HLSSegmentCache:
+        """세그먼트 캐시 (처음 사용할 때 생성)"""
+        if self._segments is None:
+            self._segments = HLSSegmentCache()
+        return self._segments
+
+    async def _run_ffmpeg(self, args: list[str]) -> tuple[int, str]:
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, stderr.decode(errors="replace")[-STDERR_TAIL:]
+
+    async def process(self, task: Task) -> TaskResult:
+        """
+        HLS 패키징 작업 처리
+
+        Args:
+            task: Task 인스턴스 (payload: content_id, nas_path, segment_seconds)
+
+        Returns:
+            TaskResult: 작업 결과
+        """
+        staging: Path | None = None
+        try:
+            content_id = task.payload.get("content_id")
+            nas_path = task.payload.get("nas_path")
+            if not content_id or not nas_path:
+                return TaskResult(
+                    success=False,
+                    message="Missing required field: content_id or nas_path",
+                    data={}
+                )
+
+            ffmpeg = shutil.which(self._ffmpeg)
+            if ffmpeg is None:
+                return TaskResult(
+                    success=False,
+                    message=f"ffmpeg not found: {self._ffmpeg}",
+                    data={"error": "ffmpeg_not_found"}
+                )
+
+            source = Path(nas_path)
+            segment_seconds = float(
+                task.payload.get("segment_seconds", self.DEFAULT_SEGMENT_SECONDS)
+            )
+
+            # remux 결과는 원본과 거의 같은 크기
+            size = (await asyncio.to_thread(source.stat)).st_size
+            await self.segments.make_room(size, exclude=content_id)
+
+            staging = await asyncio.to_thread(self.segments.staging_dir, content_id)
+            started = time.perf_counter()
+            returncode, stderr = await self._run_ffmpeg(
+                build_ffmpeg_args(ffmpeg, source, staging, segment_seconds)
+            )
+            elapsed = time.perf_counter() - started
+
+            if returncode != 0:
+                return TaskResult(
+                    success=False,
+                    message=f"HLS packaging failed: ffmpeg exited with {returncode}",
+                    data={"error": stderr.strip(), "returncode": returncode}
+                )
+
+            files = list(staging.iterdir())
+            segment_count = sum(1 for f in files if f.suffix == ".m4s")
+            size_bytes = sum(f.stat().st_size for f in files)
+            package_dir = await self.segments.commit(content_id, staging)
+            staging = None
+
+            return TaskResult(
+                success=True,
+                message=f"HLS packaged: {nas_path} → {package_dir}",
+                data={
+                    "content_id": content_id,
+                    "nas_path": nas_path,
+                    "package_dir": str(package_dir),
+                    "playlist": str(package_dir / PLAYLIST_NAME),
+                    "segment_count": segment_count,
+                    "segment_seconds": segment_seconds,
+                    "size_bytes": size_bytes,
+                    "duration_s": round(elapsed, 3),
+                }
+            )
+
+        except Exception as e:
+            return TaskResult(
+                success=False,
+                message=f"HLS packaging failed: {str(e)}",
+                data={"error": str(e)}
+            )
+
+        finally:
+            if staging is not None:
+                await asyncio.to_thread(shutil.rmtree, staging, True)
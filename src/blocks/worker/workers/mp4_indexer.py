@@ -0,0 +1,85 @@
+"""
+MP4IndexWorker
+
+MP4 moov atom에서 탐색 인덱스(키프레임 시각 → 바이트 오프셋)를 추출해 sidecar로 저장
+- 파일 전체가 아니라 최상위 박스 헤더 + moov만 읽음
+- 파일당 한 번 추출, 원본이 바뀌면 Stream 블럭이 다시 요청
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+from src.core.mp4_index import build_seek_index
+
+from ...cache.tiers import SeekIndexStore
+from ..models import Task, TaskResult
+
+
+class MP4IndexWorker:
+    """MP4 탐색 인덱스 추출 워커"""
+
+    def __init__(self, cache_service=None, index_store: SeekIndexStore | None = None):
+        """
+        Args:
+            cache_service: CacheService 인스턴스 (Optional, seek_index 저장소 공유)
+            index_store: 인덱스 저장소 (None이면 cache_service.seek_index 또는 새 인스턴스)
+        """
+        self._cache_service = cache_service
+        if index_store is None:
+            index_store = getattr(cache_service, "seek_index", None)
+        self._store = index_store if isinstance(index_store, SeekIndexStore) else None
+
+    @property
+    def store(self) -> SeekIndexStore:
+        """인덱스 저장소 (처음 사용할 때 생성)"""
+        if self._store is None:
+            self._store = SeekIndexStore()
+        return self._store
+
+    async def process(self, task: Task) -> TaskResult:
+        """
+        탐색 인덱스 추출 작업 처리
+
+        Args:
+            task: Task 인스턴스 (payload: content_id, nas_path)
+
+        Returns:
+            TaskResult: 작업 결과
+        """
+        try:
+            content_id = task.payload.get("content_id")
+            nas_path = task.payload.get("nas_path")
+            if not content_id or not nas_path:
+                return TaskResult(
+                    success=False,
+                    message="Missing required field: content_id or nas_path",
+                    data={}
+                )
+
+            started = time.perf_counter()
+            index = await asyncio.to_thread(build_seek_index, Path(nas_path))
+            sidecar = await self.store.save(content_id, index)
+            elapsed = time.perf_counter() - started
+
+            return TaskResult(
+                success=True,
+                message=f"MP4 index built: {nas_path} → {sidecar}",
+                data={
+                    "content_id": content_id,
+                    "nas_path": nas_path,
+                    "sidecar": str(sidecar),
+                    "keyframes": len(index),
+                    "duration_s": round(index.duration_s, 3),
+                    "moov_offset": index.moov_offset,
+                    "moov_size": index.moov_size,
+                    "elapsed_s": round(elapsed, 3),
+                }
+            )
+
+        except Exception as e:
+            return TaskResult(
+                success=False,
+                message=f"MP4 indexing failed: {str(e)}",
+                data={"error": str(e)}
+            )
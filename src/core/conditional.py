@@ -0,0 +1,130 @@
+"""
+Conditional Request Module
+
+HTTP 검증자(ETag / Last-Modified)와 조건부 요청 판정 (RFC 7232, RFC 7233 If-Range)
+
+본문을 만들기 전에 헤더만으로 304 여부를 결정할 수 있도록
+검증자 값만 받아서 판정한다.
+"""
+
+from email.utils import formatdate, parsedate_to_datetime
+
+
+def make_etag(*parts: int | str, weak: bool = False) -> str:
+    """
+    ETag 생성
+
+    Args:
+        *parts: ETag를 구성하는 값 (예: inode, size, mtime)
+        weak: True면 약한 검증자 (W/"...")
+
+    Returns:
+        str: 따옴표를 포함한 ETag
+
+    Examples:
+        >>> make_etag(12, 1024, 1700000000)
+        '"c-400-6553f100"'
+    """
+    value = "-".join(f"{p:x}" if isinstance(p, int) else str(p) for p in parts)
+    return f'W/"{value}"' if weak else f'"{value}"'
+
+
+def http_date(timestamp: float) -> str:
+    """Unix timestamp → HTTP-date (IMF-fixdate)"""
+    return formatdate(timestamp, usegmt=True)
+
+
+def _parse_http_date(value: str) -> float | None:
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _opaque(etag: str) -> str:
+    """약한 검증자 접두사(W/) 제거"""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(header: str, etag: str, weak: bool = True) -> bool:
+    """
+    If-None-Match / If-Match 목록에 ETag가 포함되는지
+
+    Args:
+        header: 헤더 값 ("*" 또는 쉼표로 구분된 ETag 목록)
+        etag: 현재 ETag
+        weak: True면 약한 비교 (If-None-Match), False면 강한 비교
+
+    Returns:
+        bool: 일치 여부
+    """
+    header = header.strip()
+    if header == "*":
+        return True
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if not candidate:
+            continue
+        if weak:
+            if _opaque(candidate) == _opaque(etag):
+                return True
+        elif not candidate.startswith("W/") and not etag.startswith("W/") and candidate == etag:
+            return True
+    return False
+
+
+def is_not_modified(
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    etag: str,
+    last_modified: float | None = None,
+) -> bool:
+    """
+    304 Not Modified 응답 여부
+
+    If-None-Match가 있으면 If-Modified-Since는 무시한다 (RFC 7232 3.3).
+
+    Args:
+        if_none_match: If-None-Match 헤더
+        if_modified_since: If-Modified-Since 헤더
+        etag: 현재 ETag
+        last_modified: 현재 수정 시각 (Unix timestamp, 없으면 날짜 비교 생략)
+
+    Returns:
+        bool: 클라이언트 사본이 최신이면 True
+    """
+    if if_none_match:
+        return etag_matches(if_none_match, etag, weak=True)
+
+    if if_modified_since and last_modified is not None:
+        since = _parse_http_date(if_modified_since)
+        # HTTP-date는 초 단위
+        return since is not None and int(last_modified) <= since
+
+    return False
+
+
+def if_range_matches(if_range: str | None, etag: str, last_modified: float | None = None) -> bool:
+    """
+    If-Range 조건 충족 여부 (불충족이면 Range를 무시하고 전체 응답)
+
+    Args:
+        if_range: If-Range 헤더 (ETag 또는 HTTP-date)
+        etag: 현재 ETag (강한 비교)
+        last_modified: 현재 수정 시각
+
+    Returns:
+        bool: 헤더가 없거나 일치하면 True
+    """
+    if not if_range:
+        return True
+
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        return etag_matches(if_range, etag, weak=False)
+
+    if last_modified is None:
+        return False
+    since = _parse_http_date(if_range)
+    return since is not None and int(last_modified) == since
@@ -0,0 +1,361 @@
+"""
+MP4 Seek Index Module
+
+MP4 moov atom에서 탐색용 인덱스를 추출하고 바이너리 sidecar로 직렬화한다.
+
+- moov 위치/크기 (파일 끝에 있어도 한 번의 Range 요청으로 받을 수 있게)
+- 비디오 트랙의 키프레임(sync sample) 디코드 시각 → 파일 오프셋 표
+- 재생 시간
+
+플레이어가 수십 MB의 moov를 받기 전에 시각 → 바이트 오프셋을 알 수 있다.
+편집 목록(elst)과 composition offset(ctts)은 반영하지 않는다 (키프레임 경계 탐색에는 충분).
+"""
+
+import struct
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+SIDECAR_MAGIC = b"WSIX"
+SIDECAR_VERSION = 1
+
+# magic, version, reserved, timescale, duration, moov_offset, moov_size,
+# source_size, source_mtime_ns, entry_count
+_HEADER = struct.Struct("<4sHHIQQQQQI")
+
+# sync sample 표(stss)가 없는 트랙(모든 샘플이 키프레임)은 이 간격으로 솎아냄
+MIN_ENTRY_INTERVAL_S = 1.0
+
+_BOX_HEADER = struct.Struct(">I4s")
+
+
+@dataclass
+class MP4SeekIndex:
+    """키프레임 시각 → 파일 오프셋 인덱스"""
+
+    timescale: int
+    duration: int  # timescale 단위
+    moov_offset: int
+    moov_size: int
+    source_size: int = 0
+    source_mtime_ns: int = 0
+    times: list[int] = field(default_factory=list)  # 키프레임 디코드 시각 (timescale 단위)
+    offsets: list[int] = field(default_factory=list)  # 키프레임 첫 바이트 오프셋
+
+    def __post_init__(self):
+        if self.timescale <= 0:
+            raise ValueError("timescale must be positive")
+        if len(self.times) != len(self.offsets):
+            raise ValueError("times and offsets must have the same length")
+
+    @property
+    def duration_s(self) -> float:
+        """재생 시간 (초)"""
+        return self.duration / self.timescale
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def matches(self, size: int, mtime_ns: int) -> bool:
+        """인덱스를 만든 원본 파일과 같은 파일인지"""
+        return self.source_size == size and self.source_mtime_ns == mtime_ns
+
+    def lookup(self, seconds: float) -> tuple[float, int]:
+        """
+        주어진 시각 이전의 가장 가까운 키프레임
+
+        Args:
+            seconds: 탐색 시각 (초)
+
+        Returns:
+            (키프레임 시각 초, 파일 오프셋)
+
+        Raises:
+            ValueError: 키프레임이 없음
+        """
+        if not self.times:
+            raise ValueError("Index has no keyframes")
+        i = max(bisect_right(self.times, int(seconds * self.timescale)) - 1, 0)
+        return self.times[i] / self.timescale, self.offsets[i]
+
+    def to_bytes(self) -> bytes:
+        """바이너리 sidecar 직렬화 (헤더 + 시각 배열 + 오프셋 배열, 리틀 엔디언 u64)"""
+        count = len(self.times)
+        return b"".join([
+            _HEADER.pack(
+                SIDECAR_MAGIC,
+                SIDECAR_VERSION,
+                0,
+                self.timescale,
+                self.duration,
+                self.moov_offset,
+                self.moov_size,
+                self.source_size,
+                self.source_mtime_ns,
+                count,
+            ),
+            struct.pack(f"<{count}Q", *self.times),
+            struct.pack(f"<{count}Q", *self.offsets),
+        ])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MP4SeekIndex":
+        """
+        바이너리 sidecar 역직렬화
+
+        Raises:
+            ValueError: 형식/버전이 다르거나 잘린 데이터
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Seek index is truncated")
+        (
+            magic, version, _, timescale, duration, moov_offset, moov_size,
+            source_size, source_mtime_ns, count,
+        ) = _HEADER.unpack_from(data)
+        if magic != SIDECAR_MAGIC:
+            raise ValueError("Not a seek index")
+        if version != SIDECAR_VERSION:
+            raise ValueError(f"Unsupported seek index version: {version}")
+        if len(data) != _HEADER.size + count * 16:
+            raise ValueError("Seek index is truncated")
+
+        times = list(struct.unpack_from(f"<{count}Q", data, _HEADER.size))
+        offsets = list(struct.unpack_from(f"<{count}Q", data, _HEADER.size + count * 8))
+        return cls(
+            timescale=timescale,
+            duration=duration,
+            moov_offset=moov_offset,
+            moov_size=moov_size,
+            source_size=source_size,
+            source_mtime_ns=source_mtime_ns,
+            times=times,
+            offsets=offsets,
+        )
+
+
+def _read_box_header(f: BinaryIO, offset: int, file_size: int) -> tuple[bytes, int, int] | None:
+    """(타입, 헤더 크기, 박스 크기) - 더 읽을 박스가 없으면 None"""
+    f.seek(offset)
+    header = f.read(16)
+    if len(header) < 8:
+        return None
+    size, box_type = _BOX_HEADER.unpack_from(header)
+    header_size = 8
+    if size == 1:
+        if len(header) < 16:
+            return None
+        size = struct.unpack_from(">Q", header, 8)[0]
+        header_size = 16
+    elif size == 0:
+        size = file_size - offset
+    if size < header_size:
+        raise ValueError(f"Invalid box size at offset {offset}")
+    return box_type, header_size, size
+
+
+def find_top_level_box(f: BinaryIO, box_type: bytes, file_size: int) -> tuple[int, int] | None:
+    """
+    최상위 박스 위치 검색 (박스 헤더만 읽고 본문은 건너뜀)
+
+    Returns:
+        (오프셋, 크기) or None
+    """
+    offset = 0
+    while offset < file_size:
+        header = _read_box_header(f, offset, file_size)
+        if header is None:
+            return None
+        found_type, _, size = header
+        if found_type == box_type:
+            return offset, size
+        offset += size
+    return None
+
+
+def _children(data: bytes, start: int, end: int):
+    """data[start:end] 안의 하위 박스 (타입, 본문 시작, 박스 끝)"""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = _BOX_HEADER.unpack_from(data, pos)
+        header_size = 8
+        if size == 1:
+            size = struct.unpack_from(">Q", data, pos + 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - pos
+        if size < header_size or pos + size > end:
+            raise ValueError(f"Invalid {box_type!r} box in moov")
+        yield box_type, pos + header_size, pos + size
+        pos += size
+
+
+def _child(data: bytes, start: int, end: int, box_type: bytes) -> tuple[int, int] | None:
+    for found_type, body, box_end in _children(data, start, end):
+        if found_type == box_type:
+            return body, box_end
+    return None
+
+
+def _parse_time_header(data: bytes, body: int) -> tuple[int, int]:
+    """mvhd/mdhd의 (timescale, duration)"""
+    if data[body] == 1:
+        return struct.unpack_from(">IQ", data, body + 4 + 16)
+    return struct.unpack_from(">II", data, body + 4 + 8)
+
+
+def _table(data: bytes, body: int, fmt: str, fields: int) -> tuple[int, ...]:
+    """full box 테이블 (entry_count 뒤에 entry_count * fields개 값)"""
+    count = struct.unpack_from(">I", data, body + 4)[0]
+    return struct.unpack_from(f">{count * fields}{fmt}", data, body + 8)
+
+
+def _video_track(data: bytes, start: int, end: int) -> tuple[int, int] | None:
+    """첫 비디오 트랙의 (mdia 본문 시작, mdia 끝)"""
+    for box_type, body, box_end in _children(data, start, end):
+        if box_type != b"trak":
+            continue
+        mdia = _child(data, body, box_end, b"mdia")
+        if mdia is None:
+            continue
+        hdlr = _child(data, *mdia, b"hdlr")
+        if hdlr is not None and data[hdlr[0] + 8:hdlr[0] + 12] == b"vide":
+            return mdia
+    return None
+
+
+def parse_moov(data: bytes, moov_offset: int = 0) -> MP4SeekIndex:
+    """
+    moov 박스(헤더 포함)에서 키프레임 인덱스 추출
+
+    Args:
+        data: moov 박스 전체 바이트
+        moov_offset: 파일 내 moov 오프셋
+
+    Returns:
+        MP4SeekIndex: 인덱스 (source_size/mtime은 호출자가 채움)
+
+    Raises:
+        ValueError: 비디오 트랙/샘플 표가 없거나 손상됨
+    """
+    _, body, end = next(_children(data, 0, len(data)))
+
+    mvhd = _child(data, body, end, b"mvhd")
+    if mvhd is None:
+        raise ValueError("mvhd not found")
+    movie_timescale, movie_duration = _parse_time_header(data, mvhd[0])
+
+    mdia = _video_track(data, body, end)
+    if mdia is None:
+        raise ValueError("No video track")
+    mdhd = _child(data, *mdia, b"mdhd")
+    minf = _child(data, *mdia, b"minf")
+    stbl = _child(data, *minf, b"stbl") if minf else None
+    if mdhd is None or stbl is None:
+        raise ValueError("Video track has no sample table")
+    timescale, duration = _parse_time_header(data, mdhd[0])
+
+    boxes = {box_type: box_body for box_type, box_body, _ in _children(data, *stbl)}
+    if b"stts" not in boxes or b"stsc" not in boxes or b"stsz" not in boxes:
+        raise ValueError("Incomplete sample table")
+
+    stts = _table(data, boxes[b"stts"], "I", 2)
+    stsc = _table(data, boxes[b"stsc"], "I", 3)
+    if not stsc:
+        raise ValueError("Empty sample-to-chunk table")
+    if b"co64" in boxes:
+        chunk_offsets = _table(data, boxes[b"co64"], "Q", 1)
+    elif b"stco" in boxes:
+        chunk_offsets = _table(data, boxes[b"stco"], "I", 1)
+    else:
+        raise ValueError("No chunk offset table")
+
+    stsz_body = boxes[b"stsz"]
+    sample_size, sample_count = struct.unpack_from(">II", data, stsz_body + 4)
+    sizes = None
+    if sample_size == 0:
+        sizes = struct.unpack_from(f">{sample_count}I", data, stsz_body + 12)
+
+    # stss가 없으면 모든 샘플이 키프레임
+    sync = None
+    if b"stss" in boxes:
+        sync = set(_table(data, boxes[b"stss"], "I", 1))
+    min_gap = 0 if sync is not None else int(MIN_ENTRY_INTERVAL_S * timescale)
+
+    # 샘플 하나씩 디코드 시각/오프셋을 누적하며 키프레임만 기록
+    times: list[int] = []
+    offsets: list[int] = []
+    stts_i = 0
+    stts_left = stts[0] if stts else 0
+    delta = stts[1] if stts else 0
+    dts = 0
+    sample = 0  # 0-based
+    stsc_i = 0
+    last_time = -min_gap - 1
+
+    for chunk, chunk_offset in enumerate(chunk_offsets, start=1):
+        while stsc_i + 3 < len(stsc) and stsc[stsc_i + 3] <= chunk:
+            stsc_i += 3
+        offset = chunk_offset
+        for _ in range(stsc[stsc_i + 1]):
+            if sample >= sample_count:
+                break
+            if (sync is None or sample + 1 in sync) and dts - last_time > min_gap:
+                times.append(dts)
+                offsets.append(offset)
+                last_time = dts
+            offset += sizes[sample] if sizes is not None else sample_size
+            sample += 1
+
+            dts += delta
+            stts_left -= 1
+            if stts_left == 0 and stts_i + 2 < len(stts):
+                stts_i += 2
+                stts_left = stts[stts_i]
+                delta = stts[stts_i + 1]
+
+    if duration == 0 and movie_timescale:
+        duration = movie_duration * timescale // movie_timescale
+
+    return MP4SeekIndex(
+        timescale=timescale,
+        duration=duration,
+        moov_offset=moov_offset,
+        moov_size=len(data),
+        times=times,
+        offsets=offsets,
+    )
+
+
+def build_seek_index(path: Path) -> MP4SeekIndex:
+    """
+    MP4 파일에서 탐색 인덱스 생성 (blocking I/O, 스레드에서 호출)
+
+    최상위 박스 헤더만 따라가며 moov를 찾고 moov만 읽는다.
+
+    Args:
+        path: MP4 파일
+
+    Returns:
+        MP4SeekIndex: 원본 크기/mtime이 기록된 인덱스
+
+    Raises:
+        ValueError: moov가 없거나 (fragmented MP4 포함) 파싱 실패
+    """
+    with open(path, "rb") as f:
+        stat = path.stat()
+        located = find_top_level_box(f, b"moov", stat.st_size)
+        if located is None:
+            raise ValueError(f"moov not found: {path}")
+        moov_offset, moov_size = located
+        f.seek(moov_offset)
+        data = f.read(moov_size)
+        if len(data) != moov_size:
+            raise ValueError(f"moov is truncated: {path}")
+
+    index = parse_moov(data, moov_offset)
+    if not index.times:
+        raise ValueError(f"No keyframes in sample table (fragmented MP4?): {path}")
+    index.source_size = stat.st_size
+    index.source_mtime_ns = stat.st_mtime_ns
+    return index
@@ -109,9 +109,10 @@ def register_blocks():
         ),
     ]
 
+    registered = {block.block_id for block in registry.get_all_blocks()}
     for block in blocks:
-        # 이미 등록된 블럭은 건너뛰기
-        if block.block_id not in registry.get_all_blocks():
+        # 이미 등록된 블럭은 건너뛰기 (lifespan 재실행 시)
+        if block.block_id not in registered:
             if registry.can_register(block):
                 registry.register(block)
 
@@ -125,14 +126,32 @@ async def lifespan(app: FastAPI):
     # MessageBus 초기화
     MessageBus.get_instance()
 
+    # Flat Catalog 복구 (CATALOG_STORE_PATH가 있으면 스냅샷 + 로그에서)
+    from src.blocks.flat_catalog.service import get_flat_catalog_service
+    catalog_service = get_flat_catalog_service()
+
+    # CacheService 초기화 (Stream/Worker 블럭이 같은 L2/세그먼트/탐색 인덱스를 공유)
+    from src.blocks.cache.service import CacheService
+    app.state.cache_service = CacheService()
+    await app.state.cache_service.start()
+
     # StreamService 초기화
     from src.blocks.stream.service import StreamService
-    app.state.stream_service = StreamService()
+    app.state.stream_service = StreamService(cache_service=app.state.cache_service)
+    await app.state.stream_service.setup_event_subscribers()
+
+    # WorkerService 초기화 (worker.enqueue 구독 + 백그라운드 처리 루프)
+    # CACHE_WARM(prefetch), HLS_PACKAGE, MP4_INDEX 요청을 처리
+    from src.blocks.worker.service import WorkerService
+    app.state.worker_service = WorkerService(cache_service=app.state.cache_service)
+    await app.state.worker_service.setup_event_subscribers()
+    await app.state.worker_service.start()
 
     print("=" * 50)
     print("WSOPTV Server Started")
     print("=" * 50)
     print(f"Registered Blocks: {len(registry.get_all_blocks())}")
+    print(f"Catalog Items: {catalog_service.count(visible_only=False)}")
     for block in registry.get_all_blocks():
         name = block.metadata.get("name", block.block_id)
         print(f"  - {name} v{block.version} [{block.status.value}]")
@@ -143,6 +162,17 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("WSOPTV Server Shutting Down...")
 
+    await app.state.worker_service.stop()
+    await app.state.worker_service.teardown_event_subscribers()
+
+    from src.blocks.stream.file_reader import shutdown_file_reader
+    from src.blocks.stream.read_ahead import get_read_ahead_manager
+    get_read_ahead_manager().close_all()
+    app.state.stream_service.source_cache.clear()
+    shutdown_file_reader()
+    await app.state.cache_service.stop()
+    catalog_service.close()
+
 
 # OpenAPI 태그 메타데이터
 tags_metadata = [
@@ -78,20 +78,26 @@ class TestCacheBlock:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_ssd_cache_promotion(self):
+    async def test_ssd_cache_promotion(self, tmp_path):
         """Hot content SSD 승격"""
         from src.blocks.cache.service import CacheService
         from src.blocks.cache.models import CacheTier
+        from src.blocks.cache.tiers import L2SSDCache
 
         service = CacheService()
+        service.l2 = L2SSDCache(cache_dir=str(tmp_path / "ssd"))
         content_id = "hot_video_123"
+        source = tmp_path / "hot.mp4"
+        source.write_bytes(b"v" * 4096)
 
         # Hot content로 표시
-        await service.mark_as_hot(content_id, file_path="/nas/videos/hot.mp4")
+        await service.mark_as_hot(content_id, file_path=str(source))
 
         # SSD (L2)로 승격 확인
         tier = await service.get_content_tier(content_id)
         assert tier == CacheTier.L2
+        path = await service.get_stream_path(content_id)
+        assert path.read_bytes() == source.read_bytes()
 
 
 class TestCacheBlockEvents:
@@ -117,6 +123,117 @@ class TestCacheBlockEvents:
         assert len(received_events) == 1
         assert received_events[0].payload["key"] == "missing_key"
 
+    @pytest.mark.asyncio
+    async def test_get_many_single_miss_event(self):
+        """다중 조회 미스는 이벤트 1개로 집계"""
+        from src.blocks.cache.service import CacheService
+        from src.orchestration.message_bus import MessageBus
+
+        bus = MessageBus.get_instance()
+        batch_events = []
+        single_events = []
+
+        async def batch_handler(msg):
+            batch_events.append(msg)
+
+        async def single_handler(msg):
+            single_events.append(msg)
+
+        await bus.subscribe("cache.miss_batch", batch_handler)
+        await bus.subscribe("cache.miss", single_handler)
+
+        service = CacheService()
+        await service.set_many({"a": 1, "c": 3}, ttl=60)
+        results = await service.get_many(["a", "b", "c", "d", "b"])
+
+        assert results == {"a": 1, "b": None, "c": 3, "d": None}
+        assert list(results) == ["a", "b", "c", "d"]
+        assert len(batch_events) == 1
+        assert batch_events[0].payload["keys"] == ["b", "d"]
+        assert batch_events[0].payload["count"] == 2
+        assert single_events == []
+
+    @pytest.mark.asyncio
+    async def test_invalidate_many(self):
+        """다중 무효화"""
+        from src.blocks.cache.service import CacheService
+
+        service = CacheService()
+        await service.set_many({"a": 1, "b": 2, "c": 3})
+        await service.invalidate_many(["a", "c"])
+
+        assert await service.get_many(["a", "b", "c"]) == {"a": None, "b": 2, "c": None}
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_single_flight(self):
+        """동시 미스는 loader 1회 실행, 미스 이벤트 1회"""
+        import asyncio
+
+        from src.blocks.cache.service import CacheService
+        from src.orchestration.message_bus import MessageBus
+
+        bus = MessageBus.get_instance()
+        received_events = []
+
+        async def handler(msg):
+            if msg.payload.get("key") == "catalog:hot":
+                received_events.append(msg)
+
+        await bus.subscribe("cache.miss", handler)
+
+        service = CacheService()
+        calls = 0
+        release = asyncio.Event()
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"title": "WSOP Main Event"}
+
+        waiters = [
+            asyncio.create_task(service.get_or_load("catalog:hot", loader, ttl=60))
+            for _ in range(20)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert calls == 1
+        assert all(r == {"title": "WSOP Main Event"} for r in results)
+        assert len(received_events) == 1
+        assert await service.get("catalog:hot") == {"title": "WSOP Main Event"}
+        assert service._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_error_shared(self):
+        """loader 실패는 모든 대기자에게 전달되고 다음 호출은 재시도"""
+        import asyncio
+
+        from src.blocks.cache.service import CacheService
+
+        service = CacheService()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(
+            *(service.get_or_load("k", failing) for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        async def ok():
+            return 42
+
+        assert await service.get_or_load("k", ok) == 42
+
     @pytest.mark.asyncio
     async def test_cache_evicted_event(self):
         """캐시 퇴출 이벤트 발행"""
@@ -135,3 +252,726 @@ class TestCacheBlockEvents:
         await service.evict("old_key")
 
         assert len(received_events) == 1
+
+
+class TestStaleWhileRevalidate:
+    """Soft TTL / XFetch 조기 갱신 테스트"""
+
+    class FakeClock:
+        def __init__(self):
+            self.now = 1_000_000.0
+
+        def __call__(self):
+            return self.now
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        """soft TTL 경과 후 stale 값 즉시 반환 + 백그라운드 갱신 1회"""
+        import asyncio
+
+        from src.blocks.cache.service import CacheService
+
+        service = CacheService()
+        clock = self.FakeClock()
+        service._clock = clock
+
+        version = 0
+        release = asyncio.Event()
+
+        async def loader():
+            nonlocal version
+            version += 1
+            if version > 1:
+                await release.wait()
+            return f"v{version}"
+
+        assert await service.get_or_load("meta", loader, ttl=600, soft_ttl=60) == "v1"
+
+        clock.now += 30
+        assert await service.get_or_load("meta", loader, ttl=600, soft_ttl=60) == "v1"
+        assert version == 1
+
+        clock.now += 60
+        results = [
+            await service.get_or_load("meta", loader, ttl=600, soft_ttl=60)
+            for _ in range(5)
+        ]
+        assert results == ["v1"] * 5
+        await asyncio.sleep(0)
+        assert version == 2  # 갱신은 한 번만
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert await service.get_or_load("meta", loader, ttl=600, soft_ttl=60) == "v2"
+        assert await service.get("meta") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_refresh_failure_keeps_stale_value(self):
+        """백그라운드 갱신 실패 시 stale 값 유지"""
+        import asyncio
+
+        from src.blocks.cache.service import CacheService
+
+        service = CacheService()
+        clock = self.FakeClock()
+        service._clock = clock
+
+        async def loader():
+            return "v1"
+
+        async def failing():
+            raise RuntimeError("db down")
+
+        await service.get_or_load("meta", loader, ttl=600, soft_ttl=60)
+        clock.now += 120
+
+        assert await service.get_or_load("meta", failing, ttl=600, soft_ttl=60) == "v1"
+        await asyncio.sleep(0.01)
+        assert await service.get("meta") == "v1"
+        assert service._inflight == {}
+
+    def test_xfetch_early_refresh(self):
+        """XFetch: 로딩이 오래 걸릴수록, 만료가 가까울수록 조기 갱신"""
+        from src.blocks.cache.models import CachedValue
+
+        entry = CachedValue(value="v", soft_expires_at=100.0, delta=2.0)
+
+        assert entry.should_refresh(100.0, beta=0.0, rand=0.5)  # soft 만료
+        assert not entry.should_refresh(90.0, beta=0.0, rand=0.01)  # XFetch 비활성
+        assert not entry.should_refresh(90.0, beta=1.0, rand=1.0)
+        # 2 * ln(1/0.01) ≈ 9.2초 앞당김
+        assert entry.should_refresh(91.0, beta=1.0, rand=0.01)
+        assert not entry.should_refresh(80.0, beta=1.0, rand=0.01)
+
+    @pytest.mark.asyncio
+    async def test_soft_ttl_validation(self):
+        """soft_ttl은 hard TTL보다 클 수 없음"""
+        from src.blocks.cache.service import CacheService
+
+        async def loader():
+            return 1
+
+        with pytest.raises(ValueError):
+            await CacheService().get_or_load("k", loader, ttl=60, soft_ttl=120)
+
+
+class TestPopularityTracker:
+    """시간 창 기반 Hot content 감지 테스트"""
+
+    class FakeClock:
+        def __init__(self):
+            self.now = 1_700_000_000.0
+
+        def __call__(self):
+            return self.now
+
+    def test_old_views_expire_from_window(self):
+        """1년 전 조회 5회 + 오늘 1회는 Hot이 아님"""
+        from src.blocks.cache.popularity import PopularityTracker
+
+        clock = self.FakeClock()
+        tracker = PopularityTracker(clock=clock)
+
+        for _ in range(5):
+            tracker.record("old_final")
+        assert tracker.is_hot("old_final")
+
+        clock.now += 365 * 86400
+        tracker.record("old_final")
+
+        assert tracker.estimate("old_final") == 1
+        assert not tracker.is_hot("old_final")
+
+    def test_sliding_window(self):
+        """7일 윈도우 안의 조회만 합산"""
+        from src.blocks.cache.popularity import PopularityTracker
+
+        clock = self.FakeClock()
+        tracker = PopularityTracker(clock=clock)
+
+        for _ in range(7):
+            tracker.record("clip")
+            clock.now += 86400
+
+        # 마지막 기록 후 하루 경과 → 첫날 기록은 윈도우 밖
+        assert tracker.estimate("clip") == 6
+        clock.now += 3 * 86400
+        assert tracker.estimate("clip") == 3
+
+    def test_bounded_memory(self):
+        """컨텐츠 수와 무관한 고정 크기 + 과소 추정 없음"""
+        from src.blocks.cache.popularity import CountMinSketch
+
+        sketch = CountMinSketch(width=256, depth=4)
+        size_before = len(sketch._counters)
+
+        for i in range(10_000):
+            sketch.add(f"content_{i}")
+        sketch.add("popular", 50)
+
+        assert len(sketch._counters) == size_before
+        assert sketch.estimate("popular") >= 50
+
+    @pytest.mark.asyncio
+    async def test_service_uses_window(self):
+        """CacheService.record_access / is_hot_content 연동"""
+        from src.blocks.cache.popularity import PopularityTracker
+        from src.blocks.cache.service import CacheService
+
+        clock = self.FakeClock()
+        service = CacheService()
+        service.popularity = PopularityTracker(clock=clock)
+
+        for _ in range(5):
+            await service.record_access("binge")
+        assert await service.is_hot_content("binge")
+
+        clock.now += 8 * 86400
+        assert not await service.is_hot_content("binge")
+
+
+class TestL2Admission:
+    """TinyLFU 승격 필터 테스트"""
+
+    @staticmethod
+    def _service(tmp_path, max_bytes):
+        from src.blocks.cache.service import CacheService
+        from src.blocks.cache.tiers import L2SSDCache
+        from src.blocks.cache.tiers.l2_ssd import BYTES_PER_GB
+
+        service = CacheService()
+        service.l2 = L2SSDCache(
+            cache_dir=str(tmp_path / "ssd"), max_size_gb=max_bytes / BYTES_PER_GB
+        )
+        return service
+
+    @staticmethod
+    def _file(tmp_path, name, size):
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        return str(path)
+
+    @pytest.mark.asyncio
+    async def test_admits_when_space_available(self, tmp_path):
+        """여유 공간이 있으면 빈도와 무관하게 승격"""
+        service = self._service(tmp_path, 10_000)
+
+        assert await service.mark_as_hot("new", self._file(tmp_path, "new.mp4", 1000))
+        assert await service.l2.exists("new")
+
+    @pytest.mark.asyncio
+    async def test_one_off_does_not_evict_popular(self, tmp_path):
+        """빈도가 낮은 후보는 인기 항목을 밀어내지 못함"""
+        from src.orchestration.message_bus import MessageBus
+
+        rejected = []
+
+        async def handler(msg):
+            rejected.append(msg)
+
+        await MessageBus.get_instance().subscribe("cache.ssd_rejected", handler)
+
+        service = self._service(tmp_path, 3000)
+        for _ in range(10):
+            await service.record_access("evergreen")
+        await service.mark_as_hot("evergreen", self._file(tmp_path, "e.mp4", 2500))
+
+        await service.record_access("binge")
+        promoted = await service.mark_as_hot("binge", self._file(tmp_path, "b.mp4", 1000))
+
+        assert promoted is False
+        assert await service.l2.exists("evergreen")
+        assert not await service.l2.exists("binge")
+        assert any(m.payload["content_id"] == "binge" for m in rejected)
+
+    @pytest.mark.asyncio
+    async def test_large_file_weighs_all_victims(self, tmp_path):
+        """큰 파일은 퇴출될 작은 인기 클립들의 빈도 합을 넘어야 승격"""
+        service = self._service(tmp_path, 4000)
+        for i in range(4):
+            for _ in range(3):
+                await service.record_access(f"clip{i}")
+            await service.mark_as_hot(f"clip{i}", self._file(tmp_path, f"c{i}.mp4", 1000))
+
+        for _ in range(8):
+            await service.record_access("final_table")
+        final = self._file(tmp_path, "final.mp4", 4000)
+
+        # 8회 < 클립 4개 합산 (각 5회 이상)
+        assert await service.mark_as_hot("final_table", final) is False
+        assert len(service.l2._entries) == 4
+
+        for _ in range(20):
+            await service.record_access("final_table")
+        assert await service.mark_as_hot("final_table", final) is True
+        assert list(service.l2._entries) == ["final_table"]
+
+
+class TestL2SSDCache:
+    """L2 SSD 캐시 테스트"""
+
+    @staticmethod
+    def _make_source(tmp_path, name, size):
+        path = tmp_path / "nas" / f"{name}.mp4"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"x" * size)
+        return path
+
+    @pytest.mark.asyncio
+    async def test_store_copies_atomically(self, tmp_path):
+        """임시 파일 없이 최종 파일만 남고 정확한 크기 추적"""
+        from src.blocks.cache.tiers import L2SSDCache
+
+        cache = L2SSDCache(cache_dir=str(tmp_path / "ssd"))
+        source = self._make_source(tmp_path, "a", 1500)
+
+        path = await cache.store("a", str(source))
+
+        assert path == tmp_path / "ssd" / "a.mp4"
+        assert path.read_bytes() == source.read_bytes()
+        assert cache.used_bytes == 1500
+        assert [p.name for p in (tmp_path / "ssd").iterdir()] == ["a.mp4"]
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, tmp_path):
+        """용량 초과 시 가장 오래 스트리밍되지 않은 파일 퇴출"""
+        from src.blocks.cache.tiers import L2SSDCache
+
+        cache = L2SSDCache(cache_dir=str(tmp_path / "ssd"), max_size_gb=3000 / 1024**3)
+        for name in ("a", "b", "c"):
+            await cache.store(name, str(self._make_source(tmp_path, name, 1000)))
+
+        # a를 최근에 스트리밍 → b가 가장 오래됨
+        await cache.get_path("a")
+        await cache.store("d", str(self._make_source(tmp_path, "d", 1000)))
+
+        assert await cache.exists("a")
+        assert not await cache.exists("b")
+        assert not (tmp_path / "ssd" / "b.mp4").exists()
+        assert cache.used_bytes == 3000
+
+    @pytest.mark.asyncio
+    async def test_rejects_file_larger_than_cache(self, tmp_path):
+        """캐시 전체보다 큰 파일은 거부"""
+        from src.blocks.cache.tiers import L2SSDCache
+
+        cache = L2SSDCache(cache_dir=str(tmp_path / "ssd"), max_size_gb=1000 / 1024**3)
+        with pytest.raises(ValueError):
+            await cache.store("big", str(self._make_source(tmp_path, "big", 2000)))
+
+    @pytest.mark.asyncio
+    async def test_reservation_counts_as_used(self, tmp_path):
+        """복사 중인 예약 용량 때문에 다른 승격이 용량을 넘지 않음"""
+        from src.blocks.cache.tiers import L2SSDCache
+
+        cache = L2SSDCache(cache_dir=str(tmp_path / "ssd"), max_size_gb=3000 / 1024**3)
+        await cache.store("a", str(self._make_source(tmp_path, "a", 1000)))
+
+        assert await cache.reserve("b", 1500)
+        assert await cache.reserve("c", 1500)
+        assert not await cache.exists("a")
+
+        # 남은 용량이 모두 예약됨 → 퇴출할 항목이 없으므로 거부
+        assert not await cache.reserve("d", 1000)
+        assert cache.reserved_bytes == 3000
+
+        cache.release("c")
+        assert await cache.reserve("d", 1000)
+        assert cache.used_bytes + cache.reserved_bytes <= cache.max_bytes
+
+    @pytest.mark.asyncio
+    async def test_rebuild_index_on_startup(self, tmp_path):
+        """재시작 시 캐시 디렉토리에서 인덱스 복원"""
+        from src.blocks.cache.tiers import L2SSDCache
+
+        cache = L2SSDCache(cache_dir=str(tmp_path / "ssd"))
+        await cache.store("a", str(self._make_source(tmp_path, "a", 1200)))
+        await cache.store("b", str(self._make_source(tmp_path, "b", 800)))
+        (tmp_path / "ssd" / "c.mp4.part").write_bytes(b"partial")
+
+        restarted = L2SSDCache(cache_dir=str(tmp_path / "ssd"))
+
+        assert await restarted.exists("a")
+        assert await restarted.exists("b")
+        assert not await restarted.exists("c")
+        assert restarted.used_bytes == 2000
+        assert await restarted.get_size_gb() == 2000 / 1024**3
+
+
+class TestL1BoundedCache:
+    """L1 용량 제한 및 만료 정리 테스트"""
+
+    class FakeClock:
+        def __init__(self):
+            self.now = 1000.0
+
+        def __call__(self):
+            return self.now
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entry_count(self):
+        """엔트리 수 초과 시 가장 오래 사용되지 않은 키 퇴출"""
+        from src.blocks.cache.tiers import L1RedisCache
+
+        cache = L1RedisCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_eviction_by_bytes(self):
+        """바이트 제한 초과 시 퇴출"""
+        from src.blocks.cache.tiers import L1RedisCache
+
+        cache = L1RedisCache(max_entries=None, max_bytes=5000)
+        for i in range(10):
+            await cache.set(f"k{i}", "x" * 1000)
+
+        assert cache.size_bytes <= 5000
+        assert len(cache) < 10
+        assert await cache.get("k9") == "x" * 1000
+
+    @pytest.mark.asyncio
+    async def test_monotonic_ttl(self):
+        """주입된 monotonic 시계 기준 TTL 만료"""
+        from src.blocks.cache.tiers import L1RedisCache
+
+        clock = self.FakeClock()
+        cache = L1RedisCache(clock=clock)
+        await cache.set("k", "v", ttl=10)
+
+        clock.now += 10
+        assert await cache.get("k") == "v"
+        clock.now += 1
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_sweep_expired_in_batches(self):
+        """읽지 않는 만료 키도 배치 단위로 정리"""
+        from src.blocks.cache.tiers import L1RedisCache
+
+        clock = self.FakeClock()
+        cache = L1RedisCache(clock=clock)
+        for i in range(25):
+            await cache.set(f"old{i}", i, ttl=5)
+        await cache.set("fresh", "v", ttl=100)
+        # 재설정된 키는 이전 만료 시각으로 지워지지 않아야 함
+        await cache.set("old0", "renewed", ttl=100)
+
+        clock.now += 6
+        assert cache.sweep_expired(batch_size=10) == 10
+        assert cache.sweep_expired(batch_size=10) == 10
+        assert cache.sweep_expired(batch_size=10) == 4
+        assert len(cache) == 2
+        assert await cache.get("old0") == "renewed"
+
+    @pytest.mark.asyncio
+    async def test_background_sweeper(self):
+        """백그라운드 sweeper 동작"""
+        import asyncio
+
+        from src.blocks.cache.tiers import L1RedisCache
+
+        clock = self.FakeClock()
+        cache = L1RedisCache(clock=clock)
+        await cache.set("k", "v", ttl=1)
+        clock.now += 2
+
+        cache.start_sweeper(interval=0.01)
+        await asyncio.sleep(0.05)
+        await cache.stop_sweeper()
+
+        assert len(cache) == 0
+
+
+class TestL1RedisBackend:
+    """Redis L1 백엔드 테스트 (fakeredis)"""
+
+    @pytest.fixture
+    def server(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeServer()
+
+    @staticmethod
+    def _backend(server, **kwargs):
+        import fakeredis
+
+        from src.blocks.cache.tiers import L1RedisBackend
+
+        client = fakeredis.FakeAsyncRedis(server=server)
+        return L1RedisBackend(client=client, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_shared_across_workers(self, server):
+        """워커 간 캐시 공유"""
+        worker_a = self._backend(server)
+        worker_b = self._backend(server)
+
+        await worker_a.set("catalog:1", {"title": "WSOP"}, ttl=60)
+
+        assert await worker_b.get("catalog:1") == {"title": "WSOP"}
+        assert await worker_b.exists("catalog:1")
+        await worker_b.delete("catalog:1")
+        assert await worker_b.get("catalog:1") is None
+
+    @pytest.mark.asyncio
+    async def test_get_many_set_many(self, server):
+        """파이프라인 다중 저장/조회"""
+        backend = self._backend(server, near_cache_size=0)
+
+        await backend.set_many({f"k{i}": i for i in range(5)}, ttl=60)
+        found = await backend.get_many(["k0", "k3", "missing"])
+
+        assert found == {"k0": 0, "k3": 3}
+
+        await backend.delete_many(["k0", "k1"])
+        assert await backend.get_many(["k0", "k1", "k2"]) == {"k2": 2}
+
+    @pytest.mark.asyncio
+    async def test_near_cache_invalidation(self, server):
+        """다른 워커의 set 시 pub/sub으로 near-cache 무효화"""
+        import asyncio
+
+        worker_a = self._backend(server)
+        worker_b = self._backend(server)
+        await worker_b.start()
+        try:
+            await worker_a.set("k", "v1", ttl=60)
+            assert await worker_b.get("k") == "v1"  # near-cache 적재
+
+            await worker_a.set("k", "v2", ttl=60)
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if await worker_b.get("k") == "v2":
+                    break
+
+            assert await worker_b.get("k") == "v2"
+        finally:
+            await worker_b.stop()
+
+    def test_backend_selection(self, monkeypatch):
+        """L1_CACHE_BACKEND 기본값은 인메모리 Mock"""
+        from src.blocks.cache.tiers import L1RedisCache, create_l1_cache
+
+        monkeypatch.delenv("L1_CACHE_BACKEND", raising=False)
+        assert isinstance(create_l1_cache(), L1RedisCache)
+
+        monkeypatch.setenv("L1_CACHE_BACKEND", "bogus")
+        with pytest.raises(ValueError):
+            create_l1_cache()
+
+
+class TestStreamSlotLeases:
+    """동시 스트리밍 슬롯 lease 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_release_by_lease(self):
+        """lease_id로 지정한 슬롯만 해제"""
+        from src.blocks.cache.tiers import L3Limiter, MemorySlotStore
+
+        limiter = L3Limiter(max_streams_per_user=3, store=MemorySlotStore())
+        first = await limiter.acquire_lease("u1", "a")
+        second = await limiter.acquire_lease("u1", "b")
+
+        assert await limiter.release_slot("u1", second.lease_id)
+        assert not await limiter.release_slot("u1", second.lease_id)
+
+        slots = await limiter.get_active_slots("u1")
+        assert [s.lease_id for s in slots] == [first.lease_id]
+
+    @pytest.mark.asyncio
+    async def test_abandoned_lease_expires(self):
+        """heartbeat가 끊긴 슬롯은 TTL 후 자동 해제"""
+        from src.blocks.cache.tiers import L3Limiter, MemorySlotStore
+
+        now = [1000.0]
+        limiter = L3Limiter(
+            max_streams_per_user=2, store=MemorySlotStore(clock=lambda: now[0]), lease_ttl=30
+        )
+        kept = await limiter.acquire_lease("u1", "a")
+        await limiter.acquire_lease("u1", "b")
+        assert await limiter.acquire_lease("u1", "c") is None
+
+        now[0] += 20
+        assert await limiter.heartbeat("u1", kept.lease_id)
+        now[0] += 20  # "b"는 만료, "a"는 연장됨
+
+        assert await limiter.get_active_streams("u1") == 1
+        assert await limiter.acquire_lease("u1", "c") is not None
+
+        now[0] += 60
+        assert not await limiter.heartbeat("u1", kept.lease_id)
+        assert await limiter.get_active_streams("u1") == 0
+
+
+class TestRedisSlotStore:
+    """Redis 슬롯 저장소 테스트 (fakeredis + Lua)"""
+
+    @pytest.fixture
+    def server(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        return fakeredis.FakeServer()
+
+    @staticmethod
+    def _limiter(server, clock, max_streams=3):
+        import fakeredis
+
+        from src.blocks.cache.tiers import L3Limiter, RedisSlotStore
+
+        client = fakeredis.FakeAsyncRedis(server=server)
+        store = RedisSlotStore(client=client, clock=clock)
+        return L3Limiter(max_streams_per_user=max_streams, store=store, lease_ttl=30), client
+
+    @pytest.mark.asyncio
+    async def test_limit_shared_across_nodes(self, server):
+        """여러 노드가 같은 사용자 한도를 공유"""
+        import asyncio
+        import time
+
+        node_a, _ = self._limiter(server, time.time)
+        node_b, _ = self._limiter(server, time.time)
+
+        results = await asyncio.gather(
+            *(node.acquire_lease("u1", f"c{i}") for i, node in enumerate([node_a, node_b] * 3))
+        )
+
+        assert sum(r is not None for r in results) == 3
+        assert await node_a.get_active_streams("u1") == 3
+        slots = await node_b.get_active_slots("u1")
+        assert {s.content_id for s in slots} <= {f"c{i}" for i in range(6)}
+
+        # 다른 노드에서 lease_id로 해제
+        lease = next(r for r in results if r is not None)
+        assert await node_b.release_slot("u1", lease.lease_id)
+        assert await node_a.acquire_lease("u1", "c9") is not None
+
+    @pytest.mark.asyncio
+    async def test_lease_expiry_and_heartbeat(self, server):
+        """TTL 만료 / heartbeat 연장 / 키 자동 만료"""
+        now = [1_700_000_000.0]
+        limiter, client = self._limiter(server, lambda: now[0], max_streams=1)
+
+        lease = await limiter.acquire_lease("u1", "a")
+        assert await limiter.acquire_lease("u1", "b") is None
+        assert 0 < await client.pttl("wsoptv:slots:u1") <= 30_000 + 1
+
+        now[0] += 25
+        assert await limiter.heartbeat("u1", lease.lease_id)
+        now[0] += 25
+        assert await limiter.acquire_lease("u1", "b") is None
+
+        now[0] += 10  # 마지막 heartbeat 후 35초
+        assert not await limiter.heartbeat("u1", lease.lease_id)
+        assert await limiter.get_active_streams("u1") == 0
+        assert await limiter.acquire_lease("u1", "b") is not None
+        assert await client.hlen("wsoptv:slots:u1:meta") == 1
+
+    def test_create_slot_store(self, monkeypatch):
+        """STREAM_SLOT_BACKEND 선택"""
+        from src.blocks.cache.tiers import MemorySlotStore, create_slot_store
+
+        monkeypatch.delenv("STREAM_SLOT_BACKEND", raising=False)
+        assert isinstance(create_slot_store(), MemorySlotStore)
+
+        monkeypatch.setenv("STREAM_SLOT_BACKEND", "etcd")
+        with pytest.raises(ValueError):
+            create_slot_store()
+
+
+class TestHLSSegmentCache:
+    """HLS 세그먼트 캐시 테스트"""
+
+    @staticmethod
+    def _stage(cache, content_id, segment_size=100):
+        staging = cache.staging_dir(content_id)
+        (staging / "index.m3u8").write_text("#EXTM3U\n")
+        (staging / "init.mp4").write_bytes(b"i" * 10)
+        (staging / "seg_00000.m4s").write_bytes(b"s" * segment_size)
+        return staging
+
+    @pytest.mark.asyncio
+    async def test_commit_and_get_file(self, tmp_path):
+        """임시 디렉토리를 패키지로 교체 등록 후 파일 조회"""
+        from src.blocks.cache.tiers import HLSSegmentCache
+
+        cache = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+        path = await cache.commit("a", self._stage(cache, "a"))
+
+        assert path == tmp_path / "hls" / "a"
+        assert await cache.exists("a") is True
+        assert cache.used_bytes == len("#EXTM3U\n") + 10 + 100
+        assert await cache.get_file("a", "seg_00000.m4s") == path / "seg_00000.m4s"
+        assert [p.name for p in (tmp_path / "hls").iterdir()] == ["a"]
+
+        # 재패키징 시 기존 패키지 교체 (용량도 교체)
+        await cache.commit("a", self._stage(cache, "a", segment_size=50))
+        assert cache.used_bytes == len("#EXTM3U\n") + 10 + 50
+        assert [p.name for p in (tmp_path / "hls").iterdir()] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_get_file_rejects_bad_names(self, tmp_path):
+        """패키지 밖 경로, 없는 파일, 없는 패키지는 None"""
+        from src.blocks.cache.tiers import HLSSegmentCache
+
+        cache = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+        await cache.commit("a", self._stage(cache, "a"))
+
+        assert await cache.get_file("a", "../a/index.m3u8") is None
+        assert await cache.get_file("a", ".hidden") is None
+        assert await cache.get_file("a", "seg_99999.m4s") is None
+        assert await cache.get_file("b", "index.m3u8") is None
+
+    @pytest.mark.asyncio
+    async def test_commit_requires_playlist(self, tmp_path):
+        """playlist 없는 결과는 등록하지 않음"""
+        from src.blocks.cache.tiers import HLSSegmentCache
+
+        cache = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+        staging = cache.staging_dir("a")
+
+        with pytest.raises(FileNotFoundError):
+            await cache.commit("a", staging)
+        assert await cache.exists("a") is False
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, tmp_path):
+        """용량 초과 시 가장 오래 재생되지 않은 패키지를 통째로 퇴출"""
+        from src.blocks.cache.tiers import HLSSegmentCache
+
+        package_size = len("#EXTM3U\n") + 10 + 100
+        cache = HLSSegmentCache(
+            cache_dir=str(tmp_path / "hls"), max_size_gb=package_size * 2 / 1024**3
+        )
+        await cache.commit("a", self._stage(cache, "a"))
+        await cache.commit("b", self._stage(cache, "b"))
+        await cache.get_file("a", "index.m3u8")
+
+        evicted = await cache.make_room(package_size, exclude="c")
+
+        assert evicted == ["b"]
+        assert not (tmp_path / "hls" / "b").exists()
+        assert await cache.exists("a") is True
+        assert cache.used_bytes == package_size
+
+    @pytest.mark.asyncio
+    async def test_load_index_cleans_incomplete(self, tmp_path):
+        """재시작 시 완료된 패키지만 인덱스, 중단된 임시 디렉토리는 삭제"""
+        from src.blocks.cache.tiers import HLSSegmentCache
+
+        cache = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+        await cache.commit("a", self._stage(cache, "a"))
+        self._stage(cache, "b")  # 패키징 도중 종료
+        (tmp_path / "hls" / "c").mkdir()  # playlist 없음
+
+        restarted = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+
+        assert await restarted.exists("a") is True
+        assert restarted.used_bytes == cache.used_bytes
+        assert [p.name for p in (tmp_path / "hls").iterdir()] == ["a"]
@@ -414,6 +414,72 @@ class TestFlatCatalogService:
 
         assert years == [2024, 2023, 2022]  # 내림차순
 
+    def test_find_next_part(self, service: FlatCatalogService):
+        """다음 Part → 다음 Day 순서로 다음 아이템 조회"""
+        items = {}
+        for name in [
+            "WSOP_2024_Event5_Day1_Part2.mp4",
+            "WSOP_2024_Event5_Day1_Part3.mp4",
+            "WSOP_2024_Event5_Day2_Part1.mp4",
+            "WSOP_2024_Event6_Day1_Part3.mp4",
+        ]:
+            items[name] = service.create_from_nas_file(NASFileInfo(
+                id=uuid4(),
+                file_path=f"Z:\\ARCHIVE\\WSOP\\2024\\{name}",
+                file_name=name,
+                file_size_bytes=1000000,
+                file_extension=".mp4",
+                file_category="VIDEO",
+            ))
+
+        part2 = items["WSOP_2024_Event5_Day1_Part2.mp4"]
+        part3 = items["WSOP_2024_Event5_Day1_Part3.mp4"]
+        day2 = items["WSOP_2024_Event5_Day2_Part1.mp4"]
+
+        assert service.find_next(part2.id) == part3
+        assert service.find_next(part3.id) == day2
+        assert service.find_next(day2.id) is None
+        assert service.find_next(uuid4()) is None
+
+    def test_find_next_only_parses_siblings(self, service: FlatCatalogService):
+        """다른 폴더는 보지 않고, 파싱 결과는 아이템별로 캐시"""
+        def add(path: str) -> CatalogItem:
+            return service.create_from_nas_file(NASFileInfo(
+                id=uuid4(),
+                file_path=path,
+                file_name=path.rsplit("/", 1)[1],
+                file_size_bytes=1000000,
+                file_extension=".mp4",
+                file_category="VIDEO",
+            ))
+
+        part1 = add("/nas/WSOP/2024/a/WSOP_2024_Event5_Day1_Part1.mp4")
+        part2 = add("/nas/WSOP/2024/a/WSOP_2024_Event5_Day1_Part2.mp4")
+        for i in range(20):
+            add(f"/nas/WSOP/2024/b{i}/WSOP_2024_Event5_Day1_Part{i + 2}.mp4")
+
+        parsed: list[str] = []
+        original = service._title_generator.parse_metadata
+
+        def spy(file_name: str):
+            parsed.append(file_name)
+            return original(file_name)
+
+        service._title_generator.parse_metadata = spy
+        try:
+            assert service.find_next(part1.id) == part2
+            assert sorted(parsed) == sorted([part1.file_name, part2.file_name])
+
+            parsed.clear()
+            assert service.find_next(part1.id) == part2
+            assert parsed == []
+
+            # 삭제된 형제는 인덱스에서 빠진다
+            service.delete(part2.id)
+            assert service.find_next(part1.id) is None
+        finally:
+            service._title_generator.parse_metadata = original
+
     def test_clear(self, service: FlatCatalogService):
         """전체 삭제"""
         for i in range(5):
@@ -609,3 +675,888 @@ class TestSingleton:
         service2 = get_flat_catalog_service()
 
         assert service1 is service2
+
+
+class TestCatalogETag:
+    """카탈로그 버전 ETag 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return FlatCatalogService()
+
+    @pytest.fixture
+    def client(self, service):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.flat_catalog.router import router
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_flat_catalog_service] = lambda: service
+        return TestClient(app)
+
+    @staticmethod
+    def _nas_file(i: int = 0) -> NASFileInfo:
+        return NASFileInfo(
+            id=uuid4(),
+            file_path=f"/nas/videos/WSOP_2024_Event{i}.mp4",
+            file_name=f"WSOP_2024_Event{i}.mp4",
+            file_size_bytes=1000000,
+            file_extension=".mp4",
+            file_category="VIDEO",
+        )
+
+    def test_version_changes_on_mutation(self, service: FlatCatalogService):
+        """생성/수정/삭제마다 ETag 변경, 조회는 유지"""
+        etags = [service.etag]
+
+        item = service.create_from_nas_file(self._nas_file())
+        etags.append(service.etag)
+        service.get_all()
+        service.get_projects()
+        assert service.etag == etags[-1]
+
+        service.set_visibility(item.id, False)
+        etags.append(service.etag)
+        service.delete(item.id)
+        etags.append(service.etag)
+
+        assert len(set(etags)) == 4
+        assert FlatCatalogService().etag != FlatCatalogService().etag
+
+    def test_etag_follows_store_content(self, tmp_path):
+        """같은 기록이면 재시작/압축 후에도 같은 ETag, 다른 기록이면 다른 ETag"""
+        import shutil
+
+        from src.blocks.flat_catalog.store import CatalogStore
+
+        writer = FlatCatalogService(store=CatalogStore(tmp_path / "a"))
+        writer.create_from_nas_file(self._nas_file())
+        etag = writer.etag
+        writer.close()  # 스냅샷 압축 (내용은 그대로)
+        assert writer.etag == etag
+        shutil.copytree(tmp_path / "a", tmp_path / "b")
+
+        first = FlatCatalogService(store=CatalogStore(tmp_path / "a"))
+        second = FlatCatalogService(store=CatalogStore(tmp_path / "b"))
+        assert first.etag == second.etag == etag
+
+        # 기록 수는 같지만 내용이 다른 변경
+        first.create_from_nas_file(self._nas_file(1))
+        second.create_from_nas_file(self._nas_file(2))
+        assert first.etag != second.etag
+        assert first.etag != etag
+
+        first._store.close()
+        restarted = FlatCatalogService(store=CatalogStore(tmp_path / "a"))
+        assert restarted.etag == first.etag
+
+    def test_invalid_cursor_not_masked_by_etag(self, client, service: FlatCatalogService):
+        """잘못된 커서는 If-None-Match가 일치해도 400"""
+        etag = client.get("/catalog/").headers["etag"]
+
+        response = client.get(
+            "/catalog/", params={"after": "not-a-cursor"}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "path", ["/catalog/", "/catalog/stats", "/catalog/projects", "/catalog/years"]
+    )
+    def test_not_modified(self, client, service: FlatCatalogService, path: str):
+        """If-None-Match가 현재 버전과 같으면 304"""
+        service.create_from_nas_file(self._nas_file())
+
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag == service.etag
+
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+        service.create_from_nas_file(self._nas_file(1))
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_not_modified_skips_query(self, client, service: FlatCatalogService, monkeypatch):
+        """304 판정 시 항목을 조회하지 않음"""
+        response = client.get("/catalog/")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("should not be called")
+
+        monkeypatch.setattr(service, "get_all", fail)
+        response = client.get("/catalog/", headers={"If-None-Match": response.headers["etag"]})
+        assert response.status_code == 304
+
+
+class TestCatalogIndexes:
+    """보조 인덱스 (nas_file_id / project / year / visible) 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return FlatCatalogService()
+
+    @staticmethod
+    def _nas_file(name: str) -> NASFileInfo:
+        return NASFileInfo(
+            id=uuid4(),
+            file_path=f"/nas/videos/{name}",
+            file_name=name,
+            file_size_bytes=1000000,
+            file_extension=".mp4",
+            file_category="VIDEO",
+        )
+
+    def test_update_moves_index_entries(self, service: FlatCatalogService):
+        """project/year/visibility 변경 시 필터 결과가 즉시 반영"""
+        item = service.create_from_nas_file(self._nas_file("WSOP_2024_Event1.mp4"))
+
+        service.update(item.id, project_code="HCL", year=2023)
+
+        assert service.get_all(project_code="WSOP") == []
+        assert service.get_all(project_code="HCL", year=2023) == [item]
+        assert service.get_years() == [2023]
+
+        service.set_visibility(item.id, False)
+
+        assert service.count() == 0
+        assert service.count(visible_only=False) == 1
+        assert service.get_projects() == []
+        assert service.get_all(project_code="HCL", visible_only=False) == [item]
+
+    def test_delete_removes_index_entries(self, service: FlatCatalogService):
+        """삭제된 아이템은 NAS 파일 ID/필터로 조회되지 않음"""
+        nas_file = self._nas_file("WSOP_2024_Event1.mp4")
+        item = service.create_from_nas_file(nas_file)
+
+        assert service.get_by_nas_file_id(nas_file.id) is item
+
+        service.delete(item.id)
+
+        assert service.get_by_nas_file_id(nas_file.id) is None
+        assert service.get_all(project_code="WSOP", year=2024) == []
+        assert service.get_years() == []
+
+    def test_clear_resets_indexes(self, service: FlatCatalogService):
+        """clear 후 인덱스도 비워짐"""
+        nas_file = self._nas_file("WSOP_2024_Event1.mp4")
+        service.create_from_nas_file(nas_file)
+
+        service.clear()
+
+        assert service.get_by_nas_file_id(nas_file.id) is None
+        assert service.count(project_code="WSOP") == 0
+        assert service.get_projects() == []
+
+    def test_indexes_match_full_scan(self, service: FlatCatalogService):
+        """여러 번 변경한 뒤에도 인덱스 결과가 전체 스캔 결과와 일치"""
+        import random
+
+        rng = random.Random(7)
+        projects = ["WSOP", "HCL", "GGMILLIONS"]
+        items = [
+            service.create_from_nas_file(
+                self._nas_file(f"{rng.choice(projects)}_{rng.choice([2022, 2023, 2024])}_E{i}.mp4")
+            )
+            for i in range(60)
+        ]
+        for item in rng.sample(items, 20):
+            service.update(
+                item.id,
+                project_code=rng.choice(projects),
+                year=rng.choice([2022, 2023, None]),
+                is_visible=rng.random() < 0.5,
+            )
+        for item in rng.sample(items, 10):
+            service.delete(item.id)
+
+        remaining = list(service._items.values())
+        for project in [None, *projects]:
+            for year in [None, 2022, 2023, 2024]:
+                for visible_only in [True, False]:
+                    expected = {
+                        i.id
+                        for i in remaining
+                        if (not visible_only or i.is_visible)
+                        and (project is None or i.project_code == project)
+                        and (year is None or i.year == year)
+                    }
+                    found = service.get_all(
+                        project_code=project, year=year, visible_only=visible_only, limit=1000
+                    )
+                    assert {i.id for i in found} == expected
+                    if year is None:
+                        assert service.count(project, visible_only) == len(expected)
+
+        for item in remaining:
+            assert service.get_by_nas_file_id(item.nas_file_id) is item
+
+    def test_sync_deletes_via_index(self, service: FlatCatalogService):
+        """재동기화 시 빠진 파일만 삭제, 기존 파일은 건너뜀"""
+        files = [self._nas_file(f"WSOP_2024_Event{i}.mp4") for i in range(5)]
+        service.sync_from_nas_files(files)
+
+        result = service.sync_from_nas_files(files[:3])
+
+        assert result.deleted == 2
+        assert result.skipped == 3
+        assert all(service.get_by_nas_file_id(f.id) is None for f in files[3:])
+        assert service.count() == 3
+
+    def test_migration_items_are_indexed(self, service: FlatCatalogService):
+        """add_item으로 저장한 아이템도 인덱스에 포함"""
+        item = CatalogItem(nas_file_id=uuid4(), project_code="WSOP", year=2020)
+
+        service.add_item(item)
+
+        assert service.get_by_nas_file_id(item.nas_file_id) is item
+        assert service.get_all(project_code="WSOP", year=2020) == [item]
+
+
+class TestCatalogOrdering:
+    """정렬 인덱스 + 커서 페이지네이션 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return FlatCatalogService()
+
+    @staticmethod
+    def _add(service: FlatCatalogService, count: int, project: str = "WSOP") -> list[CatalogItem]:
+        from datetime import UTC, datetime, timedelta
+
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        items = []
+        for i in range(count):
+            # 같은 created_at이 섞여도 id로 순서가 정해짐
+            item = CatalogItem(
+                nas_file_id=uuid4(),
+                project_code=project,
+                year=2024,
+                created_at=base + timedelta(minutes=i // 2),
+            )
+            items.append(service.add_item(item))
+        return items
+
+    @staticmethod
+    def _newest_first(items: list[CatalogItem]) -> list[CatalogItem]:
+        return sorted(items, key=lambda i: (i.created_at, i.id), reverse=True)
+
+    def test_skip_limit_matches_full_sort(self, service: FlatCatalogService):
+        """skip/limit 결과가 전체 정렬 결과와 동일"""
+        items = self._newest_first(self._add(service, 25))
+
+        assert service.get_all(limit=10) == items[:10]
+        assert service.get_all(skip=20, limit=10) == items[20:]
+        assert service.get_all(skip=30) == []
+
+    def test_cursor_walks_all_items(self, service: FlatCatalogService):
+        """next_cursor로 끝까지 중복/누락 없이 조회, 마지막 페이지는 cursor 없음"""
+        items = self._newest_first(self._add(service, 25))
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = service.get_page(limit=10, after=cursor)
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        assert seen == items
+
+    def test_cursor_stable_under_inserts(self, service: FlatCatalogService):
+        """새 아이템이 추가되어도 다음 페이지가 밀리지 않음"""
+        items = self._newest_first(self._add(service, 10))
+        _, cursor = service.get_page(limit=5)
+
+        for _ in range(3):
+            service.add_item(CatalogItem(project_code="WSOP"))  # created_at = 현재 시각
+        page, _ = service.get_page(limit=5, after=cursor)
+
+        assert page == items[5:]
+
+    def test_filters_use_separate_orderings(self, service: FlatCatalogService):
+        """필터 조합별 정렬 목록 (숨김/프로젝트 변경 반영)"""
+        wsop = self._newest_first(self._add(service, 6))
+        hcl = self._newest_first(self._add(service, 4, project="HCL"))
+        service.set_visibility(wsop[0].id, False)
+
+        assert service.get_all(project_code="WSOP") == wsop[1:]
+        assert service.get_all(project_code="WSOP", visible_only=False) == wsop
+        assert service.get_all(project_code="HCL", year=2024) == hcl
+        assert service.count(project_code="WSOP", year=2024) == 5
+        assert service.count(year=2023) == 0
+
+    def test_naive_created_at(self, service: FlatCatalogService):
+        """timezone 없는 created_at도 함께 정렬"""
+        from datetime import datetime
+
+        aware = self._add(service, 1)[0]
+        naive = service.add_item(CatalogItem(created_at=datetime(2030, 1, 1)))
+
+        assert service.get_all() == [naive, aware]
+
+    def test_invalid_cursor(self, service: FlatCatalogService):
+        """잘못된 커서는 ValueError, API는 400"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.flat_catalog.router import router
+
+        with pytest.raises(ValueError):
+            service.get_page(after="not-a-cursor")
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_flat_catalog_service] = lambda: service
+        client = TestClient(app)
+
+        assert client.get("/catalog/", params={"after": "bad"}).status_code == 400
+
+    def test_api_cursor_pagination(self, service: FlatCatalogService):
+        """/catalog/ 응답의 next_cursor로 다음 페이지 조회"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.flat_catalog.router import router
+
+        items = self._newest_first(self._add(service, 5))
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_flat_catalog_service] = lambda: service
+        client = TestClient(app)
+
+        first = client.get("/catalog/", params={"limit": 3}).json()
+        second = client.get(
+            "/catalog/", params={"limit": 3, "after": first["next_cursor"]}
+        ).json()
+
+        assert [i["id"] for i in first["items"]] == [str(i.id) for i in items[:3]]
+        assert [i["id"] for i in second["items"]] == [str(i.id) for i in items[3:]]
+        assert second["next_cursor"] is None
+        assert first["total"] == 5
+
+
+class TestCatalogStore:
+    """카탈로그 영속 저장소 (append-only 로그 + 스냅샷) 테스트"""
+
+    @staticmethod
+    def _nas_file(i: int) -> NASFileInfo:
+        return NASFileInfo(
+            id=uuid4(),
+            file_path=f"/nas/videos/WSOP_2024_Event{i}_Day1.mp4",
+            file_name=f"WSOP_2024_Event{i}_Day1.mp4",
+            file_size_bytes=1000000,
+            file_extension=".mp4",
+            file_category="VIDEO",
+        )
+
+    @staticmethod
+    def _crash(service: FlatCatalogService) -> None:
+        """프로세스 종료 흉내 (스냅샷 없이 로그/잠금 파일만 닫힘)"""
+        service._store.close()
+
+    def test_restart_restores_catalog(self, tmp_path):
+        """재시작 후 생성/수정/삭제가 모두 복구되고 인덱스도 재구성"""
+        from src.blocks.flat_catalog.store import CatalogStore
+
+        service = FlatCatalogService(store=CatalogStore(tmp_path))
+        files = [self._nas_file(i) for i in range(3)]
+        service.sync_from_nas_files(files)
+        first = service.get_by_nas_file_id(files[0].id)
+        service.update(first.id, display_title="Edited", is_visible=False)
+        service.delete(service.get_by_nas_file_id(files[1].id).id)
+        self._crash(service)
+
+        restored = FlatCatalogService(store=CatalogStore(tmp_path))
+
+        assert restored.count(visible_only=False) == 2
+        assert restored.count() == 1
+        item = restored.get_by_nas_file_id(files[0].id)
+        assert item.display_title == "Edited"
+        assert item.created_at == first.created_at
+        assert restored.get_by_nas_file_id(files[1].id) is None
+        assert {i.id for i in restored.get_all(project_code="WSOP", visible_only=False)} == {
+            item.id, restored.get_by_nas_file_id(files[2].id).id
+        }
+
+    def test_restart_does_not_regenerate_titles(self, tmp_path):
+        """복구 시 제목 생성기를 호출하지 않음"""
+        from src.blocks.flat_catalog.store import CatalogStore
+
+        service = FlatCatalogService(store=CatalogStore(tmp_path))
+        service.sync_from_nas_files([self._nas_file(i) for i in range(5)])
+        self._crash(service)
+
+        class NoTitles:
+            def generate(self, *args):
+                raise AssertionError("title regenerated")
+
+        restored = FlatCatalogService(title_generator=NoTitles(), store=CatalogStore(tmp_path))
+        assert restored.count() == 5
+
+    def test_torn_log_record_ignored(self, tmp_path):
+        """중간에 끊긴 마지막 로그 줄은 버리고 이후 기록은 정상 재생"""
+        from src.blocks.flat_catalog.store import CatalogStore
+
+        service = FlatCatalogService(store=CatalogStore(tmp_path))
+        service.create_from_nas_file(self._nas_file(0))
+        service.close()
+        with open(tmp_path / "log.jsonl", "a") as f:
+            f.write('{"op": "put", "item": {"id": ')
+
+        restored = FlatCatalogService(store=CatalogStore(tmp_path))
+        restored.create_from_nas_file(self._nas_file(1))
+        self._crash(restored)
+
+        again = FlatCatalogService(store=CatalogStore(tmp_path))
+        assert again.count() == 2
+
+    def test_compaction(self, tmp_path):
+        """로그가 커지면 스냅샷으로 압축, 압축 후에도 같은 상태로 복구"""
+        from src.blocks.flat_catalog.store import CatalogStore
+
+        store = CatalogStore(tmp_path)
+        store.COMPACT_MIN_RECORDS = 4
+        service = FlatCatalogService(store=store)
+        items = [service.create_from_nas_file(self._nas_file(i)) for i in range(3)]
+        for _ in range(3):
+            service.update(items[0].id, confidence=0.5)
+
+        assert (tmp_path / "snapshot.jsonl").exists()
+        assert store.log_records < 4
+
+        service.clear()
+        service.create_from_nas_file(self._nas_file(9))
+        self._crash(service)
+        restored = FlatCatalogService(store=CatalogStore(tmp_path))
+
+        assert restored.count() == 1
+        assert restored.get_by_id(items[0].id) is None
+
+    def test_close_writes_snapshot(self, tmp_path):
+        """종료 시 스냅샷을 쓰고 로그를 비움"""
+        from src.blocks.flat_catalog.store import CatalogStore
+
+        service = FlatCatalogService(store=CatalogStore(tmp_path))
+        service.create_from_nas_file(self._nas_file(0))
+        service.close()
+
+        assert (tmp_path / "log.jsonl").stat().st_size == 0
+        assert FlatCatalogService(store=CatalogStore(tmp_path)).count() == 1
+
+    def test_second_writer_rejected(self, tmp_path):
+        """같은 디렉토리를 쓰는 두 번째 저장소는 즉시 실패, 닫힌 뒤에는 열림"""
+        from src.blocks.flat_catalog.store import CatalogStore, CatalogStoreLockedError
+
+        store = CatalogStore(tmp_path)
+        with pytest.raises(CatalogStoreLockedError):
+            CatalogStore(tmp_path)
+
+        store.close()
+        other = CatalogStore(tmp_path)
+        with pytest.raises(CatalogStoreLockedError):
+            store.put(FlatCatalogService().create_from_nas_file(self._nas_file(0)))
+        other.close()
+
+    def test_env_store(self, tmp_path, monkeypatch):
+        """CATALOG_STORE_PATH가 없으면 인메모리 전용"""
+        from src.blocks.flat_catalog.store import create_catalog_store
+
+        monkeypatch.delenv("CATALOG_STORE_PATH", raising=False)
+        assert create_catalog_store() is None
+
+        monkeypatch.setenv("CATALOG_STORE_PATH", str(tmp_path / "catalog"))
+        assert create_catalog_store().path == tmp_path / "catalog"
+
+
+class TestCatalogDeltaSync:
+    """경로 기반 delta sync 테스트"""
+
+    @pytest.fixture
+    def service(self) -> FlatCatalogService:
+        return FlatCatalogService()
+
+    @staticmethod
+    def _nas_file(i: int, size: int = 1000000, mtime: float = 1.0) -> NASFileInfo:
+        from src.blocks.flat_catalog.models import stable_nas_file_id
+
+        path = f"Z:\\ARCHIVE\\WSOP\\WSOP_2024_Event{i}_Day1.mp4"
+        return NASFileInfo(
+            id=stable_nas_file_id(path),
+            file_path=path,
+            file_name=f"WSOP_2024_Event{i}_Day1.mp4",
+            file_size_bytes=size,
+            file_extension=".mp4",
+            file_category="VIDEO",
+            file_mtime=mtime,
+        )
+
+    def _full_scan(self, service: FlatCatalogService, files: list) -> str:
+        return service.apply_nas_delta(files, [], scan_id=uuid4().hex, final=True).cursor
+
+    def test_stable_id_ignores_separator_and_case(self):
+        """같은 파일은 구분자/대소문자가 달라도 같은 ID"""
+        from src.blocks.flat_catalog.models import stable_nas_file_id
+
+        assert stable_nas_file_id("Z:\\ARCHIVE\\a.mp4") == stable_nas_file_id("z:/archive/A.MP4/")
+        assert stable_nas_file_id("Z:/ARCHIVE/a.mp4") != stable_nas_file_id("Z:/ARCHIVE/b.mp4")
+
+    def test_no_change_delta_skips_title_generation(
+        self, service: FlatCatalogService, monkeypatch
+    ):
+        """변경 없는 파일은 제목을 다시 만들지 않고 커서만 진행"""
+        files = [self._nas_file(i) for i in range(20)]
+        cursor = self._full_scan(service, files)
+        version = service.version
+
+        def fail(*args):
+            raise AssertionError("title regenerated")
+
+        monkeypatch.setattr(service._title_generator, "generate", fail)
+        result = service.apply_nas_delta(files, [], cursor=cursor)
+
+        assert result.skipped == 20
+        assert result.created == result.updated == result.deleted == 0
+        assert result.cursor not in (None, cursor)
+        assert service.version == version
+
+    def test_delta_applies_changes(self, service: FlatCatalogService):
+        """크기/mtime 변경은 업데이트, 삭제 경로는 제거 (카탈로그 ID 유지)"""
+        files = [self._nas_file(i) for i in range(3)]
+        cursor = self._full_scan(service, files)
+        item = service.get_by_path(files[0].file_path)
+
+        result = service.apply_nas_delta(
+            [self._nas_file(0, mtime=2.0), self._nas_file(3)],
+            ["z:/archive/wsop/wsop_2024_event1_day1.mp4"],
+            cursor=cursor,
+        )
+
+        assert (result.created, result.updated, result.deleted) == (1, 1, 1)
+        assert service.get_by_path(files[0].file_path).id == item.id
+        assert item.file_mtime == 2.0
+        assert service.get_by_path(files[1].file_path) is None
+        assert service.count(visible_only=False) == 3
+
+    def test_stale_cursor_rejected(self, service: FlatCatalogService):
+        """커서가 없거나 오래되면 SyncCursorError, API는 409"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.flat_catalog.router import router
+        from src.blocks.flat_catalog.service import SyncCursorError
+
+        with pytest.raises(SyncCursorError):
+            service.apply_nas_delta([], [], cursor=None)
+        first = self._full_scan(service, [self._nas_file(0)])
+        service.apply_nas_delta([], [], cursor=first)
+        with pytest.raises(SyncCursorError):
+            service.apply_nas_delta([], [], cursor=first)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_flat_catalog_service] = lambda: service
+        client = TestClient(app)
+
+        response = client.post("/catalog/sync/delta", json={"cursor": first})
+        assert response.status_code == 409
+
+    def test_full_scan_prunes_unseen_files(self, service: FlatCatalogService):
+        """전체 스캔은 마지막 배치에서만 보지 못한 항목을 삭제"""
+        files = [self._nas_file(i) for i in range(4)]
+        self._full_scan(service, files)
+
+        first = service.apply_nas_delta(files[:1], [], scan_id="rescan")
+        assert first.cursor is None
+        assert first.deleted == 0
+        assert service.count(visible_only=False) == 4
+
+        last = service.apply_nas_delta(files[2:3], [], scan_id="rescan", final=True)
+        assert last.deleted == 2
+        assert last.cursor is not None
+        assert {i.file_path for i in service.get_all(visible_only=False)} == {
+            files[0].file_path, files[2].file_path
+        }
+
+    def test_interleaved_scans_keep_their_own_state(self, service: FlatCatalogService):
+        """다른 scan_id 배치가 끼어들어도 먼저 보낸 배치의 항목을 삭제하지 않음"""
+        files = [self._nas_file(i) for i in range(6)]
+        self._full_scan(service, files)
+
+        service.apply_nas_delta(files[:3], [], scan_id="A")
+        service.apply_nas_delta(files[:2], [], scan_id="B")
+        result = service.apply_nas_delta(files[3:], [], scan_id="A", final=True)
+
+        assert result.deleted == 0
+        assert service.count(visible_only=False) == 6
+
+        # 끝나지 않은 B는 독립적으로 이어감 (다음 새 스캔에서 실제 삭제 반영)
+        assert service.apply_nas_delta(files[2:], [], scan_id="B", final=True).deleted == 0
+        assert service.apply_nas_delta(files[:5], [], scan_id="C", final=True).deleted == 1
+        assert service.get_by_path(files[5].file_path) is None
+
+    def test_scan_keeps_items_changed_by_other_sync(self, service: FlatCatalogService):
+        """스캔 도중 다른 동기화가 만든 항목은 그 스캔이 삭제하지 않음"""
+        cursor = self._full_scan(service, [self._nas_file(0)])
+
+        service.apply_nas_delta([self._nas_file(0)], [], scan_id="A")
+        service.apply_nas_delta([self._nas_file(1)], [], cursor=cursor)
+        result = service.apply_nas_delta([], [], scan_id="A", final=True)
+
+        assert result.deleted == 0
+        assert service.get_by_path(self._nas_file(1).file_path) is not None
+
+    def test_finished_or_expired_scan_rejected(self, service: FlatCatalogService, monkeypatch):
+        """끝난 scan_id 재전송(final 재시도 등)과 만료된 스캔은 SyncScanError"""
+        from src.blocks.flat_catalog.service import SyncScanError
+
+        files = [self._nas_file(i) for i in range(3)]
+        service.apply_nas_delta(files, [], scan_id="done", final=True)
+        with pytest.raises(SyncScanError):
+            service.apply_nas_delta(files[:1], [], scan_id="done", final=True)
+        assert service.count(visible_only=False) == 3
+
+        service.apply_nas_delta(files[:1], [], scan_id="slow")
+        monkeypatch.setattr(FlatCatalogService, "SCAN_TTL_S", -1)
+        with pytest.raises(SyncScanError):
+            service.apply_nas_delta(files[1:], [], scan_id="slow", final=True)
+        assert service.count(visible_only=False) == 3
+
+    def test_legacy_item_matched_by_path(self, service: FlatCatalogService):
+        """랜덤 ID로 만든 기존 항목은 경로로 매칭되어 카탈로그 ID 유지"""
+        legacy = self._nas_file(0)
+        legacy.id = uuid4()
+        item = service.create_from_nas_file(legacy)
+
+        result = service.apply_nas_delta([self._nas_file(0)], [], scan_id="scan", final=True)
+
+        assert result.created == 0
+        assert result.deleted == 0
+        assert service.get_by_nas_file_id(self._nas_file(0).id).id == item.id
+
+    def test_legacy_sync_and_clear_reset_cursor(self, service: FlatCatalogService):
+        """delta 밖에서 NAS 항목이 바뀌면 커서 무효화"""
+        self._full_scan(service, [self._nas_file(0)])
+        service.sync_from_nas_files([self._nas_file(1)])
+        assert service.sync_cursor is None
+
+        self._full_scan(service, [self._nas_file(0)])
+        service.clear()
+        assert service.sync_cursor is None
+
+    def test_api_delta_roundtrip(self, service: FlatCatalogService):
+        """/catalog/sync/delta: id 없이 경로로 식별, 응답 커서로 다음 delta"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.flat_catalog.router import router
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_flat_catalog_service] = lambda: service
+        client = TestClient(app)
+        upsert = {
+            "file_path": "/mnt/nas/WSOP/WSOP_2024_Event1_Day1.mp4",
+            "file_name": "WSOP_2024_Event1_Day1.mp4",
+            "file_size_bytes": 100,
+            "file_extension": ".mp4",
+            "file_mtime": 1.5,
+        }
+
+        scan = client.post(
+            "/catalog/sync/delta", json={"scan_id": "s1", "final": True, "upserts": [upsert]}
+        ).json()
+        delta = client.post(
+            "/catalog/sync/delta", json={"cursor": scan["cursor"], "upserts": [upsert]}
+        ).json()
+
+        assert scan["created"] == 1
+        assert delta["skipped"] == 1
+        assert delta["cursor"] != scan["cursor"]
+
+    def test_cursor_survives_restart(self, tmp_path):
+        """저장소가 있으면 재시작 후에도 같은 커서로 delta 가능"""
+        from src.blocks.flat_catalog.store import CatalogStore
+
+        service = FlatCatalogService(store=CatalogStore(tmp_path))
+        cursor = self._full_scan(service, [self._nas_file(0)])
+        service.close()
+
+        restored = FlatCatalogService(store=CatalogStore(tmp_path))
+        result = restored.apply_nas_delta([self._nas_file(0)], [], cursor=cursor)
+
+        assert result.skipped == 1
+        assert restored.get_by_path(self._nas_file(0).file_path).file_mtime == 1.0
+
+
+class TestCatalogSyncStream:
+    """NDJSON 스트리밍 동기화 테스트"""
+
+    @pytest.fixture
+    def service(self) -> FlatCatalogService:
+        return FlatCatalogService()
+
+    @pytest.fixture
+    def client(self, service: FlatCatalogService):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.flat_catalog.router import router
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_flat_catalog_service] = lambda: service
+        return TestClient(app)
+
+    @staticmethod
+    def _record(i: int, size: int = 100) -> dict:
+        return {
+            "file_path": f"/mnt/nas/WSOP/WSOP_2024_Event{i}_Day1.mp4",
+            "file_name": f"WSOP_2024_Event{i}_Day1.mp4",
+            "file_size_bytes": size,
+            "file_extension": ".mp4",
+            "file_mtime": 1.0,
+        }
+
+    @staticmethod
+    def _post(client, records: list, **params) -> list[dict]:
+        import json
+
+        body = "".join(json.dumps(r) + "\n" for r in records)
+        response = client.post(
+            "/catalog/sync/stream",
+            content=body.encode(),
+            params=params,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_full_scan_in_bounded_batches(self, client, service: FlatCatalogService, monkeypatch):
+        """배치 크기만큼씩 반영하고 배치마다 진행 줄 전송"""
+        sizes = []
+        apply = service.apply_nas_delta
+
+        def spy(upserts, deletes, **kwargs):
+            sizes.append(len(upserts) + len(deletes))
+            return apply(upserts, deletes, **kwargs)
+
+        monkeypatch.setattr(service, "apply_nas_delta", spy)
+        lines = self._post(client, [self._record(i) for i in range(7)], batch_size=3)
+
+        assert max(sizes) <= 3
+        assert [line["batch"] for line in lines[:-1]] == [1, 2]
+        assert lines[1]["created"] == 6
+        assert lines[-1]["done"] is True
+        assert lines[-1]["created"] == 7
+        assert lines[-1]["cursor"] == service.sync_cursor
+        assert service.count(visible_only=False) == 7
+
+    def test_full_scan_prunes_after_stream_end(self, client, service: FlatCatalogService):
+        """커서 없이 보내면 본문 전체가 NAS 목록 - 없는 항목은 마지막에 삭제"""
+        self._post(client, [self._record(i) for i in range(5)], batch_size=2)
+        lines = self._post(client, [self._record(i) for i in range(2)], batch_size=1)
+
+        assert lines[-1]["deleted"] == 3
+        assert lines[-1]["skipped"] == 2
+        assert service.count(visible_only=False) == 2
+
+    def test_delta_mode_with_cursor(self, client, service: FlatCatalogService):
+        """커서가 있으면 변경분만 반영 (삭제 줄 포함)"""
+        cursor = self._post(client, [self._record(i) for i in range(3)])[-1]["cursor"]
+
+        lines = self._post(
+            client,
+            [self._record(0, size=200), {"delete": self._record(1)["file_path"]}],
+            cursor=cursor,
+        )
+
+        assert (lines[-1]["updated"], lines[-1]["deleted"]) == (1, 1)
+        assert service.count(visible_only=False) == 2
+        assert lines[-1]["cursor"] not in (None, cursor)
+
+    def test_stale_cursor_409(self, client):
+        """오래된 커서는 본문을 읽기 전에 409"""
+        response = client.post(
+            "/catalog/sync/stream", content=b"", params={"cursor": "stale-1"}
+        )
+        assert response.status_code == 409
+
+    def test_invalid_records_skipped(self, client, service: FlatCatalogService):
+        """잘못된 줄은 오류로 세고 나머지는 반영"""
+        import json
+
+        body = b"not json\n" + json.dumps({"file_name": "x"}).encode() + b"\n\n"
+        body += json.dumps(self._record(0)).encode()  # 마지막 줄은 개행 없음
+        response = client.post("/catalog/sync/stream", content=body)
+        last = json.loads(response.text.splitlines()[-1])
+
+        assert last["done"] is True
+        assert last["errors"] == 2
+        assert last["created"] == 1
+        assert last["error_messages"][0].startswith("line 1:")
+
+    def test_oversized_record_aborts_without_prune(self, client, service: FlatCatalogService):
+        """너무 긴 줄은 중단 - 전체 스캔이면 삭제 정리도 하지 않음"""
+        import json
+
+        from src.blocks.flat_catalog.router import SYNC_STREAM_MAX_LINE_BYTES
+
+        self._post(client, [self._record(i) for i in range(3)])
+        response = client.post(
+            "/catalog/sync/stream", content=b"x" * (SYNC_STREAM_MAX_LINE_BYTES + 1)
+        )
+
+        last = json.loads(response.text.splitlines()[-1])
+        assert last["done"] is False
+        assert "exceeds" in last["error"]
+        assert service.count(visible_only=False) == 3
+
+    @pytest.mark.asyncio
+    async def test_lines_split_across_chunks(self):
+        """청크 경계에 걸친 줄도 한 레코드로 조립"""
+        from src.blocks.flat_catalog.router import _iter_ndjson_lines
+
+        async def chunks():
+            for chunk in (b'{"a":', b' 1}\n{"b"', b": 2}\n\n", b'{"c": 3}'):
+                yield chunk
+
+        lines = [line async for line in _iter_ndjson_lines(chunks())]
+        assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+    @pytest.mark.asyncio
+    async def test_stream_overlapping_batch_sync(self, service: FlatCatalogService):
+        """스트리밍 전체 스캔 도중 배치 전체 스캔이 끝나도 서로의 항목을 삭제하지 않음"""
+        import json
+
+        from src.blocks.flat_catalog.models import stable_nas_file_id
+        from src.blocks.flat_catalog.router import DeltaFileRequest, _ingest_ndjson, _to_nas_file
+
+        records = [self._record(i) for i in range(6)]
+        files = [_to_nas_file(DeltaFileRequest.model_validate(r)) for r in records]
+        service.apply_nas_delta(files, [], scan_id="initial", final=True)
+
+        async def chunks():
+            for i, record in enumerate(records):
+                if i == 3:
+                    # 스트림 중간에 다른 클라이언트의 배치 스캔이 처음부터 끝까지 실행
+                    service.apply_nas_delta(files[:3], [], scan_id="batch")
+                    service.apply_nas_delta(files[3:], [], scan_id="batch", final=True)
+                yield (json.dumps(record) + "\n").encode()
+
+        lines = [
+            json.loads(line)
+            async for line in _ingest_ndjson(service, chunks(), None, batch_size=2)
+        ]
+
+        assert lines[-1]["done"] is True
+        assert lines[-1]["deleted"] == 0
+        assert service.count(visible_only=False) == 6
+        assert service.get_by_nas_file_id(stable_nas_file_id(records[0]["file_path"]))
@@ -167,6 +167,91 @@ class TestStreamBlockEvents:
         assert len(received_events) == 1
 
 
+class TestStreamPrefetch:
+    """다음 Part 예측 워밍 테스트"""
+
+    @staticmethod
+    def _catalog():
+        from uuid import uuid4
+
+        from src.blocks.flat_catalog.models import NASFileInfo
+        from src.blocks.flat_catalog.service import FlatCatalogService
+
+        catalog = FlatCatalogService()
+        created = [
+            catalog.create_from_nas_file(NASFileInfo(
+                id=uuid4(),
+                file_path=f"/nas/WSOP/2024/{name}",
+                file_name=name,
+                file_size_bytes=1000,
+                file_extension=".mp4",
+                file_category="VIDEO",
+            ))
+            for name in ["WSOP_2024_Event5_Day1_Part2.mp4", "WSOP_2024_Event5_Day1_Part3.mp4"]
+        ]
+        return catalog, created
+
+    @pytest.mark.asyncio
+    async def test_start_stream_enqueues_next_part(self):
+        """스트리밍 시작 시 다음 Part의 낮은 우선순위 CACHE_WARM 요청"""
+        from src.blocks.stream.service import StreamService
+        from src.orchestration.message_bus import MessageBus
+
+        catalog, (part2, part3) = self._catalog()
+        bus = MessageBus.get_instance()
+        requests = []
+
+        async def handler(msg):
+            if msg.payload.get("payload", {}).get("after") == str(part2.id):
+                requests.append(msg)
+
+        await bus.subscribe("worker.enqueue", handler)
+
+        service = StreamService(catalog_service=catalog)
+        result = await service.start_stream("user_prefetch", str(part2.id))
+
+        assert result.allowed is True
+        assert len(requests) == 1
+        assert requests[0].payload["task_type"] == "CACHE_WARM"
+        assert requests[0].payload["priority"] < 0
+        assert requests[0].payload["payload"]["content_id"] == str(part3.id)
+
+    @pytest.mark.asyncio
+    async def test_skip_prefetch_when_already_on_ssd(self):
+        """다음 Part가 이미 L2에 있으면 요청하지 않음"""
+        from src.blocks.cache.models import CacheTier
+        from src.blocks.stream.service import StreamService
+
+        class FakeCacheService:
+            async def get_content_tier(self, content_id):
+                return CacheTier.L2
+
+        catalog, (part2, _) = self._catalog()
+        service = StreamService(cache_service=FakeCacheService(), catalog_service=catalog)
+
+        assert await service._prefetch_next(str(part2.id)) is None
+        assert await service._prefetch_next("not-a-uuid") is None
+
+    @pytest.mark.asyncio
+    async def test_worker_consumes_enqueue_request(self):
+        """Worker Block이 worker.enqueue 메시지로 작업 추가"""
+        from src.blocks.worker.models import TaskType
+        from src.blocks.worker.service import WorkerService
+        from src.orchestration.message_bus import BlockMessage
+
+        worker = WorkerService()
+        await worker._on_enqueue_request(BlockMessage(
+            source_block="stream",
+            event_type="worker.enqueue",
+            payload={"task_type": "CACHE_WARM", "priority": -10, "payload": {"content_id": "c1"}},
+        ))
+
+        [task] = worker._tasks.values()
+        assert task.type == TaskType.CACHE_WARM
+        assert task.priority == -10
+        assert task.payload == {"content_id": "c1"}
+
+
 class TestStreamRouter:
     """Stream Router 테스트"""
 
@@ -241,6 +326,37 @@ class TestStreamRouter:
         response = client.post("/stream/video4/start")
         assert response.status_code == 429
 
+    def test_lease_heartbeat_and_release(self, client):
+        """start가 발급한 lease로 heartbeat/종료, 해제된 lease의 heartbeat는 404"""
+        leases = [client.post(f"/stream/video{i}/start").json()["lease_id"] for i in range(3)]
+        assert len(set(leases)) == 3
+
+        response = client.post("/stream/video1/heartbeat", params={"lease_id": leases[1]})
+        assert response.status_code == 200
+
+        # 두 번째 스트림만 종료 → 나머지 lease는 유지
+        client.post("/stream/video1/end", params={"lease_id": leases[1]})
+        response = client.post("/stream/video1/heartbeat", params={"lease_id": leases[1]})
+        assert response.status_code == 404
+        response = client.post("/stream/video0/heartbeat", params={"lease_id": leases[0]})
+        assert response.status_code == 200
+
+        assert client.post("/stream/video4/start").status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_end_without_lease_releases_matching_content(self):
+        """lease_id 없는 종료는 해당 컨텐츠의 슬롯만 해제"""
+        from src.blocks.stream.service import StreamService
+
+        service = StreamService()
+        await service.start_stream("u1", "a")
+        kept = await service.start_stream("u1", "b")
+
+        await service.end_stream("u1", "a")
+
+        slots = await service._limiter.get_active_slots("u1")
+        assert [s.lease_id for s in slots] == [kept.lease_id]
+
 
 class TestRangeHandler:
     """HTTP Range Handler 테스트"""
@@ -271,6 +387,46 @@ class TestRangeHandler:
         result = parse_range_header("invalid", total_size=10000)
         assert result is None
 
+    def test_parse_range_header_suffix(self):
+        """suffix Range 헤더 파싱 (bytes=-500)"""
+        from src.blocks.stream.range_handler import parse_range_header
+
+        result = parse_range_header("bytes=-500", total_size=10000)
+        assert result.start_byte == 9500
+        assert result.end_byte == 9999
+
+        # 파일보다 긴 suffix는 전체 파일
+        result = parse_range_header("bytes=-50000", total_size=10000)
+        assert result.start_byte == 0
+
+    def test_parse_range_set_multiple(self):
+        """여러 범위 파싱 + 정렬 + 병합"""
+        from src.blocks.stream.range_handler import parse_range_set
+
+        ranges = parse_range_set("bytes=-1000, 0-499, 400-999, 20000-", 10000)
+        assert [(r.start_byte, r.end_byte) for r in ranges] == [(0, 999), (9000, 9999)]
+
+        # 끝이 파일 크기를 넘으면 잘림
+        ranges = parse_range_set("bytes=5000-99999", 10000)
+        assert [(r.start_byte, r.end_byte) for r in ranges] == [(5000, 9999)]
+
+    def test_parse_range_set_invalid_and_unsatisfiable(self):
+        """문법 오류는 None, 만족할 수 없는 범위만 있으면 빈 리스트"""
+        from src.blocks.stream.range_handler import MAX_RANGES, parse_range_set
+
+        assert parse_range_set("bytes=500-100", 10000) is None
+        assert parse_range_set("items=0-10", 10000) is None
+        assert parse_range_set("bytes=-", 10000) is None
+        too_many = "bytes=" + ",".join(f"{i * 1000}-{i * 1000}" for i in range(MAX_RANGES + 1))
+        assert parse_range_set(too_many, 100000) is None
+
+        assert parse_range_set("bytes=10000-", 10000) == []
+        assert parse_range_set("bytes=-0", 10000) == []
+
+        # 빈 파일은 모든 범위가 만족 불가
+        assert parse_range_set("bytes=0-", 0) == []
+        assert parse_range_set("bytes=0-10,-5", 0) == []
+
     def test_validate_range_success(self):
         """유효한 Range 검증"""
         from src.blocks.stream.range_handler import validate_range
@@ -304,3 +460,1298 @@ class TestRangeHandler:
         assert headers["Content-Range"] == "bytes 0-1023/10000"
         assert headers["Content-Length"] == "1024"
         assert headers["Accept-Ranges"] == "bytes"
+
+
+class TestSendfileResponse:
+    """Zero-copy 파일 응답 테스트"""
+
+    @staticmethod
+    async def _run(response, extensions):
+        """ASGI 호출 후 전송된 메시지 수집"""
+        sent = []
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"spec_version": "2.4"},
+            "extensions": extensions,
+        }
+        await response(scope, receive, send)
+        return sent
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(bytes(range(256)) * 40)  # 10240 bytes
+        return path
+
+    @pytest.mark.asyncio
+    async def test_zerocopysend_range(self, video_file):
+        """zerocopysend 확장 지원 시 파일 범위를 직접 전송"""
+        from src.blocks.stream.sendfile import SendfileResponse
+
+        response = SendfileResponse(video_file, 100, 1123, 10240, status_code=206)
+        sent = await self._run(response, {"http.response.zerocopysend": {}})
+
+        assert sent[0]["type"] == "http.response.start"
+        assert sent[0]["status"] == 206
+        assert sent[1]["type"] == "http.response.zerocopysend"
+        assert sent[1]["offset"] == 100
+        assert sent[1]["count"] == 1024
+        assert len(sent) == 2
+
+    @pytest.mark.asyncio
+    async def test_pathsend_full_file_only(self, video_file):
+        """pathsend는 전체 파일 응답에서만 사용"""
+        from src.blocks.stream.sendfile import SendfileResponse
+
+        full = SendfileResponse(video_file, 0, 10239, 10240)
+        sent = await self._run(full, {"http.response.pathsend": {}})
+        assert sent[1] == {"type": "http.response.pathsend", "path": str(video_file)}
+
+        partial = SendfileResponse(video_file, 0, 99, 10240, status_code=206)
+        sent = await self._run(partial, {"http.response.pathsend": {}})
+        body = b"".join(m.get("body", b"") for m in sent[1:])
+        assert body == video_file.read_bytes()[:100]
+
+    @pytest.mark.asyncio
+    async def test_chunked_fallback(self, video_file):
+        """확장 미지원 또는 zero_copy=False면 청크 스트리밍"""
+        from src.blocks.stream.sendfile import SendfileResponse
+
+        response = SendfileResponse(
+            video_file, 10, 5009, 10240, status_code=206, chunk_size=1000, zero_copy=False
+        )
+        sent = await self._run(response, {"http.response.zerocopysend": {}})
+
+        assert response.delivery_mode == "chunked"
+        chunks = [m["body"] for m in sent[1:] if m["body"]]
+        assert len(chunks) == 5
+        assert b"".join(chunks) == video_file.read_bytes()[10:5010]
+
+    def test_video_endpoint_range(self, video_file):
+        """/video 엔드포인트 Range 응답"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.stream.router import router
+        from src.blocks.stream.service import StreamService
+
+        class FakeCacheService:
+            async def get_stream_path(self, content_id):
+                return video_file
+
+        app = FastAPI()
+        app.include_router(router)
+        app.state.stream_service = StreamService(cache_service=FakeCacheService())
+        client = TestClient(app)
+
+        response = client.get("/stream/video123/video", headers={"Range": "bytes=0-99"})
+        assert response.status_code == 206
+        assert response.headers["Content-Range"] == "bytes 0-99/10240"
+        assert response.content == video_file.read_bytes()[:100]
+
+        response = client.get("/stream/video123/video")
+        assert response.status_code == 200
+        assert response.content == video_file.read_bytes()
+
+
+class TestAsyncFileReader:
+    """스레드 풀 파일 리더 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_read_range_chunks_and_stats(self, tmp_path):
+        """청크 단위 읽기 및 읽기 지연 통계"""
+        from src.blocks.stream.file_reader import AsyncFileReader
+
+        path = tmp_path / "video.mp4"
+        path.write_bytes(bytes(range(256)) * 16)  # 4096 bytes
+
+        latencies = []
+        reader = AsyncFileReader(max_workers=2, on_read=lambda n, s: latencies.append(s))
+        chunks = [c async for c in reader.read_range(path, 100, 2099, chunk_size=512)]
+        reader.shutdown()
+
+        assert b"".join(chunks) == path.read_bytes()[100:2100]
+        assert [len(c) for c in chunks] == [512, 512, 512, 464]
+        assert reader.stats.reads == 4
+        assert reader.stats.bytes_read == 2000
+        assert len(latencies) == 4
+
+    @pytest.mark.asyncio
+    async def test_slow_read_does_not_block_event_loop(self, tmp_path):
+        """느린 읽기 중에도 이벤트 루프는 다른 작업 처리"""
+        import asyncio
+        import time
+
+        from src.blocks.stream.file_reader import AsyncFileReader
+
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"x" * 1024)
+
+        class SlowReader(AsyncFileReader):
+            @staticmethod
+            def _timed_pread(f, size, offset):
+                time.sleep(0.2)
+                return AsyncFileReader._timed_pread(f, size, offset)
+
+        reader = SlowReader(max_workers=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        data = await reader.read(path, 0, 1024)
+        task.cancel()
+        reader.shutdown()
+
+        assert data == b"x" * 1024
+        assert ticks >= 5
+
+    def test_invalid_worker_count(self):
+        """스레드 수는 1 이상"""
+        from src.blocks.stream.file_reader import AsyncFileReader
+
+        with pytest.raises(ValueError):
+            AsyncFileReader(max_workers=0)
+
+
+class TestReadAhead:
+    """연속 Range 요청 선행 읽기 테스트"""
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(bytes(range(256)) * 256)  # 64KB
+        return path
+
+    @staticmethod
+    def _manager(**kwargs):
+        from src.blocks.stream.file_reader import AsyncFileReader
+        from src.blocks.stream.read_ahead import ReadAheadManager
+
+        reader = AsyncFileReader(max_workers=2)
+        return ReadAheadManager(reader=reader, **kwargs), reader
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_hit_prefetch_buffer(self, video_file):
+        """연속 Range 요청은 같은 파일을 재사용하고 선행 읽기 버퍼에서 응답"""
+        manager, reader = self._manager(prefetch_bytes=16 * 1024)
+        data = video_file.read_bytes()
+        total = len(data)
+        opens = 0
+        original_open = reader.open
+
+        async def counting_open(path):
+            nonlocal opens
+            opens += 1
+            return await original_open(path)
+
+        reader.open = counting_open
+
+        received = b""
+        for start in range(0, total, 4096):
+            chunks = [
+                c async for c in manager.stream(
+                    "c1", "client-a", video_file, start, start + 4095, total, chunk_size=1024
+                )
+            ]
+            received += b"".join(chunks)
+
+        session = manager.get_session("c1", "client-a")
+        manager.close_all()
+        reader.shutdown()
+
+        assert received == data
+        assert opens == 1
+        assert session.buffer_hits > session.direct_reads
+
+    @pytest.mark.asyncio
+    async def test_random_seek_does_not_prefetch_past_range(self, video_file):
+        """첫 요청/탐색은 요청 범위 밖을 미리 읽지 않음"""
+        manager, reader = self._manager(prefetch_bytes=16 * 1024)
+        data = video_file.read_bytes()
+
+        chunks = [
+            c async for c in manager.stream(
+                "c1", "client-a", video_file, 30000, 30999, len(data), chunk_size=1024
+            )
+        ]
+        session = manager.get_session("c1", "client-a")
+
+        assert b"".join(chunks) == data[30000:31000]
+        assert session.pending is None
+        assert session.buffer_end <= 31000
+        manager.close_all()
+        reader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_closed(self, video_file):
+        """유휴 시간이 지난 세션의 파일 닫기"""
+        now = [0.0]
+        manager, reader = self._manager(
+            prefetch_bytes=4096, idle_timeout=10, clock=lambda: now[0]
+        )
+
+        async for _ in manager.stream("c1", "client-a", video_file, 0, 1023, 65536):
+            pass
+        session = manager.get_session("c1", "client-a")
+
+        assert manager.evict_idle() == 0
+        now[0] = 11
+        assert manager.evict_idle() == 1
+        assert len(manager) == 0
+
+        import asyncio
+        await asyncio.sleep(0.05)
+        assert session.file.closed
+        reader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_path_change_keeps_active_session_open(self, video_file, tmp_path):
+        """경로가 바뀌어도 전송 중인 세션은 분리만 하고 마지막 사용자가 닫음"""
+        import asyncio
+
+        manager, reader = self._manager(prefetch_bytes=4096)
+        data = video_file.read_bytes()
+        moved = tmp_path / "moved.mp4"
+        moved.write_bytes(data)
+
+        first = manager.stream("c1", "client-a", video_file, 0, 8191, len(data), chunk_size=1024)
+        received = [await first.__anext__()]
+        old = manager.get_session("c1", "client-a")
+
+        async for _ in manager.stream("c1", "client-a", moved, 0, 1023, len(data)):
+            pass
+        assert manager.get_session("c1", "client-a") is not old
+        await asyncio.sleep(0.05)
+        assert not old.file.closed
+
+        received += [c async for c in first]
+        await asyncio.sleep(0.05)
+
+        assert b"".join(received) == data[:8192]
+        assert old.file.closed
+        manager.close_all()
+        reader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shared_file_is_not_reopened(self, video_file):
+        """넘겨받은 파일은 직접 열지 않고, 세션이 닫힐 때 참조만 해제"""
+        import asyncio
+
+        manager, reader = self._manager(prefetch_bytes=16 * 1024)
+        data = video_file.read_bytes()
+        opens = 0
+        shares = []
+
+        async def counting_open(path):
+            nonlocal opens
+            opens += 1
+
+        reader.open = counting_open
+
+        def share():
+            shares.append("held")
+            return lambda: shares.remove("held")
+
+        with open(video_file, "rb", buffering=0) as f:
+            for start in range(0, 16384, 4096):
+                async for _ in manager.stream(
+                    "c1", "client-a", video_file, start, start + 4095, len(data),
+                    chunk_size=1024, file=f, share_file=share,
+                ):
+                    pass
+            assert shares == ["held"]
+
+            manager.close_all()
+            await asyncio.sleep(0.05)
+            assert shares == []
+            assert not f.closed
+
+        assert opens == 0
+        reader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_max_sessions(self, video_file):
+        """세션 수 제한 (유휴 세션부터 정리)"""
+        manager, reader = self._manager(prefetch_bytes=4096, max_sessions=2)
+
+        for client in ["a", "b", "c"]:
+            async for _ in manager.stream("c1", client, video_file, 0, 1023, 65536):
+                pass
+
+        assert len(manager) == 2
+        assert manager.get_session("c1", "a") is None
+        manager.close_all()
+        reader.shutdown()
+
+
+class TestStreamSourceCache:
+    """스트리밍 소스 공유 캐시 테스트"""
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"v" * 4096)
+        return path
+
+    @staticmethod
+    def _resolver(path, calls):
+        from src.blocks.cache.models import CacheTier
+        from src.blocks.stream.models import StreamSource
+
+        async def resolve(content_id):
+            calls.append(content_id)
+            return StreamSource(path=path, tier=CacheTier.L4)
+
+        return resolve
+
+    @pytest.mark.asyncio
+    async def test_resolve_once_and_share(self, video_file):
+        """반복 요청은 한 번만 해석/stat/open"""
+        import asyncio
+
+        from src.blocks.stream.source_cache import StreamSourceCache
+
+        calls = []
+        cache = StreamSourceCache()
+        resolve = self._resolver(video_file, calls)
+
+        entries = await asyncio.gather(*(cache.acquire("c1", resolve) for _ in range(5)))
+
+        assert calls == ["c1"]
+        assert all(e is entries[0] for e in entries)
+        assert entries[0].size == 4096
+        assert entries[0].refs == 5
+        for entry in entries:
+            cache.release(entry)
+        assert entries[0].refs == 0
+        cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_keeps_file_open_while_in_use(self, video_file):
+        """사용 중인 항목은 무효화되어도 마지막 release 후에 닫힘"""
+        import asyncio
+
+        from src.blocks.stream.source_cache import StreamSourceCache
+
+        calls = []
+        cache = StreamSourceCache()
+        resolve = self._resolver(video_file, calls)
+
+        entry = await cache.acquire("c1", resolve)
+        assert cache.invalidate(path=video_file) == 1
+        await asyncio.sleep(0.05)
+        assert not entry.file.closed
+
+        cache.release(entry)
+        await asyncio.sleep(0.05)
+        assert entry.file.closed
+
+        fresh = await cache.acquire("c1", resolve)
+        assert fresh is not entry
+        assert calls == ["c1", "c1"]
+        cache.release(fresh)
+        cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_missing_file(self, tmp_path):
+        """파일이 없으면 FileNotFoundError"""
+        from src.blocks.stream.source_cache import StreamSourceCache
+
+        cache = StreamSourceCache()
+        with pytest.raises(FileNotFoundError):
+            await cache.acquire("c1", self._resolver(tmp_path / "none.mp4", []))
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_nas_file_updated_invalidates(self, video_file):
+        """nas.file.updated 이벤트로 해당 경로 항목 무효화"""
+        from src.blocks.stream.service import StreamService
+        from src.orchestration.message_bus import BlockMessage
+
+        service = StreamService()
+        entry = await service.source_cache.acquire("c1", self._resolver(video_file, []))
+        service.source_cache.release(entry)
+
+        await service._on_nas_file_changed(BlockMessage(
+            source_block="nas",
+            event_type="nas.file.updated",
+            payload={"id": "not-a-uuid", "file_path": str(video_file)},
+        ))
+
+        assert len(service.source_cache) == 0
+        assert entry.stale
+
+    def test_video_endpoint_reuses_source(self, video_file):
+        """/video 연속 요청은 소스 해석 1회, 응답/세션 종료 후 참조 해제"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.stream.read_ahead import get_read_ahead_manager
+        from src.blocks.stream.router import router
+        from src.blocks.stream.service import StreamService
+
+        lookups = []
+
+        class FakeCacheService:
+            async def get_stream_path(self, content_id):
+                lookups.append(content_id)
+                return video_file
+
+        app = FastAPI()
+        app.include_router(router)
+        service = StreamService(cache_service=FakeCacheService())
+        app.state.stream_service = service
+        client = TestClient(app)
+
+        for start in (0, 1024, 2048):
+            response = client.get(
+                "/stream/c1/video", headers={"Range": f"bytes={start}-{start + 1023}"}
+            )
+            assert response.status_code == 206
+            assert response.content == video_file.read_bytes()[start:start + 1024]
+
+        response = client.get("/stream/c1/video", headers={"Range": "bytes=9999-"})
+        assert response.status_code == 416
+
+        assert lookups == ["c1"]
+        # 선행 읽기 세션이 같은 파일을 공유하며 닫힐 때까지 참조를 유지
+        entry = service.source_cache._entries["c1"]
+        assert entry.refs == 1
+        get_read_ahead_manager().close_all()
+        assert entry.refs == 0
+        service.source_cache.clear()
+
+
+class TestMultipartRanges:
+    """multipart/byteranges 응답 테스트"""
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(bytes(range(256)) * 64)  # 16KB
+        return path
+
+    @staticmethod
+    def _client(video_file):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.stream.router import router
+        from src.blocks.stream.service import StreamService
+
+        class FakeCacheService:
+            async def get_stream_path(self, content_id):
+                return video_file
+
+        app = FastAPI()
+        app.include_router(router)
+        service = StreamService(cache_service=FakeCacheService())
+        app.state.stream_service = service
+        return TestClient(app), service
+
+    @staticmethod
+    def _parse_parts(body: bytes, boundary: str) -> list[tuple[str, bytes]]:
+        parts = []
+        for raw in body.split(f"--{boundary}".encode())[1:-1]:
+            head, _, data = raw.partition(b"\r\n\r\n")
+            content_range = [
+                line.split(b": ", 1)[1].decode()
+                for line in head.split(b"\r\n")
+                if line.startswith(b"Content-Range")
+            ][0]
+            parts.append((content_range, data[:-2]))  # 다음 경계 앞 CRLF 제거
+        return parts
+
+    def test_multipart_response(self, video_file):
+        """moov(끝) + mdat(앞) 범위를 한 번에 응답"""
+        client, service = self._client(video_file)
+        data = video_file.read_bytes()
+
+        response = client.get(
+            "/stream/c1/video", headers={"Range": "bytes=0-1023,-2048"}
+        )
+
+        assert response.status_code == 206
+        content_type = response.headers["content-type"]
+        assert content_type.startswith("multipart/byteranges; boundary=")
+        boundary = content_type.split("boundary=")[1]
+        assert int(response.headers["content-length"]) == len(response.content)
+
+        parts = self._parse_parts(response.content, boundary)
+        assert parts == [
+            ("bytes 0-1023/16384", data[:1024]),
+            ("bytes 14336-16383/16384", data[14336:]),
+        ]
+        assert service.source_cache._entries["c1"].refs == 0
+        service.source_cache.clear()
+
+    def test_overlapping_ranges_coalesce_to_single_part(self, video_file):
+        """겹치는 범위는 합쳐져 단일 206 응답"""
+        client, service = self._client(video_file)
+
+        response = client.get(
+            "/stream/c1/video", headers={"Range": "bytes=0-999,500-1999"}
+        )
+
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 0-1999/16384"
+        assert response.content == video_file.read_bytes()[:2000]
+        service.source_cache.clear()
+
+    def test_unsatisfiable_range(self, video_file):
+        """만족할 수 없는 범위는 416 + Content-Range: bytes */size"""
+        client, service = self._client(video_file)
+
+        response = client.get("/stream/c1/video", headers={"Range": "bytes=20000-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */16384"
+        assert service.source_cache._entries["c1"].refs == 0
+        service.source_cache.clear()
+
+    def test_invalid_range_header_ignored(self, video_file):
+        """문법 오류/범위 수 초과 Range 헤더는 무시하고 200 전체 파일"""
+        from src.blocks.stream.range_handler import MAX_RANGES
+
+        client, service = self._client(video_file)
+        too_many = "bytes=" + ",".join(f"{i * 500}-{i * 500}" for i in range(MAX_RANGES + 1))
+
+        for header in ("bytes=abc", "bytes=500-100", too_many):
+            response = client.get("/stream/c1/video", headers={"Range": header})
+            assert response.status_code == 200
+            assert response.content == video_file.read_bytes()
+        service.source_cache.clear()
+
+    def test_empty_file_ranges(self, tmp_path):
+        """빈 파일: Range는 416, Range 없으면 빈 200"""
+        from src.blocks.stream.read_ahead import get_read_ahead_manager
+
+        empty = tmp_path / "empty.mp4"
+        empty.write_bytes(b"")
+        client, service = self._client(empty)
+
+        response = client.get("/stream/c1/video", headers={"Range": "bytes=0-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */0"
+
+        response = client.get("/stream/c1/video")
+        assert response.status_code == 200
+        assert response.content == b""
+        get_read_ahead_manager().close_all()
+        assert service.source_cache._entries["c1"].refs == 0
+        service.source_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_stream_multipart_reads_in_chunks(self, video_file):
+        """파트를 청크 단위로 읽음 (전체 범위를 한 번에 올리지 않음)"""
+        from src.blocks.stream.models import RangeRequest
+        from src.blocks.stream.range_handler import (
+            build_multipart_part_headers,
+            stream_multipart_ranges,
+        )
+
+        ranges = [RangeRequest(0, 4095), RangeRequest(8192, 12287)]
+        headers, closing, length = build_multipart_part_headers(
+            ranges, 16384, "video/mp4", "b"
+        )
+
+        chunks = [
+            chunk
+            async for chunk in stream_multipart_ranges(
+                video_file, ranges, headers, closing, chunk_size=1024
+            )
+        ]
+
+        assert max(len(c) for c in chunks) == 1024
+        assert sum(len(c) for c in chunks) == length
+
+
+class TestConditionalVideo:
+    """/video 조건부 요청 테스트 (ETag / Last-Modified / If-Range)"""
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"x" * 8192)
+        return path
+
+    @pytest.fixture
+    def client(self, video_file):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.stream.router import router
+        from src.blocks.stream.service import StreamService
+
+        class FakeCacheService:
+            async def get_stream_path(self, content_id):
+                return video_file
+
+        app = FastAPI()
+        app.include_router(router)
+        service = StreamService(cache_service=FakeCacheService())
+        app.state.stream_service = service
+        yield TestClient(app)
+        service.source_cache.clear()
+
+    def test_validators_present(self, client):
+        """200/206 응답에 ETag, Last-Modified 포함"""
+        full = client.get("/stream/c1/video")
+        partial = client.get("/stream/c1/video", headers={"Range": "bytes=0-99"})
+
+        assert full.headers["etag"].startswith('"')
+        assert full.headers["etag"] == partial.headers["etag"]
+        assert full.headers["last-modified"] == partial.headers["last-modified"]
+
+    def test_if_none_match(self, client):
+        """ETag 일치 시 304 (본문 없음)"""
+        etag = client.get("/stream/c1/video").headers["etag"]
+
+        response = client.get("/stream/c1/video", headers={"If-None-Match": f'"other", {etag}'})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = client.get("/stream/c1/video", headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+
+    def test_if_modified_since(self, client):
+        """Last-Modified 이후 변경 없으면 304"""
+        last_modified = client.get("/stream/c1/video").headers["last-modified"]
+
+        response = client.get("/stream/c1/video", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+        response = client.get(
+            "/stream/c1/video", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+        )
+        assert response.status_code == 200
+
+    def test_if_range(self, client):
+        """If-Range 일치 시 206, 불일치 시 전체 파일 200"""
+        etag = client.get("/stream/c1/video").headers["etag"]
+
+        response = client.get(
+            "/stream/c1/video", headers={"Range": "bytes=0-99", "If-Range": etag}
+        )
+        assert response.status_code == 206
+        assert len(response.content) == 100
+
+        response = client.get(
+            "/stream/c1/video", headers={"Range": "bytes=0-99", "If-Range": '"stale"'}
+        )
+        assert response.status_code == 200
+        assert len(response.content) == 8192
+
+    def test_etag_changes_with_file(self, video_file):
+        """파일 크기/수정 시각이 바뀌면 ETag 변경"""
+        import os
+
+        from src.blocks.cache.models import CacheTier
+        from src.blocks.stream.source_cache import ResolvedSource
+
+        stat = os.stat(video_file)
+
+        def source(size, mtime):
+            return ResolvedSource(
+                content_id="c1", path=video_file, tier=CacheTier.L4, size=size,
+                mtime=mtime, file=None, resolved_at=0.0, inode=stat.st_ino,
+            )
+
+        base = source(stat.st_size, stat.st_mtime)
+        assert base.etag == source(stat.st_size, stat.st_mtime).etag
+        assert base.etag != source(stat.st_size + 1, stat.st_mtime).etag
+        assert base.etag != source(stat.st_size, stat.st_mtime + 1).etag
+
+
+class TestBandwidthShaper:
+    """토큰 버킷 대역폭 제한 테스트"""
+
+    def test_token_bucket_burst_then_rate(self):
+        """burst만큼은 즉시, 이후는 충전 속도만큼 대기"""
+        from src.blocks.stream.bandwidth import TokenBucket
+
+        now = [0.0]
+        bucket = TokenBucket(1000, burst_bytes=2000, clock=lambda: now[0])
+
+        assert bucket.reserve(2000) == 0.0
+        assert bucket.reserve(500) == pytest.approx(0.5)
+        # 빚(500) 이후 요청은 누적해서 대기
+        assert bucket.reserve(500) == pytest.approx(1.0)
+
+        now[0] = 10.0
+        assert bucket.is_full
+        assert bucket.reserve(1000) == 0.0
+
+    def test_token_bucket_unlimited(self):
+        """rate 0이면 대기 없음"""
+        from src.blocks.stream.bandwidth import TokenBucket
+
+        bucket = TokenBucket(0, burst_bytes=0)
+        assert bucket.reserve(10**9) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_shape_paces_user(self):
+        """사용자 제한 속도로 청크 전송 (burst 이후)"""
+        import time
+
+        from src.blocks.stream.bandwidth import BandwidthShaper
+
+        # 0.8 Mbps = 100,000 B/s, burst 10,000 B
+        shaper = BandwidthShaper(user_mbps=0.8, node_mbps=0, burst_bytes=10_000)
+
+        async def chunks():
+            for _ in range(3):
+                yield b"x" * 10_000
+
+        started = time.monotonic()
+        received = [c async for c in shaper.shape("u1", chunks())]
+        elapsed = time.monotonic() - started
+
+        assert len(received) == 3
+        assert 0.15 <= elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_node_limit_shared_across_users(self):
+        """노드 제한은 모든 사용자가 공유"""
+        import time
+
+        from src.blocks.stream.bandwidth import BandwidthShaper
+
+        # 사용자 제한 없음, 노드 0.8 Mbps (burst는 1초 분량 = 100,000 B)
+        shaper = BandwidthShaper(user_mbps=0, node_mbps=0.8, burst_bytes=0)
+
+        started = time.monotonic()
+        await shaper.pace("u1", 100_000)
+        await shaper.pace("u2", 20_000)
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.15
+
+    def test_user_shaping_is_opt_in(self, monkeypatch):
+        """사용자별 제한은 STREAM_USER_SHAPING일 때만 (노드 제한은 항상)"""
+        from src.blocks.stream.service import StreamService
+
+        monkeypatch.delenv("STREAM_USER_SHAPING", raising=False)
+        monkeypatch.setenv("STREAM_USER_MBPS", "20")
+        service = StreamService()
+        assert service.bandwidth_shaper.user_mbps == 0
+        assert service.bandwidth_shaper.node_mbps > 0
+
+        monkeypatch.setenv("STREAM_USER_SHAPING", "1")
+        assert StreamService().bandwidth_shaper.user_mbps == 20.0
+
+    @pytest.mark.asyncio
+    async def test_measured_throughput_recorded_in_limiter(self, monkeypatch):
+        """측정된 처리량을 L3Limiter에 기록, 전송 종료 시 0"""
+        from src.blocks.cache.tiers import L3Limiter
+        from src.blocks.stream.bandwidth import BandwidthShaper
+        from src.blocks.stream.service import StreamService
+
+        class FakeCacheService:
+            l3 = L3Limiter(bandwidth_limit_mbps=50.0)
+
+        monkeypatch.setenv("STREAM_USER_SHAPING", "1")
+        monkeypatch.delenv("STREAM_USER_MBPS", raising=False)
+        service = StreamService(cache_service=FakeCacheService())
+        assert service.bandwidth_shaper.user_mbps == 50.0
+
+        now = [0.0]
+        shaper = BandwidthShaper(
+            user_mbps=0, node_mbps=0, on_measure=service._record_throughput,
+            clock=lambda: now[0],
+        )
+        reports = []
+
+        async def chunks():
+            for _ in range(4):
+                now[0] += 0.5
+                yield b"x" * 125_000  # 0.5초마다 125KB = 2 Mbps
+                info = await FakeCacheService.l3.get_bandwidth_info("u1")
+                reports.append(info.current_mbps)
+
+        async for _ in shaper.shape("u1", chunks()):
+            pass
+
+        assert reports[-1] == pytest.approx(2.0)
+        info = await service.get_user_bandwidth("u1")
+        assert info.limit_mbps == 50.0
+        assert info.current_mbps == 0.0
+        assert (await FakeCacheService.l3.get_bandwidth_info("u1")).current_mbps == 0.0
+        # 사용량이 0이 된 사용자 항목은 남기지 않는다
+        assert "u1" not in service._bandwidth_usage
+        assert "u1" not in FakeCacheService.l3._user_bandwidth
+
+    @pytest.mark.asyncio
+    async def test_bandwidth_endpoint_uses_client_host(self, monkeypatch):
+        """/bandwidth는 측정과 같은 키(클라이언트 주소)와 실제 적용 제한을 보고"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.stream.router import router
+        from src.blocks.stream.service import StreamService
+
+        monkeypatch.delenv("STREAM_USER_SHAPING", raising=False)
+        monkeypatch.setenv("STREAM_NODE_MBPS", "0")
+        service = StreamService()
+        app = FastAPI()
+        app.include_router(router)
+        app.state.stream_service = service
+        client = TestClient(app)
+
+        await service._record_throughput("testclient", 4.0)
+        data = client.get("/stream/c1/bandwidth").json()
+        assert data == {"limit_mbps": None, "current_mbps": 4.0}  # 제한 없음
+
+        monkeypatch.setenv("STREAM_USER_SHAPING", "1")
+        monkeypatch.setenv("STREAM_USER_MBPS", "20")
+        monkeypatch.setenv("STREAM_NODE_MBPS", "1000")
+        app.state.stream_service = StreamService()
+        assert client.get("/stream/c1/bandwidth").json()["limit_mbps"] == 20.0
+
+    def test_idle_users_pruned(self):
+        """전송 중이 아니고 버킷이 가득 찬 사용자는 정리"""
+        from src.blocks.stream.bandwidth import BandwidthShaper
+
+        now = [0.0]
+        shaper = BandwidthShaper(
+            user_mbps=8, node_mbps=0, burst_bytes=1_000_000, clock=lambda: now[0]
+        )
+        shaper._state("u1").bucket.reserve(1_000_000)
+        now[0] = 0.5
+        shaper._state("u2")
+        assert len(shaper) == 2  # u1 버킷은 아직 충전 중
+
+        now[0] = 2.0
+        shaper._state("u3")
+        assert len(shaper) == 1
+
+    @pytest.mark.asyncio
+    async def test_zerocopy_split_when_shaped(self, tmp_path):
+        """대역폭 제한 시 zerocopysend를 청크 단위로 나눠 전송"""
+        from src.blocks.stream.bandwidth import BandwidthShaper
+        from src.blocks.stream.sendfile import SendfileResponse
+
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"v" * 10240)
+        shaper = BandwidthShaper(user_mbps=1000, node_mbps=0)
+
+        response = SendfileResponse(
+            path, 0, 10239, 10240, chunk_size=4096, shaper=shaper, user_id="u1"
+        )
+        sent = await TestSendfileResponse._run(
+            response, {"http.response.zerocopysend": {}, "http.response.pathsend": {}}
+        )
+
+        # 속도 조절이 필요하므로 전체 파일이어도 pathsend 대신 zerocopysend
+        assert response.delivery_mode == "zerocopysend"
+        body = sent[1:]
+        assert [(m["offset"], m["count"], m["more_body"]) for m in body] == [
+            (0, 4096, True),
+            (4096, 4096, True),
+            (8192, 2048, False),
+        ]
+
+
+class TestHLSEndpoint:
+    """/hls 엔드포인트 테스트"""
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"x" * 8192)
+        return path
+
+    @pytest.fixture
+    def client(self, tmp_path, video_file):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.cache.tiers import HLSSegmentCache
+        from src.blocks.stream.router import router
+        from src.blocks.stream.service import StreamService
+
+        class FakeCacheService:
+            segments = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+
+            async def get_stream_path(self, content_id):
+                if content_id == "missing":
+                    return tmp_path / "missing.mp4"
+                return video_file
+
+        app = FastAPI()
+        app.include_router(router)
+        service = StreamService(cache_service=FakeCacheService())
+        app.state.stream_service = service
+        return TestClient(app), service
+
+    @staticmethod
+    async def _package(service, content_id):
+        staging = service.segment_cache.staging_dir(content_id)
+        (staging / "index.m3u8").write_text("#EXTM3U\n#EXT-X-MAP:URI=\"init.mp4\"\n")
+        (staging / "init.mp4").write_bytes(b"i" * 16)
+        (staging / "seg_00000.m4s").write_bytes(b"s" * 1024)
+        await service.segment_cache.commit(content_id, staging)
+
+    @pytest.mark.asyncio
+    async def test_serves_playlist_and_segments(self, client):
+        """playlist와 세그먼트를 각각의 Content-Type/캐시 정책으로 서빙"""
+        client, service = client
+        await self._package(service, "v1")
+
+        playlist = client.get("/stream/v1/hls/index.m3u8")
+        assert playlist.status_code == 200
+        assert playlist.headers["content-type"].startswith("application/vnd.apple.mpegurl")
+        assert "init.mp4" in playlist.text
+
+        segment = client.get("/stream/v1/hls/seg_00000.m4s")
+        assert segment.status_code == 200
+        assert segment.headers["content-type"] == "video/mp4"
+        assert segment.content == b"s" * 1024
+        assert segment.headers["cache-control"] == "public, max-age=3600"
+        assert int(playlist.headers["cache-control"].split("=")[1]) < 3600
+
+    @pytest.mark.asyncio
+    async def test_segment_not_modified(self, client):
+        """If-None-Match 일치 시 304"""
+        client, service = client
+        await self._package(service, "v1")
+
+        first = client.get("/stream/v1/hls/seg_00000.m4s")
+        response = client.get(
+            "/stream/v1/hls/seg_00000.m4s", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_unknown_segment_404(self, client):
+        """패키지는 있지만 파일이 없으면 404"""
+        client, service = client
+        await self._package(service, "v1")
+
+        assert client.get("/stream/v1/hls/seg_00099.m4s").status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_missing_package_enqueues_once(self, client):
+        """패키지가 없으면 HLS_PACKAGE 작업을 한 번만 요청하고 503"""
+        from src.orchestration.message_bus import MessageBus
+
+        client, service = client
+        requests = []
+
+        async def handler(msg):
+            if msg.payload.get("payload", {}).get("content_id") == "v2":
+                requests.append(msg)
+
+        bus = MessageBus.get_instance()
+        await bus.subscribe("worker.enqueue", handler)
+
+        first = client.get("/stream/v2/hls/index.m3u8")
+        second = client.get("/stream/v2/hls/index.m3u8")
+
+        assert first.status_code == 503
+        assert first.headers["retry-after"]
+        assert second.status_code == 503
+        assert len(requests) == 1
+        assert requests[0].payload["task_type"] == "HLS_PACKAGE"
+
+    def test_missing_source_404(self, client):
+        """원본 파일도 없으면 404"""
+        client, _ = client
+
+        assert client.get("/stream/missing/hls/index.m3u8").status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_source_change_drops_package(self, client):
+        """원본이 바뀌면 패키지 삭제"""
+        from uuid import uuid4
+
+        from src.blocks.flat_catalog.models import NASFileInfo
+        from src.blocks.flat_catalog.service import FlatCatalogService
+        from src.orchestration.message_bus import BlockMessage
+
+        _, service = client
+        catalog = FlatCatalogService()
+        nas_id = uuid4()
+        item = catalog.create_from_nas_file(NASFileInfo(
+            id=nas_id,
+            file_path="/nas/WSOP/2024/a.mp4",
+            file_name="a.mp4",
+            file_size_bytes=1000,
+            file_extension=".mp4",
+            file_category="VIDEO",
+        ))
+        service._catalog_service = catalog
+        await self._package(service, str(item.id))
+
+        await service._on_nas_file_changed(BlockMessage(
+            source_block="nas",
+            event_type="nas.file.updated",
+            payload={"id": str(nas_id), "file_path": "/nas/WSOP/2024/a.mp4"},
+        ))
+
+        assert await service.segment_cache.exists(str(item.id)) is False
+
+
+def _box(box_type, payload, version=None):
+    """MP4 박스 바이트 (version이 있으면 full box)"""
+    import struct
+
+    if version is not None:
+        payload = bytes([version, 0, 0, 0]) + payload
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _make_mp4(path, sample_sizes, sync=(1, 4, 7, 10), moov_first=False, mdhd_version=0):
+    """
+    키프레임 인덱스 테스트용 MP4 (ftyp + mdat + moov, 1초 샘플, 청크당 2샘플)
+
+    Returns:
+        list[int]: 샘플별 파일 오프셋
+    """
+    import struct
+
+    def moov_box(mdat_offset):
+        offsets = []
+        pos = mdat_offset + 8
+        for size in sample_sizes:
+            offsets.append(pos)
+            pos += size
+        count = len(sample_sizes)
+        chunk_offsets = offsets[::2]
+
+        stbl = _box(b"stbl", b"".join([
+            _box(b"stts", struct.pack(">III", 1, count, 1000), 0),
+            _box(b"stss", struct.pack(f">I{len(sync)}I", len(sync), *sync), 0),
+            _box(b"stsc", struct.pack(">IIII", 1, 1, 2, 1), 0),
+            _box(b"stsz", struct.pack(f">II{count}I", 0, count, *sample_sizes), 0),
+            _box(b"stco", struct.pack(f">I{len(chunk_offsets)}I", len(chunk_offsets),
+                                      *chunk_offsets), 0),
+        ]))
+        if mdhd_version == 1:
+            mdhd = _box(b"mdhd", struct.pack(">QQIQ", 0, 0, 1000, count * 1000) + b"\0" * 4, 1)
+        else:
+            mdhd = _box(b"mdhd", struct.pack(">IIII", 0, 0, 1000, count * 1000) + b"\0" * 4, 0)
+
+        def trak(handler, minf):
+            hdlr = _box(b"hdlr", b"\0" * 4 + handler + b"\0" * 12 + b"\0", 0)
+            return _box(b"trak", _box(b"mdia", mdhd + hdlr + minf))
+
+        return _box(b"moov", b"".join([
+            _box(b"mvhd", struct.pack(">IIII", 0, 0, 600, count * 600) + b"\0" * 80, 0),
+            trak(b"soun", _box(b"minf", b"")),
+            trak(b"vide", _box(b"minf", stbl)),
+        ])), offsets
+
+    ftyp = _box(b"ftyp", b"isom\0\0\0\0isom")
+    mdat = _box(b"mdat", b"".join(bytes([i % 256]) * size for i, size in enumerate(sample_sizes)))
+    if moov_first:
+        # moov 크기는 오프셋 값과 무관하므로 두 번 계산
+        moov, _ = moov_box(0)
+        moov, offsets = moov_box(len(ftyp) + len(moov))
+        path.write_bytes(ftyp + moov + mdat)
+    else:
+        moov, offsets = moov_box(len(ftyp))
+        path.write_bytes(ftyp + mdat + moov)
+    return offsets
+
+
+class TestMP4SeekIndex:
+    """MP4 키프레임 인덱스 추출/직렬화 테스트"""
+
+    SIZES = [100 + i * 10 for i in range(10)]
+
+    def test_moov_at_end(self, tmp_path):
+        """파일 끝의 moov에서 키프레임 시각/오프셋 추출"""
+        from src.core.mp4_index import build_seek_index
+
+        path = tmp_path / "a.mp4"
+        offsets = _make_mp4(path, self.SIZES)
+
+        index = build_seek_index(path)
+
+        assert index.timescale == 1000
+        assert index.duration_s == 10.0
+        assert index.times == [0, 3000, 6000, 9000]
+        assert index.offsets == [offsets[0], offsets[3], offsets[6], offsets[9]]
+        assert index.moov_offset == offsets[-1] + self.SIZES[-1]
+        assert index.moov_offset + index.moov_size == path.stat().st_size
+
+    def test_moov_first_and_64bit_mdhd(self, tmp_path):
+        """faststart 파일과 version 1 mdhd"""
+        from src.core.mp4_index import build_seek_index
+
+        path = tmp_path / "a.mp4"
+        offsets = _make_mp4(path, self.SIZES, moov_first=True, mdhd_version=1)
+
+        index = build_seek_index(path)
+
+        assert index.moov_offset == len(_box(b"ftyp", b"isom\0\0\0\0isom"))
+        assert index.offsets[1] == offsets[3]
+        assert index.duration_s == 10.0
+
+    def test_lookup(self, tmp_path):
+        """탐색 시각 이전의 가장 가까운 키프레임"""
+        from src.core.mp4_index import build_seek_index
+
+        path = tmp_path / "a.mp4"
+        offsets = _make_mp4(path, self.SIZES)
+        index = build_seek_index(path)
+
+        assert index.lookup(0) == (0.0, offsets[0])
+        assert index.lookup(5.5) == (3.0, offsets[3])
+        assert index.lookup(6.0) == (6.0, offsets[6])
+        assert index.lookup(999) == (9.0, offsets[9])
+
+    def test_sidecar_roundtrip(self, tmp_path):
+        """바이너리 sidecar 직렬화 (헤더 + 키프레임당 16바이트)"""
+        from src.core.mp4_index import MP4SeekIndex, build_seek_index
+
+        path = tmp_path / "a.mp4"
+        _make_mp4(path, self.SIZES)
+        index = build_seek_index(path)
+
+        data = index.to_bytes()
+        restored = MP4SeekIndex.from_bytes(data)
+
+        assert restored == index
+        assert len(data) == len(MP4SeekIndex.from_bytes(data).to_bytes())
+        assert len(data) - len(MP4SeekIndex(1, 0, 0, 0).to_bytes()) == 16 * len(index)
+
+    def test_sidecar_rejects_garbage(self):
+        """다른 형식/잘린 sidecar는 ValueError"""
+        from src.core.mp4_index import MP4SeekIndex
+
+        data = MP4SeekIndex(1000, 0, 0, 0, times=[0], offsets=[8]).to_bytes()
+
+        with pytest.raises(ValueError):
+            MP4SeekIndex.from_bytes(b"XXXX" + data[4:])
+        with pytest.raises(ValueError):
+            MP4SeekIndex.from_bytes(data[:-1])
+
+    def test_not_mp4(self, tmp_path):
+        """moov가 없으면 ValueError"""
+        from src.core.mp4_index import build_seek_index
+
+        path = tmp_path / "a.mp4"
+        path.write_bytes(_box(b"ftyp", b"isom") + _box(b"mdat", b"x" * 100))
+
+        with pytest.raises(ValueError):
+            build_seek_index(path)
+
+
+class TestSeekEndpoint:
+    """/seek 엔드포인트 테스트"""
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        _make_mp4(path, [100 + i * 10 for i in range(10)])
+        return path
+
+    @pytest.fixture
+    def client(self, tmp_path, video_file):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.blocks.cache.tiers import SeekIndexStore
+        from src.blocks.stream.router import router
+        from src.blocks.stream.service import StreamService
+
+        class FakeCacheService:
+            seek_index = SeekIndexStore(index_dir=str(tmp_path / "index"))
+
+            async def get_stream_path(self, content_id):
+                if content_id == "missing":
+                    return tmp_path / "missing.mp4"
+                return video_file
+
+        app = FastAPI()
+        app.include_router(router)
+        service = StreamService(cache_service=FakeCacheService())
+        app.state.stream_service = service
+        return TestClient(app), service
+
+    @pytest.mark.asyncio
+    async def test_seek_maps_time_to_offset(self, client, video_file):
+        """인덱스가 있으면 키프레임 오프셋과 Range 값 반환"""
+        from src.core.mp4_index import build_seek_index
+
+        client, service = client
+        index = build_seek_index(video_file)
+        await service.seek_index.save("v1", index)
+
+        response = client.get("/stream/v1/seek", params={"t": 4.2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["keyframe_time"] == 3.0
+        assert data["offset"] == index.offsets[1]
+        assert data["range"] == f"bytes={index.offsets[1]}-"
+        end = index.moov_offset + index.moov_size - 1
+        assert data["moov_range"] == f"bytes={index.moov_offset}-{end}"
+        assert data["duration"] == 10.0
+
+        # 반환된 오프셋부터 /video Range 요청 한 번으로 재생 시작
+        video = client.get("/stream/v1/video", headers={"Range": data["range"]})
+        assert video.status_code == 206
+        assert video.content[:1] == bytes([3])
+        service.source_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_missing_index_enqueues_once(self, client):
+        """인덱스가 없으면 MP4_INDEX 작업을 한 번만 요청하고 503"""
+        from src.orchestration.message_bus import MessageBus
+
+        client, _ = client
+        requests = []
+
+        async def handler(msg):
+            if msg.payload.get("task_type") == "MP4_INDEX":
+                requests.append(msg)
+
+        bus = MessageBus.get_instance()
+        await bus.subscribe("worker.enqueue", handler)
+
+        first = client.get("/stream/v2/seek", params={"t": 1})
+        second = client.get("/stream/v2/seek", params={"t": 2})
+
+        assert first.status_code == 503
+        assert first.headers["retry-after"]
+        assert second.status_code == 503
+        assert [r.payload["payload"]["content_id"] for r in requests] == ["v2"]
+
+    @pytest.mark.asyncio
+    async def test_stale_index_ignored(self, client, video_file):
+        """원본이 바뀐 인덱스는 사용하지 않음"""
+        import os
+
+        from src.core.mp4_index import build_seek_index
+
+        client, service = client
+        await service.seek_index.save("v3", build_seek_index(video_file))
+        stat = video_file.stat()
+        os.utime(video_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert client.get("/stream/v3/seek", params={"t": 1}).status_code == 503
+
+    def test_invalid_requests(self, client):
+        """음수 시각은 422, 원본 파일이 없으면 404"""
+        client, _ = client
+
+        assert client.get("/stream/v1/seek", params={"t": -1}).status_code == 422
+        assert client.get("/stream/missing/seek", params={"t": 1}).status_code == 404
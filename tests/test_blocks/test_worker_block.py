@@ -105,17 +105,20 @@ class TestWorkerService:
         assert "thumbnail" in result.message.lower() or "generated" in result.message.lower()
 
     @pytest.mark.asyncio
-    async def test_process_cache_warm_task(self):
+    async def test_process_cache_warm_task(self, tmp_path):
         """캐시 워밍 작업 처리"""
         from src.blocks.worker.service import WorkerService
         from src.blocks.worker.models import TaskType
 
         service = WorkerService()
+        nas_file = tmp_path / "nas" / "v1.mp4"
+        nas_file.parent.mkdir()
+        nas_file.write_bytes(b"v" * 1024)
 
         # 작업 추가
         task = await service.enqueue(
             task_type=TaskType.CACHE_WARM,
-            payload={"nas_path": "/nas/videos/v1.mp4", "ssd_path": "/ssd/cache/v1.mp4"}
+            payload={"nas_path": str(nas_file), "ssd_path": str(tmp_path / "ssd" / "v1.mp4")}
         )
 
         # 작업 처리
@@ -206,6 +209,31 @@ class TestWorkerService:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_background_loop_processes_enqueued(self):
+        """start() 후 enqueue된 작업은 백그라운드 루프가 처리, stop()으로 종료"""
+        import asyncio
+
+        from src.blocks.worker.models import TaskStatus, TaskType
+        from src.blocks.worker.service import WorkerService
+
+        service = WorkerService(concurrency=2)
+        await service.start()
+        try:
+            tasks = [
+                await service.enqueue(TaskType.THUMBNAIL, {"video_id": "v1", "frame_time": 5})
+                for _ in range(3)
+            ]
+            for _ in range(100):
+                if all(t.status == TaskStatus.COMPLETED for t in tasks):
+                    break
+                await asyncio.sleep(0.01)
+            assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+        finally:
+            await service.stop()
+
+        assert service._runners == []
+
 
 class TestWorkerBlockWorkers:
     """Worker Block - 개별 Worker 테스트"""
@@ -229,18 +257,22 @@ class TestWorkerBlockWorkers:
         assert result.data is not None
 
     @pytest.mark.asyncio
-    async def test_cache_warmer_worker(self):
+    async def test_cache_warmer_worker(self, tmp_path):
         """CacheWarmerWorker 단독 테스트"""
         from src.blocks.worker.workers.cache_warmer import CacheWarmerWorker
         from src.blocks.worker.models import Task, TaskType
 
+        nas_file = tmp_path / "v1.mp4"
+        nas_file.write_bytes(b"v" * 1024)
+        ssd_file = tmp_path / "ssd" / "v1.mp4"
+
         worker = CacheWarmerWorker()
         task = Task(
             id="warm-1",
             type=TaskType.CACHE_WARM,
             payload={
-                "nas_path": "/nas/videos/v1.mp4",
-                "ssd_path": "/ssd/cache/v1.mp4"
+                "nas_path": str(nas_file),
+                "ssd_path": str(ssd_file)
             }
         )
 
@@ -248,6 +280,179 @@ class TestWorkerBlockWorkers:
 
         assert result.success is True
         assert "copied" in result.message.lower() or "warmed" in result.message.lower()
+        assert ssd_file.read_bytes() == nas_file.read_bytes()
+        assert result.data["size_bytes"] == 1024
+        assert "throughput_mbps" in result.data
+
+    @pytest.mark.asyncio
+    async def test_cache_warmer_resumes_partial_copy(self, tmp_path):
+        """중단된 .part 파일에서 이어서 복사"""
+        import os
+
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.cache_warmer import CacheWarmerWorker
+
+        data = os.urandom(3 * 1024 * 1024)
+        nas_file = tmp_path / "final.mp4"
+        nas_file.write_bytes(data)
+        ssd_file = tmp_path / "ssd" / "final.mp4"
+        ssd_file.parent.mkdir()
+        (tmp_path / "ssd" / "final.mp4.part").write_bytes(data[:1024 * 1024])
+
+        worker = CacheWarmerWorker(max_mbps=0)
+        worker.CHUNK_SIZE = 256 * 1024
+        result = await worker.process(Task(
+            id="warm-2",
+            type=TaskType.CACHE_WARM,
+            payload={"nas_path": str(nas_file), "ssd_path": str(ssd_file)}
+        ))
+
+        assert result.success is True
+        assert result.data["resumed_from"] == 1024 * 1024
+        assert result.data["copied_bytes"] == 2 * 1024 * 1024
+        assert ssd_file.read_bytes() == data
+        assert not (tmp_path / "ssd" / "final.mp4.part").exists()
+
+    @pytest.mark.asyncio
+    async def test_cache_warmer_rejects_corrupt_partial(self, tmp_path):
+        """검증 실패 시 등록하지 않고 임시 파일 삭제"""
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.cache_warmer import CacheWarmerWorker
+
+        nas_file = tmp_path / "v.mp4"
+        nas_file.write_bytes(b"a" * 4096)
+        ssd_file = tmp_path / "ssd" / "v.mp4"
+        ssd_file.parent.mkdir()
+        (tmp_path / "ssd" / "v.mp4.part").write_bytes(b"b" * 2048)
+
+        result = await CacheWarmerWorker().process(Task(
+            id="warm-3",
+            type=TaskType.CACHE_WARM,
+            payload={"nas_path": str(nas_file), "ssd_path": str(ssd_file)}
+        ))
+
+        assert result.success is False
+        assert not ssd_file.exists()
+        assert not (tmp_path / "ssd" / "v.mp4.part").exists()
+
+    @pytest.mark.asyncio
+    async def test_cache_warmer_registers_with_l2(self, tmp_path):
+        """CacheService가 있으면 L2 디렉토리에 복사 후 인덱스 등록"""
+        from src.blocks.cache.service import CacheService
+        from src.blocks.cache.tiers import L2SSDCache
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.cache_warmer import CacheWarmerWorker
+
+        cache = CacheService()
+        cache.l2 = L2SSDCache(cache_dir=str(tmp_path / "ssd"))
+        nas_file = tmp_path / "clip.mp4"
+        nas_file.write_bytes(b"c" * 2048)
+
+        result = await CacheWarmerWorker(cache).process(Task(
+            id="warm-4",
+            type=TaskType.CACHE_WARM,
+            payload={"nas_path": str(nas_file), "content_id": "clip-1"}
+        ))
+
+        assert result.success is True
+        path = await cache.l2.get_path("clip-1")
+        assert path == tmp_path / "ssd" / "clip-1.mp4"
+        assert path.read_bytes() == nas_file.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_cache_warmer_uses_l2_admission(self, tmp_path):
+        """L2 승격 필터를 통과하지 못하면 인기 항목을 밀어내지 않고 거절"""
+        from src.blocks.cache.service import CacheService
+        from src.blocks.cache.tiers import L2SSDCache
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.cache_warmer import CacheWarmerWorker
+
+        cache = CacheService()
+        cache.l2 = L2SSDCache(cache_dir=str(tmp_path / "ssd"), max_size_gb=3000 / 1024**3)
+        popular = tmp_path / "popular.mp4"
+        popular.write_bytes(b"p" * 2500)
+        for _ in range(10):
+            await cache.record_access("popular")
+        await cache.mark_as_hot("popular", str(popular))
+
+        nas_file = tmp_path / "one_off.mp4"
+        nas_file.write_bytes(b"o" * 1000)
+        result = await CacheWarmerWorker(cache).process(Task(
+            id="warm-5",
+            type=TaskType.CACHE_WARM,
+            payload={"nas_path": str(nas_file), "content_id": "one_off"}
+        ))
+
+        assert result.success is False
+        assert result.data["admitted"] is False
+        assert await cache.l2.exists("popular")
+        assert not await cache.l2.exists("one_off")
+        assert cache.l2.reserved_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_warmer_skips_cached_and_ignores_ssd_path(self, tmp_path):
+        """L2가 있으면 ssd_path 대신 L2 경로에 복사, 같은 크기로 이미 있으면 복사 생략"""
+        from src.blocks.cache.service import CacheService
+        from src.blocks.cache.tiers import L2SSDCache
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.cache_warmer import CacheWarmerWorker
+
+        cache = CacheService()
+        cache.l2 = L2SSDCache(cache_dir=str(tmp_path / "ssd"))
+        nas_file = tmp_path / "clip.mp4"
+        nas_file.write_bytes(b"c" * 2048)
+        outside = tmp_path / "elsewhere" / "clip.mp4"
+        worker = CacheWarmerWorker(cache)
+        payload = {"nas_path": str(nas_file), "content_id": "clip-1", "ssd_path": str(outside)}
+
+        result = await worker.process(Task(id="warm-6", type=TaskType.CACHE_WARM, payload=payload))
+        assert result.success is True
+        assert result.data["ssd_path"] == str(tmp_path / "ssd" / "clip-1.mp4")
+        assert not outside.exists()
+
+        result = await worker.process(Task(id="warm-7", type=TaskType.CACHE_WARM, payload=payload))
+        assert result.success is True
+        assert result.data["already_cached"] is True
+        assert result.data["copied_bytes"] == 0
+        assert cache.l2.reserved_bytes == 0
+
+    def test_cache_warmer_cancel_before_rename(self, tmp_path):
+        """복사 도중 취소되면 대상 파일을 만들지 않고 .part만 남김"""
+        import threading
+        from concurrent.futures import CancelledError
+
+        from src.blocks.worker.workers.cache_warmer import CacheWarmerWorker
+
+        cancelled = threading.Event()
+
+        class CancelAfterCopy(CacheWarmerWorker):
+            def _copy_chunked(self, *args):
+                result = super()._copy_chunked(*args)
+                cancelled.set()
+                return result
+
+        nas_file = tmp_path / "v.mp4"
+        nas_file.write_bytes(b"v" * 4096)
+        target = tmp_path / "ssd" / "v.mp4"
+
+        with pytest.raises(CancelledError):
+            CancelAfterCopy(max_mbps=0)._warm(nas_file, target, cancelled)
+        assert not target.exists()
+        assert (tmp_path / "ssd" / "v.mp4.part").stat().st_size == 4096
+
+    def test_bandwidth_throttle(self):
+        """공유 대역폭 상한"""
+        import time
+
+        from src.blocks.worker.workers.cache_warmer import BandwidthThrottle
+
+        throttle = BandwidthThrottle(bytes_per_sec=1_000_000, burst_bytes=100_000)
+        started = time.monotonic()
+        for _ in range(3):
+            throttle.consume(100_000)
+
+        # 버스트 이후 200KB → 최소 약 0.2초
+        assert time.monotonic() - started >= 0.15
 
     @pytest.mark.asyncio
     async def test_nas_scanner_worker(self):
@@ -375,3 +580,269 @@ class TestWorkerBlockEvents:
         # 큐에 작업이 추가되었는지 확인
         status = await service.get_queue_status()
         assert status["total"] >= 1
+
+
+class TestHLSPackagerWorker:
+    """HLSPackagerWorker 테스트"""
+
+    def test_ffmpeg_args_remux_to_fmp4(self, tmp_path):
+        """재인코딩 없이 fMP4 HLS로 remux"""
+        from src.blocks.worker.workers.hls_packager import build_ffmpeg_args
+
+        args = build_ffmpeg_args("ffmpeg", tmp_path / "in.mp4", tmp_path / "out", 6)
+
+        assert args[args.index("-c") + 1] == "copy"
+        assert args[args.index("-hls_segment_type") + 1] == "fmp4"
+        assert args[args.index("-hls_time") + 1] == "6"
+        assert args[args.index("-hls_playlist_type") + 1] == "vod"
+        assert args[-1] == str(tmp_path / "out" / "index.m3u8")
+
+    @pytest.mark.asyncio
+    async def test_missing_ffmpeg(self, tmp_path, monkeypatch):
+        """ffmpeg가 없으면 실패 결과 (패키지 미등록)"""
+        from src.blocks.cache.tiers import HLSSegmentCache
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.hls_packager import HLSPackagerWorker
+
+        monkeypatch.setenv("FFMPEG_PATH", str(tmp_path / "no-ffmpeg"))
+        segments = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+        worker = HLSPackagerWorker(segment_cache=segments)
+
+        result = await worker.process(Task(
+            id="hls-1",
+            type=TaskType.HLS_PACKAGE,
+            payload={"content_id": "v1", "nas_path": str(tmp_path / "v1.mp4")},
+        ))
+
+        assert result.success is False
+        assert result.data["error"] == "ffmpeg_not_found"
+        assert await segments.exists("v1") is False
+
+    @pytest.mark.asyncio
+    async def test_missing_fields(self):
+        """content_id/nas_path 누락 시 실패"""
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.hls_packager import HLSPackagerWorker
+
+        worker = HLSPackagerWorker()
+        result = await worker.process(
+            Task(id="hls-2", type=TaskType.HLS_PACKAGE, payload={"content_id": "v1"})
+        )
+
+        assert result.success is False
+
+    @staticmethod
+    def _fake_ffmpeg(monkeypatch, calls, returncode=0, stderr=b""):
+        """ffmpeg 실행을 가로채 인자를 기록하고 출력 파일을 흉내냄"""
+        import asyncio
+        import shutil
+        from pathlib import Path
+
+        class FakeProcess:
+            def __init__(self):
+                self.returncode = returncode
+
+            async def communicate(self):
+                return None, stderr
+
+        async def fake_exec(*args, **kwargs):
+            calls.append((list(args), kwargs))
+            if returncode == 0:
+                out = Path(args[-1]).parent
+                (out / "init.mp4").write_bytes(b"init")
+                (out / "seg_00000.m4s").write_bytes(b"s" * 10)
+                (out / "seg_00001.m4s").write_bytes(b"s" * 10)
+                Path(args[-1]).write_text("#EXTM3U\n")
+            return FakeProcess()
+
+        monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/ffmpeg")
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+
+    @pytest.mark.asyncio
+    async def test_package_runs_ffmpeg_argv(self, tmp_path, monkeypatch):
+        """패키징 시 실제로 실행하는 ffmpeg 인자 (subprocess mock)"""
+        import asyncio
+
+        from src.blocks.cache.tiers import HLSSegmentCache
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.hls_packager import HLSPackagerWorker
+
+        source = tmp_path / "v1.mp4"
+        source.write_bytes(b"v" * 100)
+        calls = []
+        self._fake_ffmpeg(monkeypatch, calls)
+        segments = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+        worker = HLSPackagerWorker(segment_cache=segments)
+
+        result = await worker.process(Task(
+            id="hls-3",
+            type=TaskType.HLS_PACKAGE,
+            payload={"content_id": "v1", "nas_path": str(source), "segment_seconds": 4},
+        ))
+
+        assert result.success is True
+        assert result.data["segment_count"] == 2
+        (argv, kwargs), = calls
+        staging = argv[-1].rsplit("/", 1)[0]
+        assert argv == [
+            "/usr/bin/ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+            "-i", str(source),
+            "-map", "0:v:0", "-map", "0:a?",
+            "-c", "copy",
+            "-f", "hls",
+            "-hls_time", "4",
+            "-hls_playlist_type", "vod",
+            "-hls_segment_type", "fmp4",
+            "-hls_fmp4_init_filename", "init.mp4",
+            "-hls_flags", "independent_segments",
+            "-hls_segment_filename", f"{staging}/seg_%05d.m4s",
+            f"{staging}/index.m3u8",
+        ]
+        assert kwargs["stdout"] == asyncio.subprocess.DEVNULL
+        assert kwargs["stderr"] == asyncio.subprocess.PIPE
+        assert await segments.exists("v1") is True
+
+    @pytest.mark.asyncio
+    async def test_package_ffmpeg_failure(self, tmp_path, monkeypatch):
+        """ffmpeg 실패 시 stderr를 결과에 담고 패키지는 등록하지 않음"""
+        from src.blocks.cache.tiers import HLSSegmentCache
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.hls_packager import HLSPackagerWorker
+
+        source = tmp_path / "v1.mp4"
+        source.write_bytes(b"v" * 100)
+        calls = []
+        self._fake_ffmpeg(monkeypatch, calls, returncode=1, stderr=b"moov atom not found")
+        segments = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+        worker = HLSPackagerWorker(segment_cache=segments)
+
+        result = await worker.process(Task(
+            id="hls-4",
+            type=TaskType.HLS_PACKAGE,
+            payload={"content_id": "v1", "nas_path": str(source)},
+        ))
+
+        assert result.success is False
+        assert result.data == {"error": "moov atom not found", "returncode": 1}
+        assert await segments.exists("v1") is False
+        assert calls[0][0][calls[0][0].index("-hls_time") + 1] == "6"
+
+    @pytest.mark.asyncio
+    async def test_package_video(self, tmp_path):
+        """실제 ffmpeg로 패키징 후 세그먼트 캐시에 등록"""
+        import asyncio
+        import shutil
+
+        from src.blocks.cache.tiers import HLSSegmentCache
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.hls_packager import HLSPackagerWorker
+
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            pytest.skip("ffmpeg not installed")
+
+        source = tmp_path / "v1.mp4"
+        proc = await asyncio.create_subprocess_exec(
+            ffmpeg, "-nostdin", "-loglevel", "error",
+            "-f", "lavfi", "-i", "testsrc=duration=5:size=160x120:rate=10",
+            "-g", "10", "-pix_fmt", "yuv420p", str(source),
+        )
+        await proc.wait()
+
+        segments = HLSSegmentCache(cache_dir=str(tmp_path / "hls"))
+        worker = HLSPackagerWorker(segment_cache=segments)
+        result = await worker.process(Task(
+            id="hls-3",
+            type=TaskType.HLS_PACKAGE,
+            payload={"content_id": "v1", "nas_path": str(source), "segment_seconds": 2},
+        ))
+
+        assert result.success is True, result.message
+        assert result.data["segment_count"] >= 2
+        assert await segments.get_file("v1", "init.mp4") is not None
+        playlist = (await segments.get_file("v1", "index.m3u8")).read_text()
+        assert "#EXT-X-MAP:URI=\"init.mp4\"" in playlist
+        assert [p.name for p in (tmp_path / "hls").iterdir()] == ["v1"]
+
+
+class TestMP4IndexWorker:
+    """MP4IndexWorker 테스트"""
+
+    @staticmethod
+    def _make_mp4(path):
+        """키프레임 2개(0초, 2초)짜리 MP4 (moov가 파일 끝)"""
+        import struct
+
+        def box(box_type, payload, full=False):
+            if full:
+                payload = b"\0\0\0\0" + payload
+            return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+        ftyp = box(b"ftyp", b"isom\0\0\0\0")
+        mdat = box(b"mdat", b"k" * 100 + b"p" * 100 + b"k" * 100)
+        base = len(ftyp) + 8
+        stbl = box(b"stbl", b"".join([
+            box(b"stts", struct.pack(">III", 1, 3, 1000), True),
+            box(b"stss", struct.pack(">III", 2, 1, 3), True),
+            box(b"stsc", struct.pack(">IIII", 1, 1, 3, 1), True),
+            box(b"stsz", struct.pack(">II", 100, 3), True),
+            box(b"stco", struct.pack(">II", 1, base), True),
+        ]))
+        mdia = box(b"mdia", b"".join([
+            box(b"mdhd", struct.pack(">IIII", 0, 0, 1000, 3000) + b"\0" * 4, True),
+            box(b"hdlr", b"\0" * 4 + b"vide" + b"\0" * 13, True),
+            box(b"minf", stbl),
+        ]))
+        mvhd = box(b"mvhd", struct.pack(">IIII", 0, 0, 1000, 3000) + b"\0" * 80, True)
+        path.write_bytes(ftyp + mdat + box(b"moov", mvhd + box(b"trak", mdia)))
+        return base
+
+    @pytest.mark.asyncio
+    async def test_builds_sidecar(self, tmp_path):
+        """moov에서 인덱스를 추출해 sidecar로 저장"""
+        from src.blocks.cache.tiers import SeekIndexStore
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.mp4_indexer import MP4IndexWorker
+
+        source = tmp_path / "v1.mp4"
+        base = self._make_mp4(source)
+        store = SeekIndexStore(index_dir=str(tmp_path / "index"))
+        worker = MP4IndexWorker(index_store=store)
+
+        result = await worker.process(Task(
+            id="idx-1",
+            type=TaskType.MP4_INDEX,
+            payload={"content_id": "v1", "nas_path": str(source)},
+        ))
+
+        assert result.success is True, result.message
+        assert result.data["keyframes"] == 2
+        assert (tmp_path / "index" / "v1.idx").is_file()
+
+        # 새 저장소(다른 프로세스)에서도 sidecar로 조회
+        stat = source.stat()
+        index = await SeekIndexStore(index_dir=str(tmp_path / "index")).load(
+            "v1", stat.st_size, stat.st_mtime_ns
+        )
+        assert index.offsets == [base, base + 200]
+        assert index.lookup(2.5) == (2.0, base + 200)
+
+    @pytest.mark.asyncio
+    async def test_not_mp4_fails(self, tmp_path):
+        """MP4가 아니면 실패 결과 (sidecar 없음)"""
+        from src.blocks.cache.tiers import SeekIndexStore
+        from src.blocks.worker.models import Task, TaskType
+        from src.blocks.worker.workers.mp4_indexer import MP4IndexWorker
+
+        source = tmp_path / "v1.mp4"
+        source.write_bytes(b"\0" * 64)
+        worker = MP4IndexWorker(index_store=SeekIndexStore(index_dir=str(tmp_path / "index")))
+
+        result = await worker.process(Task(
+            id="idx-2",
+            type=TaskType.MP4_INDEX,
+            payload={"content_id": "v1", "nas_path": str(source)},
+        ))
+
+        assert result.success is False
+        assert not (tmp_path / "index" / "v1.idx").exists()
@@ -381,3 +381,113 @@ class TestMessageBusIntegration:
         # 두 핸들러 모두 이벤트 수신
         assert len(auth_events) >= 1
         assert len(admin_events) >= 1
+
+
+class TestAppWorkerWiring:
+    """앱 수명주기의 Worker 블럭 연결 (worker.enqueue → 백그라운드 처리)"""
+
+    @pytest.fixture
+    def app_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SSD_CACHE_PATH", str(tmp_path / "ssd"))
+        monkeypatch.setenv("HLS_CACHE_PATH", str(tmp_path / "hls"))
+        monkeypatch.setenv("MP4_INDEX_PATH", str(tmp_path / "index"))
+        monkeypatch.delenv("CATALOG_STORE_PATH", raising=False)
+
+        from src.blocks.flat_catalog.models import CatalogItem
+        from src.blocks.flat_catalog.service import get_flat_catalog_service
+        from src.main import app
+        from tests.test_blocks.test_stream_block import _make_mp4
+
+        video = tmp_path / "nas" / "video.mp4"
+        video.parent.mkdir()
+        _make_mp4(video, [100] * 12)
+
+        catalog = get_flat_catalog_service()
+        item = catalog.add_item(CatalogItem(file_path=str(video), file_name=video.name))
+        yield app, str(item.id), video
+        catalog.delete(item.id)
+
+    @staticmethod
+    def _wait(predicate, timeout=5.0):
+        import time
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.02)
+        return False
+
+    def test_enqueued_cache_warm_is_processed(self, app_env):
+        """worker.enqueue로 보낸 CACHE_WARM을 앱의 워커가 처리해 L2에 등록"""
+        from src.orchestration.message_bus import BlockMessage, MessageBus
+
+        app, content_id, video = app_env
+        completed = []
+
+        async def on_completed(msg):
+            completed.append(msg.payload)
+
+        with TestClient(app) as client:
+            bus = MessageBus.get_instance()
+            client.portal.call(bus.subscribe, "worker.task_completed", on_completed)
+            client.portal.call(bus.publish, "worker.enqueue", BlockMessage(
+                source_block="test",
+                event_type="worker.enqueue",
+                payload={
+                    "task_type": "CACHE_WARM",
+                    "payload": {"content_id": content_id, "nas_path": str(video)},
+                },
+            ))
+
+            assert self._wait(lambda: completed)
+            assert completed[0]["task_type"] == "CACHE_WARM"
+            cache_service = app.state.cache_service
+            assert client.portal.call(cache_service.l2.exists, content_id)
+            # Stream 블럭도 같은 CacheService로 L2 복사본을 찾음
+            source = client.portal.call(app.state.stream_service.get_stream_source, content_id)
+            assert source.path != video
+            client.portal.call(bus.unsubscribe, "worker.task_completed", on_completed)
+
+    def test_restarted_lifespan_streams(self, app_env):
+        """같은 프로세스에서 lifespan을 다시 시작해도 스트리밍 읽기가 동작"""
+        app, content_id, video = app_env
+        expected = video.read_bytes()[:1024]
+
+        for _ in range(2):
+            with TestClient(app) as client:
+                response = client.get(
+                    f"/stream/{content_id}/video", headers={"Range": "bytes=0-1023"}
+                )
+                assert response.status_code == 206
+                assert response.content == expected
+
+    def test_seek_index_built_by_app_worker(self, app_env):
+        """/seek: 처음엔 503, 앱의 워커가 MP4_INDEX를 처리한 뒤 200"""
+        app, content_id, _ = app_env
+
+        with TestClient(app) as client:
+            url = f"/stream/{content_id}/seek"
+            assert client.get(url, params={"t": 5}).status_code == 503
+            assert self._wait(lambda: client.get(url, params={"t": 5}).status_code == 200)
+            assert client.get(url, params={"t": 5}).json()["keyframe_time"] == 3.0
+
+    def test_seek_index_failure_reported(self, app_env, tmp_path):
+        """MP4가 아닌 파일은 워커의 추출 실패 후 503 대신 422"""
+        from src.blocks.flat_catalog.models import CatalogItem
+        from src.blocks.flat_catalog.service import get_flat_catalog_service
+
+        app, _, _ = app_env
+        broken = tmp_path / "nas" / "broken.mp4"
+        broken.write_bytes(b"not an mp4" * 100)
+        catalog = get_flat_catalog_service()
+        item = catalog.add_item(CatalogItem(file_path=str(broken), file_name=broken.name))
+
+        try:
+            with TestClient(app) as client:
+                url = f"/stream/{item.id}/seek"
+                assert client.get(url, params={"t": 1}).status_code == 503
+                assert self._wait(lambda: client.get(url, params={"t": 1}).status_code == 422)
+                assert "Seek index unavailable" in client.get(url, params={"t": 1}).json()["detail"]
+        finally:
+            catalog.delete(item.id)